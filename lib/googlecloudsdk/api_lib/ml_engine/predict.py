@@ -30,17 +30,21 @@ class InstancesEncodeError(core_exceptions.Error):
 
 class HttpRequestFailError(core_exceptions.Error):
   """Indicates that the http request fails in some way."""
-  pass
+
+  def __init__(self, message, status_code=None):
+    super(HttpRequestFailError, self).__init__(message)
+    self.status_code = status_code
 
 
-def _GetPrediction(url, body, headers):
+def _GetPrediction(url, body, headers, session=None):
   """Make http request to get prediction results."""
-  response = requests.GetSession().request(
+  response = (session or requests.GetSession()).request(
       'POST', url, data=body, headers=headers)
   return response.status_code, response.text
 
 
-def Predict(model_or_version_ref, instances, signature_name=None):
+def Predict(model_or_version_ref, instances, signature_name=None,
+            session=None):
   """Performs online prediction on the input data file.
 
   Args:
@@ -48,6 +52,8 @@ def Predict(model_or_version_ref, instances, signature_name=None):
       instances: a list of JSON or UTF-8 encoded instances to perform
           prediction on.
       signature_name: name of input/output signature in the TF meta graph.
+      session: requests.Session from requests.GetSession() to send the request
+          with, or None to use a new one.
 
   Returns:
       A json object that contains predictions.
@@ -70,10 +76,10 @@ def Predict(model_or_version_ref, instances, signature_name=None):
                                'because the input is not utf-8 encoded.')
 
   # Workaround since gcloud cannot handle HttpBody properly, see b/31403673
-  response_status, response_body = _GetPrediction(url, body, headers)
+  response_status, response_body = _GetPrediction(url, body, headers, session)
   if int(response_status) != httplib.OK:
     raise HttpRequestFailError('HTTP request failed. Response: ' +
-                               response_body)
+                               response_body, int(response_status))
   try:
     return json.loads(response_body)
   except ValueError:
@@ -111,7 +117,7 @@ def Explain(model_or_version_ref, instances):
   response_status, response_body = _GetPrediction(url, body, headers)
   if int(response_status) != httplib.OK:
     raise HttpRequestFailError('HTTP request failed. Response: ' +
-                               response_body)
+                               response_body, int(response_status))
   try:
     return json.loads(response_body)
   except ValueError:
@@ -621,6 +621,32 @@ class TopicsClient(object):
       )
     return result
 
+  def PublishMessages(self, topic_ref, messages):
+    """Publishes several messages to the given topic in one request.
+
+    Args:
+      topic_ref (Resource): Resource reference to Topic to publish to.
+      messages (list[PubsubMessage]): Messages to send. The Pub/Sub service
+        limits the number of messages and bytes in a single request.
+
+    Returns:
+      PublishResponse: Response message with message ids from the API, in the
+        same order as messages.
+    Raises:
+      PublishOperationException: When something went wrong with the publish
+        operation.
+    """
+    publish_req = self.messages.PubsubProjectsTopicsPublishRequest(
+        publishRequest=self.messages.PublishRequest(messages=messages),
+        topic=topic_ref.RelativeName(),
+    )
+    result = self._service.Publish(publish_req)
+    if len(result.messageIds) != len(messages):
+      raise PublishOperationException(
+          'Publish operation failed with Unknown error.'
+      )
+    return result
+
   def SetIamPolicy(self, topic_ref, policy):
     """Sets an IAM policy on a Topic.
 
@@ -15,12 +15,34 @@
 """Spanner database sessions API helper."""
 
 
+import codecs
+import json
+import time
+
+from apitools.base.py import encoding
 from apitools.base.py import exceptions as apitools_exceptions
 from apitools.base.py import extra_types
 from apitools.base.py import http_wrapper
 from apitools.base.py import list_pager
 from googlecloudsdk.api_lib.util import apis
 from googlecloudsdk.command_lib.spanner.sql import QueryHasDml
+from googlecloudsdk.core import log
+from googlecloudsdk.core.credentials import requests as creds_requests
+import requests
+
+# Statuses of streaming responses that are retried, from the last resume token.
+_STREAMING_RETRYABLE_STATUS_CODES = frozenset([500, 502, 503, 504])
+_MAX_STREAMING_RETRIES = 5
+_MAX_STREAMING_RETRY_DELAY_SECONDS = 32
+# Results after the last resume token are held back so they can be discarded
+# if the stream is resumed. Past this size they are returned anyway, and the
+# stream can no longer be resumed until the next resume token.
+_MAX_STREAMING_BUFFER_BYTES = 16 * 1024 * 1024
+_STREAMING_CHUNK_BYTES = 64 * 1024
+# Characters around and between the elements of a JSON array.
+_JSON_ARRAY_SEPARATORS = frozenset(' \t\r\n[,]')
+# Last characters of a chunk that may complete an element.
+_JSON_ELEMENT_ENDS = frozenset([b'}', b']', b','])
 
 
 def CheckResponse(response):
@@ -127,6 +149,192 @@ def ExecuteSql(sql, query_mode, session_ref, read_only_options=None,
   return resp
 
 
+def _IterJsonArray(chunks):
+  """Parses the elements of a JSON array as its bytes arrive.
+
+  Args:
+    chunks: Iterator of bytes, consecutive pieces of the JSON array.
+
+  Yields:
+    (element, size) tuples, where element is the parsed JSON value and size is
+    the length of its encoding.
+
+  Raises:
+    ValueError: If the array is not valid JSON.
+  """
+  decoder = json.JSONDecoder()
+  text_decoder = codecs.getincrementaldecoder('utf-8')()
+  text = ''
+  # Parsing an incomplete element is retried once enough text arrived to at
+  # least double it, so large elements are not parsed once per chunk. It is
+  # also retried when a chunk ends like an element does, so a complete element
+  # is not held back until more text arrives.
+  min_length = 0
+  final = False
+  while not final:
+    chunk = next(chunks, None)
+    final = chunk is None
+    text += text_decoder.decode(chunk or b'', final=final)
+    if (
+        len(text) < min_length
+        and not final
+        and chunk.rstrip()[-1:] not in _JSON_ELEMENT_ENDS
+    ):
+      continue
+    position = 0
+    while True:
+      while position < len(text) and text[position] in _JSON_ARRAY_SEPARATORS:
+        position += 1
+      if position == len(text):
+        break
+      try:
+        element, end = decoder.raw_decode(text, position)
+      except ValueError:
+        if final:
+          raise
+        break
+      yield element, end - position
+      position = end
+    text = text[position:]
+    min_length = 2 * len(text)
+
+
+def _StreamPartialResultSets(session, url, body):
+  """Sends an ExecuteStreamingSql request and parses the response stream.
+
+  Args:
+    session: requests.Session, The session to send the request with.
+    url: String, The URL of the executeStreamingSql method.
+    body: String, The JSON encoded ExecuteSqlRequest.
+
+  Yields:
+    (PartialResultSet, size) tuples, where size is the length of its encoding.
+
+  Raises:
+    HttpError: If the request fails, or the stream ends with an error.
+  """
+  msgs = apis.GetMessagesModule('spanner', 'v1')
+  with session.request(
+      'POST',
+      url,
+      data=body,
+      headers={'content-type': 'application/json'},
+      stream=True,
+  ) as response:
+    if response.status_code != 200:
+      raise apitools_exceptions.HttpError.FromResponse(
+          http_wrapper.Response(
+              dict(response.headers, status=str(response.status_code)),
+              response.content,
+              url,
+          )
+      )
+    for element, size in _IterJsonArray(
+        iter(response.iter_content(chunk_size=_STREAMING_CHUNK_BYTES))
+    ):
+      if 'error' in element:
+        # Errors after the response started are sent as the last element.
+        raise apitools_exceptions.HttpError.FromResponse(
+            http_wrapper.Response(
+                {'status': str(element['error'].get('code', 500))},
+                json.dumps(element),
+                url,
+            )
+        )
+      yield encoding.DictToMessage(element, msgs.PartialResultSet), size
+
+
+def _IsRetryableStreamingError(error):
+  if isinstance(error, apitools_exceptions.HttpError):
+    return error.status_code in _STREAMING_RETRYABLE_STATUS_CODES
+  # A ValueError means the response ended in the middle of a result.
+  return isinstance(
+      error,
+      (
+          requests.exceptions.ConnectionError,
+          requests.exceptions.ChunkedEncodingError,
+          ValueError,
+      ),
+  )
+
+
+def ExecuteStreamingSql(sql, query_mode, session_ref, read_only_options=None,
+                        request_options=None, http_timeout_sec=None):
+  """Executes a read-only SQL query and yields its results as they arrive.
+
+  If the stream is interrupted by a transient error, the query is resumed from
+  the last resume token the server sent. Results received after that token are
+  only yielded once the next token arrives, so none are repeated on resume.
+
+  Args:
+    sql: String, The SQL to execute. Must not contain DML.
+    query_mode: String, The mode in which to run the query. Must be one of
+      'NORMAL', 'PLAN', 'PROFILE', 'WITH_STATS', or 'WITH_PLAN_AND_STATS'.
+    session_ref: Session, The session to execute the query in.
+    read_only_options: The ReadOnly message for the read-only transaction.
+    request_options: The RequestOptions message that contains the priority.
+    http_timeout_sec: int, Maximum time in seconds to wait for each response
+      chunk.
+
+  Yields:
+    PartialResultSet messages. Chunked values are not merged.
+
+  Raises:
+    HttpError: If the query fails with an error that cannot be retried.
+  """
+  client = _GetClientInstance('spanner', 'v1', http_timeout_sec)
+  execute_sql_request = _GetQueryRequest(
+      sql, query_mode, session_ref, read_only_options, request_options
+  )
+  url = '{}v1/{}:executeStreamingSql'.format(
+      client.url, session_ref.RelativeName()
+  )
+  session = creds_requests.GetSession(
+      timeout=http_timeout_sec, streaming_response_body=True
+  )
+  resumable = True
+  retries = 0
+  while True:
+    buffered = []
+    buffered_bytes = 0
+    try:
+      for partial_result_set, size in _StreamPartialResultSets(
+          session, url, encoding.MessageToJson(execute_sql_request)
+      ):
+        buffered.append(partial_result_set)
+        buffered_bytes += size
+        if partial_result_set.resumeToken:
+          execute_sql_request.resumeToken = partial_result_set.resumeToken
+          resumable = True
+          retries = 0
+        elif buffered_bytes > _MAX_STREAMING_BUFFER_BYTES:
+          resumable = False
+        else:
+          continue
+        for buffered_result_set in buffered:
+          yield buffered_result_set
+        buffered = []
+        buffered_bytes = 0
+    except (
+        apitools_exceptions.HttpError,
+        requests.exceptions.RequestException,
+        ValueError,
+    ) as error:
+      if (
+          not resumable
+          or not _IsRetryableStreamingError(error)
+          or retries >= _MAX_STREAMING_RETRIES
+      ):
+        raise
+      retries += 1
+      log.debug('Resuming query after error: {}'.format(error))
+      time.sleep(min(2**retries, _MAX_STREAMING_RETRY_DELAY_SECONDS))
+      continue
+    for buffered_result_set in buffered:
+      yield buffered_result_set
+    return
+
+
 def _GetQueryRequest(sql,
                      query_mode,
                      session_ref=None,
@@ -46,6 +46,8 @@ class Capability(enum.Enum):
   # stream can be treated as seekable.
   DAISY_CHAIN_SEEKABLE_UPLOAD_STREAM = 'DAISY_CHAIN_SEEKABLE_UPLOAD_STREAM'
   MOVE_OBJECTS = 'MOVE_OBJECTS'
+  # Several object metadata requests can be sent in one HTTP call.
+  BATCH_REQUESTS = 'BATCH_REQUESTS'
 
 
 class DownloadStrategy(enum.Enum):
@@ -633,6 +635,27 @@ class CloudApi(object):
     """
     raise NotImplementedError('delete_object must be overridden.')
 
+  def delete_objects(self, object_urls, request_configs):
+    """Deletes objects using batch API calls.
+
+    Only available if the BATCH_REQUESTS capability is present.
+
+    Args:
+      object_urls (list[storage_url.CloudUrl]): Urls of objects to delete.
+      request_configs (list[RequestConfig]): Object containing general API
+        function arguments for the URL at the same index in object_urls.
+
+    Returns:
+      list[CloudApiError|None]: The error for each URL in object_urls, or None
+        if that object was deleted.
+
+    Raises:
+      CloudApiError: API returned an error for a whole batch call.
+      NotImplementedError: This function was not implemented by a class using
+        this interface.
+    """
+    raise NotImplementedError('delete_objects must be overridden.')
+
   def download_object(self,
                       cloud_resource,
                       download_stream,
@@ -837,6 +860,33 @@ class CloudApi(object):
     """
     raise NotImplementedError('patch_object_metadata must be overridden.')
 
+  def patch_objects_metadata(
+      self, object_resources, request_configs, posix_to_set_list=None
+  ):
+    """Updates metadata of several objects using batch API calls.
+
+    Only available if the BATCH_REQUESTS capability is present.
+
+    Args:
+      object_resources (list[resource_reference.ObjectResource]): Objects to
+        update, each containing the metadata that will be used to update it.
+      request_configs (list[RequestConfig]): Object containing general API
+        function arguments for the object at the same index in
+        object_resources.
+      posix_to_set_list (list[PosixAttributes|None]|None): Set as custom
+        metadata on the object at the same index in object_resources.
+
+    Returns:
+      list[CloudApiError|None]: The error for each object in object_resources,
+        or None if that object was updated.
+
+    Raises:
+      CloudApiError: API returned an error for a whole batch call.
+      NotImplementedError: This function was not implemented by a class using
+        this interface.
+    """
+    raise NotImplementedError('patch_objects_metadata must be overridden.')
+
   def set_object_iam_policy(self,
                             bucket_name,
                             object_name,
@@ -1294,6 +1344,27 @@ class CloudApi(object):
     """
     raise NotImplementedError('restore_object must be overridden.')
 
+  def restore_objects(self, urls, request_configs):
+    """Restores soft-deleted objects using batch API calls.
+
+    Only available if the BATCH_REQUESTS capability is present.
+
+    Args:
+      urls (list[storage_url.CloudUrl]): Object URLs with generations.
+      request_configs (list[RequestConfig]): Contains preconditions for the API
+        request for the URL at the same index in urls.
+
+    Returns:
+      list[CloudApiError|None]: The error for each URL in urls, or None if that
+        object was restored.
+
+    Raises:
+      CloudApiError: API returned an error for a whole batch call.
+      NotImplementedError: This function was not implemented by a class using
+        this interface.
+    """
+    raise NotImplementedError('restore_objects must be overridden.')
+
   def restore_bucket(self, url):
     """Restores a soft-deleted bucket.
 
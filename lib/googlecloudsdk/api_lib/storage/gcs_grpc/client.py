@@ -49,6 +49,11 @@ class GrpcClientWithJsonFallback(gcs_json_client.JsonClient):
       'publicRead',
   )
 
+  # Batch calls would bypass gRPC for deletes and restores.
+  capabilities = gcs_json_client.JsonClient.capabilities - {
+      cloud_api.Capability.BATCH_REQUESTS
+  }
+
   # The API limits the number of objects that can be composed in a single call.
   # https://cloud.google.com/storage/docs/json_api/v1/objects/compose
   _MAX_OBJECTS_PER_COMPOSE_CALL = 32
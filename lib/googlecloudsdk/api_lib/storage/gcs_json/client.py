@@ -19,11 +19,13 @@ buckets, uploading objects, and setting lifecycle conditions.
 """
 
 
+import collections
 import contextlib
 import errno
 import json
 import uuid
 
+from apitools.base.py import batch as apitools_batch
 from apitools.base.py import exceptions as apitools_exceptions
 from apitools.base.py import list_pager
 from apitools.base.py import transfer as apitools_transfer
@@ -31,6 +33,7 @@ from googlecloudsdk.api_lib.storage import cloud_api
 from googlecloudsdk.api_lib.storage import errors as cloud_errors
 from googlecloudsdk.api_lib.storage import gcs_iam_util
 from googlecloudsdk.api_lib.storage import headers_util
+from googlecloudsdk.api_lib.storage import retry_util
 from googlecloudsdk.api_lib.storage.gcs_json import download
 from googlecloudsdk.api_lib.storage.gcs_json import error_util
 from googlecloudsdk.api_lib.storage.gcs_json import metadata_util
@@ -56,6 +59,7 @@ from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
 from googlecloudsdk.core import requests
 from googlecloudsdk.core.credentials import transports
+from googlecloudsdk.core.util import retry
 from googlecloudsdk.core.util import scaled_integer
 import six
 from six.moves import urllib
@@ -75,6 +79,42 @@ _NOTIFICATION_PAYLOAD_FORMAT_KEY_TO_API_CONSTANT = {
     cloud_api.NotificationPayloadFormat.NONE: 'NONE',
 }
 
+# Requests in a batch call that fail with these codes are resent in a later
+# batch call. https://cloud.google.com/storage/docs/retry-strategy
+_BATCH_RETRYABLE_STATUS_CODES = [408, 429, 500, 502, 503, 504]
+
+# A request to send in a batch call, with the fields to send as null and the
+# headers to add to it.
+_BatchRequest = collections.namedtuple(
+    '_BatchRequest', ['message', 'cleared_fields', 'headers']
+)
+
+
+def _get_batch_url(client_url):
+  """Returns the batch endpoint for an API base URL.
+
+  For example, https://storage.googleapis.com/storage/v1/ becomes
+  https://storage.googleapis.com/batch/storage/v1.
+
+  Args:
+    client_url (str): Base URL of the apitools client.
+
+  Returns:
+    The batch endpoint URL.
+  """
+  root, separator, _ = client_url.rstrip('/').rpartition('/storage/v1')
+  if not separator:
+    return urllib.parse.urljoin(client_url, '/batch/storage/v1')
+  return root + '/batch/storage/v1'
+
+
+def _get_batch_item_status_code(error):
+  # Responses parsed out of batch calls store the status as a string.
+  try:
+    return int(error_util.get_status_code(error))
+  except (TypeError, ValueError):
+    return None
+
 
 def _get_download_link(object_resource):
   """Generates link https://cloud.google.com/storage/docs/request-endpoints."""
@@ -295,11 +335,15 @@ class JsonClient(cloud_api.CloudApi):
       cloud_api.Capability.RESUMABLE_UPLOAD,
       cloud_api.Capability.SLICED_DOWNLOAD,
       cloud_api.Capability.MOVE_OBJECTS,
+      cloud_api.Capability.BATCH_REQUESTS,
   }
 
   # The API limits the number of objects that can be composed in a single call.
   # https://cloud.google.com/storage/docs/json_api/v1/objects/compose
   MAX_OBJECTS_PER_COMPOSE_CALL = 32
+  # The API limits the number of requests that can be sent in a batch call.
+  # https://cloud.google.com/storage/docs/batch
+  MAX_REQUESTS_PER_BATCH_CALL = 100
 
   def __init__(self):
     super(JsonClient, self).__init__()
@@ -344,6 +388,67 @@ class JsonClient(cloud_api.CloudApi):
       })
     return self._apitools_request_headers_context(additional_headers)
 
+  def _execute_batch(self, method, batch_requests):
+    """Sends objects API requests in batch calls.
+
+    Requests failing with retryable status codes are resent in later batch
+    calls, with exponential backoff up to the storage/max_retries property.
+
+    Args:
+      method (str): Name of the objects service method, e.g. "Delete".
+      batch_requests (list[_BatchRequest]): Requests for method.
+
+    Returns:
+      list[CloudApiError|None]: The error for each request, or None if the
+        request succeeded.
+    """
+    batch_request = apitools_batch.BatchApiRequest(
+        batch_url=_get_batch_url(self.client.url),
+        retryable_codes=_BATCH_RETRYABLE_STATUS_CODES,
+    )
+    # Requests are serialized with the client's headers when added, so cleared
+    # fields and headers only need to be set here.
+    for request in batch_requests:
+      with self.client.IncludeFields(
+          request.cleared_fields
+      ), self._apitools_request_headers_context(request.headers):
+        batch_request.Add(self.client.objects, method, request.message)
+
+    def _execute_attempt():
+      # Only sends requests that did not get a final response yet.
+      api_calls = batch_request.Execute(
+          self.client.http,
+          max_retries=1,
+          max_batch_size=self.MAX_REQUESTS_PER_BATCH_CALL,
+      )
+      if not all(api_call.terminal_state for api_call in api_calls):
+        raise cloud_errors.RetryableApiError()
+
+    try:
+      retry_util.retryer(
+          target=_execute_attempt,
+          should_retry_if=lambda exc_type, *_: issubclass(
+              exc_type, cloud_errors.RetryableApiError
+          ),
+      )
+    except retry.MaxRetrialsException:
+      # Requests still failing keep their last error.
+      pass
+
+    errors = []
+    for api_call in batch_request.api_requests:
+      if api_call.is_error:
+        errors.append(
+            cloud_errors.translate_error(
+                api_call.exception,
+                error_util.ERROR_TRANSLATION,
+                status_code_getter=_get_batch_item_status_code,
+            )
+        )
+      else:
+        errors.append(None)
+    return errors
+
   def _get_projection(self, fields_scope, message_class):
     """Generate query projection from fields_scope.
 
@@ -1029,9 +1134,8 @@ class JsonClient(cloud_api.CloudApi):
     return metadata_util.get_object_resource_from_metadata(
         rewrite_response.resource)
 
-  @error_util.catch_http_error_raise_gcs_api_error()
-  def delete_object(self, object_url, request_config):
-    """See super class."""
+  def _get_delete_object_request(self, object_url, request_config):
+    """Returns a StorageObjectsDeleteRequest for delete_object(s)."""
     # S3 requires a string, but GCS uses an int for generation.
     if object_url.generation is not None:
       generation = int(object_url.generation)
@@ -1044,9 +1148,31 @@ class JsonClient(cloud_api.CloudApi):
         generation=generation,
         ifGenerationMatch=request_config.precondition_generation_match,
         ifMetagenerationMatch=request_config.precondition_metageneration_match)
+    return request
+
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def delete_object(self, object_url, request_config):
+    """See super class."""
     # Success returns an empty body.
     # https://cloud.google.com/storage/docs/json_api/v1/objects/delete
-    self.client.objects.Delete(request)
+    self.client.objects.Delete(
+        self._get_delete_object_request(object_url, request_config)
+    )
+
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def delete_objects(self, object_urls, request_configs):
+    """See super class."""
+    return self._execute_batch(
+        'Delete',
+        [
+            _BatchRequest(
+                self._get_delete_object_request(url, request_config),
+                cleared_fields=None,
+                headers=None,
+            )
+            for url, request_config in zip(object_urls, request_configs)
+        ],
+    )
 
   @error_util.catch_http_error_raise_gcs_api_error()
   def download_object(self,
@@ -1311,18 +1437,17 @@ class JsonClient(cloud_api.CloudApi):
           self.client.objects.Move(request)
       )
 
-  @error_util.catch_http_error_raise_gcs_api_error()
-  def patch_object_metadata(
+  def _get_patch_object_request(
       self,
       bucket_name,
       object_name,
       object_resource,
       request_config,
-      fields_scope=cloud_api.FieldsScope.NO_ACL,
-      generation=None,
-      posix_to_set=None,
+      fields_scope,
+      generation,
+      posix_to_set,
   ):
-    """See super class."""
+    """Returns a StorageObjectsPatchRequest for patch_object(s)_metadata."""
     # S3 requires a string, but GCS uses an int for generation.
     if generation:
       generation = int(generation)
@@ -1350,7 +1475,7 @@ class JsonClient(cloud_api.CloudApi):
         posix_to_set=posix_to_set,
         method_type=metadata_util.MethodType.OBJECT_PATCH,
     )
-    request = self.messages.StorageObjectsPatchRequest(
+    return self.messages.StorageObjectsPatchRequest(
         bucket=bucket_name,
         object=object_name,
         objectResource=object_metadata,
@@ -1362,12 +1487,63 @@ class JsonClient(cloud_api.CloudApi):
         projection=projection,
     )
 
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def patch_object_metadata(
+      self,
+      bucket_name,
+      object_name,
+      object_resource,
+      request_config,
+      fields_scope=cloud_api.FieldsScope.NO_ACL,
+      generation=None,
+      posix_to_set=None,
+  ):
+    """See super class."""
+    request = self._get_patch_object_request(
+        bucket_name,
+        object_name,
+        object_resource,
+        request_config,
+        fields_scope,
+        generation,
+        posix_to_set,
+    )
     with self.client.IncludeFields(
         metadata_util.get_cleared_object_fields(request_config)
     ):
       updated_metadata = self.client.objects.Patch(request)
     return metadata_util.get_object_resource_from_metadata(updated_metadata)
 
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def patch_objects_metadata(
+      self, object_resources, request_configs, posix_to_set_list=None
+  ):
+    """See super class."""
+    if posix_to_set_list is None:
+      posix_to_set_list = [None] * len(object_resources)
+    batch_requests = []
+    for object_resource, request_config, posix_to_set in zip(
+        object_resources, request_configs, posix_to_set_list
+    ):
+      batch_requests.append(
+          _BatchRequest(
+              self._get_patch_object_request(
+                  object_resource.storage_url.bucket_name,
+                  object_resource.storage_url.resource_name,
+                  object_resource,
+                  request_config,
+                  cloud_api.FieldsScope.NO_ACL,
+                  None,
+                  posix_to_set,
+              ),
+              cleared_fields=metadata_util.get_cleared_object_fields(
+                  request_config
+              ),
+              headers=None,
+          )
+      )
+    return self._execute_batch('Patch', batch_requests)
+
   @error_util.catch_http_error_raise_gcs_api_error()
   def set_object_iam_policy(self,
                             bucket_name,
@@ -1764,28 +1940,47 @@ class JsonClient(cloud_api.CloudApi):
           cloud_errors.translate_error(e, error_util.ERROR_TRANSLATION)
       )
 
-  @error_util.catch_http_error_raise_gcs_api_error()
-  def restore_object(self, url, request_config):
-    """See CloudApi class."""
+  def _get_restore_object_request(self, url, request_config):
+    """Returns a StorageObjectsRestoreRequest for restore_object(s)."""
     if request_config.resource_args:
       preserve_acl = request_config.resource_args.preserve_acl
     else:
       preserve_acl = None
 
+    return self.messages.StorageObjectsRestoreRequest(
+        bucket=url.bucket_name,
+        copySourceAcl=preserve_acl,
+        generation=int(url.generation),
+        ifGenerationMatch=request_config.precondition_generation_match,
+        ifMetagenerationMatch=(
+            request_config.precondition_metageneration_match
+        ),
+        object=url.resource_name,
+    )
+
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def restore_object(self, url, request_config):
+    """See CloudApi class."""
     object_metadata = self.client.objects.Restore(
-        self.messages.StorageObjectsRestoreRequest(
-            bucket=url.bucket_name,
-            copySourceAcl=preserve_acl,
-            generation=int(url.generation),
-            ifGenerationMatch=request_config.precondition_generation_match,
-            ifMetagenerationMatch=(
-                request_config.precondition_metageneration_match
-            ),
-            object=url.resource_name,
-        )
+        self._get_restore_object_request(url, request_config)
     )
     return metadata_util.get_object_resource_from_metadata(object_metadata)
 
+  @error_util.catch_http_error_raise_gcs_api_error()
+  def restore_objects(self, urls, request_configs):
+    """See CloudApi class."""
+    return self._execute_batch(
+        'Restore',
+        [
+            _BatchRequest(
+                self._get_restore_object_request(url, request_config),
+                cleared_fields=None,
+                headers=None,
+            )
+            for url, request_config in zip(urls, request_configs)
+        ],
+    )
+
   @error_util.catch_http_error_raise_gcs_api_error()
   def restore_bucket(self, url):
     """See CloudApi class."""
@@ -38,6 +38,7 @@ from googlecloudsdk.calliope.concepts import handlers
 from googlecloudsdk.core import log
 from googlecloudsdk.core import metrics
 from googlecloudsdk.core import properties
+from googlecloudsdk.core import tracing
 from googlecloudsdk.core.util import text
 import six
 
@@ -965,10 +966,14 @@ class Command(CommandCommon):
     command_instance = self._common_type(cli=cli, context=tool_context)
 
     base.LogCommand(self.dotted_name, args)
-    resources = command_instance.Run(args)
-    resources = display.Displayer(
-        command_instance, args, resources, display_info=self.ai.display_info
-    ).Display()
+    with tracing.Span('run', command=self.dotted_name):
+      resources = command_instance.Run(args)
+    # Resources returned as generators are fetched while they are displayed, so
+    # requests for later pages are part of this span.
+    with tracing.Span('display'):
+      resources = display.Displayer(
+          command_instance, args, resources, display_info=self.ai.display_info
+      ).Display()
     metrics.Ran()
 
     if command_instance.exit_code != 0:
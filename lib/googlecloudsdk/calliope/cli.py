@@ -37,6 +37,7 @@ from googlecloudsdk.core import config
 from googlecloudsdk.core import log
 from googlecloudsdk.core import metrics
 from googlecloudsdk.core import properties
+from googlecloudsdk.core import tracing
 from googlecloudsdk.core import yaml
 from googlecloudsdk.core.configurations import named_configs
 from googlecloudsdk.core.console import console_attr
@@ -908,9 +909,10 @@ class CLI(object):
     old_user_output_enabled = None
     old_verbosity = None
     try:
-      args = self.__parser.parse_args(_ApplyFlagsFile(argv))
-      if args.CONCEPT_ARGS is not None:
-        args.CONCEPT_ARGS.ParseConcepts()
+      with tracing.Span('parse_args'):
+        args = self.__parser.parse_args(_ApplyFlagsFile(argv))
+        if args.CONCEPT_ARGS is not None:
+          args.CONCEPT_ARGS.ParseConcepts()
       calliope_command = args._GetCommand()  # pylint: disable=protected-access
       command_path_string = '.'.join(calliope_command.GetPath())
       specified_arg_names = args.GetSpecifiedArgNames()
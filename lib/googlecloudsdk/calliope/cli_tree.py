@@ -596,6 +596,208 @@ class CliTreeGenerator(walker.Walker):
     return False
 
 
+# The most CLI tree generation processes used by default. Generation is
+# dominated by loading command modules, and more processes than this mostly
+# contend for the disk and memory.
+_MAX_DEFAULT_GENERATION_PROCESSES = 8
+
+# The CLI that the forked CLI tree generation processes generate shards of.
+_shard_cli = None
+
+
+class _ShardCliTreeGenerator(CliTreeGenerator):
+  """Generates the CLI tree of a shard of the top level groups and commands.
+
+  Only the elements on the restrict paths are loaded, but the walk starts at
+  the CLI root so that the elements are generated with their ancestor flags.
+  Walk() must be called with the same restrict paths.
+  """
+
+  def __init__(self, cli, restrict):
+    super(_ShardCliTreeGenerator, self).__init__(cli=cli, restrict=restrict)
+    self._roots = [cli._TopElement()]  # pylint: disable=protected-access
+
+
+def _GetGenerationProcessCount():
+  """Returns the number of processes to generate the CLI tree with."""
+  import multiprocessing
+  from googlecloudsdk.core import log
+  from googlecloudsdk.core import properties
+
+  # The shard processes inherit the loaded CLI, so they must be forked. Forking
+  # is not safe on macOS.
+  if (
+      'fork' not in multiprocessing.get_all_start_methods()
+      or sys.platform == 'darwin'
+  ):
+    return 1
+  try:
+    processes = properties.VALUES.core.cli_tree_generation_processes.GetInt()
+  except properties.InvalidValueError as e:
+    # The tree is also generated in the background, where failing on an
+    # invalid value would only leave it stale.
+    log.warning('%s Using the default number of processes.', e)
+    processes = None
+  if processes is None:
+    processes = min(os.cpu_count() or 1, _MAX_DEFAULT_GENERATION_PROCESSES)
+  return max(processes, 1)
+
+
+def _GetReleaseTrackNames(top):
+  """Returns the names of the release track groups of the top element."""
+  return sorted(
+      name
+      for name, group in six.iteritems(top.groups)
+      if group.ReleaseTrack().prefix == name
+  )
+
+
+def _GetShards(cli):
+  """Returns the shards the CLI tree is generated in.
+
+  A shard is a top level group or command with the groups or commands of the
+  same name in each release track, which share most of their modules.
+
+  Args:
+    cli: The CLI.
+
+  Returns:
+    [(str, [str])], The name and the dotted command paths of each shard.
+  """
+  top = cli._TopElement()  # pylint: disable=protected-access
+  tracks = _GetReleaseTrackNames(top)
+  paths = {
+      name: ['.'.join(top.GetPath() + [name])]
+      for name in top.AllSubElements()
+      if name not in tracks
+  }
+  for track in tracks:
+    for name in top.groups[track].AllSubElements():
+      paths.setdefault(name, []).append('.'.join(top.GetPath() + [track, name]))
+  return sorted(six.iteritems(paths))
+
+
+def _MakeDefaultsPicklable(command):
+  """Replaces argument defaults that cannot be pickled by their projection."""
+  import pickle
+  from googlecloudsdk.core.resource import resource_projector
+
+  def _Scrub(arg):
+    if arg.is_group:
+      for a in arg.arguments:
+        _Scrub(a)
+      return
+    try:
+      pickle.dumps(arg.default)
+    except Exception:  # pylint: disable=broad-except, any object can be a default
+      arg.default = resource_projector.MakeSerializable(arg.default)
+
+  for arg in list(command.flags.values()) + command.positionals:
+    _Scrub(arg)
+  _Scrub(command.constraints)
+  for subcommand in command.commands.values():
+    _MakeDefaultsPicklable(subcommand)
+
+
+def _GenerateShard(shard):
+  """Generates the CLI tree of a shard in a forked process.
+
+  Args:
+    shard: (str, [str]), The shard name and dotted command paths.
+
+  Returns:
+    (str, Command, float), The shard name, the CLI tree root with only the
+    shard below it and its release track groups, and the generation time in
+    seconds.
+  """
+  import time
+
+  start = time.time()
+  name, restrict = shard
+  tree = _ShardCliTreeGenerator(_shard_cli, restrict).Walk(
+      hidden=True, restrict=restrict
+  )
+  _MakeDefaultsPicklable(tree)
+  return name, tree, time.time() - start
+
+
+def _AddShard(root, shard_root, name, tracks):
+  """Moves the commands of a shard tree into the CLI tree root.
+
+  Args:
+    root: Command, The CLI tree root, with its release track groups.
+    shard_root: Command, The root of a shard tree.
+    name: str, The shard name.
+    tracks: [str], The release track group names.
+  """
+  # The walk that generated the shard may also have visited elements loaded
+  # for other shards in the same process, those are skipped.
+  name = name.replace('_', '-')
+  parents = [(root, shard_root)] + [
+      (root.commands[track], shard_root.commands[track])
+      for track in tracks
+      if track in shard_root.commands
+  ]
+  for parent, shard_parent in parents:
+    command = shard_parent.commands.get(name)
+    if command:
+      command._parent = parent  # pylint: disable=protected-access
+      parent.commands[name] = command
+
+
+def _GenerateShardedTree(cli, processes, message):
+  """Generates the CLI tree with processes each generating shards of it.
+
+  Args:
+    cli: The CLI.
+    processes: int, The number of processes.
+    message: str, The progress tracker message.
+
+  Returns:
+    The CLI tree root Command.
+  """
+  import multiprocessing
+  import time
+  from googlecloudsdk.core import log
+  from googlecloudsdk.core.console import progress_tracker
+
+  global _shard_cli
+  start = time.time()
+  top = cli._TopElement()  # pylint: disable=protected-access
+  tracks = _GetReleaseTrackNames(top)
+  shards = _GetShards(cli)
+  _shard_cli = cli
+  try:
+    # The processes are forked before the progress tracker starts a thread.
+    with multiprocessing.get_context('fork').Pool(processes) as pool:
+      with progress_tracker.ProgressTracker(message):
+        root = Command(top, None)
+        for track in tracks:
+          Command(top.groups[track], root)
+        for name, shard_root, seconds in pool.imap_unordered(
+            _GenerateShard, shards
+        ):
+          log.info('Generated the [%s] CLI tree shard in %.2fs.', name, seconds)
+          _AddShard(root, shard_root, name, tracks)
+  finally:
+    _shard_cli = None
+  # Order the commands as the walk of the whole tree does.
+  for parent in [root] + [root.commands[track] for track in tracks]:
+    parent.commands = dict(
+        sorted(
+            six.iteritems(parent.commands),
+            key=lambda item: item[0].replace('-', '_'),
+        )
+    )
+  log.info(
+      'Generated the CLI tree in %d shards with %d processes in %.2fs.',
+      len(shards),
+      processes,
+      time.time() - start,
+  )
+  return root
+
+
 _LOOKUP_SERIALIZED_FLAG_LIST = 'SERIALIZED_FLAG_LIST'
 
 
@@ -794,18 +996,24 @@ def _GenerateRoot(cli, path=None, name=DEFAULT_CLI_NAME, branch=None):
     message = 'Generating the {} CLI for one-time use (no SDK root)'.format(
         name
     )
-  with progress_tracker.ProgressTracker(message):
-    tree = CliTreeGenerator(cli, branch=branch).Walk(hidden=True)
-    setattr(tree, LOOKUP_VERSION, VERSION)
-    setattr(tree, LOOKUP_CLI_VERSION, _GetDefaultCliCommandVersion())
-    return tree
+  # A branch is generated for tests, and is small enough for one process.
+  processes = 1 if branch else _GetGenerationProcessCount()
+  if processes > 1:
+    tree = _GenerateShardedTree(cli, processes, message)
+  else:
+    with progress_tracker.ProgressTracker(message):
+      tree = CliTreeGenerator(cli, branch=branch).Walk(hidden=True)
+  setattr(tree, LOOKUP_VERSION, VERSION)
+  setattr(tree, LOOKUP_CLI_VERSION, _GetDefaultCliCommandVersion())
+  return tree
 
 
 def Dump(cli, path=None, name=DEFAULT_CLI_NAME, branch=None):
   """Dumps the CLI tree to a JSON file.
 
   The tree is processed by cli_tree._Serialize() to minimize the JSON file size
-  and generation time.
+  and generation time. The lazy layout and the help search index of the
+  default CLI are written next to the JSON file.
 
   Args:
     cli: The CLI.
@@ -827,9 +1035,37 @@ def Dump(cli, path=None, name=DEFAULT_CLI_NAME, branch=None):
       _DumpToFile(tree, f)
   from googlecloudsdk.core.resource import resource_projector
 
+  if path != '-' and name == DEFAULT_CLI_NAME:
+    _DumpLazyTree(resource_projector.MakeSerializable(tree), path)
+    _DumpHelpSearchIndex(
+        _Deserialize(resource_projector.MakeSerializable(tree)), path)
   return resource_projector.MakeSerializable(tree)
 
 
+def _DumpLazyTree(tree, path):
+  """Writes the lazy layout of the serialized tree dumped to path."""
+  from googlecloudsdk.calliope import cli_tree_lazy
+  from googlecloudsdk.core import log
+
+  try:
+    cli_tree_lazy.Write(tree, path)
+  except files.Error as e:
+    # Lazy loads fall back to loading the whole CLI tree.
+    log.debug('Lazy CLI tree for [%s] not written: %s', path, e)
+
+
+def _DumpHelpSearchIndex(tree, path):
+  """Writes the help search index of the deserialized tree dumped to path."""
+  from googlecloudsdk.command_lib.help_search import search_index
+  from googlecloudsdk.core import log
+
+  try:
+    search_index.Write(tree, path)
+  except files.Error as e:
+    # Help search falls back to searching the CLI tree.
+    log.debug('Help search index for [%s] not written: %s', path, e)
+
+
 def _IsUpToDate(tree, path, ignore_errors, verbose):
   """Returns True if the CLI tree on path is up to date.
 
@@ -906,6 +1142,38 @@ def _Load(path, cli=None, force=False, verbose=False):
   return None
 
 
+def _ReplaceConstraintIndexWithArgReference(
+    arguments, positionals, all_flags_list):
+  """Replaces the constraint argument indices with argument references."""
+  for i, arg in enumerate(arguments):
+    if isinstance(arg, int):
+      if arg < 0:  # a positional index
+        arguments[i] = positionals[-(arg + 1)]
+      else:  # a flag index
+        arguments[i] = all_flags_list[arg]
+    elif arg.get(LOOKUP_IS_GROUP, False):
+      _ReplaceConstraintIndexWithArgReference(
+          arg.get(LOOKUP_ARGUMENTS), positionals, all_flags_list
+      )
+
+
+def _DeserializeCommand(command, all_flags_list):
+  """Replaces the flag indices of one serialized command, not its subcommands.
+
+  Args:
+    command: dict, The serialized command node, modified in place.
+    all_flags_list: The serialized flag list, anything that supports
+      all_flags_list[index].
+  """
+  flags = command[LOOKUP_FLAGS]
+  for name, index in six.iteritems(flags):
+    flags[name] = all_flags_list[index]
+  arguments = command[LOOKUP_CONSTRAINTS][LOOKUP_ARGUMENTS]
+  _ReplaceConstraintIndexWithArgReference(
+      arguments, command[LOOKUP_POSITIONALS], all_flags_list
+  )
+
+
 def _Deserialize(tree):
   """Returns the deserialization of a serialized CLI tree."""
   all_flags_list = tree.get(_LOOKUP_SERIALIZED_FLAG_LIST)
@@ -915,26 +1183,8 @@ def _Deserialize(tree):
   tree[_LOOKUP_SERIALIZED_FLAG_LIST] = None
   del tree[_LOOKUP_SERIALIZED_FLAG_LIST]
 
-  def _ReplaceConstraintIndexWithArgReference(arguments, positionals):
-    for i, arg in enumerate(arguments):
-      if isinstance(arg, int):
-        if arg < 0:  # a positional index
-          arguments[i] = positionals[-(arg + 1)]
-        else:  # a flag index
-          arguments[i] = all_flags_list[arg]
-      elif arg.get(LOOKUP_IS_GROUP, False):
-        _ReplaceConstraintIndexWithArgReference(
-            arg.get(LOOKUP_ARGUMENTS), positionals
-        )
-
   def _ReplaceIndexWithFlagReference(command):
-    flags = command[LOOKUP_FLAGS]
-    for name, index in six.iteritems(flags):
-      flags[name] = all_flags_list[index]
-    arguments = command[LOOKUP_CONSTRAINTS][LOOKUP_ARGUMENTS]
-    _ReplaceConstraintIndexWithArgReference(
-        arguments, command[LOOKUP_POSITIONALS]
-    )
+    _DeserializeCommand(command, all_flags_list)
     for subcommand in command[LOOKUP_COMMANDS].values():
       _ReplaceIndexWithFlagReference(subcommand)
 
@@ -944,7 +1194,12 @@ def _Deserialize(tree):
 
 
 def Load(
-    path=None, cli=None, force=False, one_time_use_ok=False, verbose=False
+    path=None,
+    cli=None,
+    force=False,
+    one_time_use_ok=False,
+    verbose=False,
+    lazy=False,
 ):
   """Loads the default CLI tree from the json file path.
 
@@ -957,6 +1212,10 @@ def Load(
     one_time_use_ok: If True and the load fails then the CLI tree is generated
       on the fly for one time use.
     verbose: Display a status line for up to date CLI trees if True.
+    lazy: If True then load the command groups from the lazy layout of the
+      tree on first use, see cli_tree_lazy. The whole tree is loaded, and its
+      lazy layout written for the next load, if the layout is missing or out
+      of date.
 
   Raises:
     CliTreeVersionError: loaded tree version mismatch
@@ -976,12 +1235,23 @@ def Load(
         return resource_projector.MakeSerializable(tree)
       raise
 
+  if lazy and not force:
+    from googlecloudsdk.calliope import cli_tree_lazy
+
+    tree = cli_tree_lazy.Load(path)
+    if tree:
+      return tree
+
   # First try to load the tree.
   tree = _Load(path, cli=cli, force=force, verbose=verbose)
   if not tree:
-    # The load failed. Regenerate and attempt to load again.
+    # The load failed. Regenerate and attempt to load again. This also writes
+    # the lazy layout.
     Dump(cli=cli, path=path)
     tree = _Load(path)
+  elif lazy:
+    # The tree predates its lazy layout, write it for the next load.
+    _DumpLazyTree(tree, path)
 
   return _Deserialize(tree)
 
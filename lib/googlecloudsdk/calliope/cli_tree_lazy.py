@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A lazily loaded layout of the CLI tree.
+
+cli_tree.Load reads the whole JSON CLI tree and deserializes every command
+before it returns, and the whole tree stays in memory even if only a few
+command groups are used, as in a gcloud interactive session. The lazy layout
+splits the serialized tree into one JSON line per command group, holding the
+group and its commands, with its subgroups reduced to stubs that have only the
+keys needed to list and parse them. A stub loads the rest of its group the
+first time any other key is looked up.
+
+The layout is written next to the CLI tree when the tree is dumped, as two
+files: the index, which holds the line offsets and is loaded first, and the
+groups file, which holds one JSON line per distinct flag and per group and is
+read by offset.
+"""
+
+
+import functools
+import json
+import os
+
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.core.util import files
+
+import six
+
+# pylint:disable=g-import-not-at-top
+
+VERSION = '1'
+
+_INDEX_SUFFIX = '.tree_index'
+_GROUPS_SUFFIX = '.tree_groups'
+
+_LOOKUP_FLAG_OFFSETS = 'FLAG_OFFSETS'
+_LOOKUP_GROUP_OFFSETS = 'GROUP_OFFSETS'
+_LOOKUP_GROUPS_SIZE = 'GROUPS_SIZE'
+_LOOKUP_LAYOUT_VERSION = 'LAYOUT_VERSION'
+_LOOKUP_TREE_SIZE = 'TREE_SIZE'
+
+# The group id of a subgroup stub.
+_LOOKUP_GROUP_ID = 'GROUP_ID'
+
+# The subgroup keys that completing and parsing the parent command line need.
+_STUB_KEYS = (
+    cli_tree.LOOKUP_CAPSULE,
+    cli_tree.LOOKUP_IS_GROUP,
+    cli_tree.LOOKUP_IS_HIDDEN,
+    cli_tree.LOOKUP_NAME,
+    cli_tree.LOOKUP_PATH,
+    cli_tree.LOOKUP_RELEASE,
+)
+
+
+def LayoutPaths(tree_path=None):
+  """Returns the (index, groups file) paths for the CLI tree on tree_path.
+
+  Args:
+    tree_path: str, The CLI tree file path, the default CLI tree path if None.
+
+  Raises:
+    SdkConfigNotFoundError: If tree_path is None and the SDK config directory
+      does not exist.
+
+  Returns:
+    (str, str), The index and groups file paths.
+  """
+  if tree_path is None:
+    tree_path = cli_tree.CliTreeConfigPath()
+  base = os.path.splitext(tree_path)[0]
+  return base + _INDEX_SUFFIX, base + _GROUPS_SUFFIX
+
+
+def _Split(tree):
+  """Returns the groups of the serialized tree in walk order, root first.
+
+  Args:
+    tree: dict, The serialized CLI tree.
+
+  Returns:
+    [dict], The command groups with their subgroups replaced by stubs. The
+    tree is not modified.
+  """
+  groups = []
+
+  def _AddGroup(command):
+    group_id = len(groups)
+    groups.append(None)
+    group = {k: v for k, v in six.iteritems(command)
+             if k not in (cli_tree.LOOKUP_COMMANDS,
+                          cli_tree._LOOKUP_SERIALIZED_FLAG_LIST)}  # pylint: disable=protected-access
+    commands = {}
+    for name, subcommand in six.iteritems(command[cli_tree.LOOKUP_COMMANDS]):
+      if subcommand[cli_tree.LOOKUP_COMMANDS]:
+        stub = {k: subcommand[k] for k in _STUB_KEYS if k in subcommand}
+        stub[_LOOKUP_GROUP_ID] = _AddGroup(subcommand)
+        commands[name] = stub
+      else:
+        commands[name] = subcommand
+    group[cli_tree.LOOKUP_COMMANDS] = commands
+    groups[group_id] = group
+    return group_id
+
+  _AddGroup(tree)
+  return groups
+
+
+def _WriteLines(f, items):
+  """Writes one JSON line per item to f and returns their offsets."""
+  offsets = []
+  for item in items:
+    offsets.append(f.tell())
+    # Keys are not sorted, commands are listed in tree order.
+    f.write(json.dumps(item).encode('utf-8') + b'\n')
+  return offsets
+
+
+def Write(tree, tree_path=None):
+  """Writes the lazy layout of tree.
+
+  The groups file is written before the index, and the index records its size
+  and the size of the tree file, so an index is never used with files it was
+  not written with.
+
+  Args:
+    tree: dict, The serialized CLI tree.
+    tree_path: str, The path the CLI tree was dumped to, the default CLI tree
+      path if None. The layout files are written next to it.
+
+  Raises:
+    SdkConfigNotFoundError: If tree_path is None and the SDK config directory
+      does not exist.
+    files.Error: If the layout files could not be written.
+  """
+  if tree_path is None:
+    tree_path = cli_tree.CliTreeConfigPath()
+  index_path, groups_path = LayoutPaths(tree_path)
+  groups = _Split(tree)
+  with files.BinaryFileWriter(groups_path) as f:
+    flag_offsets = _WriteLines(
+        f, tree.get(cli_tree._LOOKUP_SERIALIZED_FLAG_LIST) or [])  # pylint: disable=protected-access
+    group_offsets = _WriteLines(f, groups)
+    groups_size = f.tell()
+  try:
+    tree_size = os.path.getsize(tree_path)
+  except OSError as e:
+    raise files.Error(six.text_type(e))
+  index = {
+      cli_tree.LOOKUP_VERSION: tree.get(cli_tree.LOOKUP_VERSION),
+      cli_tree.LOOKUP_CLI_VERSION: tree.get(cli_tree.LOOKUP_CLI_VERSION),
+      _LOOKUP_LAYOUT_VERSION: VERSION,
+      _LOOKUP_TREE_SIZE: tree_size,
+      _LOOKUP_GROUPS_SIZE: groups_size,
+      _LOOKUP_FLAG_OFFSETS: flag_offsets,
+      _LOOKUP_GROUP_OFFSETS: group_offsets,
+  }
+  with files.FileWriter(index_path) as f:
+    json.dump(index, f)
+
+
+def Load(tree_path=None):
+  """Loads the root of the CLI tree on tree_path from its lazy layout.
+
+  Args:
+    tree_path: str, The CLI tree file path, the default CLI tree path if None.
+
+  Returns:
+    The deserialized CLI tree root, with its subgroups loaded on first use, or
+    None if the layout does not exist, cannot be read, or is out of date.
+  """
+  try:
+    if tree_path is None:
+      tree_path = cli_tree.CliTreeConfigPath()
+    index_path, groups_path = LayoutPaths(tree_path)
+    index = json.loads(files.ReadFileContents(index_path))
+    # The index carries the versions of the tree it was split from.
+    if (index.get(_LOOKUP_LAYOUT_VERSION) != VERSION or
+        not cli_tree._IsUpToDate(  # pylint: disable=protected-access
+            index, index_path, ignore_errors=True, verbose=False) or
+        os.path.getsize(tree_path) != index[_LOOKUP_TREE_SIZE]):
+      return None
+    loader = _GroupLoader(index, groups_path)
+    return loader.LoadGroup(0)
+  except (cli_tree.Error, files.Error, OSError, ValueError, KeyError):
+    return None
+
+
+class LazyGroup(dict):
+  """A command group node that loads itself on first use.
+
+  The node starts with the stub keys of the group. Looking up, testing for or
+  iterating over any other key loads the rest of the group.
+  """
+
+  def __init__(self, stub, load):
+    super(LazyGroup, self).__init__(stub)
+    self._load = load
+
+  @property
+  def loaded(self):
+    return self._load is None
+
+  def _Load(self):
+    load = self._load
+    if load:
+      self._load = None
+      self.update(load())
+
+  def __missing__(self, key):
+    if self._load:
+      self._Load()
+      return self[key]
+    raise KeyError(key)
+
+  def __contains__(self, key):
+    if self._load and not super(LazyGroup, self).__contains__(key):
+      self._Load()
+    return super(LazyGroup, self).__contains__(key)
+
+  def get(self, key, default=None):
+    if self._load and not super(LazyGroup, self).__contains__(key):
+      self._Load()
+    return super(LazyGroup, self).get(key, default)
+
+  def __iter__(self):
+    self._Load()
+    return super(LazyGroup, self).__iter__()
+
+  def __len__(self):
+    self._Load()
+    return super(LazyGroup, self).__len__()
+
+  def keys(self):
+    self._Load()
+    return super(LazyGroup, self).keys()
+
+  def values(self):
+    self._Load()
+    return super(LazyGroup, self).values()
+
+  def items(self):
+    self._Load()
+    return super(LazyGroup, self).items()
+
+  def copy(self):
+    self._Load()
+    return dict(self)
+
+
+class _FlagReader(object):
+  """Reads the serialized flag list by index, for cli_tree._DeserializeCommand.
+
+  Flags are cached by the loader so that the commands of all loaded groups
+  share one dict per distinct flag, as they do in a deserialized tree.
+  """
+
+  def __init__(self, loader, f):
+    self._loader = loader
+    self._f = f
+
+  def __getitem__(self, index):
+    flags = self._loader.flags
+    flag = flags.get(index)
+    if flag is None:
+      flag = flags[index] = _ReadLine(
+          self._f, self._loader.flag_offsets[index])
+    return flag
+
+
+def _ReadLine(f, offset):
+  f.seek(offset)
+  return json.loads(f.readline().decode('utf-8'))
+
+
+class _GroupLoader(object):
+  """Loads the command groups of a lazy layout."""
+
+  def __init__(self, index, groups_path):
+    self.flag_offsets = index[_LOOKUP_FLAG_OFFSETS]
+    self.flags = {}
+    self._group_offsets = index[_LOOKUP_GROUP_OFFSETS]
+    self._groups_size = index[_LOOKUP_GROUPS_SIZE]
+    self._groups_path = groups_path
+
+  def LoadGroup(self, group_id):
+    """Reads and deserializes one command group.
+
+    Args:
+      group_id: int, The group id, 0 for the tree root.
+
+    Raises:
+      cli_tree.CliTreeLoadError: If the groups file changed since its index
+        was loaded or cannot be read.
+
+    Returns:
+      dict, The deserialized group with its commands and subgroup stubs.
+    """
+    try:
+      if os.path.getsize(self._groups_path) != self._groups_size:
+        raise cli_tree.CliTreeLoadError(
+            'CLI tree groups file [{}] changed while in use.'.format(
+                self._groups_path))
+      with files.BinaryFileReader(self._groups_path) as f:
+        group = _ReadLine(f, self._group_offsets[group_id])
+        flags = _FlagReader(self, f)
+        commands = group[cli_tree.LOOKUP_COMMANDS]
+        for name, command in six.iteritems(commands):
+          subgroup_id = command.pop(_LOOKUP_GROUP_ID, None)
+          if subgroup_id is None:
+            cli_tree._DeserializeCommand(command, flags)  # pylint: disable=protected-access
+          else:
+            commands[name] = LazyGroup(
+                command, functools.partial(self._LoadSubgroup, subgroup_id))
+        cli_tree._DeserializeCommand(group, flags)  # pylint: disable=protected-access
+    except (files.Error, OSError, ValueError, IndexError) as e:
+      raise cli_tree.CliTreeLoadError(six.text_type(e))
+    return group
+
+  def _LoadSubgroup(self, group_id):
+    """Returns the subgroup keys that are not in its stub."""
+    try:
+      group = self.LoadGroup(group_id)
+    except cli_tree.CliTreeLoadError as e:
+      # The tree was regenerated under a running session. The group is left
+      # empty rather than failing the completion or help it was loaded for.
+      from googlecloudsdk.core import log
+
+      log.debug('CLI tree group not loaded: %s', e)
+      group = cli_tree.Node()
+      group[cli_tree.LOOKUP_CONSTRAINTS] = {cli_tree.LOOKUP_ARGUMENTS: []}
+    for key in _STUB_KEYS:
+      group.pop(key, None)
+    return group
@@ -24,10 +24,20 @@ import re
 from googlecloudsdk.calliope import base
 from googlecloudsdk.calliope import command_release_tracks
 from googlecloudsdk.core import exceptions
+from googlecloudsdk.core import properties
+from googlecloudsdk.core.util import lazy_module
 from googlecloudsdk.core.util import pkg_resources
 from ruamel import yaml
 import six
 
+# Modules that command modules import at module scope but mostly use in Run.
+# They are imported lazily when a command module is loaded, so building the
+# parser or showing help does not pay for them.
+_LAZY_IMPORT_PREFIXES = (
+    'googlecloudsdk.api_lib.',
+    'googlecloudsdk.generated_clients.',
+)
+
 PARTIALS_ATTRIBUTE = '_PARTIALS_'
 PARTIALS_DIR = '_partials'
 
@@ -598,13 +608,26 @@ def _GetModuleFromPath(impl_file, path, construction_id):
   name_to_give = '__calliope__command__.{construction_id}.{name}'.format(
       construction_id=construction_id, name='.'.join(path).replace('-', '_')
   )
+  command = '.'.join(path)
+
+  def _WrapLazyImportError(e):
+    # A module imported lazily fails when it is first used, usually in Run,
+    # and is reported as if it failed when the command was loaded.
+    if isinstance(e, CommandLoadFailure):
+      return e
+    return CommandLoadFailure(command, e)
+
   try:
+    if properties.VALUES.core.lazy_command_imports.GetBool():
+      with lazy_module.LazyImports(
+          _LAZY_IMPORT_PREFIXES, wrap_error=_WrapLazyImportError):
+        return pkg_resources.GetModuleFromPath(name_to_give, impl_file)
     return pkg_resources.GetModuleFromPath(name_to_give, impl_file)
   # pylint:disable=broad-except, We really do want to catch everything here,
   # because if any exceptions make it through for any single command or group
   # file, the whole CLI will not work. Instead, just log whatever it is.
   except Exception as e:
-    exceptions.reraise(CommandLoadFailure('.'.join(path), e))
+    exceptions.reraise(CommandLoadFailure(command, e))
 
 
 def _ImplementationsFromModule(mod_file, module_attributes, is_command):
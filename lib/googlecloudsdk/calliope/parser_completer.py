@@ -30,15 +30,19 @@ class ArgumentCompleter(object):
     _argument: The argparse argument object.
     _completer_class: The uninstantiated completer class.
     _parsed_args: argparse parsed_args, used here if not known at __call__ time.
+    _refresh_in_background: Refresh expired resource cache tables in forked
+      processes, completing from their stale rows meanwhile, if True.
   """
 
-  def __init__(self, completer_class, parsed_args=None, argument=None):
+  def __init__(self, completer_class, parsed_args=None, argument=None,
+               refresh_in_background=False):
     # pylint: disable=g-import-not-at-top
     from googlecloudsdk.core.console import progress_tracker
     # pylint: enable=g-import-not-at-top
     self._completer_class = completer_class
     self._argument = argument
     self._parsed_args = parsed_args
+    self._refresh_in_background = refresh_in_background
     if '_ARGCOMPLETE' in os.environ:
       # This progress tracker lets long completions run in a separate process.
       # That can only happen when calliope is in argcomplete mode.
@@ -97,7 +101,8 @@ class ArgumentCompleter(object):
     if not parsed_args:
       parsed_args = self._parsed_args
     with self._progress_tracker():
-      with resource_cache.ResourceCache() as cache:
+      with resource_cache.ResourceCache(
+          refresh_in_background=self._refresh_in_background) as cache:
         return self._CompleteFromCompleterClass(
             prefix=prefix, cache=cache, parsed_args=parsed_args
         )
@@ -22,8 +22,9 @@ import os
 import random
 import re
 import string
+import tempfile
 import time
-from typing import Dict
+from typing import Dict, IO, Iterator
 
 from apitools.base.py import exceptions as http_exceptions
 from apitools.base.py import http_wrapper
@@ -40,6 +41,12 @@ from googlecloudsdk.core import transports
 from googlecloudsdk.core.util import archive
 from googlecloudsdk.core.util import files as file_utils
 
+# Source archives up to this size are kept in memory for signed URL uploads,
+# larger ones are spooled to a temporary file.
+_MAX_IN_MEMORY_ZIP_BYTES = 16 * 1024 * 1024
+
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
 # List of required files for each runtime per
 # https://cloud.google.com/functions/docs/writing#directory-structure
 # To keep things simple we don't check for file extensions, just required files.
@@ -174,6 +181,35 @@ def ValidateDirectoryHasRequiredRuntimeFiles(source: str, runtime: str) -> None:
     strategy.Validate(files_in_source_dir, runtime)
 
 
+def _WriteSourcesZip(
+    dest_zip_file: str | IO[bytes],
+    source_path: str,
+    ignore_file: str | None,
+    enforce_size_limit: bool,
+) -> None:
+  """Validates the source directory and writes it as a zip archive."""
+  _ValidateDirectoryExistsOrRaise(source_path)
+  if ignore_file and not os.path.exists(os.path.join(source_path, ignore_file)):
+    raise exceptions.IgnoreFileNotFoundError(
+        'File {0} referenced by --ignore-file does not exist.'.format(
+            ignore_file
+        )
+    )
+  if enforce_size_limit:
+    _ValidateUnpackedSourceSize(source_path, ignore_file)
+  try:
+    chooser = _GetChooser(source_path, ignore_file)
+    predicate = chooser.IsIncluded
+    archive.MakeZipFromDir(
+        dest_zip_file, source_path, predicate=predicate, parallel=True
+    )
+  except ValueError as e:
+    raise exceptions.FunctionsError(
+        'Error creating a ZIP archive with the source code '
+        'for directory {0}: {1}'.format(source_path, str(e))
+    )
+
+
 def CreateSourcesZipFile(
     zip_dir: str,
     source_path: str,
@@ -196,28 +232,46 @@ def CreateSourcesZipFile(
   Raises:
     FunctionsError
   """
-  _ValidateDirectoryExistsOrRaise(source_path)
-  if ignore_file and not os.path.exists(os.path.join(source_path, ignore_file)):
-    raise exceptions.IgnoreFileNotFoundError(
-        'File {0} referenced by --ignore-file does not exist.'.format(
-            ignore_file
-        )
-    )
-  if enforce_size_limit:
-    _ValidateUnpackedSourceSize(source_path, ignore_file)
   zip_file_name = os.path.join(zip_dir, 'fun.zip')
-  try:
-    chooser = _GetChooser(source_path, ignore_file)
-    predicate = chooser.IsIncluded
-    archive.MakeZipFromDir(zip_file_name, source_path, predicate=predicate)
-  except ValueError as e:
-    raise exceptions.FunctionsError(
-        'Error creating a ZIP archive with the source code '
-        'for directory {0}: {1}'.format(source_path, str(e))
-    )
+  _WriteSourcesZip(zip_file_name, source_path, ignore_file, enforce_size_limit)
   return zip_file_name
 
 
+def CreateSourcesZipStream(
+    source_path: str,
+    ignore_file: str | None = None,
+    enforce_size_limit=False,
+) -> IO[bytes]:
+  """Prepare zip archive with source of the function in a spooled file.
+
+  Used for uploads that send the archive as a single request body. Small
+  archives are kept in memory, larger ones are spooled to a temporary file, so
+  the archive is never held in memory as a whole.
+
+  Args:
+    source_path: str, directory containing the sources to be zipped.
+    ignore_file: custom ignore_file name. Override .gcloudignore file to
+      customize files to be skipped.
+    enforce_size_limit: if set, enforces that the unpacked source size is less
+      than or equal to 512 MB.
+
+  Returns:
+    The zip archive's file object, rewound. The caller must close it.
+  Raises:
+    FunctionsError
+  """
+  zip_stream = tempfile.SpooledTemporaryFile(
+      max_size=_MAX_IN_MEMORY_ZIP_BYTES
+  )
+  try:
+    _WriteSourcesZip(zip_stream, source_path, ignore_file, enforce_size_limit)
+  except:
+    zip_stream.close()
+    raise
+  zip_stream.seek(0)
+  return zip_stream
+
+
 def _GenerateRemoteZipFileName(function_ref: resources.Resource) -> str:
   region = function_ref.locationsId
   name = function_ref.functionsId
@@ -260,6 +314,29 @@ def _UploadFileToGeneratedUrlCheckResponse(
   return http_wrapper.CheckResponse(response)
 
 
+class _UploadBody(object):
+  """A request body that streams a seekable file in chunks.
+
+  The body is iterated from the start of the file on each send, so the request
+  can be retried. Its length is used for the Content-Length header.
+  """
+
+  def __init__(self, stream: IO[bytes]):
+    self._stream = stream
+    self.length = stream.seek(0, os.SEEK_END)
+
+  def __len__(self) -> int:
+    return self.length
+
+  def __iter__(self) -> Iterator[bytes]:
+    self._stream.seek(0)
+    while True:
+      chunk = self._stream.read(_UPLOAD_CHUNK_BYTES)
+      if not chunk:
+        return
+      yield chunk
+
+
 def UploadToGeneratedUrl(
     source_zip: str, url: str, extra_headers: Dict[str, str] | None = None
 ) -> None:
@@ -270,8 +347,29 @@ def UploadToGeneratedUrl(
     url: the signed Cloud Storage URL to upload to.
     extra_headers: extra headers to attach to the request.
   """
+  with file_utils.BinaryFileReader(source_zip) as zip_stream:
+    UploadStreamToGeneratedUrl(zip_stream, url, extra_headers=extra_headers)
+
+
+def UploadStreamToGeneratedUrl(
+    zip_stream: IO[bytes],
+    url: str,
+    extra_headers: Dict[str, str] | None = None,
+) -> None:
+  """Upload the given source ZIP archive stream to provided generated URL.
+
+  Args:
+    zip_stream: the seekable source ZIP archive, see CreateSourcesZipStream.
+    url: the signed Cloud Storage URL to upload to.
+    extra_headers: extra headers to attach to the request.
+  """
   extra_headers = extra_headers or {}
-  upload = transfer.Upload.FromFile(source_zip, mime_type='application/zip')
+  body = _UploadBody(zip_stream)
+  upload = transfer.Upload.FromStream(
+      zip_stream,
+      mime_type='application/zip',
+      total_size=body.length,
+  )
 
   def _UploadRetryFunc(retry_args: http_wrapper.ExceptionRetryArgs) -> None:
     if isinstance(retry_args.exc, http_exceptions.HttpForbiddenError):
@@ -285,22 +383,19 @@ def UploadToGeneratedUrl(
     else:
       upload.retry_func(retry_args)
 
-  try:
-    upload_request = http_wrapper.Request(
-        url,
-        http_method='PUT',
-        headers={'content-type': 'application/zip', **extra_headers},
-    )
-    upload_request.body = upload.stream.read()
-    response = http_wrapper.MakeRequest(
-        transports.GetApitoolsTransport(),
-        upload_request,
-        retry_func=_UploadRetryFunc,
-        check_response_func=_UploadFileToGeneratedUrlCheckResponse,
-        retries=upload.num_retries,
-    )
-  finally:
-    upload.stream.close()
+  upload_request = http_wrapper.Request(
+      url,
+      http_method='PUT',
+      headers={'content-type': 'application/zip', **extra_headers},
+  )
+  upload_request.body = body
+  response = http_wrapper.MakeRequest(
+      transports.GetApitoolsTransport(),
+      upload_request,
+      retry_func=_UploadRetryFunc,
+      check_response_func=_UploadFileToGeneratedUrlCheckResponse,
+      retries=upload.num_retries,
+  )
 
   if response.status_code // 100 != 2:
     raise exceptions.SourceUploadError(
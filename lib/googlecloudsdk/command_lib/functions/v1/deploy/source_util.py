@@ -110,25 +110,29 @@ def SetFunctionSourceProps(
         url=_AddDefaultBranch(source_arg)
     )
     return ['sourceRepository']
-  with file_utils.TemporaryDirectory() as tmp_dir:
-    zip_file = source_util.CreateSourcesZipFile(
-        tmp_dir,
-        source_arg,
-        ignore_file,
-        enforce_size_limit=True,
-    )
-    service = api_util.GetApiClientInstance().projects_locations_functions
-
-    if stage_bucket:
+  if stage_bucket:
+    with file_utils.TemporaryDirectory() as tmp_dir:
+      zip_file = source_util.CreateSourcesZipFile(
+          tmp_dir,
+          source_arg,
+          ignore_file,
+          enforce_size_limit=True,
+      )
       dest_object = source_util.UploadToStageBucket(
           zip_file, function_ref, stage_bucket
       )
-      function.sourceArchiveUrl = dest_object.ToUrl()
-      return ['sourceArchiveUrl']
+    function.sourceArchiveUrl = dest_object.ToUrl()
+    return ['sourceArchiveUrl']
 
+  service = api_util.GetApiClientInstance().projects_locations_functions
+  # The signed URL upload sends the archive as one request body, streamed from
+  # a spooled file.
+  with source_util.CreateSourcesZipStream(
+      source_arg, ignore_file, enforce_size_limit=True
+  ) as zip_stream:
     upload_url = _GetUploadUrl(messages, service, function_ref, kms_key)
-    source_util.UploadToGeneratedUrl(
-        zip_file,
+    source_util.UploadStreamToGeneratedUrl(
+        zip_stream,
         upload_url,
         extra_headers={
             # Magic header that needs to be specified per:
@@ -136,5 +140,5 @@ def SetFunctionSourceProps(
             'x-goog-content-length-range': '0,104857600',
         },
     )
-    function.sourceUploadUrl = upload_url
-    return ['sourceUploadUrl']
+  function.sourceUploadUrl = upload_url
+  return ['sourceUploadUrl']
@@ -239,38 +239,42 @@ def _GetSourceLocal(
     The resulting cloudfunctions_v2_messages.Source.
   """
   messages = client.MESSAGES_MODULE
-  with file_utils.TemporaryDirectory() as tmp_dir:
-    zip_file_path = source_util.CreateSourcesZipFile(
-        tmp_dir, source, args.ignore_file
-    )
-
-    if args.stage_bucket:
+  if args.stage_bucket:
+    with file_utils.TemporaryDirectory() as tmp_dir:
+      zip_file_path = source_util.CreateSourcesZipFile(
+          tmp_dir, source, args.ignore_file
+      )
       dest_object = source_util.UploadToStageBucket(
           zip_file_path, function_ref, args.stage_bucket
       )
-      return messages.Source(
-          storageSource=messages.StorageSource(
-              bucket=dest_object.bucket, object=dest_object.name
+    return messages.Source(
+        storageSource=messages.StorageSource(
+            bucket=dest_object.bucket, object=dest_object.name
+        )
+    )
+
+  # The signed URL upload sends the archive as one request body, streamed from
+  # a spooled file.
+  with source_util.CreateSourcesZipStream(
+      source, args.ignore_file
+  ) as zip_stream:
+    generate_upload_url_request = messages.GenerateUploadUrlRequest(
+        kmsKeyName=kms_key
+    )
+    try:
+      dest = client.projects_locations_functions.GenerateUploadUrl(
+          messages.CloudfunctionsProjectsLocationsFunctionsGenerateUploadUrlRequest(
+              generateUploadUrlRequest=generate_upload_url_request,
+              parent=function_ref.Parent().RelativeName(),
           )
       )
-    else:
-      generate_upload_url_request = messages.GenerateUploadUrlRequest(
-          kmsKeyName=kms_key
-      )
-      try:
-        dest = client.projects_locations_functions.GenerateUploadUrl(
-            messages.CloudfunctionsProjectsLocationsFunctionsGenerateUploadUrlRequest(
-                generateUploadUrlRequest=generate_upload_url_request,
-                parent=function_ref.Parent().RelativeName(),
-            )
-        )
-      except apitools_exceptions.HttpError as e:
-        cmek_util.ProcessException(e, kms_key)
-        raise e
+    except apitools_exceptions.HttpError as e:
+      cmek_util.ProcessException(e, kms_key)
+      raise e
 
-      source_util.UploadToGeneratedUrl(zip_file_path, dest.uploadUrl)
+    source_util.UploadStreamToGeneratedUrl(zip_stream, dest.uploadUrl)
 
-      return messages.Source(storageSource=dest.storageSource)
+  return messages.Source(storageSource=dest.storageSource)
 
 
 def _GetSource(
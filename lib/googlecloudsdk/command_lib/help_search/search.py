@@ -19,8 +19,11 @@
 from googlecloudsdk.calliope import cli_tree
 from googlecloudsdk.command_lib.help_search import lookup
 from googlecloudsdk.command_lib.help_search import rater
+from googlecloudsdk.command_lib.help_search import search_index
 from googlecloudsdk.command_lib.help_search import search_util
+from googlecloudsdk.core.util import files
 
+import six
 from six.moves import zip
 
 
@@ -34,7 +37,17 @@ def RunSearch(terms, cli):
   Returns:
     a list of json objects representing gcloud commands.
   """
+  index = search_index.Load()
+  if index:
+    return IndexSearcher(index, terms).Search()
+  # The index is written when the CLI tree is dumped, so it only needs to be
+  # written here if the tree is up to date but was dumped without one.
   parent = cli_tree.Load(cli=cli, one_time_use_ok=True)
+  if not search_index.Load():
+    try:
+      search_index.Write(parent)
+    except (cli_tree.Error, files.Error):
+      pass
   searcher = Searcher(parent, terms)
   return searcher.Search()
 
@@ -63,22 +76,27 @@ class Searcher(object):
     Returns:
       [dict], a list of the matching commands in json form.
     """
-    found_commands = self._WalkTree(self.parent, [])
+    found_commands = self._FindCommands()
     # Sorts by track, i.e. Ga -> Beta -> Alpha.
     found_commands.sort(key=lambda e: e['release'], reverse=True)
     de_duped_commands = []
-    unique_results_tracking_list = []
+    unique_results = set()
 
     for command in found_commands:
       command_path = _GetCommandPathWithoutTrackPrefix(command)
-      unique_combo = (command_path, command['results'])
-      if unique_combo not in unique_results_tracking_list:
-        unique_results_tracking_list.append(unique_combo)
+      unique_combo = (command_path,
+                      tuple(sorted(six.iteritems(command['results']))))
+      if unique_combo not in unique_results:
+        unique_results.add(unique_combo)
         de_duped_commands.append(command)
 
     self._rater.RateAll()
     return de_duped_commands
 
+  def _FindCommands(self):
+    """Returns the processed matching commands in tree walk order."""
+    return self._WalkTree(self.parent, [])
+
   def _WalkTree(self, current_parent, found_commands):
     """Recursively walks command tree, checking for matches.
 
@@ -120,6 +138,30 @@ class Searcher(object):
       return new_command
 
 
+class IndexSearcher(Searcher):
+  """Class to run help search with the help search index.
+
+  Only the commands that the index finds candidates for are read and searched,
+  so the results are the same as those of searching the CLI tree.
+  """
+
+  def __init__(self, index, terms):
+    super(IndexSearcher, self).__init__(None, terms)
+    self._index = index
+
+  def _FindCommands(self):
+    """Returns the processed matching commands in tree walk order."""
+    command_ids = set()
+    for term in self.terms:
+      command_ids.update(self._index.CommandIds(term))
+    found_commands = []
+    for command in self._index.GetCommands(sorted(command_ids)):
+      result = self._PossiblyGetResult(command)
+      if result:
+        found_commands.append(result)
+    return found_commands
+
+
 def _GetCommandPathWithoutTrackPrefix(command):
   """Helper to get the path of a command without a track prefix.
 
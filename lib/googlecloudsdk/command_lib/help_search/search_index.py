@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An inverted index of the CLI tree for help search.
+
+Searching the CLI tree with search_util.LocateTerm visits every command, so
+the whole tree has to be loaded and deserialized first. The index maps each
+lower case, whitespace separated token of the text that LocateTerm searches to
+the commands it appears in. A term can only be found in a command if each of
+its words is a substring of one of the command's tokens, so the index narrows
+a search down to the candidate commands, and only those are read and located
+with LocateTerm, which keeps the results identical to a walk of the tree.
+
+The index is written next to the CLI tree when the tree is dumped, as two
+files: the index, which is loaded by every search, and the commands file,
+which holds one JSON line per distinct flag and per command and is read by
+offset.
+"""
+
+
+import collections
+import itertools
+import json
+import os
+
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.command_lib.help_search import lookup
+from googlecloudsdk.core.util import files
+
+import six
+
+VERSION = '1'
+
+_INDEX_SUFFIX = '.help_index'
+_COMMANDS_SUFFIX = '.help_commands'
+
+_LOOKUP_COMMAND_OFFSETS = 'COMMAND_OFFSETS'
+_LOOKUP_COMMANDS_SIZE = 'COMMANDS_SIZE'
+_LOOKUP_FLAG_OFFSETS = 'FLAG_OFFSETS'
+_LOOKUP_INDEX_VERSION = 'INDEX_VERSION'
+_LOOKUP_POSTINGS = 'POSTINGS'
+
+# Command node keys that are not needed to locate terms or to list results.
+_UNINDEXED_KEYS = frozenset([lookup.COMMANDS, cli_tree.LOOKUP_CONSTRAINTS])
+
+
+def IndexPaths(tree_path=None):
+  """Returns the (index, commands file) paths for the CLI tree on tree_path.
+
+  Args:
+    tree_path: str, The CLI tree file path, the default CLI tree path if None.
+
+  Raises:
+    SdkConfigNotFoundError: If tree_path is None and the SDK config directory
+      does not exist.
+
+  Returns:
+    (str, str), The index and commands file paths.
+  """
+  if tree_path is None:
+    tree_path = cli_tree.CliTreeConfigPath()
+  base = os.path.splitext(tree_path)[0]
+  return base + _INDEX_SUFFIX, base + _COMMANDS_SUFFIX
+
+
+def _SearchedTexts(command):
+  """Yields the texts of command that search_util.LocateTerm searches."""
+  yield command[lookup.NAME]
+  yield ' '.join(command[lookup.PATH] + [lookup.NAME])
+  yield command[lookup.CAPSULE]
+  for section in six.itervalues(command[lookup.SECTIONS]):
+    yield section
+  for flag_name, flag in six.iteritems(command[lookup.FLAGS]):
+    if flag[lookup.IS_HIDDEN] or flag[lookup.IS_GLOBAL]:
+      continue
+    yield flag_name
+    hidden_choices = flag.get(lookup.ATTR, {}).get(lookup.HIDDEN_CHOICES, [])
+    yield six.text_type(
+        [c for c in flag.get(lookup.CHOICES, []) if c not in hidden_choices])
+    for sub_attribute in [lookup.DESCRIPTION, lookup.DEFAULT]:
+      yield six.text_type(flag.get(sub_attribute, ''))
+  for positional in command[lookup.POSITIONALS]:
+    yield positional[lookup.NAME]
+    yield positional[lookup.DESCRIPTION]
+  yield six.text_type([n for n, c in six.iteritems(command[lookup.COMMANDS])
+                       if not c[lookup.IS_HIDDEN]])
+
+
+def _Build(tree):
+  """Returns the postings, distinct flags and command documents of tree.
+
+  Hidden commands are not indexed since LocateTerm never finds terms in them.
+  Commands are numbered in the order the help search walks the tree.
+
+  Args:
+    tree: dict, The deserialized CLI tree.
+
+  Returns:
+    ({str: [int]}, [dict], [dict]), The ids of the commands each token appears
+    in, the distinct flags, and the command documents with their flags
+    replaced by flag ids.
+  """
+  postings = collections.defaultdict(list)
+  flags = []
+  flag_ids = {}
+  documents = []
+
+  def _FlagId(flag):
+    key = json.dumps(flag, sort_keys=True)
+    flag_id = flag_ids.get(key)
+    if flag_id is None:
+      flag_id = flag_ids[key] = len(flags)
+      flags.append(flag)
+    return flag_id
+
+  def _Visit(command):
+    if not command[lookup.IS_HIDDEN]:
+      command_id = len(documents)
+      document = {k: v for k, v in six.iteritems(command)
+                  if k not in _UNINDEXED_KEYS}
+      document[lookup.FLAGS] = {
+          name: _FlagId(flag)
+          for name, flag in six.iteritems(command[lookup.FLAGS])}
+      # Only the names of the visible subcommands are listed in results.
+      document[lookup.COMMANDS] = {
+          name: {lookup.NAME: c[lookup.NAME], lookup.IS_HIDDEN: False}
+          for name, c in six.iteritems(command[lookup.COMMANDS])
+          if not c[lookup.IS_HIDDEN]}
+      documents.append(document)
+      tokens = set()
+      for text in _SearchedTexts(command):
+        tokens.update(text.lower().split())
+      for token in tokens:
+        postings[token].append(command_id)
+    for subcommand in six.itervalues(command[lookup.COMMANDS]):
+      _Visit(subcommand)
+
+  _Visit(tree)
+  return postings, flags, documents
+
+
+def _EncodePosting(command_ids):
+  """Encodes ascending command ids as a string of comma separated deltas."""
+  return ','.join(six.text_type(command_id - previous) for previous, command_id
+                  in zip([0] + command_ids, command_ids))
+
+
+def _DecodePosting(posting):
+  """Returns the command ids encoded by _EncodePosting."""
+  return itertools.accumulate(int(delta) for delta in posting.split(','))
+
+
+def _WriteLines(f, items):
+  """Writes one JSON line per item to f and returns their offsets."""
+  offsets = []
+  for item in items:
+    offsets.append(f.tell())
+    # Keys are not sorted, LocateTerm searches the subcommands in tree order.
+    f.write(json.dumps(item).encode('utf-8') + b'\n')
+  return offsets
+
+
+def Write(tree, tree_path=None):
+  """Writes the help search index of tree.
+
+  The commands file is written before the index, and the index records its
+  size, so an index is never used with a commands file it was not written
+  with.
+
+  Args:
+    tree: dict, The deserialized CLI tree.
+    tree_path: str, The path the CLI tree was dumped to, the default CLI tree
+      path if None. The index files are written next to it.
+
+  Raises:
+    SdkConfigNotFoundError: If tree_path is None and the SDK config directory
+      does not exist.
+    files.Error: If the index files could not be written.
+  """
+  index_path, commands_path = IndexPaths(tree_path)
+  postings, flags, documents = _Build(tree)
+  with files.BinaryFileWriter(commands_path) as f:
+    flag_offsets = _WriteLines(f, flags)
+    command_offsets = _WriteLines(f, documents)
+    commands_size = f.tell()
+  index = {
+      cli_tree.LOOKUP_VERSION: tree.get(cli_tree.LOOKUP_VERSION),
+      cli_tree.LOOKUP_CLI_VERSION: tree.get(cli_tree.LOOKUP_CLI_VERSION),
+      _LOOKUP_INDEX_VERSION: VERSION,
+      _LOOKUP_COMMANDS_SIZE: commands_size,
+      _LOOKUP_FLAG_OFFSETS: flag_offsets,
+      _LOOKUP_COMMAND_OFFSETS: command_offsets,
+      _LOOKUP_POSTINGS: {token: _EncodePosting(command_ids)
+                         for token, command_ids in six.iteritems(postings)},
+  }
+  with files.FileWriter(index_path) as f:
+    json.dump(index, f)
+
+
+def Load(tree_path=None):
+  """Loads the help search index of the CLI tree on tree_path.
+
+  Args:
+    tree_path: str, The CLI tree file path, the default CLI tree path if None.
+
+  Returns:
+    The SearchIndex, or None if the index does not exist, cannot be read, or
+    is out of date.
+  """
+  try:
+    index_path, commands_path = IndexPaths(tree_path)
+    index = json.loads(files.ReadFileContents(index_path))
+    # The index carries the versions of the tree it was built from.
+    if (index.get(_LOOKUP_INDEX_VERSION) != VERSION or
+        not cli_tree._IsUpToDate(  # pylint: disable=protected-access
+            index, index_path, ignore_errors=True, verbose=False) or
+        os.path.getsize(commands_path) != index[_LOOKUP_COMMANDS_SIZE]):
+      return None
+  except (cli_tree.Error, files.Error, OSError, ValueError, KeyError):
+    return None
+  return SearchIndex(index, commands_path)
+
+
+class SearchIndex(object):
+  """A loaded help search index."""
+
+  def __init__(self, index, commands_path):
+    self._postings = index[_LOOKUP_POSTINGS]
+    self._flag_offsets = index[_LOOKUP_FLAG_OFFSETS]
+    self._command_offsets = index[_LOOKUP_COMMAND_OFFSETS]
+    self._commands_path = commands_path
+    self._flags = {}
+
+  def CommandIds(self, term):
+    """Returns the ids of the commands term may be found in, in tree order.
+
+    Args:
+      term: str, The search term.
+
+    Returns:
+      [int], A superset of the ids of the commands search_util.LocateTerm
+      finds term in.
+    """
+    words = term.lower().split()
+    if not words:
+      # Whitespace is found in nearly every command.
+      return list(range(len(self._command_offsets)))
+    command_ids = None
+    for word in words:
+      word_command_ids = set()
+      for token, posting in six.iteritems(self._postings):
+        if word in token:
+          word_command_ids.update(_DecodePosting(posting))
+      if command_ids is None:
+        command_ids = word_command_ids
+      else:
+        command_ids &= word_command_ids
+    return sorted(command_ids)
+
+  def GetCommands(self, command_ids):
+    """Reads commands from the commands file.
+
+    Args:
+      command_ids: [int], The ids of the commands to read.
+
+    Yields:
+      dict, The json representation of each command, as in the CLI tree but
+      without constraints and with only the visible subcommands, which have
+      only their names.
+    """
+    with files.BinaryFileReader(self._commands_path) as f:
+      for command_id in command_ids:
+        command = self._ReadLine(f, self._command_offsets[command_id])
+        command[lookup.FLAGS] = {
+            name: self._GetFlag(f, flag_id)
+            for name, flag_id in six.iteritems(command[lookup.FLAGS])}
+        yield command
+
+  def _GetFlag(self, f, flag_id):
+    # Most flags, --help at least, are shared by many commands.
+    flag = self._flags.get(flag_id)
+    if flag is None:
+      flag = self._flags[flag_id] = self._ReadLine(
+          f, self._flag_offsets[flag_id])
+    return flag
+
+  def _ReadLine(self, f, offset):
+    f.seek(offset)
+    return json.loads(f.readline().decode('utf-8'))
@@ -16,7 +16,6 @@
 """utils for search-help command resources."""
 
 
-import copy
 import io
 import re
 
@@ -457,7 +456,9 @@ def ProcessResult(command, results):
     A modified copy of the json command with a summary, and with the dict
         of subcommands replaced with just a list of available subcommands.
   """
-  new_command = copy.deepcopy(command)
+  # Only top level entries are replaced, so the copy shares the rest of the
+  # command instead of copying all of its help text.
+  new_command = dict(command)
   if lookup.COMMANDS in six.iterkeys(new_command):
     new_command[lookup.COMMANDS] = sorted([
         c[lookup.NAME]
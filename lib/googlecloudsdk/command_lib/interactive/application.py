@@ -28,12 +28,14 @@ from googlecloudsdk.command_lib.interactive import coshell as interactive_coshel
 from googlecloudsdk.command_lib.interactive import debug as interactive_debug
 from googlecloudsdk.command_lib.interactive import layout
 from googlecloudsdk.command_lib.interactive import parser
+from googlecloudsdk.command_lib.interactive import prefetcher
 from googlecloudsdk.command_lib.interactive import style as interactive_style
 
 from googlecloudsdk.command_lib.meta import generate_cli_trees
 
 from googlecloudsdk.core import config as core_config
 from googlecloudsdk.core import properties
+from googlecloudsdk.core.cache import resource_cache
 from googlecloudsdk.core.configurations import named_configs
 
 from prompt_toolkit import application as pt_application
@@ -49,6 +51,13 @@ from prompt_toolkit import token
 from prompt_toolkit.layout import processors as pt_layout
 
 
+# Seconds to wait on exit for each completion cache table refresh in flight.
+_BACKGROUND_REFRESH_EXIT_TIMEOUT = 5
+
+# Seconds to wait on exit for the completion cache table being prefetched.
+_PREFETCH_EXIT_TIMEOUT = 5
+
+
 class CLI(interface.CommandLineInterface):
   """Extends the prompt CLI object to include our state.
 
@@ -232,6 +241,7 @@ class Application(object):
     key_bindings: The key_bindings object holding the key binding list and
       toggle states.
     key_bindings_registry: The key bindings registry.
+    prefetcher: The resource completion prefetcher object.
   """
 
   def __init__(self, coshell=None, args=None, config=None, debug=None):
@@ -246,9 +256,9 @@ class Application(object):
     # alternative is to regenerate them before the first prompt. This could be
     # a noticeable delay for users that accrue a lot of trees. Although ignored
     # at startup, the regen will happen on demand as the individual commands
-    # are typed.
+    # are typed. The default CLI command groups are loaded as they are typed.
     self.root = generate_cli_trees.LoadAll(
-        ignore_out_of_date=True, warn_on_exceptions=True)
+        ignore_out_of_date=True, warn_on_exceptions=True, lazy=True)
 
     # Add the interactive default CLI tree nodes.
 
@@ -309,6 +319,10 @@ class Application(object):
     # The interactive completer is friends with the CLI.
     interactive_completer.cli = self.cli
 
+    # Create the resource completion prefetcher, started by Prompt().
+    self.prefetcher = prefetcher.CompletionPrefetcher(
+        completers=config.prefetch_completers, parsed_args=args)
+
     # Initialize the bindings.
     self.key_bindings.Initialize(self.cli)
     bindings_vi.LoadViBindings(self.key_bindings_registry)
@@ -342,15 +356,19 @@ class Application(object):
         style=interactive_style.GetDocumentStyle(),
     )
 
+  def _GetCurrentProjectAndAccount(self):
+    """Returns the current (project, account) tuple, None if not set."""
+    if not self.args.IsSpecified('project'):
+      named_configs.ActivePropertiesFile().Invalidate()
+    return (properties.VALUES.core.project.Get(),
+            properties.VALUES.core.account.Get())
+
   def _GetProjectAndAccount(self):
     """Returns the current (project, account) tuple."""
     if self.config.obfuscate:
       return ('me', 'myself@i')
-    if not self.args.IsSpecified('project'):
-      named_configs.ActivePropertiesFile().Invalidate()
-    project = properties.VALUES.core.project.Get() or '<NO PROJECT SET>'
-    account = properties.VALUES.core.account.Get() or '<NO ACCOUNT SET>'
-    return (project, account)
+    project, account = self._GetCurrentProjectAndAccount()
+    return (project or '<NO PROJECT SET>', account or '<NO ACCOUNT SET>')
 
   def _GetBottomStatusTokens(self, cli):
     """Returns the bottom status tokens based on the key binding state."""
@@ -379,6 +397,8 @@ class Application(object):
   def Prompt(self):
     """Prompts and returns one command line."""
     self.cli.context_was_set = not self.cli.config.context
+    # The previous command may have changed the project or account.
+    self.prefetcher.SetContext(*self._GetCurrentProjectAndAccount())
     doc = self.cli.run()
     return doc.text if doc else None
 
@@ -421,13 +441,20 @@ class Application(object):
 def main(args=None, config=None):
   """The interactive application loop."""
   coshell = interactive_coshell.Coshell()
+  app = None
   try:
-    Application(
+    app = Application(
         args=args,
         coshell=coshell,
         config=config,
         debug=interactive_debug.Debug(),
-    ).Loop()
+    )
+    app.Loop()
   finally:
     status = coshell.Close()
+    if app:
+      app.prefetcher.Stop(timeout=_PREFETCH_EXIT_TIMEOUT)
+    # Let completion cache refreshes started by the shell finish writing.
+    resource_cache.WaitForBackgroundRefreshes(
+        timeout=_BACKGROUND_REFRESH_EXIT_TIMEOUT)
   sys.exit(status)
@@ -626,9 +626,12 @@ class InteractiveCliCompleter(completion.Completer):
       self.parsed_args.__dict__ = {}
       self.parsed_args.__dict__.update(old_dict)
       self.parsed_args.__dict__.update(_NameSpaceDict(args))
+      # The interactive shell outlives TAB completions, so expired resource
+      # cache tables can be refreshed without blocking the prompt.
       completer = parser_completer.ArgumentCompleter(
           cache.completer_class,
-          parsed_args=self.parsed_args)
+          parsed_args=self.parsed_args,
+          refresh_in_background=True)
       with Spinner(self.SetSpinner):
         cache.choices = completer(prefix='')
       self.parsed_args.__dict__ = old_dict
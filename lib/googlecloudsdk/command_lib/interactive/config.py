@@ -37,6 +37,9 @@ class Config(object):
       commands if true.
     multi_column_completion_menu: Display completions as multi-column menu
       if true.
+    prefetch_completers: The list of resource completer module paths whose
+      completion cache tables are refreshed in the background for the
+      current project.
     prompt: Command prompt string.
     show_help: Show help as command args are entered if true.
     suggest: Add command line suggestions based on history if true.
@@ -56,6 +59,7 @@ class Config(object):
       manpage_generator=None,
       multi_column_completion_menu=None,
       obfuscate=None,
+      prefetch_completers=None,
       prompt=None,
       show_help=None,
       suggest=None,
@@ -112,6 +116,12 @@ class Config(object):
       obfuscate = interactive.obfuscate.GetBool()
     self.obfuscate = obfuscate
 
+    if prefetch_completers is None:
+      prefetch_completers = [
+          c for c in (interactive.prefetch_completers.Get() or '').split(',')
+          if c]
+    self.prefetch_completers = prefetch_completers
+
     if prompt is None:
       prompt = interactive.prompt.Get()
     self.prompt = six.text_type(prompt)
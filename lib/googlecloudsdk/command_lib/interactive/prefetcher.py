@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The gcloud interactive shell resource completion prefetcher.
+
+Resource completers select from resource cache tables that are filled by
+running a list command, so the first TAB on a resource arg in a project, and
+the first TAB after its table expires, waits for the list command. The
+prefetcher warms the tables of a few commonly completed collections when the
+shell enters a project context, and warms them again as they expire, so that
+TAB completion finds them up to date.
+
+The list commands update process wide state such as the properties invocation
+stack, the log verbosity and the log output stream, so they can not run next
+to the shell's own commands. A worker thread schedules the warms, and each
+warm runs in a forked process, as resource cache background refreshes do.
+"""
+
+
+import copy
+import threading
+
+from googlecloudsdk.core import log
+from googlecloudsdk.core import module_util
+from googlecloudsdk.core.cache import resource_cache
+
+import six
+
+
+def _WarmInProcess(completer_class, parsed_args, connection):
+  """Updates the table of completer_class in a forked warm process.
+
+  Args:
+    completer_class: The completer class to warm the table of.
+    parsed_args: The parsed args namespace passed to the completer.
+    connection: The connection that the table timeout is sent on, None if the
+      warm failed.
+  """
+  timeout = None
+  try:
+    with resource_cache.ResourceCache() as cache:
+      completer = completer_class(
+          cache=cache, qualified_parameter_names=set())
+      parameter_info = completer.ParameterInfo(parsed_args, None)
+      completer.Complete('', parameter_info)
+      timeout = completer.timeout
+  except (Exception, SystemExit) as e:  # pylint: disable=broad-except
+    # The completer is retried when the other tables are warmed again.
+    log.info('completion prefetch completer=%s failed: %s',
+             completer_class.__name__, six.text_type(e).rstrip())
+  connection.send(timeout)
+  connection.close()
+
+
+class CompletionPrefetcher(object):
+  """Warms the resource cache tables of completers for the current context.
+
+  Only one table is warmed at a time: the worker thread of a new context
+  starts once the worker thread of the previous context is done.
+
+  Attributes:
+    _completers: The completer module paths to prefetch.
+    _context: The (project, account) tuple being prefetched.
+    _parsed_args: The parsed args namespace passed to the completers.
+    _stop: The event that stops the worker thread of the current context.
+    _thread: The worker thread of the current context.
+  """
+
+  def __init__(self, completers, parsed_args):
+    self._completers = list(completers)
+    self._parsed_args = parsed_args
+    self._context = None
+    self._stop = None
+    self._thread = None
+
+  def SetContext(self, project, account):
+    """Starts prefetching for project and account if they changed.
+
+    The worker thread of the previous context stops after the table it is
+    warming, if any. Prefetching is not supported where the warm processes can
+    not be forked.
+
+    Args:
+      project: The current project, None if not set.
+      account: The current account, None if not set. The resource cache is
+        per account.
+
+    Returns:
+      True if prefetching was started for a new context.
+    """
+    context = (project, account)
+    if context == self._context:
+      return False
+    self._context = context
+    if self._stop:
+      self._stop.set()
+    previous = self._thread
+    if (not project or not self._completers or
+        not resource_cache._GetRefreshContext()):  # pylint: disable=protected-access
+      self._stop = None
+      # Stop still waits for the previous worker thread.
+      self._thread = previous
+      return False
+    log.info('completion prefetch project=%s', project)
+    self._stop = threading.Event()
+    # The interactive completer updates its parsed args while completing.
+    self._thread = threading.Thread(
+        target=self._Prefetch,
+        args=(self._stop, copy.copy(self._parsed_args), previous))
+    self._thread.daemon = True
+    self._thread.start()
+    return True
+
+  def Stop(self, timeout=None):
+    """Stops prefetching and waits for the worker threads.
+
+    Args:
+      timeout: The maximum number of seconds to wait for the table being
+        warmed, None to wait until it is done.
+
+    Returns:
+      True if the worker threads and warm processes are done.
+    """
+    self._context = None
+    thread = self._thread
+    if self._stop:
+      self._stop.set()
+    self._stop = self._thread = None
+    if thread:
+      thread.join(timeout)
+      return not thread.is_alive()
+    return True
+
+  def _Prefetch(self, stop, parsed_args, previous):
+    """Warms the completer tables until stop is set.
+
+    Args:
+      stop: The event that stops this worker thread.
+      parsed_args: The parsed args namespace passed to the completers.
+      previous: The worker thread of the previous context, None if there is
+        none. This thread waits for it before warming any table.
+    """
+    if previous:
+      previous.join()
+    completer_classes = []
+    for module_path in self._completers:
+      try:
+        completer_classes.append(module_util.ImportModule(module_path))
+      except module_util.ImportModuleError as e:
+        log.info('completion prefetch completer=%s not imported: %s',
+                 module_path, e)
+    while completer_classes and not stop.is_set():
+      # Warm each table again when the first one expires.
+      wait = resource_cache.DEFAULT_TIMEOUT
+      for completer_class in completer_classes:
+        if stop.is_set():
+          return
+        timeout = self._Warm(completer_class, parsed_args)
+        if timeout:
+          wait = min(wait, timeout)
+      stop.wait(wait)
+
+  def _Warm(self, completer_class, parsed_args):
+    """Updates the table of completer_class if needed, returns its timeout."""
+    context = resource_cache._GetRefreshContext()  # pylint: disable=protected-access
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_WarmInProcess, args=(completer_class, parsed_args, sender))
+    # Like the shell's own commands, a warm is not waited for at exit.
+    process.daemon = True
+    process.start()
+    sender.close()
+    with receiver:
+      try:
+        timeout = receiver.recv()
+      except EOFError:
+        # The process died before sending the timeout.
+        timeout = None
+    process.join()
+    return timeout
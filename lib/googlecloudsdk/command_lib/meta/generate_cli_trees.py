@@ -1322,16 +1322,27 @@ def UpdateCliTrees(
       if not skip_completions:
         completion_tree_path = lookup.CompletionCliTreePath(
             directory=directories[0])
+        binary_tree_path = lookup.CompletionCliTreeBinaryPath(
+            directory=directories[0])
         cli_tree_mtime = _Mtime(cli_tree_path)
         completion_tree_mtime = _Mtime(completion_tree_path)
+        tree = None
         if (force or not completion_tree_mtime or
             completion_tree_mtime < cli_tree_mtime):
           files.MakeDir(os.path.dirname(completion_tree_path))
           with files.FileWriter(completion_tree_path) as f:
-            generate_static.ListCompletionTree(cli, out=f)
+            tree = generate_static.ListCompletionTree(cli, out=f)
+          completion_tree_mtime = _Mtime(completion_tree_path)
         elif verbose:
           log.status.Print(
               '[{}] static completion CLI tree is up to date.'.format(command))
+        # Static completion ignores a binary tree older than the module, so
+        # update it whenever it is missing or stale, not only with the module.
+        # It is written last so that it is never older than the module it was
+        # generated with.
+        if tree is not None or _Mtime(binary_tree_path) < completion_tree_mtime:
+          with files.BinaryFileWriter(binary_tree_path) as f:
+            generate_static.ListCompletionTreeBinary(cli, out=f, tree=tree)
 
   if failed:
     message = 'CLI tree generation failed for [{}].'.format(
@@ -1342,7 +1353,7 @@ def UpdateCliTrees(
 
 
 def LoadAll(directory=None, ignore_out_of_date=False, root=None,
-            warn_on_exceptions=True):
+            warn_on_exceptions=True, lazy=False):
   """Loads all CLI trees in directory and adds them to tree.
 
   Args:
@@ -1350,6 +1361,7 @@ def LoadAll(directory=None, ignore_out_of_date=False, root=None,
     ignore_out_of_date: Ignore out of date trees instead of regenerating.
     root: dict, The CLI root to update. A new root is created if None.
     warn_on_exceptions: Warn on exceptions instead of raising if True.
+    lazy: Load the default CLI tree command groups on first use if True.
 
   Raises:
     CliTreeVersionError: loaded tree version mismatch
@@ -1366,7 +1378,7 @@ def LoadAll(directory=None, ignore_out_of_date=False, root=None,
   if cli_tree.DEFAULT_CLI_NAME not in root[cli_tree.LOOKUP_COMMANDS]:
     try:
       root[cli_tree.LOOKUP_COMMANDS][cli_tree.DEFAULT_CLI_NAME] = (
-          cli_tree.Load())
+          cli_tree.Load(lazy=lazy))
     except cli_tree.CliTreeLoadError:
       pass
 
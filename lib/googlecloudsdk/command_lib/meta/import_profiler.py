@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for profiling the module imports of a gcloud command."""
+
+import collections
+import os
+import re
+
+from googlecloudsdk.core import config
+from googlecloudsdk.core import execution_utils
+from googlecloudsdk.core.util import encoding
+
+# A module import, with the time spent running the module itself and the time
+# including the modules it imported, in milliseconds.
+ImportTiming = collections.namedtuple(
+    'ImportTiming', ['module', 'self_ms', 'cumulative_ms', 'children'])
+
+# A line written to stderr by python -X importtime. Nested imports are indented
+# by two spaces per level, and are written before the module importing them.
+_IMPORT_TIME_LINE_REGEX = re.compile(
+    r'^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|'
+    r' (?P<indent> *)(?P<module>\S+)\s*$')
+
+
+def ParseImportTimes(lines):
+  """Parses the output of python -X importtime into a tree of imports.
+
+  Args:
+    lines: iterable of str, The stderr lines of the Python process. Lines that
+      are not import times are ignored.
+
+  Returns:
+    [ImportTiming], The top level imports in import order.
+  """
+  pending = collections.defaultdict(list)
+  for line in lines:
+    match = _IMPORT_TIME_LINE_REGEX.match(line)
+    if not match:
+      continue
+    level = len(match.group('indent')) // 2
+    pending[level].append(ImportTiming(
+        match.group('module'),
+        int(match.group('self')) / 1000,
+        int(match.group('cumulative')) / 1000,
+        pending.pop(level + 1, [])))
+  return [timing for level in sorted(pending) for timing in pending[level]]
+
+
+def Flatten(timings, min_cumulative_ms=0, max_depth=None, depth=0):
+  """Lists the imports of a tree slowest first, indenting nested imports.
+
+  Args:
+    timings: [ImportTiming], The imports to list.
+    min_cumulative_ms: float, Imports faster than this are left out, along with
+      the imports nested in them.
+    max_depth: int, The number of levels of nested imports to list, or None
+      for all.
+    depth: int, The nesting level of timings.
+
+  Returns:
+    [dict], The module, self_ms and cumulative_ms of each import.
+  """
+  rows = []
+  for timing in sorted(timings, key=lambda t: -t.cumulative_ms):
+    if timing.cumulative_ms < min_cumulative_ms:
+      continue
+    rows.append({
+        'module': '  ' * depth + timing.module,
+        'self_ms': timing.self_ms,
+        'cumulative_ms': timing.cumulative_ms,
+    })
+    if max_depth is None or depth + 1 < max_depth:
+      rows.extend(Flatten(timing.children, min_cumulative_ms, max_depth,
+                          depth + 1))
+  return rows
+
+
+def ProfileCommand(command_args):
+  """Runs a gcloud command in a new process and times its imports.
+
+  The output of the command is discarded.
+
+  Args:
+    command_args: [str], The arguments of the command, without gcloud.
+
+  Returns:
+    (int, [ImportTiming]), The exit code of the command and its imports.
+  """
+  env = encoding.EncodeEnv(dict(os.environ, PYTHONPROFILEIMPORTTIME='1'))
+  stderr = []
+  exit_code = execution_utils.Exec(
+      execution_utils.ArgsForPythonTool(config.GcloudPath(), *command_args),
+      env=env, no_exit=True, out_func=lambda _: None, err_func=stderr.append)
+  return exit_code, ParseImportTimes(''.join(stderr).splitlines())
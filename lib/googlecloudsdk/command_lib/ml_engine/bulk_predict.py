@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utilities for online prediction on more instances than fit in a request."""
+
+import collections
+from concurrent import futures
+import contextlib
+import json
+import sys
+import threading
+import time
+
+from googlecloudsdk.api_lib.ml_engine import predict
+from googlecloudsdk.command_lib.ml_engine import predict_utilities
+from googlecloudsdk.core import exceptions as core_exceptions
+from googlecloudsdk.core import log
+from googlecloudsdk.core.credentials import requests
+from googlecloudsdk.core.util import encoding
+from googlecloudsdk.core.util import files
+from googlecloudsdk.core.util import retry
+
+from requests import exceptions as requests_exceptions
+import six
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_INSTANCES_PER_REQUEST = 100
+
+# AI Platform accepts prediction requests of up to 1.5MB. The rest of the
+# request body besides the instances is kept under the allowance.
+_MAX_BYTES_PER_REQUEST = 1500 * 1000
+_REQUEST_OVERHEAD_BYTES = 1000
+
+_RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+_MAX_RETRIES = 5
+_INITIAL_RETRY_DELAY_MS = 1000
+_MAX_RETRY_DELAY_MS = 32000
+
+_PROGRESS_INTERVAL_SECONDS = 5
+
+# Instances sent in one request, and the line number of the first of them in
+# the input, or None if the instances were not read from lines.
+_Chunk = collections.namedtuple('_Chunk', ['first_line', 'instances'])
+
+
+@contextlib.contextmanager
+def _OpenInstancesFile(path):
+  """Opens an instances file, or stdin if path is '-', for reading lines."""
+  if path == '-':
+    # Read lazily rather than with console_io.ReadFromFileOrStdin, so the
+    # input does not have to fit in memory.
+    yield getattr(sys.stdin, 'buffer', sys.stdin)
+  else:
+    with files.BinaryFileReader(path) as stream:
+      yield stream
+
+
+def ReadInstances(path, data_format):
+  """Reads newline-delimited instances one at a time.
+
+  Unlike predict_utilities.ReadInstances, the number of instances is not
+  limited and they are not all held in memory.
+
+  Args:
+    path: str, The path of the file to read, or '-' for stdin.
+    data_format: str, 'json' if each line is a JSON instance, or 'text' if
+      each line is a UTF-8 text instance.
+
+  Yields:
+    (int, instance), The line number and instance of each line.
+
+  Raises:
+    InvalidInstancesFileError: If a line is empty or not valid JSON.
+  """
+  with _OpenInstancesFile(path) as stream:
+    for line_number, line in enumerate(stream, start=1):
+      if isinstance(line, six.binary_type):
+        line = encoding.Decode(line, encoding='utf-8-sig')  # Handle UTF8-BOM
+      line = line.rstrip('\r\n')
+      if not line:
+        raise predict_utilities.InvalidInstancesFileError(
+            'Line {}: Empty line is not allowed in the instances file.'.format(
+                line_number))
+      if data_format == 'json':
+        try:
+          yield line_number, json.loads(line)
+        except ValueError:
+          raise predict_utilities.InvalidInstancesFileError(
+              'Line {}: Input instances are not in JSON format. '
+              'See "gcloud ai-platform predict --help" for details.'.format(
+                  line_number))
+      else:
+        yield line_number, line
+
+
+def Chunk(numbered_instances, instances_per_request):
+  """Groups instances into chunks that each fit in a prediction request.
+
+  Args:
+    numbered_instances: iterable of (int or None, instance), The instances and
+      their line numbers.
+    instances_per_request: int, The most instances in a chunk.
+
+  Yields:
+    _Chunk, The instances of each request, in input order.
+
+  Raises:
+    InvalidInstancesFileError: If an instance alone is too large for a
+      request.
+  """
+  first_line = None
+  instances = []
+  size = _REQUEST_OVERHEAD_BYTES
+  for line_number, instance in numbered_instances:
+    # The size of the instance in the request body, with its separator.
+    instance_size = len(json.dumps(instance).encode('utf-8')) + 2
+    if _REQUEST_OVERHEAD_BYTES + instance_size > _MAX_BYTES_PER_REQUEST:
+      raise predict_utilities.InvalidInstancesFileError(
+          'Line {}: The instance is larger than the prediction request size '
+          'limit of {} bytes.'.format(line_number, _MAX_BYTES_PER_REQUEST))
+    if size + instance_size > _MAX_BYTES_PER_REQUEST:
+      yield _Chunk(first_line, instances)
+      instances = []
+      size = _REQUEST_OVERHEAD_BYTES
+    if not instances:
+      first_line = line_number
+    instances.append(instance)
+    size += instance_size
+    if len(instances) >= instances_per_request:
+      yield _Chunk(first_line, instances)
+      instances = []
+      size = _REQUEST_OVERHEAD_BYTES
+  if instances:
+    yield _Chunk(first_line, instances)
+
+
+class BulkPredictor(object):
+  """Sends chunks of instances for prediction with several requests in flight.
+
+  Predictions are written in input order, so a slow request holds back the
+  output of the requests sent after it. At most twice as many chunks as
+  requests in flight are held in memory.
+  """
+
+  def __init__(self, model_or_version_ref, signature_name=None,
+               max_concurrent_requests=DEFAULT_MAX_CONCURRENT_REQUESTS):
+    """Initializes the predictor.
+
+    Args:
+      model_or_version_ref: Resource, The model or version to predict with.
+      signature_name: str, The name of the input/output signature in the TF
+        meta graph.
+      max_concurrent_requests: int, The most prediction requests in flight.
+    """
+    self._model_or_version_ref = model_or_version_ref
+    self._signature_name = signature_name
+    self._max_concurrent_requests = max_concurrent_requests
+    self._thread_local = threading.local()
+    self._lock = threading.Lock()
+    self._retry_count = 0
+
+  def _GetSession(self):
+    # Sessions are not shared between threads; each worker keeps its own so
+    # that requests reuse its connections.
+    session = getattr(self._thread_local, 'session', None)
+    if session is None:
+      session = requests.GetSession()
+      self._thread_local.session = session
+    return session
+
+  def _ShouldRetry(self, exc_type, exc_value, unused_traceback, unused_state):
+    if issubclass(exc_type, predict.HttpRequestFailError):
+      retryable = exc_value.status_code in _RETRYABLE_STATUS_CODES
+    else:
+      retryable = issubclass(exc_type, (requests_exceptions.ConnectionError,
+                                        requests_exceptions.Timeout))
+    if retryable:
+      with self._lock:
+        self._retry_count += 1
+    return retryable
+
+  def _SendRequest(self, chunk):
+    """Returns the predictions of a chunk. Runs in worker threads."""
+    results = predict.Predict(
+        self._model_or_version_ref, chunk.instances,
+        signature_name=self._signature_name, session=self._GetSession())
+    predictions = results.get('predictions')
+    if (not isinstance(predictions, list) or
+        len(predictions) != len(chunk.instances)):
+      raise predict.HttpRequestFailError(
+          'Prediction failed for the {} instances{}: {}'.format(
+              len(chunk.instances),
+              (' read from line {}'.format(chunk.first_line)
+               if chunk.first_line else ''),
+              results.get('error', results)))
+    return predictions
+
+  def _Predict(self, chunk):
+    retryer = retry.Retryer(
+        max_retrials=_MAX_RETRIES, exponential_sleep_multiplier=2,
+        wait_ceiling_ms=_MAX_RETRY_DELAY_MS)
+    try:
+      return retryer.RetryOnException(
+          self._SendRequest, args=(chunk,), should_retry_if=self._ShouldRetry,
+          sleep_ms=_INITIAL_RETRY_DELAY_MS)
+    except retry.MaxRetrialsException as e:
+      # Report the error of the last attempt rather than the retry state.
+      exc_info = e.last_result[1]
+      core_exceptions.reraise(exc_info[1], tb=exc_info[2])
+
+  def Predict(self, chunks, output):
+    """Predicts all chunks and writes one JSON prediction per line.
+
+    Args:
+      chunks: iterable of _Chunk, The instances to predict, from Chunk.
+      output: file-like object, Where the predictions are written.
+
+    Returns:
+      A dict summarizing the number of instances, requests and retries, and
+      the prediction rate.
+
+    Raises:
+      HttpRequestFailError: If a request failed, after retrying if the error
+        was transient. The predictions of the chunks before it are written
+        first.
+      InvalidInstancesFileError: If chunks raised it. The predictions of the
+        chunks read before the error are written first, and their number is
+        printed.
+    """
+    start_time = last_progress_time = time.time()
+    instance_count = request_count = 0
+    pending = collections.deque()
+
+    def _WriteNext():
+      predictions = pending.popleft().result()
+      for prediction in predictions:
+        output.write(json.dumps(prediction, sort_keys=True) + '\n')
+      output.flush()
+      return len(predictions)
+
+    with futures.ThreadPoolExecutor(self._max_concurrent_requests) as executor:
+      try:
+        try:
+          for chunk in chunks:
+            pending.append(executor.submit(self._Predict, chunk))
+            request_count += 1
+            if len(pending) >= 2 * self._max_concurrent_requests:
+              instance_count += _WriteNext()
+            now = time.time()
+            if now - last_progress_time >= _PROGRESS_INTERVAL_SECONDS:
+              last_progress_time = now
+              log.status.Print(
+                  'Predicted {} instances ({:.0f} instances/s).'.format(
+                      instance_count, instance_count / (now - start_time)))
+        except predict_utilities.InvalidInstancesFileError:
+          while pending:
+            instance_count += _WriteNext()
+          log.status.Print(
+              'Predicted {} instances before the invalid input.'.format(
+                  instance_count))
+          raise
+        while pending:
+          instance_count += _WriteNext()
+      finally:
+        for future in pending:
+          future.cancel()
+
+    elapsed_seconds = time.time() - start_time
+    return collections.OrderedDict([
+        ('instances', instance_count),
+        ('requests', request_count),
+        ('retries', self._retry_count),
+        ('elapsedSeconds', round(elapsed_seconds, 3)),
+        ('instancesPerSecond',
+         round(instance_count / max(elapsed_seconds, 1e-6), 1)),
+    ])
@@ -20,7 +20,9 @@ conventions of Cloud SDK do not apply here.
 
 
 import argparse
+import collections
 import json
+import multiprocessing
 import sys
 
 
@@ -134,6 +136,117 @@ def _verify_ml_libs(framework):
     sys.exit(-1)
 
 
+class _Predictor(object):
+  """A model loaded once and used to predict batches of instances."""
+
+  def __init__(self, model_dir, framework, signature_name):
+    # pylint: disable=g-import-not-at-top
+    from cloud.ml.prediction import prediction_lib
+    from cloud.ml.prediction import prediction_utils
+    # pylint: enable=g-import-not-at-top
+    framework = framework or prediction_utils.TENSORFLOW_FRAMEWORK_NAME
+    client = prediction_lib.create_client(framework, model_dir)
+    self._model = prediction_lib.create_model(client, model_dir, framework)
+    self._signature_name = signature_name
+    self._decode_base64 = None
+    if prediction_utils.should_base64_decode(
+        framework, self._model, signature_name):
+      self._decode_base64 = prediction_utils.decode_base64
+
+  def predict(self, instances):
+    if self._decode_base64:
+      instances = self._decode_base64(instances)
+    return list(
+        self._model.predict(instances, signature_name=self._signature_name))
+
+
+# The model of a worker process, loaded by the first batch sent to it.
+_worker_predictor = None
+
+
+def _predict_in_worker(predictor_args, instances):
+  """Predicts a batch of instances in a worker process."""
+  # The model is not loaded in a Pool initializer because the pool replaces
+  # workers whose initializer fails forever instead of reporting the error.
+  global _worker_predictor
+  if _worker_predictor is None:
+    _worker_predictor = _Predictor(*predictor_args)
+  return _worker_predictor.predict(instances)
+
+
+def _read_instances(lines):
+  for line in lines:
+    yield json.loads(line.rstrip('\n'))
+
+
+def _batches(instances, batch_size):
+  """Groups instances into lists of at most batch_size instances."""
+  batch = []
+  for instance in instances:
+    batch.append(instance)
+    if len(batch) == batch_size:
+      yield batch
+      batch = []
+  if batch:
+    yield batch
+
+
+def _predict_in_pool(pool, predictor_args, batches, max_pending):
+  """Predicts batches in a process pool, yielding results in input order.
+
+  At most max_pending batches are read ahead, so the instances are not all
+  read into memory before predictions are made.
+
+  Args:
+    pool: multiprocessing.Pool, The worker processes.
+    predictor_args: tuple, The arguments of _Predictor.
+    batches: iterable of lists of instances.
+    max_pending: int, The most batches sent to workers but not yet yielded.
+
+  Yields:
+    The list of predictions of each batch.
+  """
+  pending = collections.deque()
+  for batch in batches:
+    pending.append(
+        pool.apply_async(_predict_in_worker, (predictor_args, batch)))
+    if len(pending) >= max_pending:
+      yield pending.popleft().get()
+  while pending:
+    yield pending.popleft().get()
+
+
+def _write_predictions(results, output):
+  for predictions in results:
+    for prediction in predictions:
+      output.write(json.dumps(prediction) + '\n')
+    output.flush()
+
+
+def stream_predict(predictor_args, lines, output, batch_size, workers=1):
+  """Predicts newline-delimited JSON instances batch by batch.
+
+  The model is loaded once per process, and the predictions of each batch are
+  written to output as one JSON document per line as soon as they are made.
+
+  Args:
+    predictor_args: tuple, The model directory, framework and signature name.
+    lines: iterable of str, The instances, one JSON document per line.
+    output: file-like object, Where the predictions are written.
+    batch_size: int, The number of instances predicted together.
+    workers: int, The number of processes predicting batches concurrently. If
+      1, batches are predicted in this process.
+  """
+  batches = _batches(_read_instances(lines), batch_size)
+  if workers <= 1:
+    predictor = _Predictor(*predictor_args)
+    _write_predictions((predictor.predict(b) for b in batches), output)
+    return
+  with multiprocessing.Pool(workers) as pool:
+    _write_predictions(
+        _predict_in_pool(pool, predictor_args, batches, 2 * workers), output)
+
+
 def main():
   parser = argparse.ArgumentParser()
   parser.add_argument('--model-dir', required=True, help='Path of the model.')
@@ -146,6 +259,13 @@ def main():
             ' the model file name stored in the specified model-dir'))
   parser.add_argument('--signature-name', required=False,
                       help='Tensorflow signature to select input/output map.')
+  parser.add_argument(
+      '--batch-size', type=int, default=None,
+      help=('If set, instances are predicted this many at a time as they are '
+            'read, and each prediction is written on its own line.'))
+  parser.add_argument(
+      '--workers', type=int, default=1,
+      help='The number of processes predicting batches with --batch-size.')
   args, _ = parser.parse_known_args()
 
   if args.framework is None:
@@ -157,6 +277,11 @@ def main():
   if framework:
     _verify_ml_libs(framework)
 
+  if args.batch_size:
+    stream_predict((args.model_dir, framework, args.signature_name),
+                   sys.stdin, sys.stdout, args.batch_size, args.workers)
+    return
+
   # We want to do this *after* we verify ml libs so the user gets a nicer
   # error message.
   # pylint: disable=g-import-not-at-top
@@ -18,7 +18,9 @@
 import json
 import os
 import subprocess
+import threading
 
+from googlecloudsdk.command_lib.ml_engine import bulk_predict
 from googlecloudsdk.command_lib.ml_engine import local_predict
 from googlecloudsdk.command_lib.ml_engine import predict_utilities
 from googlecloudsdk.core import config
@@ -48,13 +50,9 @@ class InvalidReturnValueError(core_exceptions.Error):
   pass
 
 
-def RunPredict(model_dir, json_request=None, json_instances=None,
-               text_instances=None, framework='tensorflow',
-               signature_name=None):
-  """Run ML Engine local prediction."""
-  instances = predict_utilities.ReadInstancesFromArgs(json_request,
-                                                      json_instances,
-                                                      text_instances)
+def _StartPredictProcess(model_dir, framework, signature_name,
+                         extra_args=()):
+  """Starts local_predict in a subprocess that reads instances from stdin."""
   sdk_root = config.Paths().sdk_root
   if not sdk_root:
     raise LocalPredictEnvironmentError(
@@ -90,14 +88,25 @@ def RunPredict(model_dir, json_request=None, json_instances=None,
   predict_args = ['--model-dir', model_dir, '--framework', framework]
   if signature_name:
     predict_args += ['--signature-name', signature_name]
+  predict_args += list(extra_args)
   # Start local prediction in a subprocess.
   args = [encoding.Encode(a) for a in
           ([python_executable, local_predict.__file__] + predict_args)]
-  proc = subprocess.Popen(
+  return subprocess.Popen(
       args,
       stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
       env=env)
 
+
+def RunPredict(model_dir, json_request=None, json_instances=None,
+               text_instances=None, framework='tensorflow',
+               signature_name=None):
+  """Run ML Engine local prediction."""
+  instances = predict_utilities.ReadInstancesFromArgs(json_request,
+                                                      json_instances,
+                                                      text_instances)
+  proc = _StartPredictProcess(model_dir, framework, signature_name)
+
   # Pass the instances to the process that actually runs local prediction.
   for instance in instances:
     proc.stdin.write((json.dumps(instance) + '\n').encode('utf-8'))
@@ -115,3 +124,130 @@ def RunPredict(model_dir, json_request=None, json_instances=None,
   except ValueError:
     raise InvalidReturnValueError('The output for prediction is not '
                                   'in JSON format: ' + output)
+
+
+def _ReadInstancesLazily(json_request, json_instances, text_instances):
+  """Returns an iterator over the instances given by the prediction arguments.
+
+  Instances files are read one line at a time as the iterator is consumed. A
+  JSON request is a single document, so it is read at once.
+
+  Args:
+    json_request: str or None, see predict_utilities.ReadInstancesFromArgs.
+    json_instances: str or None, see predict_utilities.ReadInstancesFromArgs.
+    text_instances: str or None, see predict_utilities.ReadInstancesFromArgs.
+
+  Returns:
+    An iterator over the instances. It raises InvalidInstancesFileError when
+    it reaches an invalid line, or if there are no instances.
+
+  Raises:
+    InvalidInstancesFileError: If an improper combination of arguments was
+      given, or the JSON request is invalid.
+  """
+  mutex_args = [json_request, json_instances, text_instances]
+  if json_request or len({arg for arg in mutex_args if arg}) != 1:
+    return iter(predict_utilities.ReadInstancesFromArgs(
+        json_request, json_instances, text_instances))
+  if json_instances:
+    numbered_instances = bulk_predict.ReadInstances(json_instances, 'json')
+  else:
+    numbered_instances = bulk_predict.ReadInstances(text_instances, 'text')
+
+  def _Instances():
+    found = False
+    for _, instance in numbered_instances:
+      found = True
+      yield instance
+    if not found:
+      raise predict_utilities.InvalidInstancesFileError(
+          'No valid instance was found in input file.')
+
+  return _Instances()
+
+
+def StreamPredict(model_dir, json_request=None, json_instances=None,
+                  text_instances=None, framework='tensorflow',
+                  signature_name=None, batch_size=None, workers=1):
+  """Run ML Engine local prediction in batches, yielding each prediction.
+
+  The model is loaded once, and predictions are yielded as soon as the batch
+  they belong to has been predicted, instead of after all instances are.
+  Instances files are read as the subprocess consumes them, so they do not
+  have to fit in memory.
+
+  Args:
+    model_dir: str, Path to the model.
+    json_request: str or None, see predict_utilities.ReadInstancesFromArgs.
+    json_instances: str or None, see predict_utilities.ReadInstancesFromArgs.
+      Read one line at a time.
+    text_instances: str or None, see predict_utilities.ReadInstancesFromArgs.
+      Read one line at a time.
+    framework: str, The ML framework of the model.
+    signature_name: str or None, The TensorFlow signature to use.
+    batch_size: int, The number of instances predicted together.
+    workers: int, The number of processes predicting batches concurrently.
+
+  Yields:
+    The prediction of each instance, in the order of the instances.
+
+  Raises:
+    LocalPredictRuntimeError: If local prediction fails.
+    InvalidReturnValueError: If a prediction is not in JSON format.
+    InvalidInstancesFileError: If the input is invalid. The predictions of
+      the instances before an invalid line are yielded first.
+  """
+  instances = _ReadInstancesLazily(json_request, json_instances,
+                                   text_instances)
+  proc = _StartPredictProcess(
+      model_dir, framework, signature_name,
+      ['--batch-size', str(batch_size), '--workers', str(workers)])
+
+  # The instances are written and stderr is read on other threads, so that a
+  # full pipe does not block the subprocess while predictions are read here.
+  def _WriteInstances():
+    try:
+      try:
+        for instance in instances:
+          proc.stdin.write((json.dumps(instance) + '\n').encode('utf-8'))
+      except predict_utilities.InvalidInstancesFileError as e:
+        # The instances before the invalid line are still predicted.
+        read_error.append(e)
+      proc.stdin.close()
+    except (IOError, OSError):
+      # The subprocess exited early; its error is reported below.
+      pass
+
+  read_error = []
+  err = []
+  writer = threading.Thread(target=_WriteInstances)
+  # The writer may be blocked reading the instances from stdin, so it is only
+  # waited for once the subprocess read all of them.
+  writer.daemon = True
+  reader = threading.Thread(target=lambda: err.append(proc.stderr.read()))
+  writer.start()
+  reader.start()
+  read_all = False
+  try:
+    for line in proc.stdout:
+      try:
+        prediction = json.loads(encoding.Decode(line))
+      except ValueError:
+        raise InvalidReturnValueError('The output for prediction is not '
+                                      'in JSON format: ' + encoding.Decode(line))
+      yield prediction
+    read_all = True
+  finally:
+    # Stop the subprocess if the caller stopped reading predictions early.
+    if not read_all and proc.poll() is None:
+      proc.kill()
+    proc.wait()
+    reader.join()
+    proc.stdout.close()
+  if proc.returncode != 0:
+    raise LocalPredictRuntimeError(err[0])
+  writer.join()
+  if err[0]:
+    log.warning(err[0])
+  if read_error:
+    raise read_error[0]
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utilities for publishing many Cloud Pub/Sub messages from a file."""
+
+import collections
+from concurrent import futures
+import contextlib
+import json
+import sys
+import threading
+import time
+
+from apitools.base.py import exceptions as apitools_exceptions
+from googlecloudsdk.api_lib.pubsub import topics
+from googlecloudsdk.api_lib.util import exceptions as exc
+from googlecloudsdk.command_lib.pubsub import util
+from googlecloudsdk.core import log
+from googlecloudsdk.core.util import files
+from googlecloudsdk.core.util import http_encoding
+import six
+
+TEXT_FORMAT = 'text'
+JSON_FORMAT = 'json'
+
+DEFAULT_MAX_OUTSTANDING_REQUESTS = 8
+
+# Pub/Sub limits the number of messages in a publish request.
+_MAX_MESSAGES_PER_REQUEST = 1000
+# Pub/Sub limits publish requests to 10MB. The JSON API base64 encodes message
+# data, so the raw bytes in a request are kept well under 3/4 of the limit.
+_MAX_BYTES_PER_REQUEST = 7 * 1024 * 1024
+# Allowance for the encoding overhead of each message in a request.
+_MESSAGE_OVERHEAD_BYTES = 64
+
+_PROGRESS_INTERVAL_SECONDS = 1
+
+# A message to publish, its line number in the input and its estimated size.
+_InputMessage = collections.namedtuple(
+    '_InputMessage', ['line_number', 'message', 'size']
+)
+# Messages published in one request. All share the same ordering key.
+_Batch = collections.namedtuple(
+    '_Batch', ['ordering_key', 'line_numbers', 'messages']
+)
+# Outcome of publishing a batch. error is None if the batch was published.
+_BatchResult = collections.namedtuple('_BatchResult', ['batch', 'error'])
+
+
+def _GetMessageSize(message):
+  size = len(message.data or b'') + len(message.orderingKey or '')
+  if message.attributes:
+    for attribute in message.attributes.additionalProperties:
+      size += len(attribute.key) + len(attribute.value)
+  return size + _MESSAGE_OVERHEAD_BYTES
+
+
+def _ParseJsonMessage(line, line_number, messages):
+  """Parses a JSON object line into a PubsubMessage."""
+  try:
+    message_dict = json.loads(line)
+  except ValueError as e:
+    raise util.InvalidArgumentError(
+        'Line {}: invalid JSON: {}'.format(line_number, e)
+    )
+  if not isinstance(message_dict, dict):
+    raise util.InvalidArgumentError(
+        'Line {}: expected a JSON object with "data", "attributes" and'
+        ' "orderingKey" fields.'.format(line_number)
+    )
+  unknown_fields = set(message_dict) - {'data', 'attributes', 'orderingKey'}
+  if unknown_fields:
+    raise util.InvalidArgumentError(
+        'Line {}: unknown fields: {}.'.format(
+            line_number, ', '.join(sorted(unknown_fields))
+        )
+    )
+  data = message_dict.get('data')
+  if data is not None and not isinstance(data, six.string_types):
+    raise util.InvalidArgumentError(
+        'Line {}: "data" must be a string.'.format(line_number)
+    )
+  ordering_key = message_dict.get('orderingKey')
+  if ordering_key is not None and not isinstance(
+      ordering_key, six.string_types
+  ):
+    raise util.InvalidArgumentError(
+        'Line {}: "orderingKey" must be a string.'.format(line_number)
+    )
+  attributes = message_dict.get('attributes') or {}
+  if not isinstance(attributes, dict) or not all(
+      isinstance(value, six.string_types) for value in attributes.values()
+  ):
+    raise util.InvalidArgumentError(
+        'Line {}: "attributes" must be an object with string values.'.format(
+            line_number
+        )
+    )
+  return messages.PubsubMessage(
+      data=http_encoding.Encode(data) if data else None,
+      attributes=messages.PubsubMessage.AttributesValue(
+          additionalProperties=util.ParseAttributes(attributes, messages)
+      ),
+      orderingKey=ordering_key,
+  )
+
+
+@contextlib.contextmanager
+def OpenMessagesFile(path):
+  """Opens a messages file, or stdin if path is '-', for reading lines."""
+  if path == '-':
+    # Read lazily rather than with console_io.ReadStdin, so publishing starts
+    # before the producer finishes writing.
+    yield sys.stdin
+  else:
+    with files.FileReader(path) as stream:
+      yield stream
+
+
+def ReadMessages(stream, message_format, messages):
+  """Reads newline-delimited messages to publish.
+
+  Args:
+    stream (file): Text stream to read messages from.
+    message_format (str): TEXT_FORMAT if each line is the data of a message,
+      or JSON_FORMAT if each line is a JSON object with an optional "data"
+      string, "attributes" object and "orderingKey" string.
+    messages (module): Module containing pubsub proto messages.
+
+  Yields:
+    _InputMessage for each line that is not empty.
+
+  Raises:
+    InvalidArgumentError: If a line is not a valid message.
+  """
+  for line_number, line in enumerate(stream, start=1):
+    line = line.rstrip('\r\n')
+    if not line:
+      # Typically a trailing or separating blank line, not an empty message.
+      continue
+    if message_format == JSON_FORMAT:
+      message = _ParseJsonMessage(line, line_number, messages)
+    else:
+      message = messages.PubsubMessage(data=http_encoding.Encode(line))
+    if not message.data and not (
+        message.attributes and message.attributes.additionalProperties
+    ):
+      raise util.InvalidArgumentError(
+          'Line {}: You cannot send an empty message. Each message must have'
+          ' data, one or more attributes, or both.'.format(line_number)
+      )
+    yield _InputMessage(line_number, message, _GetMessageSize(message))
+
+
+class BulkPublisher(object):
+  """Publishes messages in batches with several requests in flight.
+
+  Messages are packed into requests bounded by the Pub/Sub message count and
+  size limits. Messages that share an ordering key are published in the
+  order they were read: a batch for an ordering key is only sent once the
+  previous batch for that key was published, and is failed without being sent
+  if the previous batch failed.
+  """
+
+  def __init__(
+      self,
+      topic_ref,
+      max_outstanding_requests=DEFAULT_MAX_OUTSTANDING_REQUESTS,
+  ):
+    """Initializes the publisher.
+
+    Args:
+      topic_ref (Resource): Resource reference to the Topic to publish to.
+      max_outstanding_requests (int): Maximum number of publish requests in
+        flight.
+    """
+    self._topic_ref = topic_ref
+    self._max_outstanding_requests = max_outstanding_requests
+    self._thread_local = threading.local()
+    # Ordering key to messages read but not yet sent.
+    self._pending = collections.OrderedDict()
+    self._pending_message_count = 0
+    self._pending_bytes = 0
+    self._in_flight = set()
+    # Ordering key to the future publishing its latest batch.
+    self._last_ordered_futures = {}
+    self._published_count = 0
+    self._failed_count = 0
+    self._start_time = None
+    self._last_progress_time = None
+
+  def _GetClient(self):
+    # API clients are not thread safe, so each worker thread has its own.
+    client = getattr(self._thread_local, 'client', None)
+    if client is None:
+      client = topics.TopicsClient()
+      self._thread_local.client = client
+    return client
+
+  def _PublishBatch(self, batch, previous_future):
+    """Publishes a batch. Runs in worker threads."""
+    if previous_future is not None and previous_future.result().error:
+      return _BatchResult(
+          batch,
+          'Not published because an earlier message with ordering key [{}]'
+          ' failed to publish.'.format(batch.ordering_key),
+      )
+    try:
+      self._GetClient().PublishMessages(self._topic_ref, batch.messages)
+    except apitools_exceptions.HttpError as error:
+      return _BatchResult(batch, exc.HttpException(error).message)
+    except topics.PublishOperationException as error:
+      return _BatchResult(batch, six.text_type(error))
+    return _BatchResult(batch, None)
+
+  def _ProcessResult(self, future):
+    """Records the result of a completed publish request."""
+    result = future.result()
+    ordering_key = result.batch.ordering_key
+    if self._last_ordered_futures.get(ordering_key) is future:
+      del self._last_ordered_futures[ordering_key]
+    if result.error:
+      log.error(
+          'Failed to publish {} messages read from lines {} to {}: {}'.format(
+              len(result.batch.messages),
+              result.batch.line_numbers[0],
+              result.batch.line_numbers[-1],
+              result.error,
+          )
+      )
+      self._failed_count += len(result.batch.messages)
+    else:
+      self._published_count += len(result.batch.messages)
+
+    now = time.time()
+    if now - self._last_progress_time >= _PROGRESS_INTERVAL_SECONDS:
+      self._last_progress_time = now
+      log.status.Print(
+          'Published {} messages ({:.0f} messages/s), {} failed.'.format(
+              self._published_count,
+              self._published_count / (now - self._start_time),
+              self._failed_count,
+          )
+      )
+
+  def _WaitForRequests(self, return_when):
+    done, self._in_flight = futures.wait(
+        self._in_flight, return_when=return_when
+    )
+    for future in done:
+      self._ProcessResult(future)
+
+  def _SendPending(self, executor):
+    """Sends a request for each ordering key with pending messages."""
+    for ordering_key, input_messages in self._pending.items():
+      while len(self._in_flight) >= self._max_outstanding_requests:
+        self._WaitForRequests(futures.FIRST_COMPLETED)
+      batch = _Batch(
+          ordering_key,
+          [input_message.line_number for input_message in input_messages],
+          [input_message.message for input_message in input_messages],
+      )
+      # Unordered messages are published independently.
+      previous_future = (
+          self._last_ordered_futures.get(ordering_key) if ordering_key else None
+      )
+      future = executor.submit(self._PublishBatch, batch, previous_future)
+      self._in_flight.add(future)
+      if ordering_key:
+        self._last_ordered_futures[ordering_key] = future
+    self._pending.clear()
+    self._pending_message_count = 0
+    self._pending_bytes = 0
+
+  def Publish(self, input_messages):
+    """Publishes messages.
+
+    Args:
+      input_messages (Iterable[_InputMessage]): Messages from ReadMessages.
+
+    Returns:
+      A dict summarizing the number of messages published and failed, and the
+      publish rate.
+
+    Raises:
+      InvalidArgumentError: If input_messages raised it. Requests already sent
+        are waited for first, and the error says how many messages were
+        published.
+      PublishOperationException: If any messages failed to publish.
+    """
+    self._start_time = self._last_progress_time = time.time()
+    # Workers publishing an ordered batch wait for the previous batch with the
+    # same key. That batch was submitted earlier, so it is already running.
+    with futures.ThreadPoolExecutor(self._max_outstanding_requests) as executor:
+      try:
+        for input_message in input_messages:
+          if (
+              self._pending_message_count >= _MAX_MESSAGES_PER_REQUEST
+              or self._pending_bytes + input_message.size
+              > _MAX_BYTES_PER_REQUEST
+          ):
+            self._SendPending(executor)
+          self._pending.setdefault(
+              input_message.message.orderingKey, []
+          ).append(input_message)
+          self._pending_message_count += 1
+          self._pending_bytes += input_message.size
+      except util.InvalidArgumentError as error:
+        # Messages read before the invalid line and not sent yet are dropped.
+        unsent_count = self._pending_message_count
+        self._WaitForRequests(futures.ALL_COMPLETED)
+        raise util.InvalidArgumentError(
+            '{} Stopped after publishing {} messages; {} failed and {} read'
+            ' before the error were not sent.'.format(
+                error, self._published_count, self._failed_count, unsent_count
+            )
+        )
+      self._SendPending(executor)
+      self._WaitForRequests(futures.ALL_COMPLETED)
+
+    elapsed_seconds = time.time() - self._start_time
+    summary = collections.OrderedDict([
+        ('messagesPublished', self._published_count),
+        ('messagesFailed', self._failed_count),
+        ('elapsedSeconds', round(elapsed_seconds, 3)),
+        (
+            'messagesPerSecond',
+            round(self._published_count / max(elapsed_seconds, 1e-6), 1),
+        ),
+    ])
+    if self._failed_count:
+      raise topics.PublishOperationException(
+          'Failed to publish {messagesFailed} of {total} messages.'.format(
+              total=self._failed_count + self._published_count, **summary
+          )
+      )
+    return summary
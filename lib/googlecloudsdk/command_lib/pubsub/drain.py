@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utilities for continuously pulling Cloud Pub/Sub messages to stdout."""
+
+import collections
+from concurrent import futures
+import json
+import threading
+import time
+
+from apitools.base.py import encoding
+from apitools.base.py import exceptions as apitools_exceptions
+from googlecloudsdk.api_lib.pubsub import subscriptions
+from googlecloudsdk.api_lib.util import exceptions as exc
+from googlecloudsdk.core import exceptions
+from googlecloudsdk.core import execution_utils
+from googlecloudsdk.core import log
+
+DEFAULT_CONCURRENT_PULLS = 4
+DEFAULT_MAX_OUTSTANDING_MESSAGES = 1000
+DEFAULT_MAX_OUTSTANDING_BYTES = 100 * 1024 * 1024
+
+# Pub/Sub limits the number of messages returned by a pull request.
+_MAX_MESSAGES_PER_PULL = 1000
+# Acknowledge and ModifyAckDeadline requests are limited to 512KB, so the ack
+# IDs in one request are capped well below that.
+_MAX_ACK_IDS_PER_REQUEST = 1000
+_MAX_OUTSTANDING_ACK_REQUESTS = 4
+_ACK_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Messages are assumed to expire after the minimum subscription ack deadline
+# and are extended well before that while they wait to be written.
+_MIN_ACK_DEADLINE_SECONDS = 10
+_LEASE_EXTENSION_SECONDS = 60
+_LEASE_MARGIN_SECONDS = 5
+_LEASE_CHECK_INTERVAL_SECONDS = 1
+
+_RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+_MAX_RETRY_DELAY_SECONDS = 10
+_POLL_INTERVAL_SECONDS = 1
+_PROGRESS_INTERVAL_SECONDS = 5
+
+# A message received but not yet written: its NDJSON line, the size counted
+# against the outstanding bytes and the time its lease expires.
+_OutstandingMessage = collections.namedtuple(
+    '_OutstandingMessage', ['line', 'size', 'lease_expiry']
+)
+
+
+class AcknowledgeFailedError(exceptions.Error):
+  """Indicates that written messages could not be acknowledged."""
+
+
+def _FormatMessage(received_message):
+  """Returns a received message as a JSON line without its ack ID."""
+  message_dict = encoding.MessageToPyValue(received_message)
+  message_dict.pop('ackId', None)
+  return json.dumps(message_dict, sort_keys=True) + '\n'
+
+
+class _AckBatcher(object):
+  """Sends acks and ack deadline modifications in batches from a thread.
+
+  Ack IDs are collected for up to _ACK_FLUSH_INTERVAL_SECONDS, or longer while
+  earlier requests are in flight, and sent in requests of at most
+  _MAX_ACK_IDS_PER_REQUEST IDs.
+  """
+
+  def __init__(self, subscription_ref, get_client):
+    self._subscription_ref = subscription_ref
+    self._get_client = get_client
+    self._condition = threading.Condition()
+    self._acks = []
+    # Ack deadline in seconds to the ack IDs to modify.
+    self._modifications = collections.defaultdict(list)
+    self._closed = False
+    self.failed_ack_count = 0
+    self._executor = futures.ThreadPoolExecutor(_MAX_OUTSTANDING_ACK_REQUESTS)
+    self._thread = threading.Thread(target=self._Run)
+    self._thread.daemon = True
+    self._thread.start()
+
+  def Ack(self, ack_ids):
+    with self._condition:
+      if not self._closed:
+        self._acks.extend(ack_ids)
+
+  def ModifyAckDeadline(self, ack_ids, ack_deadline):
+    with self._condition:
+      if not self._closed:
+        self._modifications[ack_deadline].extend(ack_ids)
+
+  def Close(self):
+    """Sends the pending requests and stops the batcher."""
+    with self._condition:
+      self._closed = True
+      self._condition.notify()
+    self._thread.join()
+    self._executor.shutdown()
+
+  def _Send(self, ack_ids, ack_deadline):
+    """Sends one request. Runs in the executor threads."""
+    client = self._get_client()
+    try:
+      if ack_deadline is None:
+        client.Ack(ack_ids, self._subscription_ref)
+      else:
+        client.ModifyAckDeadline(self._subscription_ref, ack_ids, ack_deadline)
+    except apitools_exceptions.HttpError as error:
+      if ack_deadline is None:
+        log.error(
+            'Failed to acknowledge {} messages: {}'.format(
+                len(ack_ids), exc.HttpException(error).message
+            )
+        )
+        with self._condition:
+          self.failed_ack_count += len(ack_ids)
+      else:
+        # The messages are redelivered once their current deadline expires.
+        log.warning(
+            'Failed to modify the ack deadline of {} messages: {}'.format(
+                len(ack_ids), exc.HttpException(error).message
+            )
+        )
+
+  def _Run(self):
+    while True:
+      with self._condition:
+        if not self._closed:
+          self._condition.wait(_ACK_FLUSH_INTERVAL_SECONDS)
+        closed = self._closed
+        acks, self._acks = self._acks, []
+        modifications, self._modifications = (
+            self._modifications,
+            collections.defaultdict(list),
+        )
+      requests = [(acks, None)] + list(
+          (ack_ids, ack_deadline)
+          for ack_deadline, ack_ids in modifications.items()
+      )
+      pending = [
+          self._executor.submit(
+              self._Send,
+              ack_ids[start:start + _MAX_ACK_IDS_PER_REQUEST],
+              ack_deadline,
+          )
+          for ack_ids, ack_deadline in requests
+          for start in range(0, len(ack_ids), _MAX_ACK_IDS_PER_REQUEST)
+      ]
+      futures.wait(pending)
+      if closed:
+        return
+
+
+class Drainer(object):
+  """Continuously pulls messages and writes them to a stream as NDJSON.
+
+  Several pull requests are kept in flight. Received messages are written in
+  the order they arrive, one JSON object per line, and acknowledged in batches
+  once written. The number and size of messages received but not yet written
+  are bounded: pull requests are only sent while there is room for their
+  messages. Messages waiting to be written have their ack deadline extended,
+  and messages left unwritten when draining stops are released for redelivery.
+  """
+
+  def __init__(
+      self,
+      subscription_ref,
+      concurrent_pulls=DEFAULT_CONCURRENT_PULLS,
+      max_outstanding_messages=DEFAULT_MAX_OUTSTANDING_MESSAGES,
+      max_outstanding_bytes=DEFAULT_MAX_OUTSTANDING_BYTES,
+  ):
+    """Initializes the drainer.
+
+    Args:
+      subscription_ref (Resource): Resource reference to the Subscription to
+        pull from.
+      concurrent_pulls (int): Number of pull requests in flight.
+      max_outstanding_messages (int): Maximum number of messages received but
+        not yet written.
+      max_outstanding_bytes (int): Maximum size of the messages received but
+        not yet written, in bytes.
+    """
+    self._subscription_ref = subscription_ref
+    self._concurrent_pulls = concurrent_pulls
+    self._max_outstanding_messages = max_outstanding_messages
+    self._max_outstanding_bytes = max_outstanding_bytes
+    self._thread_local = threading.local()
+    self._condition = threading.Condition()
+    # Ack ID to _OutstandingMessage for each message not yet written, including
+    # the messages being written.
+    self._outstanding = {}
+    self._outstanding_bytes = 0
+    # Ack IDs of the messages waiting to be written, in the order received.
+    self._ready = collections.deque()
+    # Messages requested by pull requests in flight.
+    self._reserved_message_count = 0
+    self._remaining_message_count = None
+    self._written_count = 0
+    self._last_receive_time = None
+    self._stopped = False
+    self._error = None
+    self._ack_batcher = None
+
+  def _GetClient(self):
+    # API clients are not thread safe, so each thread has its own.
+    client = getattr(self._thread_local, 'client', None)
+    if client is None:
+      client = subscriptions.SubscriptionsClient()
+      self._thread_local.client = client
+    return client
+
+  def _ReservePull(self):
+    """Waits for room for more messages and returns the number to pull."""
+    with self._condition:
+      while not self._stopped:
+        max_messages = min(
+            _MAX_MESSAGES_PER_PULL,
+            self._max_outstanding_messages
+            - len(self._outstanding)
+            - self._reserved_message_count,
+        )
+        if self._remaining_message_count is not None:
+          max_messages = min(
+              max_messages,
+              self._remaining_message_count
+              - len(self._ready)
+              - self._reserved_message_count,
+          )
+        if (
+            max_messages > 0
+            and self._outstanding_bytes < self._max_outstanding_bytes
+        ):
+          self._reserved_message_count += max_messages
+          return max_messages
+        self._condition.wait()
+      return 0
+
+  def _Pull(self):
+    """Pulls messages until stopped. Runs in the puller threads."""
+    retry_delay = 1
+    while True:
+      max_messages = self._ReservePull()
+      if not max_messages:
+        return
+      try:
+        response = self._GetClient().Pull(
+            self._subscription_ref, max_messages, return_immediately=False
+        )
+      except Exception as error:  # pylint: disable=broad-except
+        retryable = (
+            isinstance(error, apitools_exceptions.HttpError)
+            and error.status_code in _RETRYABLE_STATUS_CODES
+        )
+        with self._condition:
+          self._reserved_message_count -= max_messages
+          if not retryable:
+            # Stop draining and raise the error from Drain.
+            self._error = self._error or error
+            self._stopped = True
+          self._condition.notify_all()
+        if not retryable:
+          return
+        log.debug('Retrying pull after error: {}'.format(error))
+        time.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, _MAX_RETRY_DELAY_SECONDS)
+        continue
+      retry_delay = 1
+
+      received = [
+          (received_message.ackId, _FormatMessage(received_message))
+          for received_message in response.receivedMessages
+      ]
+      with self._condition:
+        self._reserved_message_count -= max_messages
+        if self._stopped:
+          # Release the messages so they are redelivered right away.
+          self._ack_batcher.ModifyAckDeadline(
+              [ack_id for ack_id, _ in received], 0
+          )
+        elif received:
+          lease_expiry = time.time() + _MIN_ACK_DEADLINE_SECONDS
+          for ack_id, line in received:
+            self._outstanding[ack_id] = _OutstandingMessage(
+                line, len(line), lease_expiry
+            )
+            self._outstanding_bytes += len(line)
+            self._ready.append(ack_id)
+          self._last_receive_time = time.time()
+        self._condition.notify_all()
+
+  def _ExtendLeases(self):
+    """Extends the ack deadline of messages about to expire until stopped.
+
+    Runs in its own thread, so leases are kept while writes are blocked.
+    """
+    with self._condition:
+      while not self._stopped:
+        self._condition.wait(_LEASE_CHECK_INTERVAL_SECONDS)
+        now = time.time()
+        expiring = []
+        for ack_id, message in self._outstanding.items():
+          if message.lease_expiry - now < _LEASE_MARGIN_SECONDS:
+            self._outstanding[ack_id] = message._replace(
+                lease_expiry=now + _LEASE_EXTENSION_SECONDS
+            )
+            expiring.append(ack_id)
+        if expiring:
+          self._ack_batcher.ModifyAckDeadline(
+              expiring, _LEASE_EXTENSION_SECONDS
+          )
+
+  def _TakeMessages(self, timeout):
+    """Returns the ack IDs and lines of the messages ready to be written."""
+    with self._condition:
+      if not self._ready and not self._stopped:
+        self._condition.wait(timeout)
+      count = len(self._ready)
+      if self._remaining_message_count is not None:
+        count = min(count, self._remaining_message_count)
+        self._remaining_message_count -= count
+      taken = []
+      for _ in range(count):
+        ack_id = self._ready.popleft()
+        taken.append((ack_id, self._outstanding[ack_id].line))
+      return taken
+
+  def _FinishWrite(self, ack_ids):
+    """Makes room for more messages once ack_ids were written."""
+    with self._condition:
+      for ack_id in ack_ids:
+        self._outstanding_bytes -= self._outstanding.pop(ack_id).size
+      self._written_count += len(ack_ids)
+      self._condition.notify_all()
+    # Messages are only acknowledged once written.
+    self._ack_batcher.Ack(ack_ids)
+
+  def _Stop(self):
+    """Stops pulling and releases the messages that were not written."""
+    with self._condition:
+      self._stopped = True
+      # Includes messages whose write was interrupted.
+      unwritten = list(self._outstanding)
+      self._outstanding.clear()
+      self._outstanding_bytes = 0
+      self._ready.clear()
+      self._condition.notify_all()
+    if unwritten:
+      self._ack_batcher.ModifyAckDeadline(unwritten, 0)
+
+  def Drain(self, stream, max_message_count=None, idle_timeout=None):
+    """Writes messages to stream until stopped.
+
+    Draining stops once max_message_count messages were written, once no
+    messages were received for idle_timeout seconds, or on keyboard interrupt.
+    Pull requests still in flight are not waited for; messages they return
+    are redelivered once their ack deadline expires.
+
+    Args:
+      stream (file): Text stream to write the messages to.
+      max_message_count (int): Number of messages to write, or None for no
+        limit.
+      idle_timeout (float): Seconds without receiving a message after which
+        to stop, or None to wait indefinitely.
+
+    Returns:
+      A dict with the number of messages written and the rate they were
+      written at.
+
+    Raises:
+      HttpException: If pulling messages failed with a non-retryable error.
+        Other errors raised while pulling are raised as is.
+      AcknowledgeFailedError: If any written messages were not acknowledged.
+    """
+    start_time = self._last_receive_time = time.time()
+    last_progress_time = start_time
+    self._remaining_message_count = max_message_count
+    self._ack_batcher = _AckBatcher(self._subscription_ref, self._GetClient)
+    # Daemon threads, so an in flight pull does not delay exiting.
+    threads = [threading.Thread(target=self._ExtendLeases)] + [
+        threading.Thread(target=self._Pull)
+        for _ in range(self._concurrent_pulls)
+    ]
+    for thread in threads:
+      thread.daemon = True
+      thread.start()
+
+    try:
+      # Ctrl-C stops draining instead of killing the command, so the unwritten
+      # messages are released and the written ones acknowledged.
+      with execution_utils.RaisesKeyboardInterrupt():
+        while not self._stopped and self._remaining_message_count != 0:
+          taken = self._TakeMessages(_POLL_INTERVAL_SECONDS)
+          if taken:
+            stream.write(''.join(line for _, line in taken))
+            stream.flush()
+            self._FinishWrite([ack_id for ack_id, _ in taken])
+          now = time.time()
+          if now - last_progress_time >= _PROGRESS_INTERVAL_SECONDS:
+            last_progress_time = now
+            log.status.Print(
+                'Wrote {} messages ({:.0f} messages/s).'.format(
+                    self._written_count,
+                    self._written_count / (now - start_time),
+                )
+            )
+          if (
+              idle_timeout is not None
+              and not taken
+              and now - self._last_receive_time >= idle_timeout
+          ):
+            log.status.Print(
+                'No messages received for {} seconds.'.format(idle_timeout)
+            )
+            break
+    except KeyboardInterrupt:
+      log.status.Print('Stopping.')
+    finally:
+      self._Stop()
+      self._ack_batcher.Close()
+
+    if isinstance(self._error, apitools_exceptions.HttpError):
+      raise exc.HttpException(self._error)
+    if self._error is not None:
+      raise self._error
+    if self._ack_batcher.failed_ack_count:
+      raise AcknowledgeFailedError(
+          'Failed to acknowledge {} of {} written messages. They will be'
+          ' redelivered.'.format(
+              self._ack_batcher.failed_ack_count, self._written_count
+          )
+      )
+    elapsed_seconds = time.time() - start_time
+    return collections.OrderedDict([
+        ('messagesWritten', self._written_count),
+        ('elapsedSeconds', round(elapsed_seconds, 3)),
+        (
+            'messagesPerSecond',
+            round(self._written_count / max(elapsed_seconds, 1e-6), 1),
+        ),
+    ])
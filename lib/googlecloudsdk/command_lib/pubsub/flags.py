@@ -20,6 +20,8 @@ from googlecloudsdk.api_lib.pubsub import subscriptions
 from googlecloudsdk.calliope import actions
 from googlecloudsdk.calliope import arg_parsers
 from googlecloudsdk.calliope import exceptions
+from googlecloudsdk.command_lib.pubsub import bulk_publish
+from googlecloudsdk.command_lib.pubsub import drain
 from googlecloudsdk.command_lib.pubsub import resource_args
 from googlecloudsdk.command_lib.pubsub import util
 from googlecloudsdk.core import log
@@ -68,6 +70,11 @@ BIGTABLE_EXPORT_NOT_SUPPORTED_IN_TPC = (
     'Bigtable Export Subscriptions are not available.'
 )
 
+_MESSAGE_BODY_HELP_TEXT = """\
+      The body of the message to publish to the given topic name.
+      Information on message formatting and size limits can be found at:
+      https://cloud.google.com/pubsub/docs/publisher#publish"""
+
 
 def MustSpecifyAllHelpText(config_name: str, is_update: bool):
   """The help text to tell users all fields must be specified during update."""
@@ -253,6 +260,59 @@ def AddPullFlags(
     )
 
 
+def AddDrainFlags(parser):
+  """Adds the flags for continuously pulling messages to the parser.
+
+  Args:
+    parser: The argparse parser.
+  """
+  parser.add_argument(
+      '--drain',
+      action='store_true',
+      default=False,
+      help="""\
+          Continuously pull messages with several pull requests in flight and
+          write each message to standard output as a JSON object on its own
+          line as soon as it arrives. Messages are acknowledged in batches
+          once written, so `--auto-ack` must also be specified. Runs until
+          interrupted, until `--limit` messages were written or until
+          `--idle-timeout` expires.""",
+  )
+  parser.add_argument(
+      '--concurrent-pulls',
+      type=arg_parsers.BoundedInt(lower_bound=1),
+      default=drain.DEFAULT_CONCURRENT_PULLS,
+      help='Number of pull requests in flight with `--drain`.',
+  )
+  parser.add_argument(
+      '--max-outstanding-messages',
+      type=arg_parsers.BoundedInt(lower_bound=1),
+      default=drain.DEFAULT_MAX_OUTSTANDING_MESSAGES,
+      help=(
+          'Maximum number of messages received but not yet written with'
+          ' `--drain`. No more messages are pulled until some are written.'
+      ),
+  )
+  parser.add_argument(
+      '--max-outstanding-bytes',
+      type=arg_parsers.BinarySize(),
+      default='{}MiB'.format(drain.DEFAULT_MAX_OUTSTANDING_BYTES // 2**20),
+      help=(
+          'Maximum size of the messages received but not yet written with'
+          ' `--drain`, for example `10MiB`.'
+      ),
+  )
+  parser.add_argument(
+      '--idle-timeout',
+      type=arg_parsers.Duration(),
+      help=(
+          'Stop `--drain` once no messages were received for this long, for'
+          ' example `30s`. See $ gcloud topic datetimes for information on'
+          ' duration formats. By default, runs until interrupted.'
+      ),
+  )
+
+
 def AddPushConfigFlags(
     parser, required=False, is_update=False, is_modify_push_config_request=False
 ):
@@ -993,6 +1053,20 @@ def AddSubscriptionSettingsFlags(
   )
 
 
+def _AddDeprecatedMessageBodyArg(parser):
+  parser.add_argument(
+      'message_body',
+      nargs='?',
+      default=None,
+      help=_MESSAGE_BODY_HELP_TEXT,
+      action=actions.DeprecationAction(
+          'MESSAGE_BODY',
+          show_message=lambda _: False,
+          warn=DEPRECATION_FORMAT_STR.format('MESSAGE_BODY', '--message'),
+      ),
+  )
+
+
 def AddPublishMessageFlags(parser, add_deprecated=False):
   """Adds the flags for building a PubSub message to the parser.
 
@@ -1000,23 +1074,9 @@ def AddPublishMessageFlags(parser, add_deprecated=False):
     parser: The argparse parser.
     add_deprecated: Whether or not to add the deprecated flags.
   """
-  message_help_text = """\
-      The body of the message to publish to the given topic name.
-      Information on message formatting and size limits can be found at:
-      https://cloud.google.com/pubsub/docs/publisher#publish"""
   if add_deprecated:
-    parser.add_argument(
-        'message_body',
-        nargs='?',
-        default=None,
-        help=message_help_text,
-        action=actions.DeprecationAction(
-            'MESSAGE_BODY',
-            show_message=lambda _: False,
-            warn=DEPRECATION_FORMAT_STR.format('MESSAGE_BODY', '--message'),
-        ),
-    )
-  parser.add_argument('--message', help=message_help_text)
+    _AddDeprecatedMessageBodyArg(parser)
+  parser.add_argument('--message', help=_MESSAGE_BODY_HELP_TEXT)
 
   parser.add_argument(
       '--attribute',
@@ -1040,6 +1100,54 @@ def AddPublishMessageFlags(parser, add_deprecated=False):
   )
 
 
+def AddBulkPublishFlags(parser, add_deprecated=False):
+  """Adds the flags for publishing one message or messages read from a file.
+
+  The flags building a single message are mutually exclusive with
+  `--messages-from-file`.
+
+  Args:
+    parser: The argparse parser.
+    add_deprecated: Whether or not to add the deprecated flags. The deprecated
+      positional is added outside the group, see ParseMessageBody.
+  """
+  if add_deprecated:
+    _AddDeprecatedMessageBodyArg(parser)
+  source_group = parser.add_mutually_exclusive_group()
+  AddPublishMessageFlags(source_group.add_argument_group())
+  source_group.add_argument(
+      '--messages-from-file',
+      metavar='PATH',
+      help="""\
+          Publish the newline-delimited messages in the file at PATH, or
+          standard input if PATH is `-`, instead of a single message. Messages
+          are sent in batches with several requests in flight, and messages
+          with the same ordering key are published in the order they are read.
+          Empty lines are skipped.""",
+  )
+  parser.add_argument(
+      '--messages-file-format',
+      choices={
+          bulk_publish.TEXT_FORMAT: 'Each line is the body of a message.',
+          bulk_publish.JSON_FORMAT: (
+              'Each line is a JSON object with an optional `data` string,'
+              ' `attributes` object and `orderingKey` string.'
+          ),
+      },
+      default=bulk_publish.TEXT_FORMAT,
+      help='Format of the lines in the `--messages-from-file` file.',
+  )
+  parser.add_argument(
+      '--max-outstanding-requests',
+      type=arg_parsers.BoundedInt(lower_bound=1),
+      default=bulk_publish.DEFAULT_MAX_OUTSTANDING_REQUESTS,
+      help=(
+          'Maximum number of publish requests in flight when publishing'
+          ' `--messages-from-file`.'
+      ),
+  )
+
+
 def AddSchemaSettingsFlags(parser, is_update=False):
   """Adds the flags for filling the SchemaSettings message.
 
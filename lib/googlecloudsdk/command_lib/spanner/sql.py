@@ -17,11 +17,16 @@
 
 from functools import partial
 from apitools.base.py import encoding
+from apitools.base.py import extra_types
+from googlecloudsdk.api_lib.util import apis
 from googlecloudsdk.core.resource import resource_printer
 from googlecloudsdk.core.util import text
 from sqlparse import lexer
 from sqlparse import tokens as T
 
+# Number of rows in each table when printing the results of a streamed query.
+STREAMED_RESULTS_PAGE_SIZE = 1000
+
 
 def _GetAdditionalProperty(properties, property_key, not_found_value='Unknown'):
   """Gets the value for the given key in a list of properties.
@@ -182,6 +187,20 @@ def DisplayQueryPlan(result, out):
   node_tree_root.PrettyPrint(out)
 
 
+def _GetResultsTableFormat(result):
+  """Returns the table format for the result rows of a query."""
+  # Print "(Unspecified)" for computed columns.
+  fields = [
+      field.name or '(Unspecified)'
+      for field in result.metadata.rowType.fields
+  ]
+
+  # Create the format string we pass to the table layout.
+  table_format = ','.join('row.slice({0}).join():label="{1}"'.format(i, f)
+                          for i, f in enumerate(fields))
+  return 'table({0})'.format(table_format)
+
+
 def DisplayQueryResults(result, out):
   """Prints the result rows for a query.
 
@@ -199,21 +218,133 @@ def DisplayQueryResults(result, out):
     _DisplayNumberOfRowsModified(result.stats.rowCountLowerBound, False, out)
 
   if result.metadata.rowType.fields:
-    # Print "(Unspecified)" for computed columns.
-    fields = [
-        field.name or '(Unspecified)'
-        for field in result.metadata.rowType.fields
-    ]
-
-    # Create the format string we pass to the table layout.
-    table_format = ','.join('row.slice({0}).join():label="{1}"'.format(i, f)
-                            for i, f in enumerate(fields))
     rows = [{
         'row': encoding.MessageToPyValue(row)
     } for row in result.rows]
 
     # Can't use the PrintText method because we want special formatting.
-    resource_printer.Print(rows, 'table({0})'.format(table_format), out=out)
+    resource_printer.Print(rows, _GetResultsTableFormat(result), out=out)
+
+
+def DisplayStreamedQueryResults(result, out):
+  """Prints the result rows of a streamed query as they arrive.
+
+  Rows are printed in tables of at most STREAMED_RESULTS_PAGE_SIZE rows, so
+  the rows held in memory are bounded.
+
+  Args:
+    result (StreamedResultSet): The streamed query result.
+    out: Output stream to which we print.
+  """
+  if not result.metadata.rowType.fields:
+    # Consume the stream so its stats are read.
+    for _ in result.Rows():
+      pass
+    return
+  printer = resource_printer.Printer(_GetResultsTableFormat(result), out=out)
+  for count, row in enumerate(result.Rows(), start=1):
+    printer.AddRecord({'row': row})
+    if count % STREAMED_RESULTS_PAGE_SIZE == 0:
+      printer.Page()
+  printer.Finish()
+
+
+def _MergeChunkedValue(head, tail):
+  """Merges a chunked value with the value continuing it.
+
+  Args:
+    head: The chunked value, as a Python value.
+    tail: The value continuing head in the next PartialResultSet.
+
+  Returns:
+    The merged value, following the rules in PartialResultSet.values.
+  """
+  if isinstance(head, str):
+    return head + tail
+  if isinstance(head, list):
+    if head and tail and isinstance(head[-1], (str, list, dict)):
+      return (
+          head[:-1] + [_MergeChunkedValue(head[-1], tail[0])] + tail[1:]
+      )
+    return head + tail
+  if isinstance(head, dict):
+    merged = dict(head)
+    for key, value in tail.items():
+      merged[key] = (
+          _MergeChunkedValue(merged[key], value) if key in merged else value
+      )
+    return merged
+  raise ValueError('Values of type {} cannot be chunked.'.format(type(head)))
+
+
+class StreamedResultSet(object):
+  """The result of a streaming query, read as its rows are iterated.
+
+  Attributes:
+    metadata (spanner_v1_messages.ResultSetMetadata): The metadata of the
+      result, read when the StreamedResultSet is created.
+    stats (spanner_v1_messages.ResultSetStats): The query stats, or None until
+      all rows were read.
+  """
+
+  def __init__(self, partial_result_sets):
+    """Reads the first PartialResultSet of a query.
+
+    Args:
+      partial_result_sets (Iterable[spanner_v1_messages.PartialResultSet]):
+        The stream returned by database_sessions.ExecuteStreamingSql.
+    """
+    self._partial_result_sets = iter(partial_result_sets)
+    self._first = next(self._partial_result_sets, None)
+    msgs = apis.GetMessagesModule('spanner', 'v1')
+    self.metadata = (
+        self._first and self._first.metadata
+    ) or msgs.ResultSetMetadata(rowType=msgs.StructType())
+    self.stats = None
+
+  def _IterPartialResultSets(self):
+    if self._first is not None:
+      first, self._first = self._first, None
+      yield first
+    for partial_result_set in self._partial_result_sets:
+      yield partial_result_set
+
+  def Rows(self):
+    """Yields each result row as a list of Python values.
+
+    Chunked values are merged, and only one PartialResultSet is held in memory
+    at a time. Can only be iterated once.
+    """
+    width = len(self.metadata.rowType.fields)
+    row = []
+    chunked_value = None
+    for partial_result_set in self._IterPartialResultSets():
+      if partial_result_set.stats:
+        self.stats = partial_result_set.stats
+      values = encoding.MessageToPyValue(
+          extra_types.JsonArray(entries=partial_result_set.values)
+      )
+      if chunked_value is not None and values:
+        values[0] = _MergeChunkedValue(chunked_value, values[0])
+        chunked_value = None
+      if partial_result_set.chunkedValue and values:
+        chunked_value = values.pop()
+      if not width:
+        continue
+      for value in values:
+        row.append(value)
+        if len(row) == width:
+          yield row
+          row = []
+
+  def ToResultSet(self):
+    """Reads all rows into a ResultSet message, as ExecuteSql returns."""
+    msgs = apis.GetMessagesModule('spanner', 'v1')
+    rows = [
+        encoding.PyValueToMessage(extra_types.JsonArray, row)
+        for row in self.Rows()
+    ]
+    return msgs.ResultSet(metadata=self.metadata, rows=rows, stats=self.stats)
 
 
 class Node(object):
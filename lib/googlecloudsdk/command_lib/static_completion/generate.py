@@ -19,6 +19,7 @@
 import sys
 
 from googlecloudsdk.calliope import walker
+from googlecloudsdk.command_lib.static_completion import lookup
 from googlecloudsdk.core.console import progress_tracker
 from googlecloudsdk.core.resource import resource_printer
 from googlecloudsdk.core.resource import resource_projector
@@ -194,3 +195,92 @@ def ListCompletionTree(cli, branch=None, out=None):
 STATIC_COMPLETION_CLI_TREE = ''')
   resource_printer.Print(tree, print_format='json', out=out)
   return tree
+
+
+def _EncodeFlagValue(value):
+  """Returns the (kind, encoded value) tuple for a completion tree flag value."""
+  if isinstance(value, list):
+    return (lookup.BINARY_VALUE_CHOICES,
+            lookup.BINARY_CHOICES_SEP.join(
+                str(choice) for choice in value).encode('utf-8'))
+  return lookup.BINARY_VALUE_STRING, value.encode('utf-8')
+
+
+def SerializeCompletionTreeBinary(tree):
+  """Serializes a static completion CLI tree to the compact binary format.
+
+  See the lookup module for a description of the format.
+
+  Args:
+    tree: The serialized static completion CLI tree returned by
+      GenerateCompletionTree.
+
+  Returns:
+    The binary CLI tree bytes.
+  """
+  # Lay out the nodes depth first after the header, then the string table.
+  nodes = []
+  offsets = []
+  size = lookup.BINARY_HEADER.size
+  stack = [tree]
+  while stack:
+    node = stack.pop()
+    commands = node.get(lookup.LOOKUP_COMMANDS, {})
+    flags = node.get(lookup.LOOKUP_FLAGS, {})
+    nodes.append(node)
+    offsets.append(size)
+    size += (lookup.BINARY_NODE.size +
+             len(commands) * lookup.BINARY_COMMAND_ENTRY.size +
+             len(flags) * lookup.BINARY_FLAG_ENTRY.size)
+    # Reversed so that the children are laid out in name order.
+    for name in sorted(commands, reverse=True):
+      stack.append(commands[name])
+  node_offsets = {id(node): offset for node, offset in zip(nodes, offsets)}
+
+  strings = bytearray()
+  string_offsets = {}
+
+  def _String(value):
+    """Returns the (offset, length) of value in the string table."""
+    if value not in string_offsets:
+      string_offsets[value] = size + len(strings)
+      strings.extend(value)
+    return string_offsets[value], len(value)
+
+  data = bytearray(lookup.BINARY_HEADER.pack(
+      lookup.BINARY_MAGIC, lookup.BINARY_VERSION, node_offsets[id(tree)]))
+  for node in nodes:
+    commands = node.get(lookup.LOOKUP_COMMANDS, {})
+    flags = node.get(lookup.LOOKUP_FLAGS, {})
+    data.extend(lookup.BINARY_NODE.pack(len(commands), len(flags)))
+    # Entries are sorted by their encoded name for the lookup binary search.
+    for name, child in sorted(
+        (name.encode('utf-8'), child) for name, child in commands.items()):
+      data.extend(lookup.BINARY_COMMAND_ENTRY.pack(
+          *(_String(name) + (node_offsets[id(child)],))))
+    for name, value in sorted(
+        (name.encode('utf-8'), value) for name, value in flags.items()):
+      kind, encoded_value = _EncodeFlagValue(value)
+      data.extend(lookup.BINARY_FLAG_ENTRY.pack(
+          *(_String(name) + (kind,) + _String(encoded_value))))
+  data.extend(strings)
+  return bytes(data)
+
+
+def ListCompletionTreeBinary(cli, branch=None, out=None, tree=None):
+  """Lists the static completion CLI tree in the compact binary format.
+
+  Args:
+    cli: The CLI.
+    branch: The path of the CLI subtree to generate.
+    out: The binary output stream to write to, sys.stdout.buffer by default.
+    tree: The already generated static completion CLI tree, generated from cli
+      if None.
+
+  Returns:
+    Returns the serialized static completion CLI tree.
+  """
+  if tree is None:
+    tree = GenerateCompletionTree(cli=cli, branch=branch)
+  (out or sys.stdout.buffer).write(SerializeCompletionTreeBinary(tree))
+  return tree
@@ -16,8 +16,10 @@
 """Methods for looking up completions from the static CLI tree."""
 
 
+import mmap
 import os
 import shlex
+import struct
 import sys
 from googlecloudsdk.core.util import encoding
 from googlecloudsdk.core.util import platforms
@@ -44,6 +46,31 @@ _EMPTY_STRING = ''
 _VALUE_SEP = '='
 _SPACE = ' '
 
+# The compact binary static completion CLI tree format. All integers are
+# little endian uint32 and all offsets are absolute file offsets.
+#
+#   header: MAGIC, VERSION, root node offset
+#   node:   command count, flag count,
+#           command entries sorted by name: name offset, name length,
+#             child node offset
+#           flag entries sorted by name: name offset, name length, value kind,
+#             value offset, value length
+#   string table: the UTF-8 encoded names and values
+#
+# A flag value of kind BINARY_VALUE_STRING is one of FLAG_BOOLEAN,
+# FLAG_DYNAMIC or FLAG_VALUE, kind BINARY_VALUE_CHOICES is the list of choices
+# joined by BINARY_CHOICES_SEP. A lookup only decodes the nodes on the typed
+# command path.
+BINARY_MAGIC = b'GCCT'
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct('<4sII')
+BINARY_NODE = struct.Struct('<II')
+BINARY_COMMAND_ENTRY = struct.Struct('<III')
+BINARY_FLAG_ENTRY = struct.Struct('<IIIII')
+BINARY_VALUE_STRING = 0
+BINARY_VALUE_CHOICES = 1
+BINARY_CHOICES_SEP = '\0'
+
 
 class CannotHandleCompletionError(Exception):
   """Error for when completions cannot be handled."""
@@ -235,6 +262,173 @@ def LoadCompletionCliTree():
   return tree
 
 
+def CompletionCliTreeBinaryPath(directory=None):
+  """Returns the SDK static completion binary CLI tree path."""
+  # Intentionally ignoring config path abstraction imports.
+  return os.path.join(
+      directory or _GetCompletionCliTreeDir(), 'gcloud_completions.bin')
+
+
+class _BinaryCommands(object):
+  """A lazy read-only name => _BinaryNode mapping over the binary CLI tree.
+
+  Supports the subset of the dict interface used by _FindCompletions.
+  """
+
+  def __init__(self, data, offset, count):
+    self._data = data
+    self._offset = offset
+    self._count = count
+    self._names = None
+
+  def __len__(self):
+    return self._count
+
+  def _Entry(self, index):
+    return BINARY_COMMAND_ENTRY.unpack_from(
+        self._data, self._offset + index * BINARY_COMMAND_ENTRY.size)
+
+  def _Name(self, index):
+    name_offset, name_length, _ = self._Entry(index)
+    return self._data[name_offset:name_offset + name_length]
+
+  def _Find(self, name):
+    """Returns the entry index for name by binary search, -1 if not found."""
+    key = name.encode('utf-8')
+    lo, hi = 0, self._count
+    while lo < hi:
+      mid = (lo + hi) // 2
+      if self._Name(mid) < key:
+        lo = mid + 1
+      else:
+        hi = mid
+    if lo < self._count and self._Name(lo) == key:
+      return lo
+    return -1
+
+  def __contains__(self, name):
+    return self._Find(name) >= 0
+
+  def __getitem__(self, name):
+    index = self._Find(name)
+    if index < 0:
+      raise KeyError(name)
+    return _BinaryNode(self._data, self._Entry(index)[2])
+
+  def get(self, name, default=None):
+    index = self._Find(name)
+    if index < 0:
+      return default
+    return _BinaryNode(self._data, self._Entry(index)[2])
+
+  def keys(self):
+    if self._names is None:
+      self._names = [self._Name(i).decode('utf-8') for i in range(self._count)]
+    return self._names
+
+  def __iter__(self):
+    return iter(self.keys())
+
+  def items(self):
+    return ((name, self[name]) for name in self.keys())
+
+  iteritems = items
+
+
+class _BinaryNode(object):
+  """A lazy read-only command node of the binary static completion CLI tree.
+
+  Supports the subset of the dict interface used by _FindCompletions. The
+  flags are decoded into a new dict on each access because _FindCompletions
+  updates it with the global flags.
+  """
+
+  def __init__(self, data, offset):
+    self._data = data
+    self._offset = offset
+    self._command_count, self._flag_count = BINARY_NODE.unpack_from(
+        data, offset)
+
+  def _Commands(self):
+    return _BinaryCommands(
+        self._data, self._offset + BINARY_NODE.size, self._command_count)
+
+  def _Flags(self):
+    flags = {}
+    offset = (self._offset + BINARY_NODE.size +
+              self._command_count * BINARY_COMMAND_ENTRY.size)
+    for _ in range(self._flag_count):
+      (name_offset, name_length, kind, value_offset,
+       value_length) = BINARY_FLAG_ENTRY.unpack_from(self._data, offset)
+      offset += BINARY_FLAG_ENTRY.size
+      name = self._data[name_offset:name_offset + name_length].decode('utf-8')
+      value = self._data[value_offset:value_offset + value_length].decode(
+          'utf-8')
+      if kind == BINARY_VALUE_CHOICES:
+        value = value.split(BINARY_CHOICES_SEP) if value else []
+      flags[name] = value
+    return flags
+
+  def __getitem__(self, key):
+    if key == LOOKUP_COMMANDS:
+      return self._Commands()
+    if key == LOOKUP_FLAGS:
+      return self._Flags()
+    raise KeyError(key)
+
+  def get(self, key, default=None):
+    try:
+      return self[key]
+    except KeyError:
+      return default
+
+
+def LoadCompletionCliTreeBinary(path=None):
+  """Memory maps and returns the root of the binary static completion CLI tree.
+
+  Args:
+    path: The binary CLI tree path, CompletionCliTreeBinaryPath() by default.
+
+  Raises:
+    CannotHandleCompletionError: If the binary tree is missing or invalid.
+
+  Returns:
+    The root _BinaryNode. Only the nodes that are accessed are read.
+  """
+  try:
+    with open(path or CompletionCliTreeBinaryPath(), 'rb') as f:
+      data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, root_offset = BINARY_HEADER.unpack_from(data, 0)
+  except (EnvironmentError, ValueError, struct.error):
+    raise CannotHandleCompletionError(
+        'Cannot load binary static completion CLI tree.')
+  if magic != BINARY_MAGIC or version != BINARY_VERSION:
+    raise CannotHandleCompletionError(
+        'Unsupported binary static completion CLI tree format.')
+  return _BinaryNode(data, root_offset)
+
+
+def _LoadCompletionRoot():
+  """Returns the binary static completion CLI tree if up to date."""
+  binary_path = CompletionCliTreeBinaryPath()
+  try:
+    binary_mtime = os.path.getmtime(binary_path)
+  except OSError:
+    binary_mtime = None
+  if binary_mtime is not None:
+    try:
+      module_mtime = os.path.getmtime(CompletionCliTreePath())
+    except OSError:
+      module_mtime = 0
+    # The Python module is the source of truth, ignore a stale binary tree.
+    if binary_mtime >= module_mtime:
+      try:
+        return LoadCompletionCliTreeBinary(binary_path)
+      except CannotHandleCompletionError:
+        pass
+  return LoadCompletionCliTree()
+
+
 def _OpenCompletionsOutputStream():
   """Returns the completions output stream."""
   return os.fdopen(COMPLETIONS_OUTPUT_FD, 'wb')
@@ -242,7 +436,7 @@ def _OpenCompletionsOutputStream():
 
 def _GetCompletions():
   """Returns the static completions, None if there are none."""
-  root = LoadCompletionCliTree()
+  root = _LoadCompletionRoot()
   cmd_line = _GetCmdLineFromEnv()
   return _FindCompletions(root, cmd_line)
 
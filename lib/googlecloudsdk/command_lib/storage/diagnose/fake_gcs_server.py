@@ -0,0 +1,580 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process fake of the Cloud Storage JSON API for offline benchmarks.
+
+Implements the subset of the JSON API that `gcloud storage cp`, `rsync`, `rm`
+and `ls` use against buckets with default settings: bucket and storage layout
+GETs, object GET/PATCH/DELETE, media downloads with ranges, listing with
+prefixes and delimiters, simple, multipart and resumable uploads, and batch
+calls. Objects are kept in memory. It is not a conformance fake: ACLs,
+versioning, compose, rewrite and the XML API are not implemented.
+
+Point gcloud at the fake with:
+
+  CLOUDSDK_API_ENDPOINT_OVERRIDES_STORAGE=<FakeGcsServer.endpoint>
+  CLOUDSDK_AUTH_DISABLE_CREDENTIALS=true
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import datetime
+import http.server
+import json
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+import urllib.parse
+import uuid
+
+from googlecloudsdk.core.util import hashing
+
+_BUCKET_PATH_REGEX = re.compile(r'^/storage/v1/b/(?P<bucket>[^/]+)$')
+_STORAGE_LAYOUT_PATH_REGEX = re.compile(
+    r'^/storage/v1/b/(?P<bucket>[^/]+)/storageLayout$'
+)
+_OBJECTS_PATH_REGEX = re.compile(r'^/storage/v1/b/(?P<bucket>[^/]+)/o$')
+_OBJECT_PATH_REGEX = re.compile(
+    r'^(?:/download)?/storage/v1/b/(?P<bucket>[^/]+)/o/(?P<object>.+)$'
+)
+_UPLOAD_PATH_REGEX = re.compile(
+    r'^(?:/resumable)?/upload/storage/v1/b/(?P<bucket>[^/]+)/o$'
+)
+_BATCH_PATH = '/batch/storage/v1'
+_RANGE_REGEX = re.compile(r'bytes=(?P<start>\d+)-(?P<end>\d*)')
+_CONTENT_RANGE_REGEX = re.compile(
+    r'bytes (?:(?P<start>\d+)-(?P<end>\d+)|\*)/(?P<total>\d+|\*)'
+)
+_DEFAULT_PAGE_SIZE = 1000
+
+# (status code, headers, body)
+_Response = Tuple[int, Dict[str, str], bytes]
+
+
+@dataclasses.dataclass
+class _FakeObject:
+  """An object stored by the fake."""
+
+  bucket: str
+  name: str
+  data: bytes
+  generation: int
+  metageneration: int = 1
+  content_type: str = 'application/octet-stream'
+  custom_metadata: Dict[str, str] = dataclasses.field(default_factory=dict)
+  updated: str = ''
+
+  def to_json(self, base_url: str) -> Dict[str, object]:
+    """Returns the object's JSON API metadata.
+
+    Args:
+      base_url: Scheme and host the fake is served on, used for mediaLink.
+    """
+    return {
+        'kind': 'storage#object',
+        'id': '{}/{}/{}'.format(self.bucket, self.name, self.generation),
+        'bucket': self.bucket,
+        'name': self.name,
+        'generation': str(self.generation),
+        'metageneration': str(self.metageneration),
+        'size': str(len(self.data)),
+        'contentType': self.content_type,
+        'md5Hash': base64.b64encode(
+            hashing.get_md5(self.data).digest()
+        ).decode('ascii'),
+        'storageClass': 'STANDARD',
+        'timeCreated': self.updated,
+        'updated': self.updated,
+        'etag': 'CA{}'.format(self.metageneration),
+        'metadata': self.custom_metadata or None,
+        'mediaLink': '{}/download/storage/v1/b/{}/o/{}?{}'.format(
+            base_url,
+            self.bucket,
+            urllib.parse.quote(self.name, safe=''),
+            urllib.parse.urlencode(
+                {'generation': self.generation, 'alt': 'media'}
+            ),
+        ),
+    }
+
+
+@dataclasses.dataclass
+class _ResumableUpload:
+  """State of an in-progress resumable upload."""
+
+  bucket: str
+  metadata: Dict[str, object]
+  data: bytearray = dataclasses.field(default_factory=bytearray)
+
+
+def _now() -> str:
+  return datetime.datetime.now(datetime.timezone.utc).strftime(
+      '%Y-%m-%dT%H:%M:%S.%fZ'
+  )
+
+
+def _json_response(status: int, payload: Dict[str, object]) -> _Response:
+  body = json.dumps(
+      {key: value for key, value in payload.items() if value is not None}
+  ).encode('utf-8')
+  return status, {'Content-Type': 'application/json'}, body
+
+
+def _error_response(status: int, message: str) -> _Response:
+  return _json_response(
+      status,
+      {
+          'error': {
+              'code': status,
+              'message': message,
+              'errors': [{'message': message, 'reason': 'fake'}],
+          }
+      },
+  )
+
+
+def _get_newline(data: bytes) -> bytes:
+  """Returns the line ending used by the first line of data."""
+  line, _, _ = data.partition(b'\n')
+  return b'\r\n' if line.endswith(b'\r') else b'\n'
+
+
+def _split_multipart(body: bytes, content_type: str) -> List[
+    Tuple[Dict[str, str], bytes]
+]:
+  """Splits a multipart body into (headers, payload) tuples."""
+  match = re.search(
+      r'boundary=["\']?(?P<boundary>[^"\';]+)["\']?', content_type
+  )
+  if not match:
+    return []
+  delimiter = b'--' + match.group('boundary').encode('ascii')
+  newline = _get_newline(body)
+  parts = []
+  # Payloads are binary, so only the newlines framing them are removed.
+  for raw_part in (newline + body).split(newline + delimiter)[1:]:
+    if raw_part.startswith(b'--'):
+      break
+    parts.append(_split_headers(raw_part[len(newline):], newline))
+  return parts
+
+
+def _split_headers(
+    raw: bytes, newline: bytes
+) -> Tuple[Dict[str, str], bytes]:
+  """Splits raw header lines followed by a blank line from a payload."""
+  header_block, _, payload = raw.partition(newline * 2)
+  headers = {}
+  for line in header_block.decode('utf-8').splitlines():
+    key, _, value = line.partition(':')
+    if value:
+      headers[key.strip().lower()] = value.strip()
+  return headers, payload
+
+
+class FakeGcsServer:
+  """Serves a fake Cloud Storage JSON API on a local port.
+
+  Attributes:
+    latency (float): Seconds added to each HTTP request before responding.
+    bandwidth (int|None): Bytes per second that request and response bodies
+      are throttled to. None for unlimited.
+    request_count (int): Number of HTTP requests received.
+  """
+
+  def __init__(
+      self,
+      bucket_names=('bucket',),
+      latency: float = 0.0,
+      bandwidth: Optional[int] = None,
+  ):
+    """Initializes the fake. Call start or use as a context manager to serve.
+
+    Args:
+      bucket_names (Iterable[str]): Buckets that exist in the fake.
+      latency: See class docstring.
+      bandwidth: See class docstring.
+    """
+    self.latency = latency
+    self.bandwidth = bandwidth
+    self.request_count = 0
+    self._buckets = {name: {} for name in bucket_names}
+    self._uploads = {}
+    self._next_generation = 1
+    self._lock = threading.Lock()
+    self._server = None
+    self._thread = None
+
+  @property
+  def _base_url(self) -> str:
+    return 'http://127.0.0.1:{}'.format(self._server.server_address[1])
+
+  @property
+  def endpoint(self) -> str:
+    """The value to set as the storage API endpoint override."""
+    return self._base_url + '/storage/v1/'
+
+  def start(self):
+    """Starts serving on a background thread."""
+    fake = self
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+      """Forwards requests to the fake."""
+
+      protocol_version = 'HTTP/1.1'
+
+      def log_message(self, *args):
+        del args  # Unused.
+
+      def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        headers = {key.lower(): value for key, value in self.headers.items()}
+        status, response_headers, response_body = fake.handle_request(
+            self.command, self.path, headers, body
+        )
+        self.send_response(status)
+        for key, value in response_headers.items():
+          self.send_header(key, value)
+        self.send_header('Content-Length', str(len(response_body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+          self.wfile.write(response_body)
+
+      do_DELETE = do_GET = do_HEAD = do_PATCH = do_POST = do_PUT = _handle
+
+    self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self._server.daemon_threads = True
+    self._thread = threading.Thread(target=self._server.serve_forever)
+    self._thread.daemon = True
+    self._thread.start()
+
+  def stop(self):
+    """Stops serving."""
+    if self._server:
+      self._server.shutdown()
+      self._server.server_close()
+      self._thread.join()
+      self._server = None
+
+  def __enter__(self):
+    self.start()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self.stop()
+
+  def _throttle(self, byte_count):
+    if self.bandwidth and byte_count:
+      time.sleep(byte_count / self.bandwidth)
+
+  def handle_request(
+      self, method: str, path: str, headers: Dict[str, str], body: bytes
+  ) -> _Response:
+    """Returns the response to one HTTP request, applying latency limits."""
+    with self._lock:
+      self.request_count += 1
+    if self.latency:
+      time.sleep(self.latency)
+    self._throttle(len(body))
+    response = self._dispatch(method, path, headers, body)
+    self._throttle(len(response[2]))
+    return response
+
+  def _dispatch(self, method, path, headers, body):
+    """Routes a request to its handler."""
+    parsed_url = urllib.parse.urlsplit(path)
+    query = dict(urllib.parse.parse_qsl(parsed_url.query))
+    url_path = parsed_url.path
+
+    if url_path == _BATCH_PATH and method == 'POST':
+      return self._batch(headers, body)
+
+    match = _UPLOAD_PATH_REGEX.match(url_path)
+    if match:
+      return self._upload(method, match.group('bucket'), query, headers, body)
+
+    match = _OBJECT_PATH_REGEX.match(url_path)
+    if match:
+      bucket = match.group('bucket')
+      if bucket not in self._buckets:
+        return _error_response(404, 'The specified bucket does not exist.')
+      object_name = urllib.parse.unquote(match.group('object'))
+      if method in ('GET', 'HEAD'):
+        return self._get_object(bucket, object_name, query, headers)
+      if method == 'PATCH':
+        return self._patch_object(bucket, object_name, body)
+      if method == 'DELETE':
+        return self._delete_object(bucket, object_name)
+
+    match = _OBJECTS_PATH_REGEX.match(url_path)
+    if match and method == 'GET':
+      return self._list_objects(match.group('bucket'), query)
+
+    match = _STORAGE_LAYOUT_PATH_REGEX.match(url_path)
+    if match and method == 'GET':
+      return self._get_bucket(match.group('bucket'), storage_layout=True)
+
+    match = _BUCKET_PATH_REGEX.match(url_path)
+    if match and method == 'GET':
+      return self._get_bucket(match.group('bucket'))
+
+    return _error_response(
+        404, 'Not implemented by fake: {} {}'.format(method, url_path)
+    )
+
+  def _get_bucket(self, bucket, storage_layout=False):
+    if bucket not in self._buckets:
+      return _error_response(404, 'The specified bucket does not exist.')
+    if storage_layout:
+      return _json_response(
+          200,
+          {
+              'kind': 'storage#storageLayout',
+              'bucket': bucket,
+              'location': 'US-CENTRAL1',
+              'locationType': 'region',
+          },
+      )
+    return _json_response(
+        200,
+        {
+            'kind': 'storage#bucket',
+            'id': bucket,
+            'name': bucket,
+            'location': 'US-CENTRAL1',
+            'locationType': 'region',
+            'storageClass': 'STANDARD',
+            'metageneration': '1',
+        },
+    )
+
+  def _get_object(self, bucket, object_name, query, headers):
+    fake_object = self._buckets[bucket].get(object_name)
+    if fake_object is None:
+      return _error_response(
+          404, 'No such object: {}/{}'.format(bucket, object_name)
+      )
+    if query.get('alt') != 'media':
+      return _json_response(200, fake_object.to_json(self._base_url))
+
+    data = fake_object.data
+    range_match = _RANGE_REGEX.match(headers.get('range', ''))
+    if range_match:
+      start = int(range_match.group('start'))
+      end = range_match.group('end')
+      end = int(end) if end else len(data) - 1
+      return (
+          206,
+          {
+              'Content-Type': fake_object.content_type,
+              'Content-Range': 'bytes {}-{}/{}'.format(start, end, len(data)),
+          },
+          data[start:end + 1],
+      )
+    return 200, {'Content-Type': fake_object.content_type}, data
+
+  def _patch_object(self, bucket, object_name, body):
+    with self._lock:
+      fake_object = self._buckets[bucket].get(object_name)
+      if fake_object is None:
+        return _error_response(
+            404, 'No such object: {}/{}'.format(bucket, object_name)
+        )
+      patch = json.loads(body or b'{}')
+      for key, value in (patch.get('metadata') or {}).items():
+        if value is None:
+          fake_object.custom_metadata.pop(key, None)
+        else:
+          fake_object.custom_metadata[key] = value
+      if patch.get('contentType'):
+        fake_object.content_type = patch['contentType']
+      fake_object.metageneration += 1
+      fake_object.updated = _now()
+    return _json_response(200, fake_object.to_json(self._base_url))
+
+  def _delete_object(self, bucket, object_name):
+    with self._lock:
+      if self._buckets[bucket].pop(object_name, None) is None:
+        return _error_response(
+            404, 'No such object: {}/{}'.format(bucket, object_name)
+        )
+    return 204, {}, b''
+
+  def _list_objects(self, bucket, query):
+    if bucket not in self._buckets:
+      return _error_response(404, 'The specified bucket does not exist.')
+    prefix = query.get('prefix', '')
+    delimiter = query.get('delimiter')
+    page_token = query.get('pageToken', '')
+    page_size = int(query.get('maxResults', _DEFAULT_PAGE_SIZE))
+
+    with self._lock:
+      names = sorted(self._buckets[bucket])
+    items = []
+    prefixes = []
+    last_name = next_page_token = None
+    for name in names:
+      if not name.startswith(prefix) or name <= page_token:
+        continue
+      if len(items) + len(prefixes) >= page_size:
+        next_page_token = last_name
+        break
+      last_name = name
+      if delimiter:
+        delimiter_index = name.find(delimiter, len(prefix))
+        if delimiter_index != -1:
+          name_prefix = name[:delimiter_index + len(delimiter)]
+          if not prefixes or prefixes[-1] != name_prefix:
+            prefixes.append(name_prefix)
+          # Page past the rest of the prefix's objects.
+          last_name = name_prefix + '\U0010ffff'
+          continue
+      fake_object = self._buckets[bucket].get(name)
+      if fake_object is not None:
+        items.append(fake_object.to_json(self._base_url))
+    return _json_response(
+        200,
+        {
+            'kind': 'storage#objects',
+            'items': items or None,
+            'prefixes': prefixes or None,
+            'nextPageToken': next_page_token,
+        },
+    )
+
+  def _insert_object(self, bucket, metadata, data):
+    """Stores an uploaded object and returns its metadata response."""
+    name = metadata.get('name')
+    if not name:
+      return _error_response(400, 'Object name is required.')
+    with self._lock:
+      fake_object = _FakeObject(
+          bucket=bucket,
+          name=name,
+          data=bytes(data),
+          generation=self._next_generation,
+          content_type=(
+              metadata.get('contentType') or 'application/octet-stream'
+          ),
+          custom_metadata=dict(metadata.get('metadata') or {}),
+          updated=_now(),
+      )
+      self._next_generation += 1
+      self._buckets[bucket][name] = fake_object
+    return _json_response(200, fake_object.to_json(self._base_url))
+
+  def _upload(self, method, bucket, query, headers, body):
+    """Handles simple, multipart and resumable uploads."""
+    if bucket not in self._buckets:
+      return _error_response(404, 'The specified bucket does not exist.')
+    upload_type = query.get('uploadType')
+
+    if upload_type == 'media':
+      return self._insert_object(bucket, {'name': query.get('name')}, body)
+
+    if upload_type == 'multipart':
+      parts = _split_multipart(body, headers.get('content-type', ''))
+      if len(parts) != 2:
+        return _error_response(400, 'Expected metadata and media parts.')
+      metadata = json.loads(parts[0][1] or b'{}')
+      metadata.setdefault('name', query.get('name'))
+      return self._insert_object(bucket, metadata, parts[1][1])
+
+    if upload_type == 'resumable' and 'upload_id' not in query:
+      metadata = json.loads(body or b'{}')
+      metadata.setdefault('name', query.get('name'))
+      upload_id = uuid.uuid4().hex
+      with self._lock:
+        self._uploads[upload_id] = _ResumableUpload(bucket, metadata)
+      location = 'http://{}/upload/storage/v1/b/{}/o?{}'.format(
+          headers.get('host', '127.0.0.1'),
+          bucket,
+          urllib.parse.urlencode(
+              {'uploadType': 'resumable', 'upload_id': upload_id}
+          ),
+      )
+      return 200, {'Location': location}, b''
+
+    if upload_type == 'resumable' and method == 'PUT':
+      upload = self._uploads.get(query['upload_id'])
+      if upload is None:
+        return _error_response(404, 'No such upload.')
+      range_match = _CONTENT_RANGE_REGEX.match(
+          headers.get('content-range', '')
+      )
+      total = range_match.group('total') if range_match else None
+      if range_match and range_match.group('start') is not None:
+        start = int(range_match.group('start'))
+        del upload.data[start:]
+        upload.data.extend(body)
+      elif not range_match:
+        upload.data.extend(body)
+      if total is None or (total != '*' and len(upload.data) >= int(total)):
+        with self._lock:
+          self._uploads.pop(query['upload_id'], None)
+        return self._insert_object(upload.bucket, upload.metadata, upload.data)
+      response_headers = {}
+      if upload.data:
+        response_headers['Range'] = 'bytes=0-{}'.format(len(upload.data) - 1)
+      return 308, response_headers, b''
+
+    return _error_response(
+        400, 'Unsupported upload type: {}'.format(upload_type)
+    )
+
+  def _batch(self, headers, body):
+    """Runs each request in a batch call and returns a multipart response."""
+    boundary = 'batch_' + uuid.uuid4().hex
+    response_parts = []
+    for part_headers, payload in _split_multipart(
+        body, headers.get('content-type', '')
+    ):
+      newline = _get_newline(payload)
+      request_line, _, request = payload.partition(newline)
+      method, path, _ = request_line.decode('utf-8').split(' ', 2)
+      inner_headers, inner_body = _split_headers(request, newline)
+      # Batch items share the batch call's latency.
+      status, response_headers, response_body = self._dispatch(
+          method, path, inner_headers, inner_body
+      )
+      response_headers['Content-Length'] = str(len(response_body))
+      content_id = part_headers.get('content-id', '').strip('<>')
+      response_parts.append(
+          '--{}\r\nContent-Type: application/http\r\n'
+          'Content-ID: <response-{}>\r\n\r\nHTTP/1.1 {} {}\r\n{}\r\n\r\n'
+          .format(
+              boundary,
+              content_id,
+              status,
+              http.server.BaseHTTPRequestHandler.responses.get(
+                  status, ('',)
+              )[0],
+              '\r\n'.join(
+                  '{}: {}'.format(key, value)
+                  for key, value in response_headers.items()
+              ),
+          ).encode('utf-8')
+          + response_body
+          + b'\r\n'
+      )
+    return (
+        200,
+        {'Content-Type': 'multipart/mixed; boundary={}'.format(boundary)},
+        b''.join(response_parts)
+        + '--{}--\r\n'.format(boundary).encode('utf-8'),
+    )
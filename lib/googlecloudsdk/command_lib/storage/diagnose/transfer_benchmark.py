@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Offline benchmark of gcloud storage transfer commands.
+
+Runs `gcloud storage cp`, `ls`, `rsync` and `rm` as subprocesses against a
+FakeGcsServer, so the real task graph executor, task iterators and API client
+are measured without network access or credentials. Network conditions are
+simulated with the fake's per-request latency and bandwidth limits.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from googlecloudsdk.command_lib.storage.diagnose import diagnostic
+from googlecloudsdk.command_lib.storage.diagnose import fake_gcs_server
+from googlecloudsdk.core import execution_utils
+from googlecloudsdk.core import log
+from googlecloudsdk.core.util import files as file_utils
+from googlecloudsdk.core.util import scaled_integer
+
+_BUCKET_NAME = 'benchmark-bucket'
+_BYTES_PER_GB = 1024**3
+_FILE_WRITE_CHUNK_SIZE = 1024 * 1024
+
+UPLOAD = 'upload'
+LIST = 'list'
+DOWNLOAD = 'download'
+RSYNC = 'rsync'
+DELETE = 'delete'
+# Operations run in this order, since each one uses the objects earlier ones
+# create.
+OPERATIONS = (UPLOAD, LIST, DOWNLOAD, RSYNC, DELETE)
+
+
+@dataclasses.dataclass(frozen=True)
+class Workload:
+  """A set of files to transfer.
+
+  Attributes:
+    name: Name used in results and object prefixes.
+    file_count: Number of files.
+    file_size: Size of each file in bytes.
+  """
+
+  name: str
+  file_count: int
+  file_size: int
+
+  @property
+  def total_bytes(self) -> int:
+    return self.file_count * self.file_size
+
+
+def get_default_workloads(
+    small_file_count: int = 1000,
+    small_file_size: int = 4 * 1024,
+    large_file_count: int = 4,
+    large_file_size: int = 64 * 1024 * 1024,
+) -> List[Workload]:
+  """Returns the many-small-files and few-large-files workloads."""
+  return [
+      Workload('small_files', small_file_count, small_file_size),
+      Workload('large_files', large_file_count, large_file_size),
+  ]
+
+
+@dataclasses.dataclass
+class OperationResult:
+  """Measurements for running one operation on one workload.
+
+  Metrics that cannot be measured on the current platform are set to
+  diagnostic.PLACEHOLDER_METRIC_VALUE.
+
+  Attributes:
+    workload: Name of the workload.
+    operation: Name of the operation.
+    object_count: Number of objects operated on.
+    bytes_transferred: Bytes uploaded or downloaded. 0 for operations that
+      only touch metadata.
+    seconds: Wall time of the gcloud process.
+    objects_per_second: Objects operated on per second.
+    bytes_per_second: Bytes transferred per second.
+    cpu_seconds: User and system CPU time of the gcloud process and the
+      worker processes it waited for.
+    cpu_seconds_per_gb: cpu_seconds divided by GiB transferred.
+    peak_rss_bytes: Largest resident set size of the gcloud process or its
+      worker processes.
+    exit_code: Exit code of the gcloud process.
+    http_requests: Number of HTTP requests the fake server received.
+  """
+
+  workload: str
+  operation: str
+  object_count: int
+  bytes_transferred: int
+  seconds: float
+  objects_per_second: float
+  bytes_per_second: float
+  cpu_seconds: object
+  cpu_seconds_per_gb: object
+  peak_rss_bytes: object
+  exit_code: int
+  http_requests: int
+
+
+def _get_peak_rss_bytes(max_rss: int) -> int:
+  # ru_maxrss is in bytes on macOS and kilobytes on other platforms.
+  if sys.platform == 'darwin':
+    return max_rss
+  return max_rss * 1024
+
+
+def _serve_fake(connection, latency, bandwidth):
+  """Runs a FakeGcsServer, answering request count queries until told to stop.
+
+  Args:
+    connection (multiprocessing.connection.Connection): Receives None to stop
+      or any other value to query the request count. Sent the endpoint first.
+    latency (float): See FakeGcsServer.
+    bandwidth (int|None): See FakeGcsServer.
+  """
+  with fake_gcs_server.FakeGcsServer(
+      bucket_names=[_BUCKET_NAME], latency=latency, bandwidth=bandwidth
+  ) as server:
+    connection.send(server.endpoint)
+    while connection.recv() is not None:
+      connection.send(server.request_count)
+
+
+class _FakeServerProcess:
+  """Runs a FakeGcsServer in a separate process.
+
+  Benchmarked gcloud processes are started from this process, and on Linux a
+  child's peak RSS includes its parent's RSS at the time of the fork. Keeping
+  the fake's in-memory objects out of this process keeps them out of the
+  measurements, as well as keeping the fake's CPU use off this process.
+  """
+
+  def __init__(self, latency, bandwidth):
+    self._latency = latency
+    self._bandwidth = bandwidth
+    self._connection = None
+    self._process = None
+    self.endpoint = None
+
+  def __enter__(self):
+    context = multiprocessing.get_context(method='spawn')
+    self._connection, child_connection = context.Pipe()
+    self._process = context.Process(
+        target=_serve_fake,
+        args=(child_connection, self._latency, self._bandwidth),
+    )
+    self._process.daemon = True
+    self._process.start()
+    self.endpoint = self._connection.recv()
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    self._connection.send(None)
+    self._process.join()
+
+  @property
+  def request_count(self):
+    self._connection.send(True)
+    return self._connection.recv()
+
+
+class TransferBenchmark:
+  """Runs storage commands against a fake server and measures them."""
+
+  def __init__(
+      self,
+      workloads: List[Workload],
+      operations=OPERATIONS,
+      latency: float = 0.0,
+      bandwidth: Optional[int] = None,
+      process_count: Optional[int] = None,
+      thread_count: Optional[int] = None,
+  ):
+    """Initializes the benchmark.
+
+    Args:
+      workloads: Files to transfer.
+      operations (Iterable[str]): Subset of OPERATIONS to measure. Operations
+        that later ones depend on are still run, but not reported. Operations
+        after the last one to measure are not run.
+      latency: Seconds the fake server waits before answering each request.
+      bandwidth: Bytes per second each fake server request is limited to, or
+        None for unlimited.
+      process_count: Value for storage/process_count, or None for default.
+      thread_count: Value for storage/thread_count, or None for default.
+    """
+    self._workloads = workloads
+    self._operations = set(operations)
+    self._latency = latency
+    self._bandwidth = bandwidth
+    self._process_count = process_count
+    self._thread_count = thread_count
+
+  def _get_environment(self, endpoint: str) -> Dict[str, str]:
+    """Returns the environment for gcloud subprocesses."""
+    environment = dict(os.environ)
+    environment.update({
+        'CLOUDSDK_API_ENDPOINT_OVERRIDES_STORAGE': endpoint,
+        'CLOUDSDK_AUTH_DISABLE_CREDENTIALS': 'true',
+        'CLOUDSDK_CORE_DISABLE_PROMPTS': '1',
+        'CLOUDSDK_CORE_DISABLE_USAGE_REPORTING': 'true',
+        'CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK': 'true',
+        'CLOUDSDK_STORAGE_PREFERRED_API': 'json',
+        # The fake does not implement compose.
+        'CLOUDSDK_STORAGE_PARALLEL_COMPOSITE_UPLOAD_ENABLED': 'False',
+    })
+    if self._process_count is not None:
+      environment['CLOUDSDK_STORAGE_PROCESS_COUNT'] = str(self._process_count)
+    if self._thread_count is not None:
+      environment['CLOUDSDK_STORAGE_THREAD_COUNT'] = str(self._thread_count)
+    return environment
+
+  def _run_gcloud(self, args: List[str], environment: Dict[str, str]):
+    """Runs gcloud and returns (exit code, seconds, rusage or None)."""
+    command = execution_utils.ArgsForGcloud() + args
+    log.debug('Running benchmark command: %s', command)
+    with tempfile.TemporaryFile() as output:
+      start_time = time.perf_counter()
+      process = subprocess.Popen(
+          command,
+          env=environment,
+          stdin=subprocess.DEVNULL,
+          stdout=output,
+          stderr=subprocess.STDOUT,
+      )
+      if hasattr(os, 'wait4'):
+        _, status, rusage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+      else:
+        process.wait()
+        rusage = None
+      seconds = time.perf_counter() - start_time
+      if process.returncode:
+        output.seek(0)
+        log.warning(
+            'Benchmark command %s exited with %d:\n%s',
+            ' '.join(args),
+            process.returncode,
+            output.read().decode('utf-8', 'replace'),
+        )
+    return process.returncode, seconds, rusage
+
+  def _create_files(self, directory: str, workload: Workload):
+    for index in range(workload.file_count):
+      path = os.path.join(directory, 'file{:08d}'.format(index))
+      with open(path, 'wb') as file_object:
+        bytes_remaining = workload.file_size
+        while bytes_remaining > 0:
+          chunk_size = min(bytes_remaining, _FILE_WRITE_CHUNK_SIZE)
+          file_object.write(os.urandom(chunk_size))
+          bytes_remaining -= chunk_size
+
+  def _get_commands(self, workload: Workload, source_directory: str,
+                    download_directory: str):
+    """Returns (operation, gcloud args, object count, bytes) tuples."""
+    prefix_url = 'gs://{}/{}/'.format(_BUCKET_NAME, workload.name)
+    count = workload.file_count
+    return [
+        (UPLOAD, ['storage', 'cp', '-r', source_directory, prefix_url],
+         count, workload.total_bytes),
+        (LIST, ['storage', 'ls', prefix_url + '**'], count, 0),
+        (DOWNLOAD, ['storage', 'cp', '-r', prefix_url + '*',
+                    download_directory], count, workload.total_bytes),
+        # Syncing into a new prefix copies every file after comparing the
+        # source and destination listings.
+        (RSYNC, ['storage', 'rsync', '-r', source_directory,
+                 prefix_url + 'rsync'], count, workload.total_bytes),
+        # Deletes both the uploaded and the synced copies.
+        (DELETE, ['storage', 'rm', prefix_url + '**'], 2 * count, 0),
+    ]
+
+  def _get_result(self, workload, operation, object_count, bytes_transferred,
+                  exit_code, seconds, rusage, http_requests):
+    """Builds an OperationResult from raw measurements."""
+    if rusage is None:
+      cpu_seconds = peak_rss_bytes = diagnostic.PLACEHOLDER_METRIC_VALUE
+      cpu_seconds_per_gb = diagnostic.PLACEHOLDER_METRIC_VALUE
+    else:
+      cpu_seconds = rusage.ru_utime + rusage.ru_stime
+      peak_rss_bytes = _get_peak_rss_bytes(rusage.ru_maxrss)
+      if bytes_transferred:
+        cpu_seconds_per_gb = cpu_seconds * _BYTES_PER_GB / bytes_transferred
+      else:
+        cpu_seconds_per_gb = diagnostic.PLACEHOLDER_METRIC_VALUE
+    return OperationResult(
+        workload=workload.name,
+        operation=operation,
+        object_count=object_count,
+        bytes_transferred=bytes_transferred,
+        seconds=seconds,
+        objects_per_second=object_count / seconds,
+        bytes_per_second=bytes_transferred / seconds,
+        cpu_seconds=cpu_seconds,
+        cpu_seconds_per_gb=cpu_seconds_per_gb,
+        peak_rss_bytes=peak_rss_bytes,
+        exit_code=exit_code,
+        http_requests=http_requests,
+    )
+
+  def run(self) -> List[OperationResult]:
+    """Runs the benchmark.
+
+    Returns:
+      A result for each requested operation of each workload.
+    """
+    results = []
+    with _FakeServerProcess(self._latency, self._bandwidth) as server:
+      environment = self._get_environment(server.endpoint)
+      for workload in self._workloads:
+        with file_utils.TemporaryDirectory() as temp_directory:
+          source_directory = os.path.join(temp_directory, 'source')
+          download_directory = os.path.join(temp_directory, 'download')
+          os.mkdir(source_directory)
+          os.mkdir(download_directory)
+          self._create_files(source_directory, workload)
+          log.status.Print(
+              'Benchmarking {} ({} files of {}).'.format(
+                  workload.name,
+                  workload.file_count,
+                  scaled_integer.FormatBinaryNumber(
+                      workload.file_size, decimal_places=1
+                  ),
+              )
+          )
+          for (operation, args, object_count,
+               bytes_transferred) in self._get_commands(
+                   workload, source_directory, download_directory):
+            if not self._operations.intersection(
+                OPERATIONS[OPERATIONS.index(operation):]):
+              break
+            requests_before = server.request_count
+            exit_code, seconds, rusage = self._run_gcloud(args, environment)
+            if operation not in self._operations:
+              continue
+            results.append(
+                self._get_result(
+                    workload,
+                    operation,
+                    object_count,
+                    bytes_transferred,
+                    exit_code,
+                    seconds,
+                    rusage,
+                    server.request_count - requests_before,
+                )
+            )
+    return results
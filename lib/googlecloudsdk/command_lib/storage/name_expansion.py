@@ -145,6 +145,8 @@ class NameExpansionIterator:
         managed_folder_setting=managed_folder_setting,
         folder_setting=folder_setting,
         object_state=self.object_state,
+        # Copy, move and remove tasks do not depend on expansion order.
+        preserve_order=False,
         preserve_symlinks=self._preserve_symlinks,
         raise_managed_folder_precondition_errors=(
             self._raise_managed_folder_precondition_errors
@@ -291,16 +291,21 @@ PosixAttributes = collections.namedtuple(
     'PosixAttributes', ['atime', 'mtime', 'uid', 'gid', 'mode'])
 
 
+def _get_posix_attributes_from_stat_result(stat_result):
+  """Takes os.stat_result and returns PosixAttributes object."""
+  mode, _, _, _, uid, gid, _, atime, mtime, _ = stat_result
+  return PosixAttributes(atime, mtime, uid, gid,
+                         PosixMode.from_base_ten_int(mode))
+
+
 def get_posix_attributes_from_file(file_path, preserve_symlinks=False):
   """Takes file path and returns PosixAttributes object."""
   follow_symlinks = (
       not preserve_symlinks or os.stat not in os.supports_follow_symlinks
   )
-  mode, _, _, _, uid, gid, _, atime, mtime, _ = os.stat(
-      file_path, follow_symlinks=follow_symlinks
+  return _get_posix_attributes_from_stat_result(
+      os.stat(file_path, follow_symlinks=follow_symlinks)
   )
-  return PosixAttributes(atime, mtime, uid, gid,
-                         PosixMode.from_base_ten_int(mode))
 
 
 def set_posix_attributes_on_file_if_valid(
@@ -537,6 +542,11 @@ def get_posix_attributes_from_resource(resource, preserve_symlinks=False):
   if isinstance(resource, resource_reference.ObjectResource):
     return get_posix_attributes_from_cloud_resource(resource)
   if isinstance(resource, resource_reference.FileObjectResource):
+    # Stat results cached while walking directories follow symlinks.
+    if resource.stat_result is not None and not (
+        preserve_symlinks and resource.is_symlink
+    ):
+      return _get_posix_attributes_from_stat_result(resource.stat_result)
     return get_posix_attributes_from_file(
         resource.storage_url.resource_name, preserve_symlinks
     )
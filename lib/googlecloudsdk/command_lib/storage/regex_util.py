@@ -19,6 +19,29 @@ import re
 
 from googlecloudsdk.core.util import debug_output
 
+# Matches patterns that re.match treats as "starts with a literal": literal
+# characters or escaped punctuation, optionally followed by ".*".
+_LITERAL_PREFIX_PATTERN_REGEX = re.compile(
+    r'((?:[^\\.^$*+?{}\[\]|()]|\\[^0-9A-Za-z])*)(?:\.\*)?'
+)
+
+
+def _get_literal_prefix(pattern_string):
+  """Returns the prefix a pattern matches all strings starting with, or None.
+
+  Args:
+    pattern_string (str): A pattern passed to Patterns.
+
+  Returns:
+    The literal string if pattern_string is a literal optionally followed by
+    ".*", since re.match then matches exactly the strings starting with the
+    literal. None for any other pattern.
+  """
+  match = _LITERAL_PREFIX_PATTERN_REGEX.fullmatch(pattern_string)
+  if not match:
+    return None
+  return re.sub(r'\\(.)', r'\1', match.group(1))
+
 
 class Patterns(object):
   """Holds multiple regex strings and checks matches against all."""
@@ -27,12 +50,36 @@ class Patterns(object):
     """Initializes class."""
     self._patterns = [re.compile(x) for x in pattern_strings]
     self._ignore_prefix_length = ignore_prefix_length
+    self._literal_prefixes = [
+        prefix
+        for prefix in map(_get_literal_prefix, pattern_strings)
+        if prefix is not None
+    ]
 
   def match(self, target):
     """Checks if string matches any stored pattern."""
     target_substring = target[self._ignore_prefix_length :]
     return any((p.match(target_substring) for p in self._patterns))
 
+  def match_all_with_prefix(self, prefix):
+    """Checks if every string starting with prefix matches a stored pattern.
+
+    Only patterns that are a literal optionally followed by ".*" are
+    considered, so False does not mean some string starting with prefix is
+    not matched.
+
+    Args:
+      prefix (str): The prefix to check, e.g. a directory path ending in a
+        separator.
+
+    Returns:
+      True if all strings starting with prefix are guaranteed to match.
+    """
+    prefix_substring = prefix[self._ignore_prefix_length :]
+    return any(
+        prefix_substring.startswith(p) for p in self._literal_prefixes
+    )
+
   def __repr__(self):
     return debug_output.generic_repr(self)
 
@@ -524,14 +524,20 @@ class FileObjectResource(Resource):
     storage_url (StorageUrl): A StorageUrl object representing the resource.
     md5_hash (bytes): Base64-encoded digest of MD5 hash.
     is_symlink (bool|None): Whether this file is known to be a symlink.
+    stat_result (os.stat_result|None): Result of following symlinks and
+      calling stat on the file when it was found, if known. Saves a system call
+      per attribute read when walking large directory trees.
   """
   TYPE_STRING = 'file_object'
 
-  def __init__(self, storage_url_object, md5_hash=None, is_symlink=None):
+  def __init__(
+      self, storage_url_object, md5_hash=None, is_symlink=None, stat_result=None
+  ):
     """Initializes resource. Args are a subset of attributes."""
     super(FileObjectResource, self).__init__(storage_url_object)
     self.md5_hash = md5_hash
     self._is_symlink = is_symlink
+    self.stat_result = stat_result
 
   def is_container(self):
     return False
@@ -541,6 +547,8 @@ class FileObjectResource(Resource):
     """Returns file size or None if pipe or stream."""
     if self.storage_url.is_stream:
       return None
+    if self.stat_result is not None:
+      return self.stat_result.st_size
     return os.path.getsize(self.storage_url.resource_name)
 
   @property
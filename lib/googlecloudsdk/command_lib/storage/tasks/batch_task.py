@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Task and iterator for sending compatible tasks' API requests in batches.
+
+Tasks that support batching expose:
+
+  batch_key: Compared with == to decide if two tasks can share a batch call.
+    None if the task cannot be batched.
+  execute_batch(tasks, task_status_queue=None): Class method performing the
+    work of all tasks in one or more batch calls. Returns list of errors, with
+    None for tasks that succeeded.
+"""
+
+
+from googlecloudsdk.command_lib.storage.tasks import task
+from googlecloudsdk.core import log
+
+
+# The JSON API limits the number of requests that can be sent in a batch call.
+DEFAULT_MAX_BATCH_SIZE = 100
+
+
+class BatchTask(task.Task):
+  """Executes tasks with the same batch_key in batch API calls."""
+
+  def __init__(self, tasks):
+    """Initializes task.
+
+    Args:
+      tasks (list[task.Task]): Tasks with equal, non-None batch_key values.
+    """
+    super(BatchTask, self).__init__()
+    self._tasks = tasks
+
+  def execute(self, task_status_queue=None):
+    errors = type(self._tasks[0]).execute_batch(
+        self._tasks, task_status_queue=task_status_queue
+    )
+    failures = [error for error in errors if error is not None]
+    if not failures:
+      return
+    # The executor logs the raised error and updates the exit code, so only the
+    # other failures need to be logged here.
+    for error in failures[:-1]:
+      log.error(error)
+    raise failures[-1]
+
+  def __eq__(self, other):
+    if not isinstance(other, type(self)):
+      return NotImplemented
+    return self._tasks == other._tasks
+
+
+def get_batched_task_iterator(
+    task_iterator, max_batch_size=DEFAULT_MAX_BATCH_SIZE
+):
+  """Groups consecutive tasks with the same batch_key into BatchTasks.
+
+  Tasks are only held back while the batch they belong to fills up, so the
+  first batch starts as soon as max_batch_size compatible tasks are available.
+
+  Args:
+    task_iterator (Iterable[task.Task]): Tasks to batch.
+    max_batch_size (int): Maximum number of tasks in each BatchTask.
+
+  Yields:
+    task.Task objects. Tasks without a batch_key are yielded unchanged, as are
+    batches of one.
+  """
+  pending_tasks = []
+  pending_batch_key = None
+
+  def flush():
+    if len(pending_tasks) == 1:
+      return pending_tasks[0]
+    return BatchTask(list(pending_tasks))
+
+  for task_to_batch in task_iterator:
+    batch_key = getattr(task_to_batch, 'batch_key', None)
+    if pending_tasks and (
+        batch_key is None
+        or batch_key != pending_batch_key
+        or len(pending_tasks) >= max_batch_size
+    ):
+      yield flush()
+      pending_tasks = []
+
+    if batch_key is None:
+      yield task_to_batch
+    else:
+      pending_tasks.append(task_to_batch)
+      pending_batch_key = batch_key
+
+  if pending_tasks:
+    yield flush()
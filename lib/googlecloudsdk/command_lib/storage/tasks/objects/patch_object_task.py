@@ -16,6 +16,7 @@
 
 
 from googlecloudsdk.api_lib.storage import api_factory
+from googlecloudsdk.api_lib.storage import cloud_api
 from googlecloudsdk.api_lib.storage import request_config_factory
 from googlecloudsdk.command_lib.storage import progress_callbacks
 from googlecloudsdk.command_lib.storage.tasks import task
@@ -42,6 +43,42 @@ class PatchObjectTask(task.Task):
     self._posix_to_set = posix_to_set
     self._user_request_args = user_request_args
 
+  @property
+  def batch_key(self):
+    """Tasks with equal keys can be run together. See batch_task."""
+    provider = self._object_resource.storage_url.scheme
+    if (
+        cloud_api.Capability.BATCH_REQUESTS
+        not in api_factory.get_capabilities(provider)
+    ):
+      return None
+    return (type(self), provider, self._user_request_args)
+
+  @classmethod
+  def execute_batch(cls, tasks, task_status_queue=None):
+    """Patches the objects of tasks with the same batch_key."""
+    for patch_task in tasks:
+      log.status.Print('Patching {}...'.format(patch_task._object_resource))
+
+    provider = tasks[0]._object_resource.storage_url.scheme
+    errors = api_factory.get_api(provider).patch_objects_metadata(
+        [patch_task._object_resource for patch_task in tasks],
+        [
+            request_config_factory.get_request_config(
+                patch_task._object_resource.storage_url,
+                user_request_args=patch_task._user_request_args,
+            )
+            for patch_task in tasks
+        ],
+        posix_to_set_list=[patch_task._posix_to_set for patch_task in tasks],
+    )
+
+    if task_status_queue:
+      for error in errors:
+        if error is None:
+          progress_callbacks.increment_count_callback(task_status_queue)
+    return errors
+
   def execute(self, task_status_queue=None):
     log.status.Print('Patching {}...'.format(self._object_resource))
     provider = self._object_resource.storage_url.scheme
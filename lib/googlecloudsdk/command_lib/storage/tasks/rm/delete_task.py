@@ -19,6 +19,7 @@ import abc
 import os
 
 from googlecloudsdk.api_lib.storage import api_factory
+from googlecloudsdk.api_lib.storage import cloud_api
 from googlecloudsdk.api_lib.storage import request_config_factory
 from googlecloudsdk.command_lib.storage import progress_callbacks
 from googlecloudsdk.command_lib.storage.tasks import task
@@ -174,5 +175,46 @@ class DeleteFolderTask(CloudDeleteTask):
 class DeleteObjectTask(CloudDeleteTask):
   """Task to delete an object."""
 
+  @property
+  def batch_key(self):
+    """Tasks with equal keys can be run together. See batch_task."""
+    if (
+        cloud_api.Capability.BATCH_REQUESTS
+        not in api_factory.get_capabilities(self._url.scheme)
+    ):
+      return None
+    return (
+        type(self),
+        self._url.scheme,
+        self._user_request_args,
+        self._verbose,
+    )
+
+  @classmethod
+  def execute_batch(cls, tasks, task_status_queue=None):
+    """Deletes the objects of tasks with the same batch_key."""
+    first_task = tasks[0]
+    if first_task._verbose:
+      for object_task in tasks:
+        log.status.Print('Removing {}...'.format(object_task._url))
+
+    client = api_factory.get_api(first_task._url.scheme)
+    errors = client.delete_objects(
+        [object_task._url for object_task in tasks],
+        [
+            request_config_factory.get_request_config(
+                object_task._url,
+                user_request_args=object_task._user_request_args,
+            )
+            for object_task in tasks
+        ],
+    )
+
+    if task_status_queue:
+      for error in errors:
+        if error is None:
+          progress_callbacks.increment_count_callback(task_status_queue)
+    return errors
+
   def _make_delete_api_call(self, client, request_config):
     client.delete_object(self._url, request_config)
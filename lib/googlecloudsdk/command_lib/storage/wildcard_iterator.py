@@ -18,11 +18,15 @@
 
 import abc
 import collections
+from concurrent import futures
+import copy
 import fnmatch
 import heapq
 import os
 import pathlib
+import queue
 import re
+import threading
 from typing import Iterator
 
 from googlecloudsdk.api_lib.storage import api_factory
@@ -34,6 +38,7 @@ from googlecloudsdk.command_lib.storage import folder_util
 from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage.resources import resource_reference
 from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
 from googlecloudsdk.core.util import debug_output
 import six
 
@@ -43,6 +48,60 @@ COMPRESS_WILDCARDS_REGEX = re.compile(r'\*{3,}')
 WILDCARD_REGEX = re.compile(r'[*?\[\]]')
 
 _RELATIVE_PATH_SYMBOLS = frozenset(['.', '.' + os.sep, '..', '..' + os.sep])
+# Prefix listings allowed to be queued or completed but not yet consumed, per
+# expansion thread. Bounds memory when the consumer is slower than the lister.
+_MAX_PENDING_LISTINGS_PER_THREAD = 4
+
+_ExpandedName = collections.namedtuple(
+    '_ExpandedName', ['resources', 'names_needing_expansion', 'errors']
+)
+_ScannedDirectory = collections.namedtuple(
+    '_ScannedDirectory', ['resources', 'subdirectories']
+)
+
+
+class _ListingThreadPool(object):
+  """A fixed pool of threads listing cloud prefixes.
+
+  Unlike futures.ThreadPoolExecutor, each thread closes the API clients it
+  got from api_factory before it exits, as storage task threads do.
+  """
+
+  def __init__(self, thread_count):
+    self._work_queue = queue.Queue()
+    self._threads = []
+    for _ in range(thread_count):
+      thread = threading.Thread(target=self._work)
+      thread.daemon = True
+      thread.start()
+      self._threads.append(thread)
+
+  def _work(self):
+    try:
+      while True:
+        work_item = self._work_queue.get()
+        if work_item is None:
+          return
+        future, function, args = work_item
+        if not future.set_running_or_notify_cancel():
+          continue
+        try:
+          future.set_result(function(*args))
+        except Exception as e:  # pylint: disable=broad-except
+          future.set_exception(e)
+    finally:
+      api_factory.clear_thread_local_instances()
+
+  def submit(self, function, *args):
+    """Schedules function(*args) and returns its futures.Future."""
+    future = futures.Future()
+    self._work_queue.put((future, function, args))
+    return future
+
+  def shutdown(self):
+    """Stops the threads once they finish the work already started."""
+    for _ in self._threads:
+      self._work_queue.put(None)
 
 
 def _is_hidden(path):
@@ -76,6 +135,7 @@ def get_wildcard_iterator(
     folder_setting=folder_util.FolderSetting.DO_NOT_LIST,
     next_page_token=None,
     object_state=cloud_api.ObjectState.LIVE,
+    preserve_order=True,
     preserve_symlinks=False,
     raise_managed_folder_precondition_errors=False,
     soft_deleted_buckets=False,
@@ -110,6 +170,10 @@ def get_wildcard_iterator(
        folders.
     next_page_token (str|None): Used to resume LIST calls.
     object_state (cloud_api.ObjectState): Versions of objects to query.
+    preserve_order (bool): If False, cloud resources matched under different
+      intermediate prefixes are yielded as soon as each prefix listing
+      returns, in no particular order. If True, they are yielded in the same
+      order as a sequential breadth-first expansion.
     preserve_symlinks (bool): Preserve symlinks instead of following them.
     raise_managed_folder_precondition_errors (bool): If True, raises
       precondition errors from managed folder listing. Otherwise, suppresses
@@ -139,6 +203,7 @@ def get_wildcard_iterator(
         folder_setting=folder_setting,
         next_page_token=next_page_token,
         object_state=object_state,
+        preserve_order=preserve_order,
         raise_managed_folder_precondition_errors=raise_managed_folder_precondition_errors,
         soft_deleted_buckets=soft_deleted_buckets,
         list_filter=list_filter,
@@ -280,6 +345,17 @@ class FileWildcardIterator(WildcardIterator):
     else:
       path_prefix = ''
 
+    if pathlib_path.name == '**' and not contains_wildcard(
+        str(pathlib_path.parent)
+    ):
+      # Recursive iteration of a single directory (e.g. `cp -r dir`), which can
+      # be walked without glob and per-path stat calls.
+      for resource in self._walk_directory(
+          str(pathlib_path.parent), path_prefix
+      ):
+        yield resource
+      return
+
     path_iterator = (
         path_prefix + str(p)
         for p in pathlib.Path(root).glob(path_relative_to_root)
@@ -331,6 +407,144 @@ class FileWildcardIterator(WildcardIterator):
             file_url, is_symlink=is_symlink
         )
 
+  def _walk_directory(self, directory, path_prefix):
+    """Yields everything below a directory that `directory/**` matches.
+
+    Equivalent to filtering `pathlib.Path(directory).glob('**/*')` like
+    __iter__ does, but built on os.scandir: file types come from directory
+    entries, files are stat'ed once and the result is cached on the yielded
+    resource, directories are not descended into when an exclude pattern of
+    the form `prefix.*` matches everything in them, and directories are
+    scanned concurrently. Resources are yielded in no particular order.
+
+    Args:
+      directory (str): Path of the directory to walk. '.' for the current
+        working directory.
+      path_prefix (str): Prepended to yielded paths.
+
+    Yields:
+      FileObjectResource and FileSymlinkPlaceholderResource objects.
+    """
+    if directory == '.':
+      # Matches pathlib, which yields 'a/b' rather than './a/b'.
+      directory = ''
+    thread_count = (
+        properties.VALUES.storage.wildcard_expansion_thread_count.GetInt() or 1
+    )
+    max_pending_scans = thread_count * _MAX_PENDING_LISTINGS_PER_THREAD
+    directories_to_scan = collections.deque([directory])
+    pending_scans = collections.deque()
+    executor = futures.ThreadPoolExecutor(max_workers=thread_count)
+    try:
+      while directories_to_scan or pending_scans:
+        while directories_to_scan and len(pending_scans) < max_pending_scans:
+          pending_scans.append(
+              executor.submit(
+                  self._scan_directory,
+                  directories_to_scan.popleft(),
+                  path_prefix,
+              )
+          )
+        done, _ = futures.wait(
+            pending_scans, return_when=futures.FIRST_COMPLETED
+        )
+        scan = done.pop()
+        pending_scans.remove(scan)
+
+        scanned_directory = scan.result()
+        directories_to_scan.extend(scanned_directory.subdirectories)
+        for resource in scanned_directory.resources:
+          yield resource
+    finally:
+      for scan in pending_scans:
+        scan.cancel()
+      executor.shutdown(wait=False)
+
+  def _is_excluded(self, path):
+    return (self._exclude_patterns and self._exclude_patterns.match(path)) or (
+        not self._include_hidden_files and _is_hidden(path)
+    )
+
+  def _scan_directory(self, directory, path_prefix):
+    """Lists one directory for _walk_directory.
+
+    Args:
+      directory (str): Path of the directory to list, or '' for the current
+        working directory.
+      path_prefix (str): Prepended to paths checked against exclude patterns
+        and yielded.
+
+    Returns:
+      _ScannedDirectory with resources to yield and subdirectories to scan.
+    """
+    resources = []
+    subdirectories = []
+    try:
+      # Like pathlib, skip directories that cannot be read.
+      with os.scandir(directory or '.') as entry_iterator:
+        entries = list(entry_iterator)
+    except OSError as e:
+      log.debug('Skipping directory {}: {}'.format(directory, e))
+      return _ScannedDirectory(resources, subdirectories)
+
+    for entry in entries:
+      path = os.path.join(directory, entry.name)
+      prefixed_path = path_prefix + path
+      is_symlink = entry.is_symlink()
+      try:
+        # Follows symlinks.
+        is_directory = entry.is_dir()
+      except OSError:
+        is_directory = False
+
+      if is_directory and not is_symlink:
+        # Like pathlib, do not descend into symlinked directories.
+        if not (
+            self._exclude_patterns
+            and self._exclude_patterns.match_all_with_prefix(
+                prefixed_path + os.sep
+            )
+        ):
+          subdirectories.append(path)
+        continue
+
+      if self._is_excluded(prefixed_path):
+        continue
+      if self._files_only:
+        try:
+          is_file = entry.is_file()
+        except OSError:
+          is_file = False
+        if not is_file:
+          if storage_url.is_named_pipe(prefixed_path):
+            raise command_errors.InvalidUrlError(
+                _FILES_ONLY_ERROR_FORMAT.format(self._url.resource_name)
+            )
+          continue
+
+      file_url = storage_url.FileUrl(prefixed_path)
+      if is_symlink:
+        if self._preserve_symlinks:
+          resources.append(
+              resource_reference.FileSymlinkPlaceholderResource(file_url)
+          )
+          continue
+        if is_directory or self._ignore_symlinks:
+          log.warning('Skipping symlink {}'.format(prefixed_path))
+          continue
+
+      try:
+        stat_result = entry.stat()
+      except OSError:
+        # Broken symlink or file deleted during iteration.
+        continue
+      resources.append(
+          resource_reference.FileObjectResource(
+              file_url, is_symlink=is_symlink, stat_result=stat_result
+          )
+      )
+    return _ScannedDirectory(resources, subdirectories)
+
 
 class CloudWildcardIterator(WildcardIterator):
   """Class to iterate over Cloud Storage strings containing wildcards."""
@@ -349,6 +563,7 @@ class CloudWildcardIterator(WildcardIterator):
       folder_setting=folder_util.FolderSetting.DO_NOT_LIST,
       next_page_token=None,
       object_state=cloud_api.ObjectState.LIVE,
+      preserve_order=True,
       raise_managed_folder_precondition_errors=True,
       soft_deleted_buckets=False,
       list_filter=None,
@@ -379,6 +594,7 @@ class CloudWildcardIterator(WildcardIterator):
         folders.
       next_page_token (str|None): Used to resume LIST calls.
       object_state (cloud_api.ObjectState): Versions of objects to query.
+      preserve_order (bool): See get_wildcard_iterator.
       raise_managed_folder_precondition_errors (bool): If True, raises
         precondition errors from managed folder listing. Otherwise, suppresses
         these errors. This is helpful in commands that list managed folders by
@@ -403,6 +619,7 @@ class CloudWildcardIterator(WildcardIterator):
     self._folder_setting = folder_setting
     self._next_page_token = next_page_token
     self._object_state = object_state
+    self._preserve_order = preserve_order
     self._raise_managed_folder_precondition_errors = (
         raise_managed_folder_precondition_errors
     )
@@ -775,70 +992,239 @@ class CloudWildcardIterator(WildcardIterator):
     else:
       object_name = original_object_name
 
-    names_needing_expansion = collections.deque([object_name])
-    error = None
+    names_needing_expansion = collections.deque()
+    errors = []
+    # The first listing is streamed from the calling thread so that a single
+    # large (e.g. recursive) listing never has to be held in memory.
+    for resource in self._expand_name(
+        bucket_name,
+        object_name,
+        original_object_name,
+        is_hns_bucket,
+        names_needing_expansion,
+        errors,
+    ):
+      yield resource
+
+    thread_count = (
+        properties.VALUES.storage.wildcard_expansion_thread_count.GetInt() or 1
+    )
+    if thread_count > 1 and len(names_needing_expansion) > 1:
+      expanded_resources = self._expand_names_in_parallel(
+          bucket_name,
+          names_needing_expansion,
+          original_object_name,
+          is_hns_bucket,
+          errors,
+          thread_count,
+      )
+    else:
+      expanded_resources = self._expand_names_sequentially(
+          bucket_name,
+          names_needing_expansion,
+          original_object_name,
+          is_hns_bucket,
+          errors,
+      )
+    for resource in expanded_resources:
+      yield resource
+
+    if errors:
+      raise errors[-1]
+
+  def _expand_names_sequentially(
+      self,
+      bucket_name,
+      names_needing_expansion,
+      original_object_name,
+      is_hns_bucket,
+      errors,
+  ):
+    """Expands names breadth-first, one prefix listing at a time."""
     while names_needing_expansion:
       name = names_needing_expansion.popleft()
+      for resource in self._expand_name(
+          bucket_name,
+          name,
+          original_object_name,
+          is_hns_bucket,
+          names_needing_expansion,
+          errors,
+      ):
+        yield resource
 
-      # Parse out the prefix, delimiter, filter_pattern and suffix.
-      # Given a string 'a/b*c/d/e*f/g.txt', this will return
-      # CloudWildcardParts(prefix='a/b', filter_pattern='*c',
-      #                    delimiter='/', suffix='d/e*f/g.txt')
-      wildcard_parts = CloudWildcardParts.from_string(name, self._url.delimiter)
+  def _expand_names_in_parallel(
+      self,
+      bucket_name,
+      names_needing_expansion,
+      original_object_name,
+      is_hns_bucket,
+      errors,
+      thread_count,
+  ):
+    """Expands names breadth-first with concurrent prefix listings.
 
-      # Fetch all the objects and prefixes.
-      resource_iterator = self._get_resource_iterator(
-          bucket_name, wildcard_parts, is_hns_bucket
-      )
+    Each name is listed on a bounded thread pool. Names found by a listing are
+    queued for expansion as soon as that listing is consumed, so deeper levels
+    start before shallower ones finish.
 
-      # We have all the objects and prefixes that matched wildcard_parts.prefix.
-      # Use filter_pattern to eliminate non-matching objects and prefixes.
-      filtered_resources = self._filter_resources(
-          resource_iterator,
-          wildcard_parts.prefix + wildcard_parts.filter_pattern,
-      )
+    Args:
+      bucket_name (str): Name of the bucket.
+      names_needing_expansion (collections.deque[str]): Names left to expand.
+      original_object_name (str): Object name from the URL being expanded.
+      is_hns_bucket (bool): Whether the bucket is an HNS bucket.
+      errors (list[Exception]): Errors to raise after expansion completes.
+      thread_count (int): Maximum number of concurrent prefix listings.
 
-      for resource in filtered_resources:
-        resource_path = resource.storage_url.resource_name
-        if wildcard_parts.suffix:
-          # pylint: disable=unidiomatic-typecheck
-          # We do not want this check to pass for child classes.
-          if type(resource) is resource_reference.PrefixResource:
-            # pylint: enable=unidiomatic-typecheck
-            # Suffix is present, which indicates that we have more wildcards to
-            # expand. Let's say object_name is a/b1c. Then the new string that
-            # we want to expand will be a/b1c/d/e*f/g.txt
-            if WILDCARD_REGEX.search(resource_path):
-              error = command_errors.InvalidUrlError(
-                  'Cloud folders named with wildcards are not supported.'
-                  ' API returned {}'.format(resource)
-              )
-            else:
-              names_needing_expansion.append(
-                  resource_path + wildcard_parts.suffix
+    Yields:
+      resource_reference.Resource objects. If self._preserve_order is True,
+      they are in the same order _expand_names_sequentially would yield them.
+      Otherwise, each listing's resources are yielded as soon as it returns.
+    """
+    max_pending_listings = thread_count * _MAX_PENDING_LISTINGS_PER_THREAD
+    pending_listings = collections.deque()
+    executor = _ListingThreadPool(thread_count)
+    try:
+      while names_needing_expansion or pending_listings:
+        while (
+            names_needing_expansion
+            and len(pending_listings) < max_pending_listings
+        ):
+          pending_listings.append(
+              executor.submit(
+                  self._list_name,
+                  bucket_name,
+                  names_needing_expansion.popleft(),
+                  original_object_name,
+                  is_hns_bucket,
               )
+          )
+
+        if self._preserve_order:
+          listing = pending_listings.popleft()
         else:
-          # Make sure regular object not returned if the original query was for
-          # a prefix or object with a trailing delimiter.
-          # Needed for gs://b/f*/ to filter out gs://b/f.txt.
-          if not resource_path.endswith(
-              self._url.delimiter
-          ) and original_object_name.endswith(self._url.delimiter):
-            continue
-
-          # The order is important as Folders should take precdence
-          # over Managed Folders for an HNS bucket, So if a resource is a
-          # Folder, then we need not convert it to a Managed Folder
-          resource = self._maybe_convert_prefix_to_folder(
-              resource, is_hns_bucket
+          done, _ = futures.wait(
+              pending_listings, return_when=futures.FIRST_COMPLETED
           )
-          if not isinstance(resource, resource_reference.FolderResource):
-            resource = self._maybe_convert_prefix_to_managed_folder(resource)
+          listing = done.pop()
+          pending_listings.remove(listing)
 
-          yield self._decrypt_resource_if_necessary(resource)
+        expanded_name = listing.result()
+        names_needing_expansion.extend(expanded_name.names_needing_expansion)
+        errors.extend(expanded_name.errors)
+        for resource in expanded_name.resources:
+          yield resource
+    finally:
+      # Runs on errors and when the caller stops iterating early.
+      for listing in pending_listings:
+        listing.cancel()
+      executor.shutdown()
+
+  def _list_name(
+      self, bucket_name, name, original_object_name, is_hns_bucket
+  ):
+    """Runs _expand_name to completion. Called from expansion threads."""
+    # API clients are not thread-safe. api_factory keeps one per thread, which
+    # the expansion thread closes when it exits.
+    iterator = copy.copy(self)
+    iterator._client = api_factory.get_api(self._url.scheme)  # pylint: disable=protected-access
+    names_needing_expansion = []
+    errors = []
+    resources = list(
+        iterator._expand_name(  # pylint: disable=protected-access
+            bucket_name,
+            name,
+            original_object_name,
+            is_hns_bucket,
+            names_needing_expansion,
+            errors,
+        )
+    )
+    return _ExpandedName(resources, names_needing_expansion, errors)
+
+  def _expand_name(
+      self,
+      bucket_name,
+      name,
+      original_object_name,
+      is_hns_bucket,
+      names_needing_expansion,
+      errors,
+  ):
+    """Expands one level of wildcards in a name.
+
+    Args:
+      bucket_name (str): Name of the bucket.
+      name (str): Object name that may contain wildcards.
+      original_object_name (str): Object name from the URL being expanded.
+      is_hns_bucket (bool): Whether the bucket is an HNS bucket.
+      names_needing_expansion (list[str]|collections.deque[str]): Names with
+        wildcards left to expand are appended here.
+      errors (list[Exception]): Errors to raise after expansion completes are
+        appended here.
+
+    Yields:
+      resource_reference.Resource objects matching name that need no further
+      expansion.
+    """
+    # Parse out the prefix, delimiter, filter_pattern and suffix.
+    # Given a string 'a/b*c/d/e*f/g.txt', this will return
+    # CloudWildcardParts(prefix='a/b', filter_pattern='*c',
+    #                    delimiter='/', suffix='d/e*f/g.txt')
+    wildcard_parts = CloudWildcardParts.from_string(name, self._url.delimiter)
+
+    # Fetch all the objects and prefixes.
+    resource_iterator = self._get_resource_iterator(
+        bucket_name, wildcard_parts, is_hns_bucket
+    )
+
+    # We have all the objects and prefixes that matched wildcard_parts.prefix.
+    # Use filter_pattern to eliminate non-matching objects and prefixes.
+    filtered_resources = self._filter_resources(
+        resource_iterator,
+        wildcard_parts.prefix + wildcard_parts.filter_pattern,
+    )
+
+    for resource in filtered_resources:
+      resource_path = resource.storage_url.resource_name
+      if wildcard_parts.suffix:
+        # pylint: disable=unidiomatic-typecheck
+        # We do not want this check to pass for child classes.
+        if type(resource) is resource_reference.PrefixResource:
+          # pylint: enable=unidiomatic-typecheck
+          # Suffix is present, which indicates that we have more wildcards to
+          # expand. Let's say object_name is a/b1c. Then the new string that
+          # we want to expand will be a/b1c/d/e*f/g.txt
+          if WILDCARD_REGEX.search(resource_path):
+            errors.append(
+                command_errors.InvalidUrlError(
+                    'Cloud folders named with wildcards are not supported.'
+                    ' API returned {}'.format(resource)
+                )
+            )
+          else:
+            names_needing_expansion.append(
+                resource_path + wildcard_parts.suffix
+            )
+      else:
+        # Make sure regular object not returned if the original query was for
+        # a prefix or object with a trailing delimiter.
+        # Needed for gs://b/f*/ to filter out gs://b/f.txt.
+        if not resource_path.endswith(
+            self._url.delimiter
+        ) and original_object_name.endswith(self._url.delimiter):
+          continue
+
+        # The order is important as Folders should take precdence
+        # over Managed Folders for an HNS bucket, So if a resource is a
+        # Folder, then we need not convert it to a Managed Folder
+        resource = self._maybe_convert_prefix_to_folder(
+            resource, is_hns_bucket
+        )
+        if not isinstance(resource, resource_reference.FolderResource):
+          resource = self._maybe_convert_prefix_to_managed_folder(resource)
 
-    if error:
-      raise error
+        yield self._decrypt_resource_if_necessary(resource)
 
   def _get_regex_patterns(self, wildcard_pattern):
     """Returns list of regex patterns derived from the wildcard patterns.
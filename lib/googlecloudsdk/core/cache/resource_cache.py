@@ -68,7 +68,10 @@ parameter can take on.
 
 
 import abc
+import copy
 import os
+import sys
+import threading
 
 from googlecloudsdk.core import config
 from googlecloudsdk.core import log
@@ -97,6 +100,132 @@ DEFAULT_TIMEOUT = 1*60*60
 VERSION = 'googlecloudsdk.resource-1.0'
 
 
+def _GetRefreshContext():
+  """Returns the multiprocessing context to refresh in, None if unsupported."""
+  import multiprocessing  # pylint: disable=g-import-not-at-top
+
+  # The refresh processes inherit the updater and the program state it reads,
+  # so they must be forked. Forking is not safe on macOS.
+  if (
+      'fork' not in multiprocessing.get_all_start_methods()
+      or sys.platform == 'darwin'
+  ):
+    return None
+  return multiprocessing.get_context('fork')
+
+
+def _Refresh(cache_name, table_name, updater, columns, keys, timeout,
+             parameter_info, aggregations):
+  """Updates a cache table in a forked refresh process."""
+  try:
+    with ResourceCache(name=cache_name) as cache:
+      # The updater may select from the cache itself, so give it a shallow
+      # copy bound to this process's connection.
+      updater = copy.copy(updater)
+      updater.cache = cache
+      rows = updater.Update(parameter_info, aggregations)
+      if rows is None:
+        return
+      table = cache.Table(
+          table_name, columns=columns, keys=keys, timeout=timeout)
+      table.DeleteRows()
+      table.AddRows(rows)
+      table.Validate()
+    log.info('cache table=%s refreshed in background rows=%d',
+             table_name, len(rows))
+  except Exception as e:  # pylint: disable=broad-except
+    log.info('cache table=%s background refresh failed: %s', table_name, e)
+
+
+class _BackgroundRefresher(object):
+  """Refreshes expired resource cache tables in forked processes.
+
+  Updaters typically run list commands in the calling process, and those
+  update process wide state such as the properties invocation stack and the
+  log verbosity, so a refresh can not run on a thread next to the foreground
+  command. Each refresh runs in a forked process that writes the new rows
+  through its own cache connection. At most one refresh per cache table is
+  in flight at any time.
+
+  Attributes:
+    _lock: Guards _processes.
+    _processes: The (cache name, table name) => refresh process dict of the
+      refreshes that may still be running.
+  """
+
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._processes = {}
+
+  def Refresh(self, updater, table, parameter_info, aggregations):
+    """Starts refreshing table with updater unless it is already in flight.
+
+    Args:
+      updater: The Updater that populates table.
+      table: The expired persistent table object.
+      parameter_info: A ParamaterInfo object for accessing parameter values in
+        the program state.
+      aggregations: A list of aggregation Parameter objects.
+
+    Returns:
+      True if the table is being refreshed, False if it can not be refreshed
+      in the background and must be updated by the caller.
+    """
+    context = _GetRefreshContext()
+    if not context:
+      return False
+    key = (updater.cache.name, table.name)
+    with self._lock:
+      self._processes = {
+          k: p for k, p in six.iteritems(self._processes) if p.is_alive()}
+      if key in self._processes:
+        return True
+      process = context.Process(
+          target=_Refresh,
+          args=(updater.cache.name, table.name, updater, table.columns,
+                table.keys, table.timeout, parameter_info, aggregations))
+      # Like the calling command, the refresh is not waited for at exit.
+      process.daemon = True
+      process.start()
+      self._processes[key] = process
+    return True
+
+  def Wait(self, timeout=None):
+    """Waits for the in-flight refreshes to finish.
+
+    Args:
+      timeout: The maximum number of seconds to wait for each refresh, None to
+        wait until all are done.
+
+    Returns:
+      True if no refreshes are in flight anymore.
+    """
+    with self._lock:
+      processes = list(self._processes.values())
+    for process in processes:
+      process.join(timeout)
+    with self._lock:
+      self._processes = {
+          k: p for k, p in six.iteritems(self._processes) if p.is_alive()}
+      return not self._processes
+
+
+_BACKGROUND_REFRESHER = _BackgroundRefresher()
+
+
+def WaitForBackgroundRefreshes(timeout=None):
+  """Waits for the resource cache tables being refreshed in the background.
+
+  Args:
+    timeout: The maximum number of seconds to wait for each refresh, None to
+      wait until all are done.
+
+  Returns:
+    True if no refreshes are in flight anymore.
+  """
+  return _BACKGROUND_REFRESHER.Wait(timeout)
+
+
 class ParameterInfo(object):
   """An object for accessing parameter values in the program state.
 
@@ -299,7 +428,10 @@ class Updater(BaseUpdater):
   def SelectTable(self, table, row_template, parameter_info, aggregations=None):
     """Returns the list of rows matching row_template in table.
 
-    Refreshes expired tables by calling the updater.
+    Refreshes expired tables by calling the updater. If the cache was opened
+    with refresh_in_background=True and the expired table still holds
+    matching rows then those stale rows are returned immediately and the table
+    is refreshed in a forked process, where forking is supported.
 
     Args:
       table: The persistent table object.
@@ -319,6 +451,13 @@ class Updater(BaseUpdater):
     try:
       return table.Select(row_template)
     except exceptions.CacheTableExpired:
+      if getattr(self.cache, 'refresh_in_background', False):
+        rows = table.Select(row_template, ignore_expiration=True)
+        if rows and _BACKGROUND_REFRESHER.Refresh(
+            self, table, parameter_info, aggregations):
+          log.info('cache table=%s expired, refreshing in background',
+                   table.name)
+          return rows
       rows = self.Update(parameter_info, aggregations)
       if rows is not None:
         table.DeleteRows()
@@ -503,9 +642,16 @@ class Updater(BaseUpdater):
 
 
 class ResourceCache(PERSISTENT_CACHE_IMPLEMENTATION.Cache):
-  """A resource cache object."""
+  """A resource cache object.
+
+  Attributes:
+    refresh_in_background: If True then Updater.SelectTable returns the stale
+      rows of expired tables and refreshes them in forked processes. Only
+      worthwhile in long running processes, and only supported by the sqlite
+      implementation.
+  """
 
-  def __init__(self, name=None, create=True):
+  def __init__(self, name=None, create=True, refresh_in_background=False):
     """ResourceCache constructor.
 
     Args:
@@ -513,11 +659,16 @@ class ResourceCache(PERSISTENT_CACHE_IMPLEMENTATION.Cache):
         conditioned on the account name is used.
           <GLOBAL_CONFIG_DIR>/cache/<ACCOUNT>/resource.cache
       create: Create the cache if it doesn't exist if True.
+      refresh_in_background: Refresh expired tables in forked processes,
+        serving their stale rows meanwhile, if True.
     """
     if not name:
       name = self.GetDefaultName()
     super(ResourceCache, self).__init__(
         name=name, create=create, version=VERSION)
+    self.refresh_in_background = bool(
+        refresh_in_background and
+        PERSISTENT_CACHE_IMPLEMENTATION is sqlite_cache)
 
   @staticmethod
   def GetDefaultName():
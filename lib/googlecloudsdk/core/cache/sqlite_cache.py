@@ -22,6 +22,7 @@ See the persistent_cache module for a detailed description.
 import errno
 import gc
 import os
+import re
 
 from googlecloudsdk.core.cache import exceptions
 from googlecloudsdk.core.cache import metadata_table
@@ -33,6 +34,15 @@ from six.moves import range  # pylint: disable=redefined-builtin
 import sqlite3
 
 
+# Tables with at least this many rows added at once are ANALYZEd so that the
+# query planner picks the most selective column index for template matches.
+_ANALYZE_MIN_ROWS = 1000
+
+# Characters that make a row template string a LIKE pattern: * and . are the
+# template match ops, % and _ are LIKE match ops themselves.
+_LIKE_PATTERN_CHARS = re.compile(r'[*.%_]')
+
+
 def _FieldRef(column):
   """Returns a field reference name.
 
@@ -45,34 +55,96 @@ def _FieldRef(column):
   return 'f{column}'.format(column=column)
 
 
+def _IndexName(table, column):
+  """Returns the name of the index on column in table.
+
+  Args:
+    table: The table name.
+    column: The field column number counting from 0.
+
+  Returns:
+    The index name, unique across all tables in the cache.
+  """
+  return '{table}.{field}'.format(table=table, field=_FieldRef(column))
+
+
+def _AsciiLower(string):
+  """Returns string with only its ASCII letters lowercased, as NOCASE does."""
+  return ''.join(
+      six.unichr(ord(c) + 32) if 'A' <= c <= 'Z' else c for c in string)
+
+
+def _PrefixRange(pattern):
+  """Returns a NOCASE [lower, upper) string range for a LIKE pattern.
+
+  Every string matched by a pattern like 'abc*x' starts with 'abc' ignoring
+  ASCII case, so it also falls in the NOCASE range ['abc', 'abd'). Adding the
+  range to the LIKE term lets sqlite use a column index instead of scanning
+  every row.
+
+  Args:
+    pattern: A row template column string.
+
+  Returns:
+    A (lower, upper) tuple if pattern starts with a literal prefix, None
+    otherwise.
+  """
+  prefix = _AsciiLower(re.split(r'[*.%_]', pattern, maxsplit=1)[0])
+  if not prefix:
+    return None
+  last = ord(prefix[-1])
+  if last >= 0x10FFFF or 0xD7FF <= last < 0xE000:
+    return None
+  return prefix, prefix[:-1] + six.unichr(last + 1)
+
+
 def _Where(row_template=None):
-  """Returns a WHERE clause for the row template.
+  """Returns a WHERE clause and its parameters for the row template.
 
-  Column string matching supports * and ? match ops.
+  Column string matching supports * and . (any one character) match ops and
+  ignores ASCII case. Literal terms are compared with =, and patterns with a
+  literal prefix are also bounded by a prefix range, so that both can use the
+  NOCASE column indexes. Patterns are matched with LIKE.
 
   Args:
     row_template: A template row tuple. A column value None means match all
       values for this column. A None value for row means all rows.
 
   Returns:
-    A WHERE clause for the row template or the empty string if there is no none.
+    A (clause, parameters) tuple, where clause is a WHERE clause for the row
+    template or the empty string if there is no none, and parameters is the
+    list of values bound to the clause placeholders.
   """
   terms = []
+  parameters = []
   if row_template:
     for index in range(len(row_template)):
       term = row_template[index]
       if term is None:
         continue
+      field = _FieldRef(index)
       if isinstance(term, six.string_types):
-        pattern = term.replace('*', '%').replace('.', '_').replace('"', '""')
-        terms.append('{field} LIKE "{pattern}"'.format(
-            field=_FieldRef(index), pattern=pattern))
+        if term == '*':
+          continue
+        if not _LIKE_PATTERN_CHARS.search(term):
+          terms.append('{field} = ? COLLATE NOCASE'.format(field=field))
+          parameters.append(term)
+          continue
+        prefix_range = _PrefixRange(term)
+        if prefix_range:
+          terms.append(
+              '{field} >= ? COLLATE NOCASE AND {field} < ? COLLATE NOCASE'
+              .format(field=field))
+          parameters.extend(prefix_range)
+        pattern = term.replace('*', '%').replace('.', '_')
+        terms.append('{field} LIKE ?'.format(field=field))
+        parameters.append(pattern)
       else:
-        terms.append('{field} = {term}'.format(
-            field=_FieldRef(index), term=term))
+        terms.append('{field} = ?'.format(field=field))
+        parameters.append(term)
   if not terms:
-    return ''
-  return  ' WHERE ' + ' AND '.join(terms)
+    return '', parameters
+  return ' WHERE ' + ' AND '.join(terms), parameters
 
 
 class _Table(persistent_cache_base.Table):
@@ -100,6 +172,7 @@ class _Table(persistent_cache_base.Table):
     self._values = ', '.join(['?'] * columns)
     self.deleted = False
     # pylint: disable=protected-access
+    self._cache._CreateIndexes(name, columns)
     if self._cache._metadata:
       self._cache._tables[name] = self
 
@@ -141,6 +214,8 @@ class _Table(persistent_cache_base.Table):
         format(
             table=self.name, fields=self._fields, values=self._values),
         rows)
+    if len(rows) >= _ANALYZE_MIN_ROWS:
+      self._cache.cursor.execute('ANALYZE "{table}"'.format(table=self.name))
     self._cache._db.commit()  # pylint: disable=protected-access
 
   def DeleteRows(self, row_templates=None):
@@ -148,9 +223,10 @@ class _Table(persistent_cache_base.Table):
     if row_templates:
       self._CheckRowTemplates(row_templates)
       for template in row_templates:
+        where, parameters = _Where(template)
         self._cache.cursor.execute(
-            'DELETE FROM "{table}"{where}'.format(
-                table=self.name, where=_Where(template)))
+            'DELETE FROM "{table}"{where}'.format(table=self.name, where=where),
+            parameters)
     else:
       self._cache.cursor.execute(
           'DELETE FROM "{table}" WHERE 1'.format(table=self.name))
@@ -164,9 +240,11 @@ class _Table(persistent_cache_base.Table):
       raise exceptions.CacheTableExpired(
           '[{}] cache table [{}] has expired.'.format(
               self._cache.name, self.name))
+    where, parameters = _Where(row_template)
     self._cache.cursor.execute(
         'SELECT {fields} FROM "{table}"{where}'.format(
-            fields=self._fields, table=self.name, where=_Where(row_template)))
+            fields=self._fields, table=self.name, where=where),
+        parameters)
     return self._cache.cursor.fetchall()
 
 
@@ -276,3 +354,28 @@ class Cache(metadata_table.CacheUsingMetadataTable):
     self.cursor.execute(
         'CREATE TABLE IF NOT EXISTS "{name}" {fields}'.format(
             name=name, fields=fields))
+
+  def _CreateIndexes(self, name, columns):
+    """Creates the column indexes of table name if they do not exist yet.
+
+    This runs whenever a table is opened, so that tables created before the
+    indexes were introduced get them too. Each column gets a NOCASE index,
+    which the primary key index can not stand in for, so that template matches
+    on e.g. the resource name column of (project, zone, name) rows do not scan
+    the whole table.
+
+    Args:
+      name: The table name.
+      columns: The number of columns in each row.
+    """
+    try:
+      for column in range(columns):
+        self.cursor.execute(
+            'CREATE INDEX IF NOT EXISTS "{index}" ON "{name}" '
+            '({field} COLLATE NOCASE)'.format(
+                index=_IndexName(name, column), name=name,
+                field=_FieldRef(column)))
+    except sqlite3.OperationalError:
+      # The indexes only speed up selects, a read-only or locked cache still
+      # works without them.
+      pass
@@ -32,6 +32,7 @@ from googlecloudsdk.api_lib.auth import util as auth_util
 from googlecloudsdk.core import config
 from googlecloudsdk.core import log
 from googlecloudsdk.core import properties
+from googlecloudsdk.core import tracing
 from googlecloudsdk.core.configurations import named_configs
 from googlecloudsdk.core.credentials import creds as c_creds
 from googlecloudsdk.core.credentials import exceptions as creds_exceptions
@@ -751,6 +752,7 @@ class CredentialInfo(object):
     return cred_info
 
 
+@tracing.Traced('credentials.load')
 def Load(
     account=None,
     scopes=None,
@@ -1002,6 +1004,7 @@ def _Load(
   return cred
 
 
+@tracing.Traced('credentials.refresh')
 def Refresh(credentials,
             is_impersonated_credential=False,
             include_email=False,
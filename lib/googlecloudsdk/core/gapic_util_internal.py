@@ -34,6 +34,7 @@ from googlecloudsdk.core import exceptions
 from googlecloudsdk.core import log
 from googlecloudsdk.core import metrics
 from googlecloudsdk.core import properties
+from googlecloudsdk.core import tracing
 from googlecloudsdk.core import transport as core_transport
 from googlecloudsdk.core.credentials import transport
 from googlecloudsdk.core.util import encoding
@@ -875,6 +876,41 @@ class RPCDurationReporterInterceptor(grpc.UnaryUnaryClientInterceptor):
     return response
 
 
+class TracingInterceptor(grpc.UnaryUnaryClientInterceptor):
+  """Interceptor for recording a trace span for each unary-unary RPC."""
+
+  def intercept_unary_unary(self, continuation, client_call_details, request):
+    """Intercepts and records the span of an RPC.
+
+    Overrides abstract method defined in grpc.UnaryUnaryClientInterceptor.
+    Args:
+        continuation: a function to continue the request process.
+        client_call_details: a grpc._interceptor._ClientCallDetails
+            instance containing request metadata.
+        request: the request value for the RPC.
+    Returns:
+        A grpc.Call/grpc.Future instance representing a service response.
+    """
+    attributes = {'method': client_call_details.method}
+    if hasattr(request, 'ByteSize'):
+      attributes['request_bytes'] = request.ByteSize()
+    start_time = time.time()
+    response = continuation(client_call_details, request)
+    end_time = time.time()
+    try:
+      attributes['status'] = response.code().name
+      result = response.result()
+      if hasattr(result, 'ByteSize'):
+        attributes['response_bytes'] = result.ByteSize()
+    except Exception:  # pylint: disable=broad-except
+      # A failed RPC raises its error from result().
+      pass
+    tracing.AddSpan(
+        tracing.GRPC_REQUEST_SPAN, start_time, end_time, **attributes)
+
+    return response
+
+
 class EcpGrpcSigner(object):
   """A custom signer for ECP (Enterprise Certificate Proxy)."""
 
@@ -1113,6 +1149,8 @@ def MakeTransport(
   interceptors.append(TimeoutInterceptor())
   interceptors.append(IAMAuthHeadersInterceptor())
   interceptors.append(RPCDurationReporterInterceptor())
+  if tracing.IsEnabled():
+    interceptors.append(TracingInterceptor())
   interceptors.append(QuotaProjectInterceptor(credentials))
   interceptors.append(APIEnablementInterceptor())
   interceptors.append(RequestOrgRestrictionInterceptor())
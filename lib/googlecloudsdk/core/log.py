@@ -23,8 +23,11 @@ import datetime
 import json
 import logging
 import os
+import queue
 import sys
+import threading
 import time
+import weakref
 
 from googlecloudsdk.core import properties
 from googlecloudsdk.core.console import console_attr
@@ -65,6 +68,14 @@ USED_SURFACE_PATTERN = r'Running \[gcloud\.([-\w\.]+)\.[-\w]+\]'
 # For example, `logs/1970.01.01/12.00.00.000000.log`.
 DAY_DIR_FORMAT = '%Y.%m.%d'
 FILENAME_FORMAT = '%H.%M.%S.%f'
+# The modification time of this file in a logs directory records the last log
+# cleanup of the directory.
+_LOG_CLEANUP_MARKER_FILE_NAME = '.last_cleanup'
+
+# The most log lines the background log writer writes with one write call.
+_LOG_WRITE_BATCH_SIZE = 1000
+# Tells the background log writer to stop.
+_CLOSE_LOG_WRITER = object()
 
 # These are for Structured (JSON) Log Records
 STRUCTURED_RECORD_VERSION = '0.0.1'
@@ -103,6 +114,105 @@ class _NullHandler(logging.Handler, object):
     self.lock = None
 
 
+class _AsyncFileHandler(logging.Handler):
+  """A handler that writes log records to a file on a background thread.
+
+  Records are formatted on the thread that logs them and queued, and a daemon
+  thread appends them to the file in batches, so logging a record does not
+  wait for the file system. flush() and close() wait until the queued records
+  are written, and logging.shutdown() calls both when the process exits.
+  """
+
+  def __init__(self, filename, encoding=None):
+    super(_AsyncFileHandler, self).__init__()
+    self.baseFilename = os.path.abspath(filename)
+    self._stream = open(filename, 'a', encoding=encoding)
+    self._StartWriter()
+    _async_file_handlers.add(self)
+
+  def _StartWriter(self):
+    self._queue = queue.SimpleQueue()
+    self._writer = threading.Thread(
+        target=self._WriteQueuedLines, name='log-writer')
+    self._writer.daemon = True
+    self._writer.start()
+
+  def _WriteQueuedLines(self):
+    """Writes queued lines until the handler is closed."""
+    while True:
+      items = [self._queue.get()]
+      try:
+        while len(items) < _LOG_WRITE_BATCH_SIZE:
+          items.append(self._queue.get_nowait())
+      except queue.Empty:
+        pass
+      lines = [item for item in items if isinstance(item, six.text_type)]
+      if lines:
+        try:
+          self._stream.write(''.join(lines))
+          self._stream.flush()
+        except (OSError, IOError, ValueError):
+          # There is no caller to report to. As with a full disk for a
+          # FileHandler, the records are lost but logging carries on.
+          pass
+      for item in items:
+        if isinstance(item, threading.Event):
+          item.set()
+      if _CLOSE_LOG_WRITER in items:
+        return
+
+  def emit(self, record):
+    if self._stream is None:
+      return
+    try:
+      self._queue.put(self.format(record) + '\n')
+    except Exception:  # pylint: disable=broad-except
+      self.handleError(record)
+
+  def flush(self):
+    """Waits until the records logged so far are written to the file."""
+    if self._stream is None or not self._writer.is_alive():
+      return
+    written = threading.Event()
+    self._queue.put(written)
+    written.wait()
+
+  def close(self):
+    self.acquire()
+    try:
+      if self._stream is not None:
+        if self._writer.is_alive():
+          self._queue.put(_CLOSE_LOG_WRITER)
+          self._writer.join()
+        self._stream.close()
+        self._stream = None
+    finally:
+      self.release()
+    super(_AsyncFileHandler, self).close()
+
+
+_async_file_handlers = weakref.WeakSet()
+
+
+def _FlushLogFilesBeforeFork():
+  # Neither the queue nor the writer thread survive in a forked child, and the
+  # parent may exit without cleanup right after forking.
+  for handler in list(_async_file_handlers):
+    handler.flush()
+
+
+def _RestartLogWritersAfterFork():
+  for handler in list(_async_file_handlers):
+    if handler._stream is not None:  # pylint: disable=protected-access
+      handler._StartWriter()  # pylint: disable=protected-access
+
+
+if hasattr(os, 'register_at_fork'):
+  os.register_at_fork(
+      before=_FlushLogFilesBeforeFork,
+      after_in_child=_RestartLogWritersAfterFork)
+
+
 class _UserOutputFilter(object):
   """A filter to turn on and off user output.
 
@@ -717,8 +827,7 @@ class _LogManager(object):
     # A handler to write DEBUG and above to log files in the given directory
     try:
       log_file = self._SetupLogsDir(logs_dir)
-      file_handler = logging.FileHandler(
-          log_file, encoding=LOG_FILE_ENCODING)
+      file_handler = _AsyncFileHandler(log_file, encoding=LOG_FILE_ENCODING)
     except (OSError, IOError, files.Error) as exp:
       warning('Could not setup log file in {0}, ({1}: {2}.\n'
               'The configuration directory may not be writable. '
@@ -735,12 +844,27 @@ class _LogManager(object):
     self.file_only_logger.addHandler(file_handler)
 
   def _CleanUpLogs(self, logs_dir):
-    """Clean up old log files if log cleanup has been enabled."""
-    if self._GetMaxLogDays():
-      try:
-        self._CleanLogsDir(logs_dir)
-      except OSError:
+    """Clean up old log files if log cleanup has been enabled and is due."""
+    if not self._GetMaxLogDays():
+      return
+    marker = os.path.join(logs_dir, _LOG_CLEANUP_MARKER_FILE_NAME)
+    interval = (
+        properties.VALUES.core.log_cleanup_interval_hours.GetInt() * 60 * 60)
+    try:
+      if time.time() - os.path.getmtime(marker) < interval:
+        return
+    except OSError:
+      # The directory has not been cleaned up yet.
+      pass
+    try:
+      # Touch the marker first, so that gcloud instances started while this
+      # cleanup runs skip theirs.
+      with open(marker, 'a'):
         pass
+      os.utime(marker, None)
+      self._CleanLogsDir(logs_dir)
+    except OSError:
+      pass
 
   def _CleanLogsDir(self, logs_dir):
     """Cleans up old log files form the given logs directory.
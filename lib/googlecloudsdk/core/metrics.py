@@ -35,6 +35,7 @@ from googlecloudsdk.core.console import console_attr
 from googlecloudsdk.core.console import console_io
 from googlecloudsdk.core.util import agents
 from googlecloudsdk.core.util import encoding
+from googlecloudsdk.core.util import files as file_utils
 from googlecloudsdk.core.util import platforms
 import six
 import six.moves.urllib.error
@@ -61,6 +62,20 @@ _CLEARCUT_ENDPOINT = 'https://play.googleapis.com/log'
 _CLEARCUT_EVENT_METADATA_KEY = 'event_metadata'
 _CLEARCUT_ERROR_TYPE_KEY = 'error_type'
 
+# In spool mode, commands append their metrics to a spool shared by all gcloud
+# processes, and a single reporter process sends them in batches.
+_SPOOL_DIR_NAME = 'metrics_spool'
+_SPOOL_FILE_NAME = 'events.jsonl'
+_SPOOL_LOCK_FILE_NAME = 'events.lock'
+_SPOOL_LAST_FLUSH_FILE_NAME = 'last_flush'
+_SPOOL_BATCH_FILE_FORMAT = 'batch-{time_millis}-{pid}.jsonl'
+# The spool is flushed when it gets this large, or this long after the last
+# flush.
+_SPOOL_FLUSH_BYTES = 256 * 1024
+_SPOOL_FLUSH_INTERVAL_SECS = 300
+# If the spool stays locked longer, metrics are reported without it.
+_SPOOL_LOCK_TIMEOUT_SECS = 1
+
 
 class _Event(object):
 
@@ -534,25 +549,88 @@ class _MetricsCollector(object):
         log.debug('Failed to write telemetry file: %s', e)
     self._metrics = []
 
-  def ReportMetrics(self, wait_for_report=False):
-    """Reports the collected metrics using a separate async process."""
-    if not self._metrics:
-      return
+  def _SpoolMetrics(self, flush=False):
+    """Appends the collected metrics to the spool shared by all commands.
 
-    if encoding.GetEncodedValue(os.environ, 'CLOUDSDK_FROM_GOCLOUD') == '1':
-      self._WriteGoTelemetryFile()
-      return
+    Args:
+      flush: bool, True to flush the spool regardless of its size and age.
 
-    temp_metrics_file = tempfile.NamedTemporaryFile(delete=False)
-    with temp_metrics_file:
-      pickle.dump(self._metrics, temp_metrics_file)
+    Returns:
+      Optional[str], The path of a batch of spooled metrics this process must
+      report, or None if the spool does not need to be flushed yet.
+
+    Raises:
+      OSError: If the spool cannot be written.
+      ValueError: If the metrics cannot be encoded as JSON.
+      file_utils.Error: If the spool cannot be locked.
+    """
+    lines = [json.dumps(metric, sort_keys=True) + '\n'
+             for metric in self._metrics]
+    spool_dir = os.path.join(config.Paths().global_config_dir, _SPOOL_DIR_NAME)
+    file_utils.MakeDir(spool_dir, mode=0o700)
+    spool_path = os.path.join(spool_dir, _SPOOL_FILE_NAME)
+    last_flush_path = os.path.join(spool_dir, _SPOOL_LAST_FLUSH_FILE_NAME)
+
+    with file_utils.FileLock(
+        os.path.join(spool_dir, _SPOOL_LOCK_FILE_NAME),
+        timeout_secs=_SPOOL_LOCK_TIMEOUT_SECS):
+      with file_utils.FileWriter(spool_path, private=True, append=True) as f:
+        f.write(''.join(lines))
       self._metrics = []
 
+      if not os.path.exists(last_flush_path):
+        file_utils.WriteFileContents(last_flush_path, '', private=True)
+      since_last_flush = time.time() - os.path.getmtime(last_flush_path)
+      if not (flush or
+              os.path.getsize(spool_path) >= _SPOOL_FLUSH_BYTES or
+              since_last_flush >= _SPOOL_FLUSH_INTERVAL_SECS):
+        return None
+
+      # Other commands start a new spool, while this batch is being reported.
+      batch_path = os.path.join(
+          spool_dir,
+          _SPOOL_BATCH_FILE_FORMAT.format(
+              time_millis=GetTimeMillis(), pid=os.getpid()))
+      os.rename(spool_path, batch_path)
+      os.utime(last_flush_path, None)
+    return batch_path
+
+  def _RestoreSpoolBatch(self, batch_path):
+    """Appends a batch that could not be reported back to the spool.
+
+    Args:
+      batch_path: str, The path of the batch, as returned by _SpoolMetrics.
+
+    Raises:
+      OSError: If the spool cannot be written.
+      file_utils.Error: If the spool cannot be locked.
+    """
+    spool_dir = os.path.dirname(batch_path)
+    with file_utils.FileLock(
+        os.path.join(spool_dir, _SPOOL_LOCK_FILE_NAME),
+        timeout_secs=_SPOOL_LOCK_TIMEOUT_SECS):
+      batch = file_utils.ReadFileContents(batch_path)
+      with file_utils.FileWriter(
+          os.path.join(spool_dir, _SPOOL_FILE_NAME),
+          private=True, append=True) as f:
+        f.write(batch)
+      os.remove(batch_path)
+
+  def _StartReporter(self, reporter_args, wait_for_report=False):
+    """Starts the metrics reporting script in a separate process.
+
+    Args:
+      reporter_args: [str], The arguments of the reporting script.
+      wait_for_report: bool, True to wait for the script to finish.
+
+    Returns:
+      bool, True if the reporting process was started.
+    """
     this_file = encoding.Decode(__file__)
     reporting_script_path = os.path.realpath(
         os.path.join(os.path.dirname(this_file), 'metrics_reporter.py'))
     execution_args = execution_utils.ArgsForPythonTool(
-        reporting_script_path, temp_metrics_file.name)
+        reporting_script_path, *reporter_args)
     # On Python 2.x on Windows, the first arg can't be unicode. We encode
     # encode it anyway because there is really nothing else we can do if
     # that happens.
@@ -570,11 +648,53 @@ class _MetricsCollector(object):
       # This can happen specifically if the Python executable moves between the
       # start of this process and now.
       log.debug('Metrics reporting process failed to start.')
+      return False
     if wait_for_report:
       # NOTE: p.wait() can cause a deadlock. p.communicate() is recommended.
       # See python docs for more information.
       p.communicate()
       log.debug('Metrics reporting process finished.')
+    return True
+
+  def ReportMetrics(self, wait_for_report=False):
+    """Reports the collected metrics using a separate async process.
+
+    In spool mode, the metrics are appended to a spool instead, and a reporting
+    process is only started when the spool needs to be flushed.
+
+    Args:
+      wait_for_report: bool, True to wait for the metrics to be sent. In spool
+        mode, this also flushes the spool.
+    """
+    if not self._metrics:
+      return
+
+    if encoding.GetEncodedValue(os.environ, 'CLOUDSDK_FROM_GOCLOUD') == '1':
+      self._WriteGoTelemetryFile()
+      return
+
+    if properties.VALUES.metrics.spool.GetBool():
+      try:
+        batch_path = self._SpoolMetrics(flush=wait_for_report)
+      except (OSError, TypeError, ValueError, file_utils.Error) as e:
+        # The metrics that were not spooled are reported on their own below.
+        log.debug('Failed to spool metrics: %s', e)
+      else:
+        if batch_path and not self._StartReporter(
+            ['--spool', batch_path], wait_for_report):
+          # The batch is reported with a later flush instead.
+          try:
+            self._RestoreSpoolBatch(batch_path)
+          except (OSError, file_utils.Error) as e:
+            log.debug('Failed to restore spooled metrics: %s', e)
+        return
+
+    temp_metrics_file = tempfile.NamedTemporaryFile(delete=False)
+    with temp_metrics_file:
+      pickle.dump(self._metrics, temp_metrics_file)
+      self._metrics = []
+
+    self._StartReporter([temp_metrics_file.name], wait_for_report)
 
 
 def _RecordEventAndSetTimerContext(
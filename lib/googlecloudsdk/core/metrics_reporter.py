@@ -16,6 +16,8 @@
 """Script for reporting gcloud metrics."""
 
 
+import collections
+import json
 import os
 import pickle
 import sys
@@ -45,6 +47,9 @@ except ImportError:
 # indefinitely while waiting for a response.
 TIMEOUT_IN_SEC = 10
 
+# Maximum number of log events sent in a single Clearcut request.
+MAX_EVENTS_PER_REQUEST = 100
+
 
 def ReportMetrics(metrics_file_path):
   """Sends the specified anonymous usage event to the given analytics endpoint.
@@ -62,9 +67,79 @@ def ReportMetrics(metrics_file_path):
     session.request(metric[1], metric[0], data=metric[2], headers=metric[3],
                     timeout=TIMEOUT_IN_SEC)
 
+
+def _BatchClearcutRequests(metrics):
+  """Merges Clearcut requests that only differ in their log events.
+
+  Args:
+    metrics: [(str, str, str, dict)], The url, method, body and headers of each
+      request.
+
+  Returns:
+    [(str, str, str, dict)], The requests to send. Requests whose body is not a
+    Clearcut request are returned as is.
+  """
+  batches = collections.OrderedDict()
+  batched_metrics = []
+  for url, method, body, headers in metrics:
+    try:
+      request = json.loads(body)
+    except (TypeError, ValueError):
+      request = None
+    if not isinstance(request, dict) or not isinstance(
+        request.get('log_event'), list):
+      batched_metrics.append((url, method, body, headers))
+      continue
+    log_events = request.pop('log_event')
+    request_time_ms = request.pop('request_time_ms', None)
+    key = (url, method, json.dumps(request, sort_keys=True),
+           json.dumps(headers, sort_keys=True))
+    key_requests = batches.setdefault(key, [])
+    if (not key_requests or
+        len(key_requests[-1]['log_event']) >= MAX_EVENTS_PER_REQUEST):
+      request['log_event'] = []
+      key_requests.append(request)
+    key_requests[-1]['log_event'].extend(log_events)
+    key_requests[-1]['request_time_ms'] = request_time_ms
+
+  for (url, method, _, headers_json), key_requests in batches.items():
+    headers = json.loads(headers_json)
+    for request in key_requests:
+      batched_metrics.append(
+          (url, method, json.dumps(request, sort_keys=True), headers))
+  return batched_metrics
+
+
+def ReportSpooledMetrics(batch_file_path):
+  """Sends a batch of metrics flushed from the metrics spool.
+
+  Args:
+      batch_file_path: str, File with one JSON encoded metric (list) per line.
+  """
+  with files.FileReader(batch_file_path) as batch_file:
+    metrics = []
+    for line in batch_file:
+      try:
+        metrics.append(json.loads(line))
+      except ValueError:
+        # A writer was interrupted in the middle of a line.
+        pass
+  os.remove(batch_file_path)
+
+  session = requests.Session()
+
+  for url, method, body, headers in _BatchClearcutRequests(metrics):
+    session.request(method, url, data=body, headers=headers,
+                    timeout=TIMEOUT_IN_SEC)
+
+
 if __name__ == '__main__':
   try:
-    ReportMetrics(argv_utils.GetDecodedArgv()[1])
+    argv = argv_utils.GetDecodedArgv()
+    if argv[1] == '--spool':
+      ReportSpooledMetrics(argv[2])
+    else:
+      ReportMetrics(argv[1])
   # pylint: disable=bare-except, Never fail or output a stacktrace here.
   except:
     pass
@@ -479,6 +479,23 @@ class _Section(object):
         validator=functools.partial(_BooleanValidator, name),
         choices=('true', 'false'))
 
+  def _AddInt(self,
+              name,
+              help_text=None,
+              internal=False,
+              hidden=False,
+              callbacks=None,
+              default=None):
+    """Adds a property that only accepts positive integers."""
+    return self._Add(
+        name=name,
+        help_text=help_text,
+        internal=internal,
+        hidden=hidden,
+        callbacks=callbacks,
+        default=default,
+        validator=functools.partial(_IntegerValidator, name))
+
   def Property(self, property_name):
     """Gets a property from this section, given its name.
 
@@ -1547,6 +1564,14 @@ class _SectionComponentManager(_Section):
         hidden=True,
         help_text='If True, Google Cloud CLI will not display warning messages '
         'about overridden configurations.')
+    self.delta_updates = self._AddBool(
+        'delta_updates',
+        default=False,
+        help_text='If True, `gcloud components update` only downloads the '
+        'files that changed in a component, for components whose repository '
+        'publishes a file manifest. Components fall back to a full download '
+        'otherwise. Only components installed or updated while this is set '
+        'can be updated this way.')
     self.fixed_sdk_version = self._Add('fixed_sdk_version', hidden=True)
     self.snapshot_url = self._Add('snapshot_url', hidden=True)
     # We need the original snapshot_url because snapshot_url may be
@@ -1956,6 +1981,19 @@ class _SectionCore(_Section):
         'instead of the nice UX scrubbed exceptions.')
     self.print_unhandled_tracebacks = self._AddBool(
         'print_unhandled_tracebacks', hidden=True)
+    self.lazy_command_imports = self._AddBool(
+        'lazy_command_imports',
+        default=True,
+        hidden=True,
+        help_text='If True, the API modules imported by command modules are '
+        'only run when the command first uses them, usually in Run.')
+    self.cli_tree_generation_processes = self._AddInt(
+        'cli_tree_generation_processes',
+        hidden=True,
+        help_text='The number of processes that generate the CLI tree, each '
+        'loading some of the top level command groups. If unset, one process '
+        'per CPU is used, up to 8. Set to 1 to generate the tree in the '
+        'gcloud process.')
     self.print_handled_tracebacks = self._AddBool(
         'print_handled_tracebacks', hidden=True)
     self.trace_token = self._Add(
@@ -1963,6 +2001,20 @@ class _SectionCore(_Section):
         help_text='Token used to route traces of service requests for '
         'investigation of issues. This token will be provided by Google '
         'support.')
+    self.trace_spans_dir = self._Add(
+        'trace_spans_dir',
+        help_text='If set, each gcloud invocation writes a trace of where its '
+        'time goes to a new file in this directory. The trace has nested '
+        'spans for startup, loading the command, parsing its arguments, '
+        'loading credentials, each API request and printing the output. See '
+        '`trace_spans_format` for the file format.')
+    self.trace_spans_format = self._Add(
+        'trace_spans_format',
+        choices=['chrome', 'otlp'],
+        default='chrome',
+        help_text='The format of the trace files written to `trace_spans_dir`. '
+        '`chrome` is the Chrome trace event format, which chrome://tracing '
+        'and Perfetto open. `otlp` is OpenTelemetry protocol JSON.')
     self.request_reason = self._Add('request_reason', hidden=True)
     self.pass_credentials_to_gsutil = self._AddBool(
         'pass_credentials_to_gsutil',
@@ -2076,6 +2128,14 @@ class _SectionCore(_Section):
         ' files. If unset, the default is 30 days.',
         default='30')
 
+    self.log_cleanup_interval_hours = self._AddInt(
+        'log_cleanup_interval_hours',
+        default=24,
+        help_text='Minimum number of hours between two passes of log garbage'
+        ' collection over the logs directory. Log files are deleted a whole'
+        ' day at a time, so passes more frequent than the default of 24'
+        ' hours rarely delete anything.')
+
     self.disable_file_logging = self._AddBool(
         'disable_file_logging',
         default=False,
@@ -2623,6 +2683,14 @@ class _SectionInteractive(_Section):
         default=False,
         hidden=True,
         help_text='If True, obfuscate status PII.')
+    self.prefetch_completers = self._Add(
+        'prefetch_completers',
+        default='',
+        help_text=('Comma separated list of resource completer module paths, '
+                   'for example googlecloudsdk.command_lib.compute.completers:'
+                   'ZonesCompleter, whose completion cache tables are '
+                   'refreshed in the background for the current project. '
+                   'Empty (the default) disables the refresh.'))
     self.prompt = self._Add(
         'prompt', default='$ ', help_text='Command prompt string.')
     self.show_help = self._AddBool(
@@ -2776,6 +2844,13 @@ class _SectionMetrics(_Section):
     self.environment = self._Add('environment', hidden=True)
     self.environment_version = self._Add('environment_version', hidden=True)
     self.command_name = self._Add('command_name', internal=True)
+    self.spool = self._AddBool(
+        'spool',
+        hidden=True,
+        help_text='If True, commands append usage metrics to a local spool '
+        'that is reported in batches, instead of starting a reporting '
+        'process after every command. Useful on hosts that run many gcloud '
+        'commands.')
 
     def GetAgentName():
       from googlecloudsdk.core.util import agents  # pylint: disable=g-import-not-at-top
@@ -3708,6 +3783,15 @@ class _SectionStorage(_Section):
         ' on the same thread. Turning off can help with some bugs but will'
         ' hurt performance.')
 
+    self.wildcard_expansion_thread_count = self._AddInt(
+        'wildcard_expansion_thread_count',
+        default=8,
+        help_text='The number of threads used to list intermediate prefixes'
+        ' concurrently when expanding cloud URLs with wildcards in several'
+        ' path components (e.g. `gs://bucket/*/2024-*/part-*`), and to scan'
+        ' local directories concurrently during recursive iteration. Set to 1'
+        ' to list one prefix or directory at a time.')
+
     self.preferred_api = self._Add(
         'preferred_api',
         default=StoragePreferredApi.JSON.value,
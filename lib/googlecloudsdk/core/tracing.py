@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local tracing of where the time of a gcloud invocation goes.
+
+Tracing is off unless the core/trace_spans_dir property is set. Each
+invocation then writes one file to that directory, with nested spans for
+interpreter startup, imports, loading the command, parsing the arguments,
+loading and refreshing credentials, each HTTP and gRPC request, and printing
+the resources. Depending on core/trace_spans_format the file is a Chrome trace
+(for chrome://tracing or https://ui.perfetto.dev) or OTLP JSON.
+
+Code that wants its own span uses the Span context manager, or the Traced
+decorator, which do nothing when tracing is off:
+
+  with tracing.Span('compute.wait', operation=name) as attributes:
+    ...
+    attributes['done'] = True
+"""
+
+import atexit
+import collections
+import contextlib
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+
+from googlecloudsdk.core import log
+from googlecloudsdk.core import properties
+from googlecloudsdk.core.util import files
+
+CHROME_FORMAT = 'chrome'
+OTLP_FORMAT = 'otlp'
+
+HTTP_REQUEST_SPAN = 'http.request'
+GRPC_REQUEST_SPAN = 'grpc.request'
+
+_FILE_NAME_FORMAT = 'gcloud-{time_millis}-{pid}.json'
+_ROOT_SPAN_NAME = 'gcloud'
+
+# OTLP span kinds.
+_OTLP_KIND_INTERNAL = 1
+_OTLP_KIND_CLIENT = 3
+
+_Span = collections.namedtuple(
+    '_Span',
+    ['name', 'span_id', 'parent_id', 'thread_id', 'start_time', 'end_time',
+     'attributes'])
+
+_tracer = None
+
+
+def _ProcessStartTime():
+  """Gets the time this process started, or None if it is not known."""
+  try:
+    with open('/proc/self/stat') as f:
+      # The command name in parentheses may contain spaces.
+      fields = f.read().rpartition(')')[2].split()
+    start_ticks = int(fields[19])
+    since_boot = time.clock_gettime(time.CLOCK_BOOTTIME)
+    ticks_per_second = os.sysconf('SC_CLK_TCK')
+  except (OSError, ValueError, IndexError, AttributeError):
+    return None
+  return time.time() - (since_boot - start_ticks / ticks_per_second)
+
+
+class Tracer(object):
+  """Collects the spans of an invocation from any thread."""
+
+  def __init__(self, start_time, trace_dir=None, trace_format=CHROME_FORMAT):
+    self.start_time = start_time
+    self.trace_dir = trace_dir
+    self.trace_format = trace_format
+    self._spans = []
+    self._lock = threading.Lock()
+    self._span_ids = itertools.count(1)
+    self._local = threading.local()
+    self.root_id = next(self._span_ids)
+
+  def _Stack(self):
+    stack = getattr(self._local, 'stack', None)
+    if stack is None:
+      stack = self._local.stack = []
+    return stack
+
+  def NewSpanId(self):
+    with self._lock:
+      return next(self._span_ids)
+
+  def CurrentSpanId(self):
+    """Gets the innermost span open on this thread, or the root span."""
+    stack = self._Stack()
+    return stack[-1] if stack else self.root_id
+
+  @contextlib.contextmanager
+  def Span(self, name, attributes):
+    """Records a span around the body of the with statement."""
+    span_id = self.NewSpanId()
+    parent_id = self.CurrentSpanId()
+    stack = self._Stack()
+    stack.append(span_id)
+    start_time = time.time()
+    try:
+      yield attributes
+    except BaseException as e:
+      attributes.setdefault('error', type(e).__name__)
+      raise
+    finally:
+      stack.pop()
+      self.AddSpan(name, start_time, time.time(), attributes,
+                   span_id=span_id, parent_id=parent_id)
+
+  def AddSpan(self, name, start_time, end_time, attributes, span_id=None,
+              parent_id=None):
+    """Records a span that was timed by the caller."""
+    span = _Span(
+        name, span_id or self.NewSpanId(),
+        parent_id or self.CurrentSpanId(), threading.current_thread().ident,
+        start_time, end_time, dict(attributes))
+    with self._lock:
+      self._spans.append(span)
+
+  def Spans(self, end_time):
+    """Gets the recorded spans, starting with the root span."""
+    root = _Span(_ROOT_SPAN_NAME, self.root_id, None,
+                 threading.main_thread().ident, self.start_time, end_time,
+                 {'pid': os.getpid()})
+    with self._lock:
+      return [root] + sorted(self._spans, key=lambda s: s.start_time)
+
+  def ToChromeTrace(self, end_time):
+    """Gets the spans as a Chrome trace with one complete event per span."""
+    pid = os.getpid()
+    events = []
+    for span in self.Spans(end_time):
+      events.append({
+          'name': span.name,
+          'cat': 'gcloud',
+          'ph': 'X',
+          'ts': round(span.start_time * 1e6),
+          'dur': round((span.end_time - span.start_time) * 1e6),
+          'pid': pid,
+          'tid': span.thread_id,
+          'args': span.attributes,
+      })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+  def ToOtlp(self, end_time):
+    """Gets the spans as an OTLP JSON ExportTraceServiceRequest."""
+    trace_id = os.urandom(16).hex()
+    spans = []
+    for span in self.Spans(end_time):
+      otlp_span = {
+          'traceId': trace_id,
+          'spanId': '{0:016x}'.format(span.span_id),
+          'name': span.name,
+          'kind': (_OTLP_KIND_CLIENT
+                   if span.name in (HTTP_REQUEST_SPAN, GRPC_REQUEST_SPAN)
+                   else _OTLP_KIND_INTERNAL),
+          'startTimeUnixNano': str(int(span.start_time * 1e9)),
+          'endTimeUnixNano': str(int(span.end_time * 1e9)),
+          'attributes': _OtlpAttributes(span.attributes),
+      }
+      if span.parent_id:
+        otlp_span['parentSpanId'] = '{0:016x}'.format(span.parent_id)
+      spans.append(otlp_span)
+    return {'resourceSpans': [{
+        'resource': {'attributes': _OtlpAttributes({
+            'service.name': 'gcloud', 'process.pid': os.getpid()})},
+        'scopeSpans': [{
+            'scope': {'name': 'googlecloudsdk'},
+            'spans': spans,
+        }],
+    }]}
+
+
+def _OtlpAttributes(attributes):
+  """Converts a dict to a list of OTLP JSON KeyValues."""
+  key_values = []
+  for key, value in sorted(attributes.items()):
+    if isinstance(value, bool):
+      otlp_value = {'boolValue': value}
+    elif isinstance(value, int):
+      otlp_value = {'intValue': str(value)}
+    elif isinstance(value, float):
+      otlp_value = {'doubleValue': value}
+    else:
+      otlp_value = {'stringValue': str(value)}
+    key_values.append({'key': key, 'value': otlp_value})
+  return key_values
+
+
+def Start(start_time=None, imports_end_time=None):
+  """Starts tracing this invocation if core/trace_spans_dir is set.
+
+  The trace is written when the process exits.
+
+  Args:
+    start_time: float, When gcloud started running, before its imports.
+    imports_end_time: float, When the imports of the entry point finished.
+  """
+  global _tracer
+  trace_dir = properties.VALUES.core.trace_spans_dir.Get()
+  if _tracer or not trace_dir:
+    return
+  trace_format = properties.VALUES.core.trace_spans_format.Get()
+  start_time = start_time or time.time()
+  process_start_time = _ProcessStartTime()
+  if process_start_time is not None and process_start_time < start_time:
+    _tracer = Tracer(process_start_time, trace_dir, trace_format)
+    _tracer.AddSpan('interpreter', process_start_time, start_time, {})
+  else:
+    _tracer = Tracer(start_time, trace_dir, trace_format)
+  if imports_end_time:
+    _tracer.AddSpan('imports', start_time, imports_end_time, {})
+  atexit.register(Finish)
+
+
+def IsEnabled():
+  """Returns whether spans are being recorded."""
+  return _tracer is not None
+
+
+@contextlib.contextmanager
+def Span(name, **attributes):
+  """Records a span around the body of the with statement if tracing is on.
+
+  Args:
+    name: str, The name of the span.
+    **attributes: Values describing the span. The with statement gets the
+      dict of them, to add values only known at the end.
+
+  Yields:
+    dict, The attributes of the span.
+  """
+  if _tracer is None:
+    yield attributes
+  else:
+    with _tracer.Span(name, attributes):
+      yield attributes
+
+
+def Traced(name):
+  """Decorates a function to record a span for each call if tracing is on."""
+
+  def Decorator(func):
+
+    @functools.wraps(func)
+    def Wrapper(*args, **kwargs):
+      if _tracer is None:
+        return func(*args, **kwargs)
+      with _tracer.Span(name, {}):
+        return func(*args, **kwargs)
+
+    return Wrapper
+
+  return Decorator
+
+
+def AddSpan(name, start_time, end_time, **attributes):
+  """Records a span timed by the caller, if tracing is on.
+
+  Args:
+    name: str, The name of the span.
+    start_time: float, When the span started, in seconds since the epoch.
+    end_time: float, When the span ended, in seconds since the epoch.
+    **attributes: Values describing the span.
+  """
+  if _tracer is not None:
+    _tracer.AddSpan(name, start_time, end_time, attributes)
+
+
+def Finish():
+  """Stops tracing and writes the trace file.
+
+  Returns:
+    str, The path of the trace file, or None if tracing was off or the file
+    could not be written.
+  """
+  global _tracer
+  tracer, _tracer = _tracer, None
+  if tracer is None:
+    return None
+  end_time = time.time()
+  if tracer.trace_format == OTLP_FORMAT:
+    trace = tracer.ToOtlp(end_time)
+  else:
+    trace = tracer.ToChromeTrace(end_time)
+  path = os.path.join(tracer.trace_dir, _FILE_NAME_FORMAT.format(
+      time_millis=int(tracer.start_time * 1000), pid=os.getpid()))
+  try:
+    files.MakeDir(tracer.trace_dir)
+    files.WriteFileContents(path, json.dumps(trace))
+  except (files.Error, OSError) as e:
+    log.debug('Could not write the trace file [%s]: %s', path, e)
+    return None
+  log.debug('Wrote the trace of this invocation to [%s].', path)
+  return path
@@ -27,6 +27,7 @@ from googlecloudsdk.core import config
 from googlecloudsdk.core import log
 from googlecloudsdk.core import metrics
 from googlecloudsdk.core import properties
+from googlecloudsdk.core import tracing
 from googlecloudsdk.core.console import console_attr
 from googlecloudsdk.core.console import console_io
 from googlecloudsdk.core.util import agents
@@ -207,6 +208,9 @@ class RequestWrapper(six.with_metaclass(abc.ABCMeta, object)):
           )
       )
 
+    if tracing.IsEnabled():
+      handlers.append(Handler(StartSpan(), RecordSpan()))
+
     # Do this one last so that it sees the effects of the other modifiers.
     if properties.VALUES.core.log_http.GetBool():
       redact_token = properties.VALUES.core.log_http_redact_token.GetBool()
@@ -585,6 +589,64 @@ def ReportDuration():
   return _ReportDuration
 
 
+def _BodySize(body, headers):
+  """Gets the size of a request or response body, or None if unknown."""
+  if isinstance(body, (bytes, six.text_type)):
+    return len(body)
+  for header, value in six.iteritems(headers or {}):
+    if header.lower() in ('content-length', b'content-length'):
+      try:
+        return int(value)
+      except ValueError:
+        return None
+  return None
+
+
+def StartSpan():
+  """Records the details of a request for its trace span.
+
+  Returns:
+    A function that can be used in a Handler.request.
+  """
+
+  def _StartSpan(request):
+    """Records the start time, method and URL of a request."""
+    url, _, query = six.ensure_str(request.uri).partition('?')
+    data = {
+        'start_time': time.time(),
+        'method': six.ensure_str(request.method or 'GET'),
+        # The query is left out as it may contain keys.
+        'url': url,
+        'page_token': 'pageToken=' in query,
+    }
+    request_bytes = _BodySize(request.body, request.headers)
+    if request_bytes is not None:
+      data['request_bytes'] = request_bytes
+    return data
+
+  return _StartSpan
+
+
+def RecordSpan():
+  """Records the trace span of a request once its response arrives.
+
+  Returns:
+    A function that can be used in a Handler.response.
+  """
+
+  def _RecordSpan(response, data):
+    """Records the span with the status and size of the response."""
+    attributes = dict(data, status=response.status_code)
+    start_time = attributes.pop('start_time')
+    response_bytes = _BodySize(response.body, response.headers)
+    if response_bytes is not None:
+      attributes['response_bytes'] = response_bytes
+    tracing.AddSpan(tracing.HTTP_REQUEST_SPAN, start_time, time.time(),
+                    **attributes)
+
+  return _RecordSpan
+
+
 def GetAndCacheArchitecture(user_platform):
   """Get and cache architecture of client machine.
 
@@ -0,0 +1,465 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Delta updates of components from a manifest of the files they contain.
+
+A component in a snapshot may have a data.manifest URL next to its archive.
+The manifest is a JSON object listing every entry of the archive in order:
+
+  {
+    "objects": "objects/",
+    "files": [
+      {"path": "lib/", "type": "dir", "mode": 493},
+      {"path": "lib/tool.py", "sha256": "<hex digest>", "size": 1234,
+       "mode": 420},
+      {"path": "bin/tool", "type": "symlink", "target": "../lib/tool.py"}
+    ]
+  }
+
+The gzip compressed contents of each file are stored at
+<objects>/<sha256>.gz, where a relative objects URL is relative to the
+manifest. When updating an installed component, files whose contents match a
+file of the installed version are copied locally and only the others are
+downloaded. Everything is assembled and verified in a staging directory, which
+is then installed like an extracted archive.
+"""
+
+import collections
+from concurrent import futures
+import gzip
+import json
+import os
+import posixpath
+import re
+import shutil
+import stat
+import tarfile
+import threading
+import zlib
+
+from googlecloudsdk.core import exceptions
+from googlecloudsdk.core import log
+from googlecloudsdk.core.console import console_io
+from googlecloudsdk.core.updater import installers
+from googlecloudsdk.core.util import files as file_utils
+import requests
+import six
+
+
+OBJECT_SUFFIX = '.gz'
+DEFAULT_OBJECTS_URL = 'objects/'
+
+# Maximum number of changed files of a component downloaded at the same time.
+_MAX_PARALLEL_OBJECTS = 4
+
+_FILE = 'file'
+_DIR = 'dir'
+_SYMLINK = 'symlink'
+
+ManifestEntry = collections.namedtuple(
+    'ManifestEntry', ['path', 'type', 'sha256', 'size', 'mode', 'target']
+)
+
+
+class Error(exceptions.Error):
+  """Base exception for the delta module."""
+
+  pass
+
+
+class ManifestError(Error):
+  """Exception for when a file manifest cannot be fetched or is malformed."""
+
+  pass
+
+
+class ObjectVerificationError(Error):
+  """Exception for when downloaded file contents do not match their hash."""
+
+  pass
+
+
+def _NormalizePath(path):
+  """Normalizes a relative manifest path, rejecting ones outside the root."""
+  if not isinstance(path, six.string_types) or not path:
+    raise ManifestError('Invalid path in manifest: [{0}]'.format(path))
+  norm_path = posixpath.normpath(path)
+  if (posixpath.isabs(norm_path) or norm_path == '..' or
+      norm_path.startswith('../') or '\\' in norm_path):
+    raise ManifestError('Invalid path in manifest: [{0}]'.format(path))
+  return norm_path
+
+
+def _ParseEntry(entry):
+  """Parses an entry of the files list of a manifest into a ManifestEntry."""
+  if not isinstance(entry, dict):
+    raise ManifestError('Invalid file entry in manifest: [{0}]'.format(entry))
+  entry_type = entry.get('type', _FILE)
+  path = _NormalizePath(entry.get('path'))
+  mode = entry.get('mode')
+  if mode is not None and not isinstance(mode, int):
+    raise ManifestError('Invalid mode for [{0}] in manifest.'.format(path))
+  sha256, size, target = None, None, None
+  if entry_type == _FILE:
+    sha256, size = entry.get('sha256'), entry.get('size')
+    if not isinstance(sha256, six.string_types) or len(sha256) != 64:
+      raise ManifestError('Invalid sha256 for [{0}] in manifest.'.format(path))
+    if not isinstance(size, int) or size < 0:
+      raise ManifestError('Invalid size for [{0}] in manifest.'.format(path))
+  elif entry_type == _SYMLINK:
+    target = entry.get('target')
+    if not isinstance(target, six.string_types) or not target:
+      raise ManifestError('Invalid target for [{0}] in manifest.'.format(path))
+    # Links must point inside the component, the same way paths must.
+    if posixpath.isabs(target):
+      raise ManifestError('Invalid target for [{0}] in manifest.'.format(path))
+    try:
+      _NormalizePath(posixpath.join(posixpath.dirname(path), target))
+    except ManifestError:
+      raise ManifestError('Invalid target for [{0}] in manifest.'.format(path))
+  elif entry_type != _DIR:
+    raise ManifestError(
+        'Invalid type [{0}] for [{1}] in manifest.'.format(entry_type, path))
+  return ManifestEntry(path, entry_type, sha256, size, mode, target)
+
+
+def ParseManifest(manifest_dict):
+  """Parses the contents of a file manifest.
+
+  Args:
+    manifest_dict: dict, The JSON contents of the manifest.
+
+  Returns:
+    (str, [ManifestEntry]), The objects URL as written in the manifest and the
+    entries of the archive in order.
+
+  Raises:
+    ManifestError: If the manifest is malformed.
+  """
+  if not isinstance(manifest_dict, dict):
+    raise ManifestError('The manifest must be a JSON object.')
+  objects_url = manifest_dict.get('objects', DEFAULT_OBJECTS_URL)
+  if not isinstance(objects_url, six.string_types):
+    raise ManifestError('Invalid objects URL in manifest.')
+  file_entries = manifest_dict.get('files')
+  if not isinstance(file_entries, list):
+    raise ManifestError('The manifest must have a list of files.')
+  entries = [_ParseEntry(entry) for entry in file_entries]
+  paths = set()
+  for entry in entries:
+    if entry.path in paths:
+      raise ManifestError(
+          'Duplicate path [{0}] in manifest.'.format(entry.path))
+    paths.add(entry.path)
+  symlinks = set(entry.path for entry in entries if entry.type == _SYMLINK)
+  for entry in entries:
+    parent = posixpath.dirname(entry.path)
+    while parent:
+      if parent in symlinks:
+        raise ManifestError(
+            'Path [{0}] in manifest is under the symlink [{1}].'.format(
+                entry.path, parent))
+      parent = posixpath.dirname(parent)
+  return objects_url, entries
+
+
+def LoadManifest(url, command_path='unknown'):
+  """Fetches and parses the file manifest at the given URL.
+
+  Args:
+    url: str, The URL of the manifest.
+    command_path: the command path to include in the User-Agent header if the
+      URL is HTTP
+
+  Returns:
+    (str, [ManifestEntry]), The absolute URL of the objects and the entries of
+    the archive in order.
+
+  Raises:
+    ManifestError: If the manifest cannot be fetched or is malformed.
+  """
+  try:
+    response = installers.MakeRequest(url, command_path)
+    manifest_dict = json.loads(response.content.decode('utf-8'))
+  except (requests.exceptions.HTTPError, OSError, installers.Error,
+          ValueError) as e:
+    raise ManifestError(
+        'Could not load the manifest [{0}]: {1}'.format(url, e))
+  objects_url, entries = ParseManifest(manifest_dict)
+  if not re.search(r'^\w+://', objects_url):
+    objects_url = posixpath.dirname(url) + '/' + objects_url
+  return objects_url.rstrip('/') + '/', entries
+
+
+def _FileMode(path):
+  return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def _LinkOrCopy(source, dest, mode):
+  """Hard links source to dest, or copies it if the mode must change."""
+  if mode is None or _FileMode(source) == mode | stat.S_IWUSR:
+    try:
+      os.link(source, dest)
+      return
+    except OSError:
+      pass
+  shutil.copy2(source, dest)
+  if mode is not None:
+    os.chmod(dest, mode | stat.S_IWUSR)
+
+
+class _LocalFiles(object):
+  """Finds installed files by content hash, checking they were not modified."""
+
+  def __init__(self, sdk_root, installed_hashes):
+    self._sdk_root = sdk_root
+    self._paths_by_hash = collections.defaultdict(list)
+    for path, sha256 in sorted(installed_hashes.items()):
+      self._paths_by_hash[sha256].append(path)
+    self._verified = {}
+
+  def Find(self, sha256):
+    """Gets the full path of an installed file with the given contents.
+
+    Args:
+      sha256: str, The hex digest of the contents.
+
+    Returns:
+      Optional[str], The path of the file, or None if no installed file has
+      these contents.
+    """
+    for path in self._paths_by_hash.get(sha256, []):
+      full_path = os.path.join(self._sdk_root, path)
+      if path not in self._verified:
+        self._verified[path] = (
+            os.path.isfile(full_path) and not os.path.islink(full_path) and
+            file_utils.Checksum.HashSingleFile(full_path) == sha256)
+      if self._verified[path]:
+        return full_path
+    return None
+
+
+class _Progress(object):
+  """Reports the fraction of bytes downloaded by several threads."""
+
+  def __init__(self, total_size, progress_callback):
+    self._total_size = total_size
+    self._progress_callback = progress_callback
+    self._bytes_done = 0
+    self._lock = threading.Lock()
+
+  def Add(self, num_bytes):
+    with self._lock:
+      self._bytes_done += num_bytes
+      if self._total_size:
+        self._progress_callback(self._bytes_done / self._total_size)
+
+
+def _FetchObject(objects_url, entry, dest, progress, command_path):
+  """Downloads, decompresses and verifies the contents of a file."""
+  url = objects_url + entry.sha256 + OBJECT_SUFFIX
+  checksum = file_utils.Checksum()
+  size = 0
+  try:
+    response = installers.MakeRequest(url, command_path)
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    with file_utils.BinaryFileWriter(dest) as fp:
+      for chunk in response.iter_content(
+          chunk_size=installers.WRITE_BUFFER_SIZE):
+        data = decompressor.decompress(chunk)
+        checksum.AddContents(data)
+        fp.write(data)
+        size += len(data)
+        progress.Add(len(data))
+      data = decompressor.flush()
+      checksum.AddContents(data)
+      fp.write(data)
+      size += len(data)
+  except (requests.exceptions.HTTPError, OSError, installers.Error,
+          zlib.error) as e:
+    raise Error('Could not download [{0}]: {1}'.format(url, e))
+  if size != entry.size or checksum.HexDigest() != entry.sha256:
+    raise ObjectVerificationError(
+        'The contents of [{0}] downloaded from [{1}] do not match the '
+        'manifest.'.format(entry.path, url))
+  if entry.mode is not None:
+    os.chmod(dest, entry.mode | stat.S_IWUSR)
+
+
+def _CheckSymlinks(staging_dir, entries):
+  """Checks the staged symlinks resolve inside the staging directory.
+
+  Each target is checked to be inside the component when the manifest is
+  parsed, but a target that goes up through another symlink can still end up
+  outside of it.
+
+  Args:
+    staging_dir: str, The directory the entries are staged in.
+    entries: [ManifestEntry], The entries of the manifest.
+
+  Raises:
+    ManifestError: If a symlink resolves outside of staging_dir.
+  """
+  root = os.path.join(os.path.realpath(staging_dir), '')
+  for entry in entries:
+    if entry.type != _SYMLINK:
+      continue
+    resolved = os.path.realpath(os.path.join(staging_dir, entry.path))
+    if not os.path.join(resolved, '').startswith(root):
+      raise ManifestError(
+          'Invalid target for [{0}] in manifest.'.format(entry.path))
+
+
+def StageComponent(component, installed_hashes, sdk_root, staging_dir,
+                   progress_callback=None, command_path='unknown'):
+  """Stages a component from its file manifest and the installed version.
+
+  Args:
+    component: schemas.Component, The component to stage. It must have a
+      data.manifest URL.
+    installed_hashes: {str: str}, The sha256 hex digest of each file of the
+      installed version of the component.
+    sdk_root: str, The path to the root directory of all Cloud SDK files.
+    staging_dir: str, The path of the directory to stage the files in.
+    progress_callback: f(float), A function to call with the fraction of
+      completeness.
+    command_path: the command path to include in the User-Agent header if the
+      URL is HTTP
+
+  Returns:
+    installers.StagedArchive, The files of the component in the staging
+    directory.
+
+  Raises:
+    Error: If the component cannot be staged from its manifest. The staging
+      directory is removed, and the component should be downloaded in full.
+  """
+  progress_callback = progress_callback or console_io.DefaultProgressBarCallback
+  objects_url, entries = LoadManifest(component.data.manifest, command_path)
+
+  local_files = _LocalFiles(sdk_root, installed_hashes)
+  local_sources = {}
+  to_fetch = collections.OrderedDict()
+  for entry in entries:
+    if entry.type != _FILE:
+      continue
+    local_source = local_files.Find(entry.sha256)
+    if local_source:
+      local_sources[entry.path] = local_source
+    else:
+      to_fetch.setdefault(entry.sha256, []).append(entry)
+  fetch_size = sum(same[0].size for same in to_fetch.values())
+  # The archive is compressed and the objects are compressed individually, so
+  # comparing uncompressed bytes to the archive size favors the full download.
+  if component.data.size and fetch_size >= component.data.size:
+    raise Error(
+        'The changed files of [{0}] are larger than its archive.'.format(
+            component.id))
+  log.debug('Delta update of [%s]: %d files unchanged, %d bytes to download.',
+            component.id, len(local_sources), fetch_size)
+
+  if os.path.exists(staging_dir):
+    file_utils.RmTree(staging_dir)
+  try:
+    file_utils.MakeDir(staging_dir)
+    for entry in entries:
+      dest = os.path.join(staging_dir, entry.path)
+      if entry.type == _DIR:
+        file_utils.MakeDir(dest)
+        if entry.mode is not None:
+          os.chmod(dest, entry.mode | stat.S_IWUSR)
+        continue
+      file_utils.MakeDir(os.path.dirname(dest))
+      if entry.type == _SYMLINK:
+        os.symlink(entry.target, dest)
+      elif entry.path in local_sources:
+        _LinkOrCopy(local_sources[entry.path], dest, entry.mode)
+    _CheckSymlinks(staging_dir, entries)
+
+    progress = _Progress(fetch_size, progress_callback)
+    with futures.ThreadPoolExecutor(_MAX_PARALLEL_OBJECTS) as executor:
+      fetches = [
+          executor.submit(
+              _FetchObject, objects_url, same[0],
+              os.path.join(staging_dir, same[0].path), progress, command_path)
+          for same in to_fetch.values()]
+      futures.wait(fetches)
+      for fetch in fetches:
+        fetch.result()
+    # Files with the same contents are only downloaded once.
+    for same in to_fetch.values():
+      fetched = os.path.join(staging_dir, same[0].path)
+      for entry in same[1:]:
+        _LinkOrCopy(fetched, os.path.join(staging_dir, entry.path), entry.mode)
+  except (OSError, Error) as e:
+    file_utils.RmTree(staging_dir)
+    if isinstance(e, Error):
+      raise
+    raise Error('Could not stage [{0}]: {1}'.format(component.id, e))
+  progress_callback(1)
+
+  files = [
+      entry.path + '/' if entry.type == _DIR else entry.path
+      for entry in entries]
+  hashes = dict(
+      (entry.path, entry.sha256) for entry in entries if entry.type == _FILE)
+  return installers.StagedArchive(staging_dir, files, hashes)
+
+
+def CreateManifest(archive_path, objects_dir, objects_url=DEFAULT_OBJECTS_URL):
+  """Creates the file manifest and objects of a component archive.
+
+  This is how a repository publishes components for delta updates: the
+  returned manifest is hosted next to the archive and referenced from the
+  component's data.manifest, and objects_dir is hosted at objects_url.
+
+  Args:
+    archive_path: str, The path of the component's .tar.gz archive.
+    objects_dir: str, The directory to write the compressed file contents to.
+      Contents already in the directory are not written again, so it can be
+      shared by all the components and versions of a repository.
+    objects_url: str, The URL objects_dir is hosted at, relative to the
+      manifest.
+
+  Returns:
+    dict, The JSON contents of the manifest.
+  """
+  file_utils.MakeDir(objects_dir)
+  entries = collections.OrderedDict()
+  with tarfile.open(archive_path) as tar:
+    for member in tar:
+      path = _NormalizePath(member.name)
+      # Later entries for the same path replace earlier ones when extracting.
+      entries.pop(path, None)
+      entry = {'path': path, 'mode': stat.S_IMODE(member.mode)}
+      if member.isdir():
+        entry['type'] = _DIR
+      elif member.issym():
+        entry['type'] = _SYMLINK
+        entry['target'] = member.linkname
+      elif member.isfile() or member.islnk():
+        contents = tar.extractfile(member).read()
+        checksum = file_utils.Checksum().AddContents(contents)
+        entry['sha256'] = checksum.HexDigest()
+        entry['size'] = len(contents)
+        object_path = os.path.join(
+            objects_dir, entry['sha256'] + OBJECT_SUFFIX)
+        if not os.path.exists(object_path):
+          with file_utils.BinaryFileWriter(object_path) as fp:
+            fp.write(gzip.compress(contents))
+      else:
+        continue
+      entries[path] = entry
+  return {'objects': objects_url, 'files': list(entries.values())}
@@ -15,8 +15,11 @@
 
 """Implementations of installers for different component types."""
 
+import collections
 import os
+import posixpath
 import re
+import shutil
 import stat
 import sys
 import tarfile
@@ -42,6 +45,13 @@ TIMEOUT_IN_SEC = 60
 UPDATE_MANAGER_TIMEOUT_IN_SEC = 3
 WRITE_BUFFER_SIZE = 16 * 1024
 
+# A component archive extracted into a staging directory, along with the
+# files it contains in archive order and the sha256 hex digest of each regular
+# file, if they were computed. Directories end with a '/'.
+StagedArchive = collections.namedtuple(
+    'StagedArchive', ['staging_dir', 'files', 'hashes']
+)
+
 
 class Error(exceptions.Error):
   """Base exception for the installers module."""
@@ -215,95 +225,221 @@ def _ExecuteRequestAndRaiseExceptions(url, headers, timeout):
   return response
 
 
-def DownloadTar(
-    url, download_dir, progress_callback=None, command_path='unknown'
+def _GetContentLength(response):
+  """Gets the size of a response body from its headers, or 0 if unknown."""
+  try:
+    return int(response.headers.get('Content-Length', 0))
+  except ValueError:
+    return 0
+
+
+class _ResponseReader(object):
+  """A read-only file object over the body of a streamed response.
+
+  Lets tarfile consume an archive while it is being downloaded.
+  """
+
+  def __init__(self, response, total_size, progress_callback):
+    """Initializes the reader.
+
+    Args:
+      response: requests.Response, A response opened with stream=True.
+      total_size: int, The expected size of the body in bytes, or 0 if unknown.
+      progress_callback: f(float), A function to call with the fraction of the
+        body read so far.
+    """
+    self._chunks = response.iter_content(chunk_size=WRITE_BUFFER_SIZE)
+    self._buffer = b''
+    self._bytes_read = 0
+    self._total_size = total_size
+    self._progress_callback = progress_callback
+
+  def read(self, size=-1):
+    while size < 0 or len(self._buffer) < size:
+      chunk = next(self._chunks, None)
+      if chunk is None:
+        break
+      self._buffer += chunk
+      self._bytes_read += len(chunk)
+      if self._total_size:
+        self._progress_callback(self._bytes_read / self._total_size)
+    if size < 0:
+      size = len(self._buffer)
+    data, self._buffer = self._buffer[:size], self._buffer[size:]
+    return data
+
+
+def _ShouldUseDataFilter():
+  # Tarfile module has a bug where it does not properly apply the "inherit
+  # permissions" bit on Windows machines when extracting files from a tar
+  # file on Python 3.12 and 3.13.
+  return (
+      sys.version_info >= (3, 12)
+      and sys.version_info < (3, 14)
+      and platforms.OperatingSystem.IsWindows()
+  )
+
+
+def _MemberNames(members):
+  return [
+      member.name + '/' if member.isdir() else member.name
+      for member in members
+  ]
+
+
+def _ExtractMember(tar, member, extract_dir):
+  """Extracts a single member of the given tar file."""
+  tar.extract(member, extract_dir)
+  full_path = os.path.join(extract_dir, member.name)
+  # Ensure read-and-write permission for all files
+  if os.path.isfile(full_path) and not os.access(full_path, os.W_OK):
+    os.chmod(full_path, stat.S_IWUSR | stat.S_IREAD)
+
+
+def HashFiles(root_dir, files):
+  """Gets the sha256 hex digest of the regular files in the given list.
+
+  Args:
+    root_dir: str, The directory the files are relative to.
+    files: [str], The files and directories, as returned by
+      DownloadAndExtractTar.
+
+  Returns:
+    {str: str}, The normalized path of each regular file to its digest.
+  """
+  hashes = {}
+  for name in files:
+    full_path = os.path.join(root_dir, name)
+    if os.path.isfile(full_path) and not os.path.islink(full_path):
+      hashes[posixpath.normpath(name)] = file_utils.Checksum.HashSingleFile(
+          full_path
+      )
+  return hashes
+
+
+def DownloadAndExtractTar(
+    url,
+    extract_dir,
+    progress_callback=None,
+    command_path='unknown',
+    size=None,
 ):
-  """Download the given tar file.
+  """Downloads the given tar file and extracts it as the bytes arrive.
+
+  The archive is never written to disk, and extraction overlaps with the
+  download instead of waiting for it to complete.
 
   Args:
     url: str, The URL to download.
-    download_dir: str, The path to put the temporary download file into.
+    extract_dir: str, The path to extract the tar into.
     progress_callback: f(float), A function to call with the fraction of
       completeness.
     command_path: the command path to include in the User-Agent header if the
       URL is HTTP
+    size: int, The expected size of the archive in bytes, used to report
+      progress if the response does not have a Content-Length.
 
   Returns:
-    str, The path of the downloaded tar file.
+    [str], The files that were extracted from the tar file.
 
   Raises:
-    URLFetchError: If there is a problem fetching the given URL.
+    URLFetchError: If there is a problem fetching the given URL, or the
+      downloaded archive is truncated or malformed.
   """
   progress_callback = progress_callback or console_io.DefaultProgressBarCallback
-  if not os.path.exists(download_dir):
-    file_utils.MakeDir(download_dir)
-  download_file_path = os.path.join(download_dir, os.path.basename(url))
-  if os.path.exists(download_file_path):
-    os.remove(download_file_path)
+  if not os.path.exists(extract_dir):
+    file_utils.MakeDir(extract_dir)
 
   try:
     response = MakeRequest(url, command_path)
-    with file_utils.BinaryFileWriter(download_file_path) as fp:
-      total_written = 0
-      total_size = len(response.content)
-      for chunk in response.iter_content(chunk_size=WRITE_BUFFER_SIZE):
-        fp.write(chunk)
-        total_written += len(chunk)
-        progress_callback(total_written / total_size)
-    progress_callback(1)
-  except (requests.exceptions.HTTPError, OSError) as e:
+    reader = _ResponseReader(
+        response, _GetContentLength(response) or size or 0, progress_callback
+    )
+    # Stream mode reads the archive front to back exactly once.
+    with tarfile.open(fileobj=reader, mode='r|*') as tar:
+      if _ShouldUseDataFilter():
+        tar.extractall(path=extract_dir, filter='data')
+        files = _MemberNames(tar.getmembers())
+      else:
+        members = []
+        for member in tar:
+          _ExtractMember(tar, member, extract_dir)
+          members.append(member)
+        files = _MemberNames(members)
+  except (requests.exceptions.HTTPError, OSError, EOFError,
+          tarfile.TarError) as e:
     raise URLFetchError(e)
 
-  return download_file_path
+  progress_callback(1)
+  return files
 
 
-def ExtractTar(downloaded_archive, extract_dir, progress_callback=None):
-  """Extracts the given archive.
+def InstallStagedArchive(staged_archive, install_dir, progress_callback=None):
+  """Moves the files of an archive extracted by DownloadAndExtractTar.
+
+  The staging directory must be on the same file system as install_dir, so
+  each file is moved with a rename. The staging directory is removed after.
+  If moving fails, the new files moved so far and the directories created
+  for them are removed again, so the component is not left partially
+  installed.
 
   Args:
-    downloaded_archive: str, The path to the archive downloaded previously.
-    extract_dir: str, The path to extract the tar into.
+    staged_archive: StagedArchive, The extracted archive.
+    install_dir: str, The path to move the files into.
     progress_callback: f(float), A function to call with the fraction of
       completeness.
 
   Returns:
-    [str], The files that were extracted from the tar file.
+    [str], The files that were installed.
   """
   progress_callback = progress_callback or console_io.DefaultProgressBarCallback
-  if not os.path.exists(extract_dir):
-    file_utils.MakeDir(extract_dir)
+  staging_dir, files, _ = staged_archive
+  total_files = len(files)
+  moved_paths = []
+  created_dirs = []
+
+  def MakeDirs(path):
+    missing_dirs = []
+    while path and not os.path.isdir(path):
+      missing_dirs.append(path)
+      path = os.path.dirname(path)
+    for missing_dir in reversed(missing_dirs):
+      file_utils.MakeDir(missing_dir)
+      created_dirs.append(missing_dir)
 
-  with tarfile.open(name=downloaded_archive) as tar:
-    members = tar.getmembers()
-    # Tarfile module has a bug where it does not properly apply the "inherit
-    # permissions" bit on Windows machines when extracting files from a tar
-    # file on Python 3.12 and 3.13.
-    if (
-        sys.version_info >= (3, 12)
-        and sys.version_info < (3, 14)
-        and platforms.OperatingSystem.IsWindows()
-    ):
-      tar.extractall(path=extract_dir, filter='data')
-      files = [
-          member.name + '/' if member.isdir() else member.name
-          for member in members
-      ]
-    else:
-      total_files = len(members)
-
-      files = []
-      for num, member in enumerate(members, start=1):
-        files.append(member.name + '/' if member.isdir() else member.name)
-        tar.extract(member, extract_dir)
-        full_path = os.path.join(extract_dir, member.name)
-        # Ensure read-and-write permission for all files
-        if os.path.isfile(full_path) and not os.access(full_path, os.W_OK):
-          os.chmod(full_path, stat.S_IWUSR | stat.S_IREAD)
-        progress_callback(num / total_files)
-
-    progress_callback(1)
-
-  os.remove(downloaded_archive)
+  try:
+    for num, name in enumerate(files, start=1):
+      source = os.path.join(staging_dir, name)
+      dest = os.path.join(install_dir, name)
+      if name.endswith('/'):
+        MakeDirs(os.path.normpath(dest))
+        if os.path.isdir(source):
+          shutil.copymode(source, dest)
+      # Archives may contain the same file more than once. The staged copy is
+      # the last one, and is moved the first time the file is listed.
+      elif os.path.lexists(source):
+        MakeDirs(os.path.dirname(dest))
+        replaced = os.path.lexists(dest)
+        os.replace(source, dest)
+        if not replaced:
+          moved_paths.append(dest)
+      progress_callback(num / total_files)
+  except OSError:
+    for path in reversed(moved_paths):
+      try:
+        os.remove(path)
+      except OSError:
+        pass
+    for path in reversed(created_dirs):
+      try:
+        os.rmdir(path)
+      except OSError:
+        # Not empty, e.g. because another component installed into it.
+        pass
+    raise
+  progress_callback(1)
+
+  file_utils.RmTree(staging_dir)
   return files
 
 
@@ -346,8 +482,8 @@ class ComponentInstaller(object):
         URL is HTTP
 
     Returns:
-      Optional[str], The path of the downloaded archive, or None if the
-        component has no actual sources.
+      Optional[StagedArchive], The component's files extracted into a staging
+        directory, or None if the component has no actual sources.
 
     Raises:
       UnsupportedSourceError: If the component data source is of an unknown
@@ -375,11 +511,11 @@ class ComponentInstaller(object):
     )
 
   def Extract(self, downloaded_archive, progress_callback=None):
-    """Extracts the archive previously downloaded from self.Download().
+    """Installs the archive previously downloaded from self.Download().
 
     Args:
-      downloaded_archive: Optional[str], The path to the archive downloaded
-        previously.
+      downloaded_archive: Optional[StagedArchive], The archive downloaded and
+        extracted into a staging directory previously.
       progress_callback: f(float), A function to call with the fraction of
         completeness.
 
@@ -390,7 +526,7 @@ class ComponentInstaller(object):
       # From a component with no actual data/sources; nothing to extract.
       return []
 
-    return ExtractTar(
+    return InstallStagedArchive(
         downloaded_archive, self.__sdk_root, progress_callback=progress_callback
     )
 
@@ -399,7 +535,9 @@ class ComponentInstaller(object):
   ):
     """Download implementation for a component with source in a .tar.gz.
 
-    Downloads the .tar for the component and returns its path.
+    Downloads the .tar for the component and extracts it into a staging
+    directory while it downloads. The files are moved into the SDK root by
+    self.Extract().
 
     Args:
       component: schemas.Component, The component to install.
@@ -409,8 +547,8 @@ class ComponentInstaller(object):
         URL is HTTP
 
     Returns:
-      Optional[str], The path of the downloaded archive, or None if the
-        component has no actual sources.
+      Optional[StagedArchive], The component's files extracted into a staging
+        directory, or None if the component has no actual sources.
 
     Raises:
       ValueError: If the source URL for the tar file is relative, but there is
@@ -431,12 +569,25 @@ class ComponentInstaller(object):
           )
       )
 
+    staging_dir = os.path.join(self.__download_directory, component.id)
+    if os.path.exists(staging_dir):
+      file_utils.RmTree(staging_dir)
+
     try:
-      return DownloadTar(
+      files = DownloadAndExtractTar(
           url,
-          self.__download_directory,
+          staging_dir,
           progress_callback=progress_callback,
           command_path=command_path,
+          size=component.data.size,
       )
     except (URLFetchError, AuthenticationError) as e:
+      if os.path.exists(staging_dir):
+        file_utils.RmTree(staging_dir)
       raise ComponentDownloadFailedError(component.id, e)
+    # The hashes are only used by later delta updates, so the extracted files
+    # are not read again unless those are enabled.
+    hashes = {}
+    if properties.VALUES.component_manager.delta_updates.GetBool():
+      hashes = HashFiles(staging_dir, files)
+    return StagedArchive(staging_dir, files, hashes)
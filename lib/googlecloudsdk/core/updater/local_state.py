@@ -23,6 +23,7 @@ tracking when we check for updates.
 
 import compileall
 import errno
+import json
 import logging
 import os
 import posixpath
@@ -32,7 +33,8 @@ import sys
 
 from googlecloudsdk.core import config
 from googlecloudsdk.core import exceptions
-from googlecloudsdk.core.console import console_io
+from googlecloudsdk.core import properties
+from googlecloudsdk.core.updater import delta
 from googlecloudsdk.core.updater import installers
 from googlecloudsdk.core.updater import snapshots
 from googlecloudsdk.core.util import encoding
@@ -298,15 +300,10 @@ class InstallationState(object):
     self._ClearStaging()
 
     with file_utils.TemporaryDirectory() as t:
-      download_dir = os.path.join(t, '.download')
       extract_dir = os.path.join(t, '.extract')
-      (download_callback, extract_callback) = (
-          console_io.SplitProgressBar(progress_callback, [1, 1]))
-      downloaded_tar = installers.DownloadTar(
-          url, download_dir, progress_callback=download_callback,
+      installers.DownloadAndExtractTar(
+          url, extract_dir, progress_callback=progress_callback,
           command_path='components.reinstall')
-      installers.ExtractTar(
-          downloaded_tar, extract_dir, progress_callback=extract_callback)
       files = os.listdir(extract_dir)
       if len(files) != 1:
         raise InvalidDownloadError()
@@ -440,6 +437,10 @@ class InstallationState(object):
                command_path='unknown'):
     """Downloads the given component based on the given snapshot.
 
+    If component_manager/delta_updates is set and the component has a file
+    manifest, only the files that differ from the installed version are
+    downloaded. Otherwise, or if that fails, the whole archive is downloaded.
+
     Args:
       snapshot: snapshots.ComponentSnapshot, The snapshot that describes the
         component to install.
@@ -450,8 +451,8 @@ class InstallationState(object):
         URL is HTTP
 
     Returns:
-      Optional[str], The path of the downloaded archive, or None if the
-        component has no actual sources.
+      Optional[installers.StagedArchive], The component's files extracted into a
+        staging directory, or None if the component has no actual sources.
 
     Raises:
       installers.URLFetchError: If the component associated with the provided
@@ -459,11 +460,34 @@ class InstallationState(object):
     """
     self._CreateStateDir()
     component = snapshot.ComponentFromId(component_id)
+    if (properties.VALUES.component_manager.delta_updates.GetBool() and
+        component.data and component.data.manifest):
+      installed_hashes = InstallationManifest(
+          self._state_directory, component_id).InstalledHashes()
+      if installed_hashes:
+        try:
+          return delta.StageComponent(
+              component, installed_hashes, self.__sdk_root,
+              os.path.join(self._state_directory,
+                           installers.ComponentInstaller.DOWNLOAD_DIR_NAME,
+                           component_id),
+              progress_callback=progress_callback, command_path=command_path)
+        except delta.Error as e:
+          logging.info('Downloading all of [%s] instead of a delta update: %s',
+                       component_id, e)
     downloaded_archive = self._component_installer.Download(
         component, progress_callback=progress_callback,
         command_path=command_path)
     return downloaded_archive
 
+  @_RaisesPermissionsError
+  def ClearDownloads(self):
+    """Deletes components downloaded by self.Download() but not installed."""
+    download_dir = os.path.join(
+        self._state_directory, installers.ComponentInstaller.DOWNLOAD_DIR_NAME)
+    if os.path.exists(download_dir):
+      file_utils.RmTree(download_dir)
+
   @_RaisesPermissionsError
   def Install(self, snapshot, component_id, downloaded_archive,
               progress_callback=None):
@@ -473,15 +497,17 @@ class InstallationState(object):
       snapshot: snapshots.ComponentSnapshot, The snapshot that describes the
         component to install.
       component_id: str, The component to install from the given snapshot.
-      downloaded_archive: Optional[str], The path to the archive downloaded
-        previously.
+      downloaded_archive: Optional[installers.StagedArchive], The archive
+        downloaded and extracted into a staging directory previously.
       progress_callback: f(float), A function to call with the fraction of
         completeness.
     """
     files = self._component_installer.Extract(
         downloaded_archive, progress_callback=progress_callback)
     manifest = InstallationManifest(self._state_directory, component_id)
-    manifest.MarkInstalled(snapshot, files)
+    manifest.MarkInstalled(
+        snapshot, files,
+        hashes=downloaded_archive.hashes if downloaded_archive else None)
 
   @_RaisesPermissionsError
   def Uninstall(self, component_id, progress_callback=None):
@@ -655,6 +681,7 @@ class InstallationManifest(object):
   """Class to encapsulate the data stored in installation manifest files."""
 
   MANIFEST_SUFFIX = '.manifest'
+  HASHES_SUFFIX = '.hashes.json'
 
   def __init__(self, state_dir, component_id):
     """Creates a new InstallationManifest.
@@ -671,8 +698,11 @@ class InstallationManifest(object):
     self.manifest_file = os.path.join(
         self.state_dir,
         component_id + InstallationManifest.MANIFEST_SUFFIX)
+    self.hashes_file = os.path.join(
+        self.state_dir,
+        component_id + InstallationManifest.HASHES_SUFFIX)
 
-  def MarkInstalled(self, snapshot, files):
+  def MarkInstalled(self, snapshot, files, hashes=None):
     """Marks this component as installed with the given snapshot and files.
 
     This saves the ComponentSnapshot and writes the installed files to a
@@ -682,10 +712,17 @@ class InstallationManifest(object):
       snapshot: snapshots.ComponentSnapshot, The snapshot that was the source
         of the install.
       files: list of str, The files that were created by the installation.
+      hashes: {str: str}, The sha256 hex digest of each installed regular file,
+        used to only download changed files in later delta updates.
     """
     with file_utils.FileWriter(self.manifest_file) as fp:
       for f in _NormalizeFileList(files):
         fp.write(f + '\n')
+    if hashes:
+      with file_utils.FileWriter(self.hashes_file) as fp:
+        json.dump(hashes, fp, indent=0, sort_keys=True)
+    elif os.path.isfile(self.hashes_file):
+      os.remove(self.hashes_file)
     snapshot.WriteToFile(self.snapshot_file, component_id=self.id)
 
   def MarkUninstalled(self):
@@ -694,7 +731,7 @@ class InstallationManifest(object):
     This does not actually uninstall the component, but rather just removes the
     snapshot and manifest.
     """
-    for f in [self.manifest_file, self.snapshot_file]:
+    for f in [self.manifest_file, self.hashes_file, self.snapshot_file]:
       if os.path.isfile(f):
         os.remove(f)
 
@@ -732,6 +769,23 @@ class InstallationManifest(object):
       files = [line.rstrip() for line in f]
     return files
 
+  def InstalledHashes(self):
+    """Gets the content hashes of the files installed by this component.
+
+    Returns:
+      {str: str}, The sha256 hex digest of each installed regular file, or {}
+      if they were not recorded when the component was installed.
+    """
+    if not os.path.isfile(self.hashes_file):
+      return {}
+    try:
+      with file_utils.FileReader(self.hashes_file) as f:
+        hashes = json.load(f)
+    except ValueError:
+      logging.debug('Ignoring malformed hashes file [%s]', self.hashes_file)
+      return {}
+    return hashes if isinstance(hashes, dict) else {}
+
 
 def _NormalizeFileList(file_list):
   """Removes non-empty directory entries and sorts resulting list."""
@@ -284,6 +284,8 @@ class ComponentData(object):
     checksum: str, The hex digest of the archive file.
     contents_checksum: str, The hex digest of the contents of all files in the
       archive.
+    manifest: str, The hosted location of a manifest of the files in the
+      archive, used for delta updates. See the delta module for its format.
   """
 
   @classmethod
@@ -294,6 +296,7 @@ class ComponentData(object):
     p.Parse('size')
     p.Parse('checksum')
     p.Parse('contents_checksum')
+    p.Parse('manifest')
     return cls(**p.Args())
 
   def ToDictionary(self):
@@ -303,15 +306,18 @@ class ComponentData(object):
     w.Write('size')
     w.Write('checksum')
     w.Write('contents_checksum')
+    w.Write('manifest')
     return w.Dictionary()
 
   # pylint: disable=redefined-builtin, params must match JSON names
-  def __init__(self, type, source, size, checksum, contents_checksum):
+  def __init__(self, type, source, size, checksum, contents_checksum,
+               manifest=None):
     self.type = type
     self.source = source
     self.size = size
     self.checksum = checksum
     self.contents_checksum = contents_checksum
+    self.manifest = manifest
 
 
 class ComponentPlatform(object):
@@ -274,9 +274,14 @@ class ComponentSnapshot(object):
           sdk_def.release_notes_url = ComponentSnapshot._GetAbsoluteURL(
               url, sdk_def.release_notes_url)
         for c in sdk_def.components:
-          if not c.data or not c.data.source:
+          if not c.data:
             continue
-          c.data.source = ComponentSnapshot._GetAbsoluteURL(url, c.data.source)
+          if c.data.source:
+            c.data.source = ComponentSnapshot._GetAbsoluteURL(
+                url, c.data.source)
+          if c.data.manifest:
+            c.data.manifest = ComponentSnapshot._GetAbsoluteURL(
+                url, c.data.manifest)
 
       if not merged:
         merged = sdk_def
@@ -398,6 +403,37 @@ class ComponentSnapshot(object):
     component_filter = lambda c: c.platform.Matches(platform_filter)
     return self._ClosureFor(component_ids, self.__consumers, component_filter)
 
+  def DependencyOrderedGroups(self, component_ids):
+    """Groups the given components so that dependencies come first.
+
+    Each group only contains components whose dependencies among the given
+    components are in earlier groups, so the components of a group are
+    independent of each other. Components in a dependency cycle are put in the
+    same group.
+
+    Args:
+      component_ids: list of str, The ids of the components to order.
+
+    Returns:
+      [[str]], The groups of component ids, in the order they can be installed.
+    """
+    remaining = set(component_ids)
+    dependencies = {}
+    for component_id in remaining:
+      closure = self._ClosureFor(
+          [component_id], self.__dependencies, lambda c: True)
+      dependencies[component_id] = (closure & remaining) - {component_id}
+    groups = []
+    while remaining:
+      # A component is ready once every remaining dependency is in a cycle with
+      # it, and so also depends on it.
+      group = [c_id for c_id in remaining
+               if all(c_id in dependencies[dep_id]
+                      for dep_id in dependencies[c_id] & remaining)]
+      groups.append(sorted(group))
+      remaining -= set(group)
+    return groups
+
   def ConnectedComponents(self, component_ids, platform_filter=None):
     """Gets all the components that are connected to any of the given ids.
 
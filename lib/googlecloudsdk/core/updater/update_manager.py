@@ -16,12 +16,14 @@
 """Higher level functions to support updater operations at the CLI level."""
 
 
+from concurrent import futures
 import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import textwrap
+import threading
 
 from googlecloudsdk.core import argv_utils
 from googlecloudsdk.core import config
@@ -47,6 +49,9 @@ from googlecloudsdk.core.util import platforms
 import six
 from six.moves import map  # pylint: disable=redefined-builtin
 
+# Maximum number of components downloaded or installed at the same time.
+_MAX_PARALLEL_COMPONENTS = 4
+
 # These are components that used to exist, but we removed.  In order to prevent
 # scripts and installers that use them from getting errors, we will just warn
 # and move on.  This can be removed once we think enough time has passed.
@@ -911,6 +916,68 @@ version [{1}].  To clear your fixed version setting, run:
       first = False
     return results_map
 
+  def _UpdateInParallelWithProgressBar(self, component_groups, action,
+                                       action_func, first=False, last=False):
+    """Performs an update on groups of components while using a progress bar.
+
+    The components of a group are acted on in parallel, and each group is only
+    started once the previous one is done. A single progress bar tracks all the
+    components, weighted by their size.
+
+    Args:
+      component_groups: [[schemas.Component]], The components that are going to
+        be acted on.
+      action: str, The action that is printed for this update.
+      action_func: func, The function to call to actually do the update.  It
+        takes a single argument which is the component id.  It is called from
+        worker threads.
+      first: bool, True if this is the first stacked ProgressBar group.
+      last: bool, True if this is the last stacked ProgressBar group.
+
+    Returns:
+      dict, Map of component ID to result of action_func for each component.
+    """
+    components = [c for group in component_groups for c in group]
+    results_map = {}
+    if not components:
+      return results_map
+    if len(components) == 1:
+      name = components[0].details.display_name
+    else:
+      name = '{0} components'.format(len(components))
+    label = '{action}: {name}'.format(action=action, name=name)
+
+    weights = dict(
+        (c.id, (c.data.size if c.data and c.data.size else 0) or 1)
+        for c in components)
+    total_weight = sum(weights.values())
+    progress = dict((c.id, 0) for c in components)
+    lock = threading.Lock()
+
+    with console_io.ProgressBar(
+        label=label, stream=log.status, first=first, last=last) as pb:
+
+      def ProgressCallback(component_id):
+        def Inner(progress_factor):
+          with lock:
+            progress[component_id] = min(progress_factor, 1)
+            pb.SetProgress(sum(
+                progress[c_id] * weight
+                for c_id, weight in six.iteritems(weights)) / total_weight)
+        return Inner
+
+      with futures.ThreadPoolExecutor(_MAX_PARALLEL_COMPONENTS) as executor:
+        for group in component_groups:
+          group_futures = [
+              (c.id, executor.submit(action_func, c.id,
+                                     progress_callback=ProgressCallback(c.id)))
+              for c in group]
+          # Raises the first error once the rest of the group is done.
+          futures.wait([future for _, future in group_futures])
+          for component_id, future in group_futures:
+            results_map[component_id] = future.result()
+    return results_map
+
   def _DownloadFunction(self, install_state, diff):
     def Inner(component_id, progress_callback):
       return install_state.Download(
@@ -918,11 +985,15 @@ version [{1}].  To clear your fixed version setting, run:
           command_path='components.update')
     return Inner
 
-  def _InstallFunction(self, install_state, diff, downloads_map):
+  def _InstallFunction(self, install_state, diff, downloads_map,
+                       installed_ids):
     def Inner(component_id, progress_callback):
-      return install_state.Install(
+      result = install_state.Install(
           diff.latest, component_id, downloads_map[component_id],
           progress_callback=progress_callback)
+      # list.append is atomic, so worker threads can share the list.
+      installed_ids.append(component_id)
+      return result
     return Inner
 
   def Install(self, components, throw_if_unattended=False, restart_args=None):
@@ -1064,18 +1135,42 @@ version [{1}].  To clear your fixed version setting, run:
 
     with execution_utils.UninterruptibleSection(stream=log.status):
       self.__Write(log.status, 'Performing in place update...\n')
-      downloads_map = self._UpdateWithProgressBar(
-          components_to_install, 'Downloading',
-          self._DownloadFunction(install_state, diff),
-          first=True, last=False)
+      # Components are extracted into a staging area as they download, so
+      # nothing in the installation changes until all of them have downloaded.
+      try:
+        downloads_map = self._UpdateInParallelWithProgressBar(
+            [components_to_install], 'Downloading',
+            self._DownloadFunction(install_state, diff),
+            first=True, last=False)
+      except Exception:  # pylint: disable=broad-except
+        install_state.ClearDownloads()
+        raise
       self._UpdateWithProgressBar(
           components_to_remove, 'Uninstalling',
           install_state.Uninstall,
           first=not components_to_install, last=not components_to_install)
-      self._UpdateWithProgressBar(
-          components_to_install, 'Installing',
-          self._InstallFunction(install_state, diff, downloads_map),
-          first=False, last=True)
+      # Dependencies are installed before the components that need them.
+      components_by_id = dict((c.id, c) for c in components_to_install)
+      install_groups = [
+          [components_by_id[c_id] for c_id in group]
+          for group in diff.latest.DependencyOrderedGroups(components_by_id)]
+      installed_ids = []
+      try:
+        self._UpdateInParallelWithProgressBar(
+            install_groups, 'Installing',
+            self._InstallFunction(install_state, diff, downloads_map,
+                                  installed_ids),
+            first=False, last=True)
+      except Exception:  # pylint: disable=broad-except
+        install_state.ClearDownloads()
+        not_installed_ids = sorted(
+            set(components_by_id) - set(installed_ids))
+        self.__Write(
+            log.status,
+            '\nInstalled components: [{0}]\nComponents not installed: '
+            '[{1}]\n'.format(', '.join(sorted(installed_ids)),
+                              ', '.join(not_installed_ids)))
+        raise
 
     # Clear deprecated directories for new state
     install_state.ClearDeprecatedDirs()
@@ -16,13 +16,11 @@
 """Set of utilities for dealing with archives."""
 
 
+import collections
+from concurrent import futures
 import os
-import shutil
-import tempfile
-import time
 import zipfile
 from googlecloudsdk.core import log
-import googlecloudsdk.core.util.files as files
 import six
 
 try:
@@ -33,13 +31,21 @@ try:
 except ImportError:
   _ZIP_COMPRESSION = zipfile.ZIP_STORED
 
+_PARALLEL_ZIP_MAX_WORKERS = 16
+_PARALLEL_ZIP_PENDING_ENTRIES_PER_WORKER = 16
+_PARALLEL_ZIP_MAX_PENDING_BYTES = 256 * 1024 * 1024
+# Larger files are read by the writer, which streams them into the archive,
+# instead of being held in memory after being read ahead by a worker.
+_PARALLEL_ZIP_MAX_FILE_BYTES = 16 * 1024 * 1024
 
-def MakeZipFromDir(dest_zip_file, src_dir, predicate=None):
+
+def MakeZipFromDir(dest_zip_file, src_dir, predicate=None, parallel=False):
   """Create a ZIP archive from a directory.
 
   This is similar to shutil.make_archive. However, prior to Python 3.8,
   shutil.make_archive cannot create ZIP archives for files with mtimes older
-  than 1980. So that's why this function exists.
+  than 1980. So that's why this function exists. Such files are recorded with
+  the earliest timestamp a ZIP archive can hold.
 
   Examples:
     Filesystem:
@@ -58,63 +64,142 @@ def MakeZipFromDir(dest_zip_file, src_dir, predicate=None):
 
   Args:
     dest_zip_file: str, filesystem path to the zip file to be created. Note that
-      directory should already exist for destination zip file.
+      directory should already exist for destination zip file. May also be a
+      writable binary file object, which does not need to be seekable, so the
+      archive can be streamed to a pipe or request body without a temp file.
     src_dir: str, filesystem path to the directory to zip up
     predicate: callable, takes one argument (file path). File will be included
                in the zip if and only if the predicate(file_path). Defaults to
                always true.
+    parallel: bool, if True, read files ahead on worker threads while earlier
+      entries are compressed. Entries are still written in the same order as
+      the serial mode.
   """
 
   if predicate is None:
     predicate = lambda x: True
-  zip_file = zipfile.ZipFile(dest_zip_file, 'w', _ZIP_COMPRESSION)
+  zip_file = zipfile.ZipFile(
+      dest_zip_file, 'w', _ZIP_COMPRESSION, strict_timestamps=False
+  )
   try:
-    for root, _, filelist in os.walk(six.text_type(src_dir)):
-      dir_path = os.path.normpath(os.path.relpath(root, src_dir))
-      if not predicate(dir_path):
-        continue
-      if dir_path != os.curdir:
-        AddToArchive(zip_file, src_dir, dir_path, False)
-      for file_name in filelist:
-        file_path = os.path.join(dir_path, file_name)
-        if not predicate(file_path):
-          continue
-        AddToArchive(zip_file, src_dir, file_path, True)
+    entries = _IterZipEntries(src_dir, predicate)
+    if parallel:
+      _WriteEntriesInParallel(zip_file, src_dir, entries)
+    else:
+      for rel_path, _ in entries:
+        _WriteEntry(zip_file, src_dir, rel_path)
   finally:
     zip_file.close()
 
 
-def AddToArchive(zip_file, src_dir, rel_path, is_file):
-  """Add a file or directory (without its contents) to a ZIP archive.
+def _IterZipEntries(src_dir, predicate):
+  """Yields (relative path, is file) for each entry to add to an archive."""
+  for root, _, filelist in os.walk(six.text_type(src_dir)):
+    dir_path = os.path.normpath(os.path.relpath(root, src_dir))
+    if not predicate(dir_path):
+      continue
+    if dir_path != os.curdir:
+      yield dir_path, False
+    for file_name in filelist:
+      file_path = os.path.join(dir_path, file_name)
+      if not predicate(file_path):
+        continue
+      yield file_path, True
 
-  Args:
-    zip_file: the ZIP archive
-    src_dir: the base directory for rel_path, will not be recorded in the
-      archive
-    rel_path: the relative path to the file or directory to add
-    is_file: a Boolean indicating whether rel_path points to a file (rather than
-      a directory)
-  """
-  full_path = os.path.join(src_dir, rel_path)
 
+def _WriteEntry(zip_file, src_dir, rel_path):
+  """Adds a file or directory (without its contents) to a ZIP archive."""
+  full_path = os.path.join(src_dir, rel_path)
   try:
-    mtime = os.path.getmtime(full_path)
-    if time.gmtime(mtime)[0] < 1980:
-      # ZIP files can't contain entries for which the mtime is older than 1980.
-      # We will create a temporary copy of the file or directory (which
-      # will have a fresh mtime) and add it instead.
-      if is_file:
-        temp_file_handle, temp_file_path = tempfile.mkstemp()
-        os.close(temp_file_handle)
-        shutil.copyfile(full_path, temp_file_path)
-        zip_file.write(temp_file_path, rel_path)
-        os.remove(temp_file_path)
-      else:
-        with files.TemporaryDirectory() as temp_dir:
-          zip_file.write(temp_dir, rel_path)
-    else:
-      zip_file.write(full_path, rel_path)
-
+    zip_file.write(full_path, rel_path)
   except FileNotFoundError:
     log.warning('Skipping non-existent path: %s', full_path)
-    return
+
+
+def _ReadFile(full_path):
+  """Returns the contents of a file, or None if it no longer exists."""
+  try:
+    with open(full_path, 'rb') as f:
+      return f.read()
+  except FileNotFoundError:
+    return None
+
+
+def _WriteEntriesInParallel(zip_file, src_dir, entries):
+  """Reads files ahead in worker threads and writes entries in order.
+
+  zipfile has no public API to add data compressed elsewhere, so entries are
+  compressed by this thread as they are written. zlib releases the GIL while
+  compressing, so the workers read the next files in the meantime. Files
+  larger than _PARALLEL_ZIP_MAX_FILE_BYTES are not read ahead; they are
+  written with ZipFile.write when their turn comes, which streams them.
+
+  Args:
+    zip_file: zipfile.ZipFile, the archive being written.
+    src_dir: str, the base directory for the entries' paths.
+    entries: iterable of (relative path, is file) tuples.
+  """
+  worker_count = _GetParallelZipWorkerCount()
+  # Files read ahead of the writer are held in memory, so both the number of
+  # entries and the bytes they hold are bounded.
+  max_pending_entries = worker_count * _PARALLEL_ZIP_PENDING_ENTRIES_PER_WORKER
+  # Deque of (zip_info, future or None for directories and large files).
+  pending = collections.deque()
+  pending_bytes = 0
+
+  def WriteOldestPending():
+    zip_info, future = pending.popleft()
+    if future is None:
+      _WriteEntry(zip_file, src_dir, zip_info.filename)
+      return 0
+    # The entry's size from the file system was added to pending_bytes.
+    pending_file_size = zip_info.file_size
+    data = future.result()
+    if data is None:
+      log.warning(
+          'Skipping non-existent path: %s',
+          os.path.join(src_dir, zip_info.filename),
+      )
+    else:
+      zip_file.writestr(zip_info, data, compress_type=zip_file.compression)
+    return pending_file_size
+
+  with futures.ThreadPoolExecutor(worker_count) as executor:
+    try:
+      for rel_path, is_file in entries:
+        full_path = os.path.join(src_dir, rel_path)
+        try:
+          zip_info = zipfile.ZipInfo.from_file(
+              full_path, rel_path, strict_timestamps=False
+          )
+        except FileNotFoundError:
+          log.warning('Skipping non-existent path: %s', full_path)
+          continue
+        if (
+            is_file
+            and not zip_info.is_dir()
+            and zip_info.file_size <= _PARALLEL_ZIP_MAX_FILE_BYTES
+        ):
+          # Make room before submitting, so the bound holds while reading.
+          while pending and (
+              len(pending) >= max_pending_entries
+              or pending_bytes + zip_info.file_size
+              > _PARALLEL_ZIP_MAX_PENDING_BYTES
+          ):
+            pending_bytes -= WriteOldestPending()
+          pending.append((zip_info, executor.submit(_ReadFile, full_path)))
+          pending_bytes += zip_info.file_size
+        else:
+          pending.append((zip_info, None))
+          while len(pending) > max_pending_entries:
+            pending_bytes -= WriteOldestPending()
+      while pending:
+        WriteOldestPending()
+    finally:
+      for _, future in pending:
+        if future:
+          future.cancel()
+
+
+def _GetParallelZipWorkerCount():
+  return min(_PARALLEL_ZIP_MAX_WORKERS, os.cpu_count() or 1)
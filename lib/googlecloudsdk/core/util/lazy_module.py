@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A utility for importing modules lazily to improve performance.
+
+A module imported lazily is created and put in sys.modules as usual, but its
+code only runs when one of its attributes is first used. Code like
+
+  from googlecloudsdk.api_lib.compute import base_classes
+
+then costs almost nothing until base_classes is actually used, which for a
+command module is often only in Run.
+"""
+
+import contextlib
+import importlib.abc
+import importlib.machinery
+import sys
+import threading
+import types
+
+from googlecloudsdk.core import exceptions
+
+# Loaders whose modules are plain module objects created by the import system.
+_LAZY_LOADER_TYPES = (
+    importlib.machinery.SourceFileLoader,
+    importlib.machinery.SourcelessFileLoader,
+)
+
+# Attributes the import system reads from modules already in sys.modules.
+# Reading them does not run the module.
+_NON_LOADING_ATTRIBUTES = frozenset(['__spec__'])
+
+# Held while a lazy module runs, so other threads wait for it to finish.
+_load_lock = threading.RLock()
+_loading = set()
+# The id of each lazy module not run yet to the function that wraps its error,
+# if it has one.
+_error_wrappers = {}
+
+
+def _Load(module):
+  """Runs the code of a lazy module if it has not run yet."""
+  with _load_lock:
+    if type(module) is not _LazyModule or id(module) in _loading:
+      return
+    _loading.add(id(module))
+    wrap_error = _error_wrappers.pop(id(module), None)
+    spec = types.ModuleType.__getattribute__(module, '__spec__')
+    try:
+      spec.loader.exec_module(module)
+    except BaseException as e:
+      # As for a failed import, the next import of the module runs it again.
+      if sys.modules.get(spec.name) is module:
+        del sys.modules[spec.name]
+      if wrap_error is None or not isinstance(e, Exception):
+        raise
+      exceptions.reraise(wrap_error(e))
+    finally:
+      _loading.discard(id(module))
+      object.__setattr__(module, '__class__', types.ModuleType)
+
+
+class _LazyModule(types.ModuleType):
+  """A module whose code runs when one of its attributes is first used."""
+
+  def __getattribute__(self, name):
+    if name not in _NON_LOADING_ATTRIBUTES:
+      _Load(self)
+    return types.ModuleType.__getattribute__(self, name)
+
+  def __delattr__(self, name):
+    _Load(self)
+    types.ModuleType.__delattr__(self, name)
+
+
+class _LazyLoader(importlib.abc.Loader):
+  """Wraps the loader of a module to defer running its code."""
+
+  def __init__(self, loader, wrap_error):
+    self._loader = loader
+    self._wrap_error = wrap_error
+
+  def create_module(self, spec):
+    return None
+
+  def exec_module(self, module):
+    module.__spec__.loader = self._loader
+    module.__loader__ = self._loader
+    with _load_lock:
+      if self._wrap_error is None:
+        _error_wrappers.pop(id(module), None)
+      else:
+        _error_wrappers[id(module)] = self._wrap_error
+    module.__class__ = _LazyModule
+
+
+class _LazyFinder(object):
+  """Finds modules with the other finders and makes some of them lazy."""
+
+  def __init__(self, prefixes, wrap_error):
+    self._prefixes = tuple(prefixes)
+    self._wrap_error = wrap_error
+
+  def find_spec(self, name, path, target=None):
+    """Finds the spec of a module, with a lazy loader if it matches."""
+    if not name.startswith(self._prefixes):
+      return None
+    for finder in sys.meta_path:
+      if finder is self or not hasattr(finder, 'find_spec'):
+        continue
+      spec = finder.find_spec(name, path, target)
+      if spec is None:
+        continue
+      if type(spec.loader) in _LAZY_LOADER_TYPES:  # pylint: disable=unidiomatic-typecheck
+        spec.loader = _LazyLoader(spec.loader, self._wrap_error)
+      return spec
+    return None
+
+
+@contextlib.contextmanager
+def LazyImports(prefixes, wrap_error=None):
+  """Imports modules lazily in the body of the with statement.
+
+  Only modules that are not imported yet and whose name starts with one of the
+  prefixes are imported lazily. Packages are imported lazily too, but using
+  one of their submodules runs them.
+
+  Args:
+    prefixes: [str], The prefixes of the names of the modules to import
+      lazily, for example 'googlecloudsdk.api_lib.'.
+    wrap_error: func(Exception) -> Exception, If given, an error raised by the
+      code of a lazy module when it is first used is passed to this function,
+      and the error it returns is raised instead. This way the error can
+      still say which import deferred the module.
+
+  Yields:
+    None.
+  """
+  finder = _LazyFinder(prefixes, wrap_error)
+  sys.meta_path.insert(0, finder)
+  try:
+    yield
+  finally:
+    sys.meta_path.remove(finder)
+
+
+def IsLoaded(module):
+  """Returns whether the code of a module has run."""
+  return type(module) is not _LazyModule
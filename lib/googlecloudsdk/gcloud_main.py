@@ -36,6 +36,7 @@ from googlecloudsdk.core import config
 from googlecloudsdk.core import log
 from googlecloudsdk.core import metrics
 from googlecloudsdk.core import properties
+from googlecloudsdk.core import tracing
 from googlecloudsdk.core.credentials import creds_context_managers
 from googlecloudsdk.core.credentials import devshell as c_devshell
 from googlecloudsdk.core.survey import survey_check
@@ -45,6 +46,8 @@ from googlecloudsdk.core.util import keyboard_interrupt
 from googlecloudsdk.core.util import platforms
 import surface
 
+IMPORTS_END_TIME = time.time()
+
 # Disable stack traces when the command is interrupted.
 keyboard_interrupt.InstallHandler()
 
@@ -214,11 +217,13 @@ def main(gcloud_cli=None, credential_providers=None):
   if not platforms.PythonVersion().IsCompatible():
     sys.exit(1)
   metrics.Started(START_TIME)
+  tracing.Start(START_TIME, IMPORTS_END_TIME)
   metrics.Executions(
       'gcloud',
       local_state.InstallationState.VersionForInstalledComponent('core'))
   if gcloud_cli is None:
-    gcloud_cli = CreateCLI([])
+    with tracing.Span('load_cli'):
+      gcloud_cli = CreateCLI([])
 
   with creds_context_managers.CredentialProvidersManager(credential_providers):
     try:
@@ -15,6 +15,9 @@
 """ai-platform local predict command."""
 
 
+import json
+
+from googlecloudsdk.calliope import arg_parsers
 from googlecloudsdk.calliope import base
 from googlecloudsdk.command_lib.ml_engine import flags
 from googlecloudsdk.command_lib.ml_engine import local_utils
@@ -72,6 +75,23 @@ def _AddLocalPredictArgs(parser):
       This flag accepts "-" for stdin.
       """)
   flags.SIGNATURE_NAME.AddToParser(parser)
+  parser.add_argument(
+      '--batch-size',
+      type=arg_parsers.BoundedInt(1),
+      help="""\
+      Predict this many instances at a time, loading the model only once, and
+      print each prediction as soon as its batch is predicted instead of after
+      all instances are. Unless `--format` is given, predictions are printed
+      as newline-delimited JSON, one prediction per line.
+      """)
+  parser.add_argument(
+      '--workers',
+      type=arg_parsers.BoundedInt(1),
+      default=1,
+      help="""\
+      Number of processes that predict batches concurrently with
+      `--batch-size`. Each process loads its own copy of the model.
+      """)
 
 
 class Predict(base.Command):
@@ -88,6 +108,23 @@ class Predict(base.Command):
       log.status.Print('If the signature defined in the model is '
                        'not serving_default then you must specify it via '
                        '--signature-name flag, otherwise the command may fail.')
+    if args.batch_size:
+      predictions = local_utils.StreamPredict(
+          args.model_dir,
+          json_request=args.json_request,
+          json_instances=args.json_instances,
+          text_instances=args.text_instances,
+          framework=framework_flag,
+          signature_name=args.signature_name,
+          batch_size=args.batch_size,
+          workers=args.workers)
+      if args.IsSpecified('format'):
+        return predictions
+      for prediction in predictions:
+        log.out.write(json.dumps(prediction, sort_keys=True) + '\n')
+        log.out.flush()
+      return None
+
     results = local_utils.RunPredict(
         args.model_dir,
         json_request=args.json_request,
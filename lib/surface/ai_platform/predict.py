@@ -16,7 +16,9 @@
 
 
 from googlecloudsdk.api_lib.ml_engine import predict
+from googlecloudsdk.calliope import arg_parsers
 from googlecloudsdk.calliope import base
+from googlecloudsdk.command_lib.ml_engine import bulk_predict
 from googlecloudsdk.command_lib.ml_engine import endpoint_util
 from googlecloudsdk.command_lib.ml_engine import flags
 from googlecloudsdk.command_lib.ml_engine import predict_utilities
@@ -88,6 +90,54 @@ versions run
   flags.GetRegionArg(include_global=True).AddToParser(parser)
   flags.SIGNATURE_NAME.AddToParser(parser)
 
+  bulk_group = parser.add_group(help='Bulk prediction.')
+  bulk_group.add_argument(
+      '--bulk',
+      action='store_true',
+      required=True,
+      help="""\
+      Predict on any number of instances. The instances are read as they are
+      needed and sent in several requests, each within the service request
+      size limit. Requests that fail with a transient error are retried.
+      Predictions are printed in input order as newline-delimited JSON, one
+      prediction per line, and a summary with the prediction rate is printed
+      to stderr.
+      """)
+  bulk_group.add_argument(
+      '--instances-per-request',
+      type=arg_parsers.BoundedInt(1),
+      default=bulk_predict.DEFAULT_INSTANCES_PER_REQUEST,
+      help='Most instances sent in one prediction request with `--bulk`.')
+  bulk_group.add_argument(
+      '--max-concurrent-requests',
+      type=arg_parsers.BoundedInt(1),
+      default=bulk_predict.DEFAULT_MAX_CONCURRENT_REQUESTS,
+      help='Most prediction requests in flight at once with `--bulk`.')
+
+
+def _RunBulk(args, model_or_version_ref):
+  """Predicts on the instances in chunks and prints NDJSON predictions."""
+  if args.json_request:
+    instances = predict_utilities.ReadInstancesFromArgs(
+        args.json_request, None, None)
+    numbered_instances = ((None, instance) for instance in instances)
+  elif args.json_instances:
+    numbered_instances = bulk_predict.ReadInstances(
+        args.json_instances, 'json')
+  else:
+    numbered_instances = bulk_predict.ReadInstances(
+        args.text_instances, 'text')
+  predictor = bulk_predict.BulkPredictor(
+      model_or_version_ref, signature_name=args.signature_name,
+      max_concurrent_requests=args.max_concurrent_requests)
+  summary = predictor.Predict(
+      bulk_predict.Chunk(numbered_instances, args.instances_per_request),
+      log.out)
+  log.status.Print(
+      'Predicted {instances} instances with {requests} requests and '
+      '{retries} retries in {elapsedSeconds}s ({instancesPerSecond} '
+      'instances/s).'.format(**summary))
+
 
 def _Run(args):
   """This is what gets called when the user runs this command.
@@ -97,8 +147,15 @@ def _Run(args):
       command invocation.
 
   Returns:
-    A json object that contains predictions.
+    A json object that contains predictions, or None with --bulk.
   """
+  if args.bulk:
+    region = region_util.GetRegion(args)
+    with endpoint_util.MlEndpointOverrides(region=region):
+      _RunBulk(args, predict_utilities.ParseModelOrVersionRef(
+          args.model, args.version))
+    return None
+
   instances = predict_utilities.ReadInstancesFromArgs(
       args.json_request,
       args.json_instances,
@@ -134,8 +191,8 @@ class Predict(base.Command):
      `{command}` sends a prediction request to AI Platform for the given
      instances. This command will read up to 100 instances, though the service
      itself will accept instances up to the payload limit size (currently,
-     1.5MB). If you are predicting on more instances, you should use batch
-     prediction via
+     1.5MB). To predict on more instances with online prediction, use
+     `--bulk`. You can also use batch prediction via
 
          $ {parent_command} jobs submit prediction.
   """
@@ -156,8 +213,8 @@ class PredictBeta(base.Command):
      `{command}` sends a prediction request to AI Platform for the given
      instances. This command will read up to 100 instances, though the service
      itself will accept instances up to the payload limit size (currently,
-     1.5MB). If you are predicting on more instances, you should use batch
-     prediction via
+     1.5MB). To predict on more instances with online prediction, use
+     `--bulk`. You can also use batch prediction via
 
          $ {parent_command} jobs submit prediction.
   """
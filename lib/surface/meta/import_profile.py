@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The `gcloud meta import-profile` command."""
+
+import argparse
+
+from googlecloudsdk.calliope import base
+from googlecloudsdk.command_lib.meta import import_profiler
+from googlecloudsdk.core import exceptions
+from googlecloudsdk.core import log
+
+
+@base.UniverseCompatible
+class ImportProfile(base.Command):
+  """Show where the module imports of a gcloud command spend their time.
+
+  Runs the given gcloud command in a new Python process with import timing
+  enabled, discards its output, and lists the modules it imported as a tree,
+  slowest first. CUMULATIVE_MS includes the modules a module imported, SELF_MS
+  does not.
+
+  ## EXAMPLES
+
+  To see the imports that take 10ms or more for showing the help of
+  `gcloud compute instances list`, run:
+
+    $ {command} --min-cumulative-ms=10 -- compute instances list --help
+  """
+
+  @staticmethod
+  def Args(parser):
+    parser.add_argument(
+        '--min-cumulative-ms',
+        type=float,
+        default=5,
+        help='Leave out imports, and the imports nested in them, that take '
+        'less than this many milliseconds.')
+    parser.add_argument(
+        '--depth',
+        type=int,
+        help='The number of levels of nested imports to list. All levels are '
+        'listed by default.')
+    parser.add_argument(
+        'command',
+        nargs=argparse.REMAINDER,
+        help='The gcloud command to profile, without `gcloud`.')
+    parser.display_info.AddFormat(
+        'table(module:label=MODULE, cumulative_ms:label=CUMULATIVE_MS,'
+        ' self_ms:label=SELF_MS)')
+
+  def Run(self, args):
+    command = args.command
+    if command and command[0] == '--':
+      command = command[1:]
+    if not command:
+      raise exceptions.Error('No command to profile.')
+    exit_code, timings = import_profiler.ProfileCommand(command)
+    if exit_code:
+      log.warning('The profiled command exited with status [%d].', exit_code)
+    return import_profiler.Flatten(
+        timings, min_cumulative_ms=args.min_cumulative_ms,
+        max_depth=args.depth)
@@ -18,6 +18,7 @@
 
 from googlecloudsdk.calliope import base
 from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.calliope import exceptions
 from googlecloudsdk.command_lib.static_completion import generate
 
 
@@ -39,10 +40,25 @@ class ListGCloud(base.Command):
               'variant of the CLI tree that only contains the subcommand and '
               'flag name dictionaries. The tree is written as a Python '
               'source file (~1MiB) that loads fast (~30ms) as a .pyc file.'))
+    parser.add_argument(
+        '--binary',
+        action='store_true',
+        help=('With `--completions`, list the static completion CLI tree in '
+              'the compact binary format that static completion memory maps '
+              'so that a lookup only reads the nodes on the typed command '
+              'path.'))
 
   def Run(self, args):
+    if args.binary and not args.completions:
+      raise exceptions.RequiredArgumentException(
+          '--completions',
+          'The --binary flag can only be specified when using the '
+          '--completions flag.')
     branch = args.branch.split('.') if args.branch else None
-    if args.completions:
+    if args.binary:
+      generate.ListCompletionTreeBinary(
+          cli=self._cli_power_users_only, branch=branch)
+    elif args.completions:
       generate.ListCompletionTree(cli=self._cli_power_users_only, branch=branch)
     else:
       cli_tree.Dump(cli=self._cli_power_users_only, path='-', branch=branch)
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""The `gcloud meta storage-benchmark` command."""
+
+import dataclasses
+
+from googlecloudsdk.calliope import arg_parsers
+from googlecloudsdk.calliope import base
+from googlecloudsdk.command_lib.storage.diagnose import transfer_benchmark
+
+
+@base.UniverseCompatible
+@base.Hidden
+class StorageBenchmark(base.Command):
+  """Benchmark gcloud storage transfers against a local fake server.
+
+  Runs `gcloud storage cp`, `ls`, `rsync` and `rm` as separate gcloud
+  processes on a many-small-files and a few-large-files workload. The commands
+  talk to a fake of the Cloud Storage JSON API served from its own local
+  process, so the fake's CPU and memory use are not counted. Reports wall time,
+  throughput, and the CPU time per GiB and peak RSS of each gcloud process and
+  the worker processes it waited for. No network access or credentials are
+  needed.
+  """
+
+  detailed_help = {
+      'EXAMPLES': """
+      To benchmark with 20ms of added latency per request:
+
+        $ {command} --latency=0.02
+
+      To benchmark only uploads of 100 small files:
+
+        $ {command} --operations=upload --small-file-count=100 --large-file-count=0
+      """,
+  }
+
+  @staticmethod
+  def Args(parser):
+    parser.add_argument(
+        '--latency',
+        type=arg_parsers.BoundedFloat(lower_bound=0.0),
+        default=0.0,
+        help='Seconds the fake server waits before answering each request.',
+    )
+    parser.add_argument(
+        '--bandwidth',
+        type=arg_parsers.BinarySize(),
+        help=(
+            'Per-request bandwidth limit of the fake server in bytes per'
+            ' second, for example `10MiB`. Unlimited by default.'
+        ),
+    )
+    parser.add_argument(
+        '--operations',
+        type=arg_parsers.ArgList(choices=transfer_benchmark.OPERATIONS),
+        metavar='OPERATION',
+        default=list(transfer_benchmark.OPERATIONS),
+        help=(
+            'Operations to report. Operations that reported ones depend on'
+            ' still run.'
+        ),
+    )
+    parser.add_argument(
+        '--small-file-count',
+        type=arg_parsers.BoundedInt(lower_bound=0),
+        default=1000,
+        help='Number of files in the small files workload.',
+    )
+    parser.add_argument(
+        '--small-file-size',
+        type=arg_parsers.BinarySize(),
+        default='4KiB',
+        help='Size of each file in the small files workload.',
+    )
+    parser.add_argument(
+        '--large-file-count',
+        type=arg_parsers.BoundedInt(lower_bound=0),
+        default=4,
+        help='Number of files in the large files workload.',
+    )
+    parser.add_argument(
+        '--large-file-size',
+        type=arg_parsers.BinarySize(),
+        default='64MiB',
+        help='Size of each file in the large files workload.',
+    )
+    parser.add_argument(
+        '--process-count',
+        type=arg_parsers.BoundedInt(lower_bound=1),
+        help='Value of storage/process_count for the benchmarked commands.',
+    )
+    parser.add_argument(
+        '--thread-count',
+        type=arg_parsers.BoundedInt(lower_bound=1),
+        help='Value of storage/thread_count for the benchmarked commands.',
+    )
+    parser.display_info.AddFormat('json')
+
+  def Run(self, args):
+    workloads = [
+        workload
+        for workload in transfer_benchmark.get_default_workloads(
+            small_file_count=args.small_file_count,
+            small_file_size=args.small_file_size,
+            large_file_count=args.large_file_count,
+            large_file_size=args.large_file_size,
+        )
+        if workload.file_count
+    ]
+    benchmark = transfer_benchmark.TransferBenchmark(
+        workloads,
+        operations=args.operations,
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+        process_count=args.process_count,
+        thread_count=args.thread_count,
+    )
+    return [dataclasses.asdict(result) for result in benchmark.run()]
@@ -21,9 +21,11 @@ from googlecloudsdk.api_lib.pubsub import subscriptions
 from googlecloudsdk.api_lib.util import exceptions as util_ex
 from googlecloudsdk.calliope import base
 from googlecloudsdk.calliope import exceptions
+from googlecloudsdk.command_lib.pubsub import drain
 from googlecloudsdk.command_lib.pubsub import flags
 from googlecloudsdk.command_lib.pubsub import resource_args
 from googlecloudsdk.command_lib.pubsub import util
+from googlecloudsdk.core import log
 
 MESSAGE_FORMAT = """\
 table[box](
@@ -49,6 +51,31 @@ table[box](
 """
 
 
+def _RunDrain(args, max_messages):
+  """Writes messages from a subscription to stdout until stopped."""
+  if not args.auto_ack:
+    raise exceptions.RequiredArgumentException(
+        '--auto-ack', 'Must be specified with --drain.'
+    )
+  subscription_ref = args.CONCEPTS.subscription.Parse()
+  drainer = drain.Drainer(
+      subscription_ref,
+      concurrent_pulls=args.concurrent_pulls,
+      max_outstanding_messages=args.max_outstanding_messages,
+      max_outstanding_bytes=args.max_outstanding_bytes,
+  )
+  summary = drainer.Drain(
+      log.out.GetConsoleWriterStream(),
+      max_message_count=max_messages,
+      idle_timeout=args.idle_timeout,
+  )
+  # Standard output only holds the messages.
+  log.status.Print(
+      'Wrote {messagesWritten} messages in {elapsedSeconds} seconds'
+      ' ({messagesPerSecond} messages/s).'.format(**summary)
+  )
+
+
 def _Run(args, max_messages, return_immediately=False):
   """Pulls messages from a subscription."""
   client = subscriptions.SubscriptionsClient()
@@ -116,7 +143,15 @@ class Pull(base.ListCommand):
           Please note that this command is not guaranteed to return all the
           messages in your backlog or the maximum specified in the --limit
           argument.  Receiving fewer messages than available occasionally
-          is normal."""
+          is normal.""",
+      'EXAMPLES':
+          """\
+          To write every message in a subscription's backlog to a file as
+          newline-delimited JSON, stopping once no messages arrive for 30
+          seconds, run:
+
+            $ {command} mysubscription --drain --auto-ack --idle-timeout=30s > messages.json
+          """,
   }
 
   @staticmethod
@@ -124,12 +159,27 @@ class Pull(base.ListCommand):
     parser.display_info.AddFormat(MESSAGE_FORMAT_WITH_ACK_STATUS)
     resource_args.AddSubscriptionResourceArg(parser, 'to pull messages from.')
     flags.AddPullFlags(parser)
+    flags.AddDrainFlags(parser)
 
     base.LIMIT_FLAG.SetDefault(parser, 1)
 
+  # Whether Run drained messages, which are written to stdout directly.
+  _drained = False
+
   def Run(self, args):
+    self._drained = args.drain
+    if args.drain:
+      # The default limit is for single pulls; drain until stopped unless a
+      # limit is given.
+      return _RunDrain(
+          args, args.limit if args.IsSpecified('limit') else None
+      )
     return _Run(args, args.limit)
 
+  def Epilog(self, resources_were_displayed):
+    if not self._drained:
+      super(Pull, self).Epilog(resources_were_displayed)
+
 
 @base.ReleaseTracks(base.ReleaseTrack.BETA, base.ReleaseTrack.ALPHA)
 class PullBeta(Pull):
@@ -142,6 +192,7 @@ class PullBeta(Pull):
     flags.AddPullFlags(
         parser, add_deprecated=True, add_wait=True, add_return_immediately=True
     )
+    flags.AddDrainFlags(parser)
 
   def Run(self, args):
     if args.IsSpecified('limit'):
@@ -152,6 +203,19 @@ class PullBeta(Pull):
     else:
       max_messages = args.max_messages
 
+    self._drained = args.drain
+    if args.drain:
+      if args.IsSpecified('return_immediately'):
+        raise exceptions.ConflictingArgumentsException(
+            '--drain', '--return-immediately'
+        )
+      return _RunDrain(
+          args,
+          max_messages
+          if args.IsSpecified('limit') or args.IsSpecified('max_messages')
+          else None,
+      )
+
     return_immediately = False
     if args.IsSpecified('return_immediately'):
       return_immediately = args.return_immediately
@@ -17,6 +17,8 @@
 
 from googlecloudsdk.api_lib.pubsub import topics
 from googlecloudsdk.calliope import base
+from googlecloudsdk.calliope import exceptions
+from googlecloudsdk.command_lib.pubsub import bulk_publish
 from googlecloudsdk.command_lib.pubsub import flags
 from googlecloudsdk.command_lib.pubsub import resource_args
 from googlecloudsdk.command_lib.pubsub import util
@@ -25,8 +27,32 @@ from googlecloudsdk.core.resource import resource_projector
 from googlecloudsdk.core.util import http_encoding
 
 
+def _RunBulkPublish(args, message_body):
+  """Publishes the messages in --messages-from-file to a topic."""
+  # The flags are in a mutually exclusive group, but the deprecated positional
+  # cannot be.
+  if message_body:
+    raise exceptions.ConflictingArgumentsException(
+        '--messages-from-file', 'MESSAGE_BODY'
+    )
+  topic_ref = args.CONCEPTS.topic.Parse()
+  publisher = bulk_publish.BulkPublisher(
+      topic_ref, max_outstanding_requests=args.max_outstanding_requests
+  )
+  messages = topics.GetMessagesModule()
+  with bulk_publish.OpenMessagesFile(args.messages_from_file) as stream:
+    return publisher.Publish(
+        bulk_publish.ReadMessages(
+            stream, args.messages_file_format, messages
+        )
+    )
+
+
 def _Run(args, message_body, legacy_output=False):
   """Publishes a message to a topic."""
+  if args.messages_from_file:
+    return _RunBulkPublish(args, message_body)
+
   client = topics.TopicsClient()
 
   attributes = util.ParseAttributes(args.attribute, messages=client.messages)
@@ -62,13 +88,22 @@ class Publish(base.Command):
           run:
 
             $ {command} mytopic --message="Hello World!" --attribute=KEY1=VAL1,KEY2=VAL2
+
+          To publish each line of a file as a message, run:
+
+            $ {command} mytopic --messages-from-file=messages.txt
+
+          To publish JSON messages with attributes and ordering keys from
+          standard input, run:
+
+            $ printf '%s\\n' '{"data": "Hello", "orderingKey": "k1"}' | {command} mytopic --messages-from-file=- --messages-file-format=json
       """
   }
 
   @classmethod
   def Args(cls, parser):
     resource_args.AddTopicResourceArg(parser, 'to publish messages to.')
-    flags.AddPublishMessageFlags(parser)
+    flags.AddBulkPublishFlags(parser)
 
   def Run(self, args):
     return _Run(args, args.message)
@@ -81,7 +116,7 @@ class PublishBeta(Publish):
   @classmethod
   def Args(cls, parser):
     resource_args.AddTopicResourceArg(parser, 'to publish messages to.')
-    flags.AddPublishMessageFlags(parser, add_deprecated=True)
+    flags.AddBulkPublishFlags(parser, add_deprecated=True)
 
   def Run(self, args):
     message_body = flags.ParseMessageBody(args)
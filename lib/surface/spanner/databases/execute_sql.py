@@ -57,6 +57,15 @@ def CreateSession(args, database_role=None):
       collection='spanner.projects.instances.databases.sessions')
 
 
+def _StreamAndDeleteSession(session, partial_result_sets):
+  """Yields partial_result_sets, then deletes the session they are read from."""
+  try:
+    for partial_result_set in partial_result_sets:
+      yield partial_result_set
+  finally:
+    database_sessions.Delete(session)
+
+
 def AddBaseArgs(parser):
   """Parses provided arguments to add base arguments used for both Beta and GA.
 
@@ -173,17 +182,39 @@ class Query(base.Command):
     )
     read_only_options = self.ParseReadOnlyOptions(args)
     session = CreateSession(args, args.database_role)
-    try:
-      return database_sessions.ExecuteSql(
-          args.sql,
-          args.query_mode,
-          session,
-          read_only_options,
-          request_options,
-          args.enable_partitioned_dml,
-          args.timeout)
-    finally:
-      database_sessions.Delete(session)
+    if read_only_options is None or args.enable_partitioned_dml:
+      try:
+        return database_sessions.ExecuteSql(
+            args.sql,
+            args.query_mode,
+            session,
+            read_only_options,
+            request_options,
+            args.enable_partitioned_dml,
+            args.timeout)
+      finally:
+        database_sessions.Delete(session)
+
+    # Queries are streamed, so their results are not limited in size and the
+    # rows are printed as they arrive.
+    result = sql.StreamedResultSet(
+        _StreamAndDeleteSession(
+            session,
+            database_sessions.ExecuteStreamingSql(
+                args.sql,
+                args.query_mode,
+                session,
+                read_only_options,
+                request_options,
+                args.timeout,
+            ),
+        )
+    )
+    if args.query_mode != 'NORMAL' or args.IsSpecified('format'):
+      # Query stats are displayed before the rows, and --format prints the
+      # whole result set.
+      return result.ToResultSet()
+    return result
 
   def ParseReadOnlyOptions(self, args):
     """Parses the options for a read-only request from command line arguments.
@@ -236,6 +267,9 @@ class Query(base.Command):
       args: The arguments originally passed to the command.
       result: The output of the command before display.
     """
+    if isinstance(result, sql.StreamedResultSet):
+      sql.DisplayStreamedQueryResults(result, log.out)
+      return
     display_plan = (
         args.query_mode == 'PLAN'
         or args.query_mode == 'PROFILE'
@@ -24,6 +24,7 @@ from googlecloudsdk.command_lib.storage import flags
 from googlecloudsdk.command_lib.storage import name_expansion
 from googlecloudsdk.command_lib.storage import stdin_iterator
 from googlecloudsdk.command_lib.storage import user_request_args_factory
+from googlecloudsdk.command_lib.storage.tasks import batch_task
 from googlecloudsdk.command_lib.storage.tasks import task_executor
 from googlecloudsdk.command_lib.storage.tasks import task_graph_executor
 from googlecloudsdk.command_lib.storage.tasks import task_status
@@ -230,7 +231,7 @@ class Update(base.Command):
 
     task_status_queue = task_graph_executor.multiprocessing_context.Queue()
     self.exit_code = task_executor.execute_tasks(
-        task_iterator,
+        batch_task.get_batched_task_iterator(task_iterator),
         parallelizable=True,
         task_status_queue=task_status_queue,
         progress_manager_args=task_status.ProgressManagerArgs(
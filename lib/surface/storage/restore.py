@@ -28,6 +28,7 @@ from googlecloudsdk.command_lib.storage import stdin_iterator
 from googlecloudsdk.command_lib.storage import storage_url
 from googlecloudsdk.command_lib.storage import user_request_args_factory
 from googlecloudsdk.command_lib.storage import wildcard_iterator
+from googlecloudsdk.command_lib.storage.tasks import batch_task
 from googlecloudsdk.command_lib.storage.tasks import task_executor
 from googlecloudsdk.command_lib.storage.tasks import task_graph_executor
 from googlecloudsdk.command_lib.storage.tasks import task_status
@@ -381,8 +382,12 @@ class Restore(base.Command):
           args, ExecutionMode.SYNCHRONOUS, _BULK_RESTORE_FLAGS
       )
 
+    task_iterator = _restore_task_iterator(args)
+    if not args.all_versions:
+      # Versions must be restored in order, which batch calls don't guarantee.
+      task_iterator = batch_task.get_batched_task_iterator(task_iterator)
     self.exit_code = task_executor.execute_tasks(
-        task_iterator=_restore_task_iterator(args),
+        task_iterator=task_iterator,
         parallelizable=not args.all_versions,
         task_status_queue=task_status_queue,
         progress_manager_args=task_status.ProgressManagerArgs(
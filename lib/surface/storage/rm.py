@@ -27,6 +27,7 @@ from googlecloudsdk.command_lib.storage import plurality_checkable_iterator
 from googlecloudsdk.command_lib.storage import rm_command_util
 from googlecloudsdk.command_lib.storage import stdin_iterator
 from googlecloudsdk.command_lib.storage import user_request_args_factory
+from googlecloudsdk.command_lib.storage.tasks import batch_task
 from googlecloudsdk.command_lib.storage.tasks import task_executor
 from googlecloudsdk.command_lib.storage.tasks import task_graph_executor
 from googlecloudsdk.command_lib.storage.tasks import task_status
@@ -181,7 +182,9 @@ class Rm(base.Command):
 
     log.status.Print('Removing objects:')
     object_exit_code = task_executor.execute_tasks(
-        task_iterator_factory.object_iterator(),
+        batch_task.get_batched_task_iterator(
+            task_iterator_factory.object_iterator()
+        ),
         parallelizable=True,
         task_status_queue=task_status_queue,
         progress_manager_args=task_status.ProgressManagerArgs(
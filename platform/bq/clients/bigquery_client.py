@@ -12,7 +12,7 @@ import logging
 import tempfile
 import time
 import traceback
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 import urllib
 
 # To configure apiclient logging.
@@ -203,6 +203,11 @@ class BigqueryClient:
     self._models_apiclient = None
     self._op_connection_service_client = None
     self._iam_policy_apiclient = None
+    # Clients already built by BuildApiClient, keyed by the service, api
+    # version, root url and hash of the discovery document they were built
+    # from, so that e.g. the models and routines clients reuse the core
+    # BigQuery client instead of resolving the same document again.
+    self._built_apiclients = {}
     default_flag_values = {
         'iam_policy_discovery_document': _DEFAULT,
     }
@@ -554,17 +559,29 @@ class BigqueryClient:
           discovery_url=discovery_url,  # pyrefly: ignore[bad-argument-type]
       )
 
-    discovery_document_to_build_client = self.OverrideEndpoint(
+    cache_key = (
+        service,
+        api_version,
+        discovery_root_url,
+        discovery_document_cache.get_document_hash(discovery_document),  # pyrefly: ignore[bad-argument-type]
+    )
+    if cache_key in self._built_apiclients:
+      logging.info('Using the cached "%s" API client', service)
+      return self._built_apiclients[cache_key]
+
+    discovery_document_to_build_client = self._OverrideParsedEndpoint(
         discovery_document=discovery_document,  # pyrefly: ignore[bad-argument-type]
         service=service,
         discovery_root_url=discovery_root_url,
     )
 
-    bq_logging.SaveStringToLogDirectoryIfAvailable(
-        file_prefix='discovery_document',
-        content=discovery_document_to_build_client,  # pyrefly: ignore[bad-argument-type]
-        apilog=bq_flags.APILOG.value,
-    )
+    # Serializing the document back to json is only needed for the log.
+    if bq_logging.GetLogDirectory(bq_flags.APILOG.value):
+      bq_logging.SaveStringToLogDirectoryIfAvailable(
+          file_prefix='discovery_document',
+          content=json.dumps(discovery_document_to_build_client),
+          apilog=bq_flags.APILOG.value,
+      )
 
     try:
       # If the underlying credentials object used for authentication is of type
@@ -587,7 +604,7 @@ class BigqueryClient:
       )
       raise
 
-
+    self._built_apiclients[cache_key] = built_client
     return built_client
 
   @property
@@ -737,32 +754,63 @@ class BigqueryClient:
     if discovery_document is None:
       return discovery_document
 
-    discovery_document = bq_api_utils.parse_discovery_doc(discovery_document)  # pyrefly: ignore[bad-assignment]
+    return json.dumps(
+        self._OverrideParsedEndpoint(
+            discovery_document=discovery_document,
+            service=service,
+            discovery_root_url=discovery_root_url,
+        )
+    )
+
+  def _OverrideParsedEndpoint(
+      self,
+      discovery_document: Union[str, bytes, Dict[str, Any]],
+      service: Service,
+      discovery_root_url: Optional[str] = None,
+  ) -> Dict[str, Any]:
+    """Returns the parsed discovery document with its endpoint overridden.
+
+    The document is parsed through discovery_document_cache, so building
+    several clients from the same document does not parse it each time.
+
+    Args:
+      discovery_document: BigQuery discovery document, as json or parsed.
+      service: The BigQuery service being used.
+      discovery_root_url: The root URL to use for the discovery document.
+
+    Returns:
+      A parsed copy of discovery_document with the updated endpoint.
+    """
+    # Only top level keys are updated, so a shallow copy leaves a dict passed
+    # in by the caller untouched.
+    discovery_document = dict(
+        discovery_document_cache.get_parsed_document(discovery_document)
+    )
 
     logging.info(
         'Discovery doc routing values being considered for updates: rootUrl:'
         ' (%s), basePath: (%s), baseUrl: (%s)',
-        discovery_document['rootUrl'],  # pyrefly: ignore[bad-index]
-        discovery_document['basePath'],  # pyrefly: ignore[bad-index]
-        discovery_document['baseUrl'],  # pyrefly: ignore[bad-index]
+        discovery_document['rootUrl'],
+        discovery_document['basePath'],
+        discovery_document['baseUrl'],
     )
 
-    discovery_document['rootUrl'] = bq_api_utils.get_tpc_root_url_from_flags(  # pyrefly: ignore[unsupported-operation]
+    discovery_document['rootUrl'] = bq_api_utils.get_tpc_root_url_from_flags(
         service=service, inputted_flags=bq_flags
     )
 
 
-    discovery_document['baseUrl'] = urllib.parse.urljoin(  # pyrefly: ignore[unsupported-operation]
-        discovery_document['rootUrl'], discovery_document['servicePath']  # pyrefly: ignore[bad-index]
+    discovery_document['baseUrl'] = urllib.parse.urljoin(
+        discovery_document['rootUrl'], discovery_document['servicePath']
     )
 
     logging.info(
         'Discovery doc routing values post updates: rootUrl: (%s), basePath:'
         ' (%s), baseUrl: (%s)',
-        discovery_document['rootUrl'],  # pyrefly: ignore[bad-index]
-        discovery_document['basePath'],  # pyrefly: ignore[bad-index]
-        discovery_document['baseUrl'],  # pyrefly: ignore[bad-index]
+        discovery_document['rootUrl'],
+        discovery_document['basePath'],
+        discovery_document['baseUrl'],
     )
 
-    return json.dumps(discovery_document)
+    return discovery_document
 
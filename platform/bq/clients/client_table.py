@@ -4,6 +4,7 @@
 from typing import Dict, List, Optional, cast
 
 from googleapiclient import discovery
+import httplib2
 
 from clients import table_reader as bq_table_reader
 from frontend import utils as bq_frontend_utils
@@ -29,6 +30,7 @@ def insert_table_rows(
     skip_invalid_rows: Optional[bool] = None,
     ignore_unknown_values: Optional[bool] = None,
     template_suffix: Optional[int] = None,
+    http: Optional[httplib2.Http] = None,
 ):
   """Insert rows into a table.
 
@@ -42,6 +44,9 @@ def insert_table_rows(
       present in the schema.
     template_suffix: Optional. The suffix used to generate the template table's
       name.
+    http: Optional. The http object used to execute the request instead of the
+      one the insert_client was built with. Needed when inserting from several
+      threads, since httplib2.Http objects are not thread-safe.
 
   Returns:
     result of the operation.
@@ -62,7 +67,7 @@ def insert_table_rows(
       ),
       **table_dict,
   )
-  return op.execute()
+  return op.execute(http=http)
 
 
 def read_schema_and_rows(
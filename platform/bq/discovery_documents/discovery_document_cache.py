@@ -2,10 +2,13 @@
 """Provides Logic for Fetching and Storing Discovery Documents from an on-disc cache."""
 
 import hashlib
+import json
+import marshal
 import os
 import pathlib
+import sys
 import tempfile
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
 from absl import logging
 
@@ -14,6 +17,118 @@ from pyglib import stringutil
 
 _DISCOVERY_CACHE_FILE = 'api_discovery.json'
 
+# The directory where parsed discovery documents are persisted between
+# invocations, in marshal format keyed by the hash of their contents.
+PARSED_CACHE_ROOT = os.path.expanduser('~/.bigquery/parsed_discovery')
+
+# The marshal format is only stable within a Python version.
+_PARSED_CACHE_SUFFIX = '.py{}{}.marshal{}'.format(
+    sys.version_info[0], sys.version_info[1], marshal.version
+)
+
+# Marshalled parsed discovery documents keyed by the hash of their contents.
+# Several API clients can be built from the same large document in one
+# invocation, so each distinct document is only parsed once per process, and
+# unmarshalling it is cheaper than both parsing and deep copying it.
+_marshalled_documents: Dict[str, bytes] = {}
+
+
+def get_document_hash(
+    discovery_document: Union[str, bytes, Dict[str, Any]],
+) -> str:
+  """Returns a stable hash of the contents of a discovery document."""
+  if isinstance(discovery_document, dict):
+    discovery_document = json.dumps(discovery_document, sort_keys=True)
+  # Use the sha1 hash as this is not security-related, just need a stable hash.
+  return hashlib.sha1(
+      stringutil.ensure_binary(discovery_document, 'utf8')
+  ).hexdigest()
+
+
+def _get_parsed_cache_file_name(
+    cache_root: str, document_hash: str
+) -> pathlib.Path:
+  """Returns the file name of the persisted parsed document."""
+  return pathlib.Path(cache_root, document_hash + _PARSED_CACHE_SUFFIX)
+
+
+def _load_marshalled_document(
+    cache_root: str, document_hash: str
+) -> Optional[bytes]:
+  """Returns the persisted marshalled document, None if not usable."""
+  file = _get_parsed_cache_file_name(cache_root, document_hash)
+  try:
+    with open(file, 'rb') as f:
+      contents = f.read()
+    # Check that the file is complete before trusting it.
+    if isinstance(marshal.loads(contents), dict):
+      return contents
+    logging.warning('Ignoring the invalid parsed discovery doc %s', file)
+  except FileNotFoundError:
+    logging.info('Parsed discovery doc not in cache. %s', file)
+  except Exception as e:  # pylint: disable=broad-except
+    logging.warning('Error loading parsed discovery doc %s: %s', file, e)
+  return None
+
+
+def _save_marshalled_document(
+    cache_root: str, document_hash: str, contents: bytes
+) -> None:
+  """Persists a marshalled document, logging rather than raising errors."""
+  file = _get_parsed_cache_file_name(cache_root, document_hash)
+  try:
+    file.parent.mkdir(parents=True, exist_ok=True)
+    # Write and rename so that other invocations never read a partial file.
+    with tempfile.NamedTemporaryFile(
+        dir=file.parent, suffix='.tmp', delete=False
+    ) as f:
+      f.write(contents)
+    os.replace(f.name, file)
+  except Exception as e:  # pylint: disable=broad-except
+    logging.warning('Error saving parsed discovery doc %s: %s', file, e)
+
+
+def get_parsed_document(
+    discovery_document: Union[str, bytes, Dict[str, Any]],
+    cache_root: Optional[str] = PARSED_CACHE_ROOT,
+) -> Dict[str, Any]:
+  """Returns the parsed discovery document, parsing it at most once.
+
+  Documents are looked up by the hash of their contents, first in the
+  process, then in `cache_root`, so a changed document is parsed again and
+  persisted under its new hash.
+
+  Args:
+    discovery_document: [str|bytes|dict], The discovery document as json or
+      already parsed.
+    cache_root: [str], The directory where parsed documents are persisted,
+      None to only cache them in the process.
+
+  Returns:
+    The discovery document as a dict. Documents passed as json are returned
+    as a new object on each call that callers may update; dicts are returned
+    as is.
+  """
+  if isinstance(discovery_document, dict):
+    return discovery_document
+  if not isinstance(discovery_document, (str, bytes)):
+    raise ValueError(
+        f'Unsupported discovery document type: {type(discovery_document)}'
+    )
+  document_hash = get_document_hash(discovery_document)
+  contents = _marshalled_documents.get(document_hash)
+  if contents is None and cache_root:
+    contents = _load_marshalled_document(cache_root, document_hash)
+  if contents is None:
+    logging.info('Parsing discovery document %s', document_hash)
+    contents = marshal.dumps(
+        json.loads(stringutil.ensure_str(discovery_document, 'utf8'))
+    )
+    if cache_root:
+      _save_marshalled_document(cache_root, document_hash, contents)
+  _marshalled_documents[document_hash] = contents
+  return marshal.loads(contents)
+
 
 def _get_cache_file_name(
     cache_root: str, discovery_url: str, api_name: str, api_version: str
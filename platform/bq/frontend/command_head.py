@@ -50,7 +50,9 @@ class Head(bigquery_command.BigqueryCmd):
     flags.DEFINE_integer(
         'max_rows',
         100,
-        'The number of rows to print when showing table data.',
+        'The number of rows to print when showing table data. With the pretty '
+        'and sparse formats, column widths are computed from the first 1000 '
+        'rows and longer values in later rows are abbreviated.',
         short_name='n',
         flag_values=fv,
     )
@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 """The BQ CLI `insert` command."""
 
+import collections
+from concurrent import futures
+import json
 import sys
-from typing import Optional, TextIO
+import threading
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, TextIO
 
 from absl import app
 from absl import flags
@@ -24,6 +28,77 @@ FLAGS = flags.FLAGS
 # pylint: disable=g-doc-return-or-yield
 # pylint: disable=g-doc-args
 
+# The insertAll API rejects requests whose HTTP payload exceeds 10 MB, leave
+# some headroom for the request envelope and per-row JSON framing.
+_DEFAULT_MAX_REQUEST_BYTES = 9 * 1024 * 1024
+
+# Per-row overhead of the insertAll row envelope around the serialized row and
+# its insert id, including the separator between rows.
+_ROW_OVERHEAD_BYTES = len('{"json": , "insertId": ""}, ')
+
+
+class _InsertBatch(NamedTuple):
+  """A batch of rows sent in a single insertAll request."""
+
+  # Zero-based index of the first row of the batch within the input.
+  first_index: int
+  rows: List[bq_processor_utils.InsertEntry]
+  # One-based input line number of each row.
+  line_numbers: List[int]
+
+
+def _ReadBatches(
+    json_file: TextIO,
+    insert_id: Optional[str],
+    max_rows: Optional[int],
+    max_bytes: Optional[int],
+) -> Iterator[_InsertBatch]:
+  """Yields batches of rows read from newline delimited JSON.
+
+  A batch is closed once it holds max_rows rows or once adding the next row
+  would make the request payload exceed max_bytes, measuring rows as they are
+  serialized in the request body. A single row larger than max_bytes is sent
+  on its own and left to the server to reject. Blank lines are skipped.
+  """
+  rows = []
+  line_numbers = []
+  first_index = 0
+  batch_bytes = 0
+  row_number = 1
+  for lineno, line in enumerate(json_file, 1):
+    if not line.strip():
+      continue
+    try:
+      unique_insert_id = None
+      if insert_id is not None:
+        unique_insert_id = insert_id + '_' + str(row_number)
+      entry = bq_processor_utils.JsonToInsertEntry(unique_insert_id, line)
+    except bq_error.BigqueryClientError as e:
+      raise app.UsageError('Line %d: %s' % (lineno, str(e)))
+    # The API client serializes the request body with json.dumps, whose
+    # default ensure_ascii output has one byte per character.
+    row_bytes = len(json.dumps(entry.record)) + _ROW_OVERHEAD_BYTES
+    if unique_insert_id:
+      row_bytes += len(unique_insert_id)
+    if rows and max_bytes and batch_bytes + row_bytes > max_bytes:
+      yield _InsertBatch(first_index, rows, line_numbers)
+      first_index += len(rows)
+      rows = []
+      line_numbers = []
+      batch_bytes = 0
+    rows.append(entry)
+    line_numbers.append(lineno)
+    batch_bytes += row_bytes
+    row_number += 1
+    if max_rows and len(rows) >= max_rows:
+      yield _InsertBatch(first_index, rows, line_numbers)
+      first_index += len(rows)
+      rows = []
+      line_numbers = []
+      batch_bytes = 0
+  if rows:
+    yield _InsertBatch(first_index, rows, line_numbers)
+
 
 class Insert(bigquery_command.BigqueryCmd):
   usage = """insert [-s] [-i] [-x=<suffix>] <table identifier> [file]"""
@@ -64,6 +139,24 @@ class Insert(bigquery_command.BigqueryCmd):
         'Internally the insertId field is used for deduping of inserted rows.',
         flag_values=fv,
     )
+    flags.DEFINE_integer(
+        'max_request_bytes',
+        _DEFAULT_MAX_REQUEST_BYTES,
+        'The approximate maximum size in bytes of the rows sent in a single '
+        'insert request. Rows are batched until either this size or '
+        '--max_rows_per_request is reached.',
+        lower_bound=1,
+        flag_values=fv,
+    )
+    flags.DEFINE_integer(
+        'max_concurrent_requests',
+        1,
+        'The maximum number of insert requests in flight at the same time. '
+        'Rows are still read in order and errors are reported in input order, '
+        'but batches may be committed out of order when greater than 1.',
+        lower_bound=1,
+        flag_values=fv,
+    )
     self._ProcessCommandRc(fv)
 
   def RunWithArgs(
@@ -83,6 +176,10 @@ class Insert(bigquery_command.BigqueryCmd):
     Insert to dataset.table_suffix table using dataset.table table as its
     template.
       bq insert -x=_suffix dataset.table /tmp/mydata.json
+
+    Keep up to 8 insert requests of at most 5 MB each in flight:
+      bq insert --max_concurrent_requests=8 --max_request_bytes=5000000
+        dataset.table /tmp/mydata.json
     """
     if filename:
       with open(filename, 'r') as json_file:
@@ -93,6 +190,8 @@ class Insert(bigquery_command.BigqueryCmd):
             ignore_unknown_values=self.ignore_unknown_values,
             template_suffix=self.template_suffix,
             insert_id=self.insert_id,
+            max_request_bytes=self.max_request_bytes,
+            max_concurrent_requests=self.max_concurrent_requests,
         )
     else:
       return self._DoInsert(
@@ -102,6 +201,8 @@ class Insert(bigquery_command.BigqueryCmd):
           ignore_unknown_values=self.ignore_unknown_values,
           template_suffix=self.template_suffix,
           insert_id=self.insert_id,
+          max_request_bytes=self.max_request_bytes,
+          max_concurrent_requests=self.max_concurrent_requests,
       )
 
   def _DoInsert(
@@ -112,8 +213,17 @@ class Insert(bigquery_command.BigqueryCmd):
       ignore_unknown_values: Optional[bool] = None,
       template_suffix: Optional[int] = None,
       insert_id: Optional[str] = None,
+      max_request_bytes: Optional[int] = _DEFAULT_MAX_REQUEST_BYTES,
+      max_concurrent_requests: Optional[int] = 1,
   ) -> int:
-    """Insert the contents of the file into a table."""
+    """Insert the contents of the file into a table.
+
+    Rows are grouped into batches bounded by --max_rows_per_request and
+    max_request_bytes, and up to max_concurrent_requests batches are sent at
+    the same time. Once any batch reports errors no further batches are
+    started; the errors of all completed batches are reported in input order
+    with their record index and line number in the input.
+    """
     client = bq_cached_client.Client.Get()
     reference = bq_client_utils.GetReference(
         id_fallbacks=client,
@@ -126,57 +236,101 @@ class Insert(bigquery_command.BigqueryCmd):
         'Must provide a table identifier for insert.',
         is_usage_error=True,
     )
-    batch = []
+    insert_client = client.GetInsertApiClient()
+    max_concurrent_requests = max_concurrent_requests or 1
+
+    # httplib2.Http objects are not thread-safe, so each worker thread sends
+    # its requests through its own authorized http object.
+    thread_state = threading.local()
 
-    def Flush():
-      result = client_table.insert_table_rows(
-          insert_client=client.GetInsertApiClient(),
+    def Flush(batch: _InsertBatch) -> Dict[str, Any]:
+      http = None
+      if max_concurrent_requests > 1:
+        http = getattr(thread_state, 'http', None)
+        if http is None:
+          http = client.GetAuthorizedHttp(client.credentials, client.GetHttp())
+          thread_state.http = http
+      return client_table.insert_table_rows(
+          insert_client=insert_client,
           table_dict=reference,  # pyrefly: ignore[bad-argument-type]
-          inserts=batch,
+          inserts=batch.rows,
           skip_invalid_rows=skip_invalid_rows,
           ignore_unknown_values=ignore_unknown_values,
           template_suffix=template_suffix,
+          http=http,
       )
-      del batch[:]
-      return result, result.get('insertErrors', None)
 
     result = {}
-    errors = None
-    lineno = 1
-    for line in json_file:
-      try:
-        unique_insert_id = None
-        if insert_id is not None:
-          unique_insert_id = insert_id + '_' + str(lineno)
-        batch.append(
-            bq_processor_utils.JsonToInsertEntry(unique_insert_id, line)
-        )
-        lineno += 1
-      except bq_error.BigqueryClientError as e:
-        raise app.UsageError('Line %d: %s' % (lineno, str(e)))
-      if (
-          FLAGS.max_rows_per_request
-          and len(batch) == FLAGS.max_rows_per_request
-      ):
-        result, errors = Flush()
-      if errors:
-        break
-    if batch and not errors:
-      result, errors = Flush()
+    insert_errors = []
+    # The input line number of each reported row, by its index in the input.
+    error_line_numbers = {}
 
+    def Collect(batch: _InsertBatch, batch_result: Dict[str, Any]) -> None:
+      nonlocal result
+      result = batch_result
+      for entry in batch_result.get('insertErrors', None) or []:
+        entry = dict(entry)
+        batch_index = entry.get('index', 0)
+        # Report the index within the whole input rather than the batch.
+        entry['index'] = batch.first_index + batch_index
+        if 0 <= batch_index < len(batch.line_numbers):
+          error_line_numbers[entry['index']] = batch.line_numbers[batch_index]
+        insert_errors.append(entry)
+
+    batches = _ReadBatches(
+        json_file,
+        insert_id,
+        FLAGS.max_rows_per_request,
+        max_request_bytes,
+    )
+    if max_concurrent_requests == 1:
+      for batch in batches:
+        Collect(batch, Flush(batch))
+        if insert_errors:
+          break
+    else:
+      with futures.ThreadPoolExecutor(
+          max_workers=max_concurrent_requests
+      ) as executor:
+        # Results are collected in submission order so that errors are
+        # reported in input order, and at most max_concurrent_requests
+        # batches are read ahead of the oldest outstanding one.
+        pending = collections.deque()
+        try:
+          for batch in batches:
+            if len(pending) >= max_concurrent_requests:
+              done_batch, future = pending.popleft()
+              Collect(done_batch, future.result())
+              if insert_errors:
+                break
+            pending.append((batch, executor.submit(Flush, batch)))
+          while pending:
+            done_batch, future = pending.popleft()
+            Collect(done_batch, future.result())
+        finally:
+          for _, future in pending:
+            future.cancel()
+
+    if insert_errors:
+      result = dict(result, insertErrors=insert_errors)
     if bq_flags.FORMAT.value in ['prettyjson', 'json']:
       bq_utils.PrintFormattedJsonObject(result)
     elif bq_flags.FORMAT.value in [None, 'sparse', 'pretty']:
-      if errors:
-        for entry in result['insertErrors']:
-          entry_errors = entry['errors']
-          sys.stdout.write('record %d errors: ' % (entry['index'],))
-          for error in entry_errors:
-            print(
-                '\t%s: %s'
-                % (
-                    stringutil.ensure_str(error['reason']),
-                    stringutil.ensure_str(error.get('message')),
-                )
+      for entry in insert_errors:
+        entry_errors = entry['errors']
+        sys.stdout.write(
+            'record %d (line %d) errors: '
+            % (
+                entry['index'],
+                error_line_numbers.get(entry['index'], entry['index'] + 1),
             )
-    return 1 if errors else 0
+        )
+        for error in entry_errors:
+          print(
+              '\t%s: %s'
+              % (
+                  stringutil.ensure_str(error['reason']),
+                  stringutil.ensure_str(error.get('message')),
+              )
+          )
+    return 1 if insert_errors else 0
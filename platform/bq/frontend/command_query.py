@@ -68,7 +68,9 @@ class Query(bigquery_command.BigqueryCmd):
     flags.DEFINE_integer(
         'max_rows',
         100,
-        'How many rows to return in the result.',
+        'How many rows to return in the result. With the pretty and sparse '
+        'formats, column widths are computed from the first 1000 rows and '
+        'longer values in later rows are abbreviated.',
         short_name='n',
         flag_values=fv,
     )
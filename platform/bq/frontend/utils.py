@@ -454,7 +454,11 @@ class TablePrinter(object):
     return values
 
   def PrintTable(self, fields, rows, use_full_timestamp: bool):
-    formatter = utils_flags.get_formatter_from_flags(secondary_format='pretty')
+    # Rows are written out as they are formatted rather than buffered in the
+    # formatter, so large result sets are not held in memory a second time.
+    formatter = utils_flags.get_streaming_formatter_from_flags(
+        secondary_format='pretty'
+    )
     self._ValidateFields(fields, formatter)
     formatter.AddFields(fields)
     formatter.AddRows(
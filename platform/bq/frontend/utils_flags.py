@@ -31,6 +31,16 @@ def get_formatter_from_flags(
     return table_formatter.GetFormatter(secondary_format)
 
 
+def get_streaming_formatter_from_flags(
+    secondary_format: Optional[str] = 'sparse',
+) -> table_formatter.TableFormatter:
+  """Returns a formatter that writes rows to stdout as they are added."""
+  if FLAGS['format'].present:
+    return table_formatter.GetStreamingFormatter(FLAGS.format)
+  else:
+    return table_formatter.GetStreamingFormatter(secondary_format)
+
+
 def get_job_id_from_flags() -> Optional[bq_client_utils.JobIdGenerator]:
   """Returns the job id or job generator from the flags."""
   if FLAGS.fingerprint_job_id and FLAGS.job_id:
@@ -77,6 +77,27 @@ Additional formatters can be added by subclassing TableFormatter and
 overriding the following methods:
   __len__, __unicode__, AddRow, column_names, AddColumn
 
+Streaming Output
+----------------
+
+  The formatters above keep every row until Print is called. For large
+  result sets, GetStreamingFormatter returns variants of the same
+  formats that write each row to the output as soon as it is added and
+  only keep a bounded number of rows in memory:
+
+  StreamingCsvFormatter, StreamingJsonFormatter and
+    StreamingPrettyJsonFormatter write each row immediately.
+
+  StreamingPrettyFormatter and StreamingSparsePrettyFormatter buffer the
+    first `window` rows to compute the column widths, then write those
+    rows and every later one immediately, abbreviating entries that are
+    wider than the sampled widths.
+
+  Print must be called once all rows are added to finish the output
+  (e.g. the closing bracket of a JSON array or the bottom border of a
+  pretty table). The output is identical to that of the corresponding
+  buffering formatter as long as no entry needs abbreviation.
+
 Formatters that require non-empty output to be valid should override
 `_empty_output_meaningful`
 For example JsonFormatter must emit '[]' to produce valid json.
@@ -582,6 +603,202 @@ class NullFormatter(TableFormatter):
     self._column_names.append(column_name)
 
 
+def _Encode(text):
+  """Encode text as done by TableFormatter.Print."""
+  # Hack to avoid UnicodeEncodeErrors when printing the encoded string.
+  encoding = sys.stdout.encoding or 'utf8'
+  return text.encode(encoding, 'backslashreplace').decode(encoding)
+
+
+class StreamingPrettyFormatter(PrettyFormatter):
+  """PrettyFormatter that writes rows as they are added.
+
+  Column widths are computed over the first `window` rows only. Once that
+  many rows have been added the header and the buffered rows are written,
+  and every later row is written as soon as it is added; entries wider than
+  their column are abbreviated.
+  """
+
+  def __init__(self, output=None, window=1000, **kwds):
+    """Initialize a new StreamingPrettyFormatter.
+
+    Keyword arguments:
+      output: (default: sys.stdout) File to write the table to.
+      window: (default: 1000) Number of rows used to compute column widths.
+    """
+    super(StreamingPrettyFormatter, self).__init__(**kwds)
+    self._output = output
+    self._window = max(1, window)
+    self._started = False
+    self._row_count = 0
+
+  def __len__(self):
+    return self._row_count
+
+  def _Write(self, lines):
+    file = self._output if self._output else sys.stdout
+    for line in lines:
+      print(_Encode(line), file=file)
+
+  def _Start(self):
+    """Write the header and the rows buffered so far."""
+    self._Write(itertools.chain(self.FormatHeader(), self.FormatRows()))
+    self.rows = []
+    self.row_heights = []
+    self._started = True
+
+  def FormatFooter(self):
+    """Return the lines written after the last row of this table."""
+    return self.FormatHrule()
+
+  def AddRow(self, row):
+    """Add a row to this table, writing it out once widths are known.
+
+    Args:
+      row: A list of length equal to the number of columns in this table.
+
+    Raises:
+      FormatterException: If the row length is invalid.
+    """
+    if not self._started:
+      super(StreamingPrettyFormatter, self).AddRow(row)
+      self._row_count += 1
+      if len(self.rows) >= self._window:
+        self._Start()
+      return
+    if len(row) != len(self.column_names):
+      raise FormatterException('Invalid row length: %s' % (len(row),))
+    row_height = max(len(str(entry).splitlines() or ['']) for entry in row)
+    self._row_count += 1
+    self._Write(self.FormatRow(row, row_height))
+
+  def Print(self, output=None):
+    """Finish the table, writing out any rows that are still buffered."""
+    if output:
+      self._output = output
+    if not self._started:
+      if self:
+        self._Write([self.__unicode__()])
+      return
+    self._Write(self.FormatFooter())
+
+
+class StreamingSparsePrettyFormatter(StreamingPrettyFormatter,
+                                     SparsePrettyFormatter):
+  """SparsePrettyFormatter that writes rows as they are added."""
+
+  def FormatFooter(self):
+    return []
+
+
+class StreamingCsvFormatter(CsvFormatter):
+  """CsvFormatter that writes rows as they are added.
+
+  The header line is written along with the first row, so nothing is
+  written for a table without rows. Like CsvFormatter, trailing whitespace
+  at the end of the table is dropped, so it is held back until more output
+  follows it.
+  """
+
+  def __init__(self, output=None, **kwds):
+    super(StreamingCsvFormatter, self).__init__(**kwds)
+    self._output = output
+    self._row_count = 0
+    self._pending_whitespace = ''
+
+  def __nonzero__(self):
+    return bool(self._row_count)
+
+  def __bool__(self):
+    return bool(self._row_count)
+
+  def __len__(self):
+    if self._row_count or not self.skip_header_when_empty:
+      return self._row_count + 1
+    return 0
+
+  def AddRow(self, row):
+    file = self._output if self._output else sys.stdout
+    text = self._pending_whitespace
+    if not self._row_count:
+      text += ','.join(self._header) + '\n'
+    self._table.writerow(row)
+    text += self._buffer.getvalue()
+    self._buffer.seek(0)
+    self._buffer.truncate()
+    stripped = text.rstrip()
+    self._pending_whitespace = text[len(stripped):]
+    file.write(_Encode(stripped))
+    self._row_count += 1
+
+  def Print(self, output=None):
+    """End the table, all rows were written as they were added."""
+    if output:
+      self._output = output
+    if self._row_count:
+      file = self._output if self._output else sys.stdout
+      file.write('\n')
+
+
+class StreamingJsonFormatter(JsonFormatter):
+  """JsonFormatter that writes rows as they are added."""
+
+  def __init__(self, output=None, **kwds):
+    super(StreamingJsonFormatter, self).__init__(**kwds)
+    self._output = output
+    self._row_count = 0
+
+  def __len__(self):
+    return self._row_count
+
+  def _Write(self, text):
+    file = self._output if self._output else sys.stdout
+    file.write(_Encode(text))
+
+  def _DumpRow(self, row_dict):
+    return json.dumps(
+        row_dict, separators=(',', ':'), sort_keys=True, ensure_ascii=False)
+
+  def _Separator(self):
+    return ',' if self._row_count else '['
+
+  def _Terminator(self):
+    return ']' if self._row_count else '[]'
+
+  def AddRow(self, row):
+    if len(row) != len(self._field_names):
+      raise FormatterException('Invalid row: %s' % (row,))
+    self._Write(
+        self._Separator() + self._DumpRow(dict(zip(self._field_names, row))))
+    self._row_count += 1
+
+  def Print(self, output=None):
+    """Write the end of the JSON array."""
+    if output:
+      self._output = output
+    self._Write(self._Terminator() + '\n')
+
+
+class StreamingPrettyJsonFormatter(StreamingJsonFormatter):
+  """PrettyJsonFormatter that writes rows as they are added."""
+
+  def _DumpRow(self, row_dict):
+    row_json = json.dumps(
+        row_dict,
+        separators=(', ', ': '),
+        sort_keys=True,
+        indent=2,
+        ensure_ascii=False)
+    return '\n'.join('  ' + line for line in row_json.splitlines())
+
+  def _Separator(self):
+    # Matches the item separator json.dumps uses for the whole array.
+    return ', \n' if self._row_count else '[\n'
+
+  def _Terminator(self):
+    return '\n]' if self._row_count else '[]'
+
+
 def GetFormatter(table_format):
   """Map a format name to a TableFormatter object."""
   if table_format == 'csv':
@@ -599,3 +816,28 @@ def GetFormatter(table_format):
   else:
     raise FormatterException('Unknown format: %s' % table_format)
   return table_formatter
+
+
+def GetStreamingFormatter(table_format, output=None):
+  """Map a format name to a TableFormatter that writes rows as added.
+
+  Args:
+    table_format: The format name, as accepted by GetFormatter.
+    output: (default: sys.stdout) File to write the table to.
+
+  Returns:
+    A TableFormatter. Print must be called once all rows are added.
+  """
+  if table_format == 'csv':
+    table_formatter = StreamingCsvFormatter(output=output)
+  elif table_format == 'pretty':
+    table_formatter = StreamingPrettyFormatter(output=output)
+  elif table_format == 'json':
+    table_formatter = StreamingJsonFormatter(output=output)
+  elif table_format == 'prettyjson':
+    table_formatter = StreamingPrettyJsonFormatter(output=output)
+  elif table_format == 'sparse':
+    table_formatter = StreamingSparsePrettyFormatter(output=output)
+  else:
+    table_formatter = GetFormatter(table_format)
+  return table_formatter
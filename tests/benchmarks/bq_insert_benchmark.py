@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures `bq insert` throughput against a fake insertAll endpoint.
+
+The fake endpoint answers every tabledata.insertAll request after a fixed
+latency and records the size and row count of each request, so the benchmark
+shows both the throughput gained from concurrent requests and whether the
+request size bound holds on the wire.
+
+Usage:
+  python tests/benchmarks/bq_insert_benchmark.py [--rows=N] [--latency=S]
+      [--concurrency=1,4,8] [--max_request_bytes=B] [--json]
+"""
+
+import argparse
+import http.server
+import io
+import json
+import os
+import sys
+import threading
+import time
+
+_SDK_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+_BQ_DIR = os.path.join(_SDK_ROOT, 'platform', 'bq')
+sys.path[:0] = [_BQ_DIR, os.path.join(_BQ_DIR, 'third_party')]
+
+# pylint: disable=g-import-not-at-top,wrong-import-position
+import bq  # pylint: disable=unused-import  # Sets up the bq flags.
+from absl import flags
+from frontend import bq_cached_client
+from frontend import command_insert
+from googleapiclient import discovery
+import httplib2
+# pylint: enable=g-import-not-at-top,wrong-import-position
+
+
+class _FakeInsertAllServer(object):
+  """A local HTTP stand-in for the tabledata.insertAll method."""
+
+  def __init__(self, latency):
+    self.requests = []
+    self._lock = threading.Lock()
+    fake = self
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+      protocol_version = 'HTTP/1.1'
+
+      def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        rows = len(json.loads(body)['rows'])
+        with fake._lock:  # pylint: disable=protected-access
+          fake.requests.append((len(body), rows))
+        time.sleep(latency)
+        response = b'{"kind": "bigquery#tableDataInsertAllResponse"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+      def log_message(self, *args):
+        pass
+
+    self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self._server.daemon_threads = True
+    self.url = 'http://127.0.0.1:{0}/'.format(self._server.server_port)
+    self._thread = threading.Thread(target=self._server.serve_forever)
+    self._thread.daemon = True
+
+  def __enter__(self):
+    self._thread.start()
+    return self
+
+  def __exit__(self, *args):
+    self._server.shutdown()
+    self._server.server_close()
+
+
+class _FakeClient(object):
+  """The parts of the bq client used by `bq insert`."""
+
+  credentials = None
+  project_id = 'project'
+  dataset_id = ''
+
+  def __init__(self, endpoint):
+    with open(os.path.join(_BQ_DIR, 'discovery_next', 'bigquery.json')) as f:
+      document = f.read()
+    self._apiclient = discovery.build_from_document(
+        document,
+        http=httplib2.Http(),
+        client_options={'api_endpoint': endpoint},
+    )
+
+  def GetInsertApiClient(self):
+    return self._apiclient
+
+  def GetHttp(self):
+    return httplib2.Http()
+
+  def GetAuthorizedHttp(self, unused_credentials, http):
+    return http
+
+
+def _Rows(num_rows):
+  lines = []
+  for i in range(num_rows):
+    # Padded, escaped input is larger than the rows as sent on the wire.
+    row = {'id': i, 'name': 'rowé %d' % i, 'payload': 'x' * 200}
+    lines.append(json.dumps(row, indent=2).replace('\n', ' ') + '\n')
+  return ''.join(lines)
+
+
+def RunBenchmark(num_rows, latency, concurrency_levels, max_request_bytes,
+                 max_rows_per_request):
+  """Inserts num_rows rows once per concurrency level and returns the stats."""
+  flags.FLAGS(['bq_insert_benchmark'])
+  flags.FLAGS.max_rows_per_request = max_rows_per_request
+  data = _Rows(num_rows)
+  results = []
+  for concurrency in concurrency_levels:
+    with _FakeInsertAllServer(latency) as server:
+      client = _FakeClient(server.url)
+      bq_cached_client.Client.Get = staticmethod(lambda: client)
+      command = command_insert.Insert.__new__(command_insert.Insert)
+      start = time.time()
+      status = command._DoInsert(  # pylint: disable=protected-access
+          'project:dataset.table',
+          io.StringIO(data),
+          max_request_bytes=max_request_bytes,
+          max_concurrent_requests=concurrency,
+      )
+      elapsed = time.time() - start
+    results.append({
+        'concurrency': concurrency,
+        'status': status,
+        'seconds': round(elapsed, 3),
+        'rows_per_second': round(num_rows / elapsed, 1),
+        'requests': len(server.requests),
+        'rows_received': sum(rows for _, rows in server.requests),
+        'max_request_bytes': max(size for size, _ in server.requests),
+    })
+  return results
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--rows', type=int, default=20000)
+  parser.add_argument('--latency', type=float, default=0.05,
+                      help='Seconds the fake endpoint takes per request.')
+  parser.add_argument('--concurrency', default='1,4,8',
+                      help='Comma separated --max_concurrent_requests values.')
+  parser.add_argument('--max_request_bytes', type=int, default=256 * 1024)
+  parser.add_argument('--max_rows_per_request', type=int, default=None)
+  parser.add_argument('--json', action='store_true',
+                      help='Print the results as JSON.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark(
+      args.rows, args.latency,
+      [int(c) for c in args.concurrency.split(',')],
+      args.max_request_bytes, args.max_rows_per_request)
+  if args.json:
+    print(json.dumps(results))
+    return
+  print('{0:>11} {1:>9} {2:>10} {3:>9} {4:>14}'.format(
+      'concurrency', 'seconds', 'rows/s', 'requests', 'max req bytes'))
+  for r in results:
+    print('{concurrency:>11} {seconds:>9} {rows_per_second:>10} '
+          '{requests:>9} {max_request_bytes:>14}'.format(**r))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures CLI tree generation in one process and in sharded processes.
+
+Generates the CLI tree of some top level command groups, in all release
+tracks, in a new Python process for each measurement so that no command
+module is imported beforehand: once with a walk of the tree in that process,
+then with the groups sharded across forked processes. Shard generation times
+are logged at info verbosity.
+
+Usage:
+  python tests/benchmarks/cli_tree_benchmark.py [--groups=a,b,...]
+      [--processes=N,...] [--json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+_SDK_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+_DEFAULT_GROUPS = 'config,topic,pubsub,storage,ai_platform,iam'
+
+# Runs in the measured process: argv is the groups and the process count, 1
+# for a walk of the tree in the process.
+_GENERATE = """
+import json, sys, time
+sys.path[:0] = sys.argv[3:]
+from googlecloudsdk import gcloud_main
+from googlecloudsdk.calliope import cli_tree
+groups = sys.argv[1].split(',')
+processes = int(sys.argv[2])
+cli = gcloud_main.CreateCLI([])
+start = time.time()
+shards = [s for s in cli_tree._GetShards(cli) if s[0] in groups]
+if processes == 1:
+  paths = [path for _, shard_paths in shards for path in shard_paths]
+  cli_tree._ShardCliTreeGenerator(cli, paths).Walk(
+      hidden=True, restrict=paths)
+else:
+  cli_tree._GetShards = lambda unused_cli: shards
+  cli_tree._GenerateShardedTree(cli, processes, 'Generating')
+print(json.dumps({'seconds': time.time() - start}))
+"""
+
+
+def _Generate(groups, processes):
+  """Returns the seconds taken to generate the tree of groups."""
+  with tempfile.TemporaryDirectory() as config_dir:
+    env = dict(os.environ, CLOUDSDK_CONFIG=config_dir,
+               CLOUDSDK_CORE_VERBOSITY='info')
+    output = subprocess.check_output(
+        [sys.executable, '-c', _GENERATE, groups, str(processes),
+         os.path.join(_SDK_ROOT, 'lib'),
+         os.path.join(_SDK_ROOT, 'lib', 'third_party')], env=env)
+  return json.loads(output.decode('utf-8').splitlines()[-1])['seconds']
+
+
+def RunBenchmark(groups, process_counts):
+  """Runs the CLI tree generation benchmark and returns its results."""
+  results = []
+  for processes in process_counts:
+    seconds = _Generate(groups, processes)
+    results.append({
+        'benchmark': 'generate [{0}] with {1} process(es)'.format(
+            groups, processes),
+        'seconds': round(seconds, 3),
+    })
+  return results
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--groups', default=_DEFAULT_GROUPS,
+                      help='Comma separated top level group names.')
+  parser.add_argument('--processes', default='1,2,4',
+                      help='Comma separated process counts to measure.')
+  parser.add_argument('--json', action='store_true',
+                      help='Print the results as JSON.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark(
+      args.groups, [int(p) for p in args.processes.split(',')])
+  if args.json:
+    print(json.dumps(results))
+    return
+  for r in results:
+    print(', '.join('{0}={1}'.format(k, v) for k, v in r.items()))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures resource completion latency against a large resource cache.
+
+A ResourceCompleter for compute.instances is backed by an updater that
+returns a synthetic project with many instances instead of running a list
+command. The first completion fills the cache, later completions select
+matching rows from it, as TAB completion does once the cache is warm.
+
+Usage:
+  python tests/benchmarks/completion_benchmark.py [--instances=N]
+      [--zones=N] [--repeat=N] [--drop_indexes] [--json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path[:0] = [
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'lib', path)
+    for path in ('', 'third_party')]
+
+# pylint: disable=g-import-not-at-top,wrong-import-position
+from googlecloudsdk.command_lib.util import completers
+from googlecloudsdk.core.cache import resource_cache
+# pylint: enable=g-import-not-at-top,wrong-import-position
+
+_PROJECT = 'bench-project'
+
+_PREFIXES = (
+    # (description, prefix)
+    ('exact name', 'instance-00042'),
+    ('prefix, few matches', 'instance-0004'),
+    ('prefix, many matches', 'instance-1'),
+    ('other case prefix', 'INSTANCE-0004'),
+    ('no matches', 'missing-'),
+)
+
+
+class _ParameterInfo(resource_cache.ParameterInfo):
+  """Parameter info for a command line without resource flags."""
+
+  def GetFlag(self, parameter_name, parameter_value=None,
+              check_properties=True, for_update=False):
+    del parameter_name, parameter_value, check_properties, for_update
+    return None
+
+
+class _InstanceCompleter(completers.ResourceCompleter):
+  """A compute.instances completer listing a synthetic project."""
+
+  num_instances = 0
+  num_zones = 1
+
+  def __init__(self, **kwargs):
+    super(_InstanceCompleter, self).__init__(
+        collection='compute.instances', **kwargs)
+
+  def Update(self, parameter_info, aggregations):
+    del parameter_info, aggregations  # Unused.
+    return [
+        (_PROJECT, 'zone-{0}'.format(i % self.num_zones),
+         'instance-{0:05d}'.format(i))
+        for i in range(self.num_instances)]
+
+
+def _DropIndexes(cache_name):
+  # pylint: disable=g-import-not-at-top
+  import sqlite3
+  # pylint: enable=g-import-not-at-top
+  db = sqlite3.connect(cache_name)
+  names = [row[0] for row in db.execute(
+      "SELECT name FROM sqlite_master WHERE type = 'index' AND sql NOT NULL")]
+  for name in names:
+    db.execute('DROP INDEX "{0}"'.format(name))
+  db.commit()
+  db.close()
+
+
+def RunBenchmark(num_instances, num_zones, repeat, drop_indexes):
+  """Completes each benchmark prefix repeat times and returns the latencies."""
+  _InstanceCompleter.num_instances = num_instances
+  _InstanceCompleter.num_zones = num_zones
+  cache_dir = tempfile.mkdtemp()
+  try:
+    cache_name = os.path.join(cache_dir, 'resource.cache')
+    parameter_info = _ParameterInfo()
+    with resource_cache.ResourceCache(name=cache_name) as cache:
+      start = time.time()
+      _InstanceCompleter(cache=cache).Complete('', parameter_info)
+      fill_seconds = time.time() - start
+    if drop_indexes:
+      _DropIndexes(cache_name)
+      # Opening the cache would create the dropped indexes again.
+      # pylint: disable=protected-access
+      resource_cache.sqlite_cache.Cache._CreateIndexes = (
+          lambda self, name, columns: None)
+
+    results = []
+    with resource_cache.ResourceCache(name=cache_name) as cache:
+      completer = _InstanceCompleter(cache=cache)
+      for description, prefix in _PREFIXES:
+        latencies = []
+        for _ in range(repeat):
+          start = time.time()
+          matches = completer.Complete(prefix, parameter_info)
+          latencies.append(time.time() - start)
+        latencies.sort()
+        results.append({
+            'prefix': prefix,
+            'description': description,
+            'matches': len(matches),
+            'median_ms': round(latencies[len(latencies) // 2] * 1000, 3),
+        })
+    return {'fill_seconds': round(fill_seconds, 3), 'completions': results}
+  finally:
+    shutil.rmtree(cache_dir)
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--instances', type=int, default=50000)
+  parser.add_argument('--zones', type=int, default=20)
+  parser.add_argument('--repeat', type=int, default=20)
+  parser.add_argument('--drop_indexes', action='store_true',
+                      help='Measure selects without the column indexes.')
+  parser.add_argument('--json', action='store_true',
+                      help='Print the results as JSON.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark(
+      args.instances, args.zones, args.repeat, args.drop_indexes)
+  if args.json:
+    print(json.dumps(results))
+    return
+  print('cache filled with {0} instances in {1}s'.format(
+      args.instances, results['fill_seconds']))
+  print('{0:<22} {1:<16} {2:>8} {3:>10}'.format(
+      'completion', 'prefix', 'matches', 'median ms'))
+  for r in results['completions']:
+    print('{description:<22} {prefix:<16} {matches:>8} {median_ms:>10}'.format(
+        **r))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures gcloud help search with and without the help search index.
+
+Builds a synthetic CLI tree with GA, beta and alpha tracks of many commands,
+writes it and its help search index, and times each search from loading the
+files to the rated results: by loading and walking the whole tree, as help
+search did before the index, and with the index.
+
+Usage:
+  python tests/benchmarks/help_search_benchmark.py [--groups=N]
+      [--commands-per-group=N] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path[:0] = [
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'lib', path)
+    for path in ('', 'third_party')]
+
+# pylint: disable=g-import-not-at-top,wrong-import-position
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.command_lib.help_search import search
+from googlecloudsdk.command_lib.help_search import search_index
+# pylint: enable=g-import-not-at-top,wrong-import-position
+
+_TERMS = (
+    ['instance'],
+    ['zone', 'network'],
+    ['service-account'],
+    ['xyzzy'],
+)
+
+_WORDS = ('the', 'of', 'a', 'to', 'and', 'resource', 'instance', 'network',
+          'zone', 'region', 'project', 'service', 'account', 'policy', 'key',
+          'bucket', 'cluster', 'disk', 'image', 'operation', 'specified',
+          'default', 'value', 'name', 'list', 'create', 'update', 'delete')
+
+_VERBS = ('create', 'delete', 'describe', 'list', 'update', 'add-iam-policy',
+          'remove-iam-policy', 'set-labels')
+
+
+def _Text(rng, words):
+  return ' '.join(rng.choice(_WORDS) for _ in range(words)) + '.'
+
+
+def _Flag(rng, name, is_global=False):
+  return {
+      'name': name,
+      'description': _Text(rng, 40),
+      'default': None,
+      'choices': [],
+      'attr': {},
+      'is_global': is_global,
+      'is_hidden': False,
+      'is_required': False,
+      'type': 'string',
+      'value': name[2:].upper(),
+  }
+
+
+def _Node(path, rng, flags=None, commands=None, release='GA'):
+  return {
+      'name': path[-1] if path else 'gcloud',
+      'path': path,
+      'capsule': _Text(rng, 8),
+      'sections': {'DESCRIPTION': _Text(rng, 80),
+                   'EXAMPLES': _Text(rng, 40)},
+      'flags': flags or {},
+      'positionals': [],
+      'commands': commands or {},
+      'constraints': {},
+      'is_group': bool(commands),
+      'is_hidden': False,
+      'release': release,
+  }
+
+
+def _Tree(groups, commands_per_group, rng):
+  """Returns a synthetic deserialized CLI tree."""
+  help_flag = _Flag(rng, '--help')
+
+  def _Track(track, release):
+    tracked = {}
+    for g in range(groups):
+      group_path = ['gcloud'] + track + ['group{0}'.format(g)]
+      commands = {}
+      for c in range(commands_per_group):
+        name = '{0}-{1}'.format(_VERBS[c % len(_VERBS)], c)
+        flags = {'--help': help_flag}
+        for word in rng.sample(_WORDS, 8):
+          flag = _Flag(rng, '--{0}-{1}'.format(word, rng.choice(_WORDS)))
+          flags[flag['name']] = flag
+        commands[name] = _Node(group_path + [name], rng, flags=flags,
+                               release=release)
+      tracked[group_path[-1]] = _Node(
+          group_path, rng, flags={'--help': help_flag}, commands=commands,
+          release=release)
+    return tracked
+
+  commands = _Track([], 'GA')
+  for track in ('alpha', 'beta'):
+    commands[track] = _Node(
+        ['gcloud', track], rng, flags={'--help': help_flag},
+        commands=_Track([track], track.upper()), release=track.upper())
+  tree = _Node([], rng, commands=commands,
+               flags={'--verbosity': _Flag(rng, '--verbosity', True)})
+  tree[cli_tree.LOOKUP_VERSION] = cli_tree.VERSION
+  tree[cli_tree.LOOKUP_CLI_VERSION] = cli_tree.TEST_CLI_VERSION_TEST
+  return tree
+
+
+def _Timed(func):
+  start = time.time()
+  result = func()
+  return result, time.time() - start
+
+
+def RunBenchmark(groups, commands_per_group):
+  """Runs the help search benchmark and returns its results."""
+  rng = random.Random(0)
+  tree = _Tree(groups, commands_per_group, rng)
+  temp_dir = tempfile.mkdtemp()
+  try:
+    tree_path = os.path.join(temp_dir, 'gcloud.json')
+    with open(tree_path, 'w') as f:
+      json.dump(tree, f)
+    _, write_seconds = _Timed(lambda: search_index.Write(tree, tree_path))
+    del tree
+    results = [{
+        'benchmark': 'write index ({0} commands)'.format(
+            3 * groups * (commands_per_group + 1)),
+        'seconds': round(write_seconds, 3),
+        'tree_mb': round(os.path.getsize(tree_path) / 1e6, 1),
+        'index_mb': round(sum(os.path.getsize(p) for p in
+                              search_index.IndexPaths(tree_path)) / 1e6, 1),
+    }]
+
+    def _SearchTree(terms):
+      with open(tree_path) as f:
+        parent = json.load(f)
+      return search.Searcher(parent, terms).Search()
+
+    def _SearchIndex(terms):
+      return search.IndexSearcher(
+          search_index.Load(tree_path), terms).Search()
+
+    for terms in _TERMS:
+      tree_results, tree_seconds = _Timed(lambda: _SearchTree(terms))  # pylint: disable=cell-var-from-loop
+      index_results, index_seconds = _Timed(lambda: _SearchIndex(terms))  # pylint: disable=cell-var-from-loop
+      if tree_results != [
+          dict(r, constraints={}) for r in index_results]:
+        raise AssertionError('Index results differ for {0}.'.format(terms))
+      results.append({
+          'benchmark': 'search {0}'.format(' '.join(terms)),
+          'results': len(index_results),
+          'tree_s': round(tree_seconds, 3),
+          'index_s': round(index_seconds, 3),
+      })
+    return results
+  finally:
+    shutil.rmtree(temp_dir)
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--groups', type=int, default=100)
+  parser.add_argument('--commands-per-group', type=int, default=40)
+  parser.add_argument('--json', action='store_true',
+                      help='Print the results as JSON.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark(args.groups, args.commands_per_group)
+  if args.json:
+    print(json.dumps(results))
+    return
+  for r in results:
+    print(', '.join('{0}={1}'.format(k, v) for k, v in r.items()))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures gcloud interactive CLI tree loading, whole and lazy.
+
+Builds a synthetic serialized CLI tree with GA, beta and alpha tracks of many
+command groups, writes it and its lazy layout, and measures the time and the
+memory held to load the tree as gcloud interactive did before the lazy layout
+and with it, and to then parse command lines in a few groups with the
+interactive parser.
+
+Usage:
+  python tests/benchmarks/interactive_cli_tree_benchmark.py [--groups=N]
+      [--subgroups-per-group=N] [--commands-per-group=N] [--json]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path[:0] = [
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'lib', path)
+    for path in ('', 'third_party')]
+
+# pylint: disable=g-import-not-at-top,wrong-import-position
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.calliope import cli_tree_lazy
+from googlecloudsdk.command_lib.interactive import parser
+# pylint: enable=g-import-not-at-top,wrong-import-position
+
+_WORDS = ('the', 'of', 'a', 'to', 'and', 'resource', 'instance', 'network',
+          'zone', 'region', 'project', 'service', 'account', 'policy', 'key',
+          'bucket', 'cluster', 'disk', 'image', 'operation', 'specified')
+
+_VERBS = ('create', 'delete', 'describe', 'list', 'update')
+
+_COMMAND_LINES = (
+    'gcloud group0 subgroup0 create-0 --zone-key=x --help',
+    'gcloud beta group1 subgroup1 list-3 --verbosity=info',
+    'gcloud group2 describe-2 NAME',
+)
+
+
+def _Text(rng, words):
+  return ' '.join(rng.choice(_WORDS) for _ in range(words)) + '.'
+
+
+def _Tree(groups, subgroups_per_group, commands_per_group, rng):
+  """Returns a synthetic serialized CLI tree, as json.loads reads it."""
+  flags = []
+
+  def _FlagIndex(name, is_global=False):
+    flags.append({
+        'name': name,
+        'description': _Text(rng, 30),
+        'default': None,
+        'choices': [],
+        'attr': {},
+        'is_global': is_global,
+        'is_hidden': False,
+        'is_required': False,
+        'type': 'string',
+        'value': name[2:].upper(),
+    })
+    return len(flags) - 1
+
+  common_flags = {'--help': _FlagIndex('--help'),
+                  '--verbosity': _FlagIndex('--verbosity', True)}
+
+  def _Node(path, release, commands=None, command_flags=None):
+    return {
+        'name': path[-1],
+        'path': path,
+        'capsule': _Text(rng, 8),
+        'sections': {'DESCRIPTION': _Text(rng, 80),
+                     'EXAMPLES': _Text(rng, 40)},
+        'flags': dict(common_flags, **(command_flags or {})),
+        'positionals': [{'name': 'NAME', 'description': _Text(rng, 10),
+                         'nargs': '?', 'value': 'NAME'}],
+        'commands': commands or {},
+        'constraints': {'arguments': []},
+        'is_group': bool(commands),
+        'is_hidden': False,
+        'release': release,
+    }
+
+  def _Commands(path, release):
+    commands = {}
+    for c in range(commands_per_group):
+      name = '{0}-{1}'.format(_VERBS[c % len(_VERBS)], c)
+      command_flags = {}
+      for word in rng.sample(_WORDS, 6):
+        flag_name = '--{0}-{1}'.format(word, rng.choice(_WORDS))
+        command_flags[flag_name] = _FlagIndex(flag_name)
+      commands[name] = _Node(path + [name], release,
+                             command_flags=command_flags)
+    return commands
+
+  def _Track(track, release):
+    tracked = {}
+    for g in range(groups):
+      group_path = ['gcloud'] + track + ['group{0}'.format(g)]
+      commands = _Commands(group_path, release)
+      for s in range(subgroups_per_group):
+        subgroup_path = group_path + ['subgroup{0}'.format(s)]
+        commands[subgroup_path[-1]] = _Node(
+            subgroup_path, release,
+            commands=_Commands(subgroup_path, release))
+      tracked[group_path[-1]] = _Node(group_path, release, commands=commands)
+    return tracked
+
+  commands = _Track([], 'GA')
+  for track in ('alpha', 'beta'):
+    commands[track] = _Node(['gcloud', track], track.upper(),
+                            commands=_Track([track], track.upper()))
+  tree = _Node(['gcloud'], 'GA', commands=commands)
+  tree['path'] = []
+  tree[cli_tree.LOOKUP_VERSION] = cli_tree.VERSION
+  tree[cli_tree.LOOKUP_CLI_VERSION] = cli_tree.TEST_CLI_VERSION_TEST
+  tree[cli_tree._LOOKUP_SERIALIZED_FLAG_LIST] = flags  # pylint: disable=protected-access
+  return tree
+
+
+def _Parse(tree):
+  root = cli_tree.Node(description='The CLI tree root.')
+  root[cli_tree.LOOKUP_COMMANDS][cli_tree.DEFAULT_CLI_NAME] = tree
+  interactive_parser = parser.Parser(root)
+  for line in _COMMAND_LINES:
+    interactive_parser.ParseCommand(line)
+
+
+def _Measure(load):
+  """Returns the seconds and held MB to load, then to load and parse."""
+  gc.collect()
+  start = time.time()
+  tree = load()
+  load_seconds = time.time() - start
+  _Parse(tree)
+  use_seconds = time.time() - start
+  del tree
+  gc.collect()
+
+  tracemalloc.start()
+  tree = load()
+  load_mb = tracemalloc.get_traced_memory()[0] / 1e6
+  _Parse(tree)
+  use_mb = tracemalloc.get_traced_memory()[0] / 1e6
+  tracemalloc.stop()
+  return load_seconds, use_seconds, load_mb, use_mb
+
+
+def RunBenchmark(groups, subgroups_per_group, commands_per_group):
+  """Runs the interactive CLI tree benchmark and returns its results."""
+  rng = random.Random(0)
+  tree = _Tree(groups, subgroups_per_group, commands_per_group, rng)
+  temp_dir = tempfile.mkdtemp()
+  try:
+    tree_path = os.path.join(temp_dir, 'gcloud.json')
+    with open(tree_path, 'w') as f:
+      json.dump(tree, f)
+    start = time.time()
+    cli_tree_lazy.Write(tree, tree_path)
+    write_seconds = time.time() - start
+    del tree
+    results = [{
+        'benchmark': 'write lazy layout',
+        'seconds': round(write_seconds, 3),
+        'tree_mb': round(os.path.getsize(tree_path) / 1e6, 1),
+        'layout_mb': round(sum(os.path.getsize(p) for p in
+                               cli_tree_lazy.LayoutPaths(tree_path)) / 1e6, 1),
+    }]
+    for name, load in (
+        ('whole', lambda: cli_tree.Load(tree_path)),
+        ('lazy', lambda: cli_tree.Load(tree_path, lazy=True))):
+      load_seconds, use_seconds, load_mb, use_mb = _Measure(load)
+      results.append({
+          'benchmark': 'load {0}'.format(name),
+          'load_s': round(load_seconds, 3),
+          'load_and_parse_s': round(use_seconds, 3),
+          'load_mb': round(load_mb, 1),
+          'load_and_parse_mb': round(use_mb, 1),
+      })
+    return results
+  finally:
+    shutil.rmtree(temp_dir)
+
+
+def main(argv):
+  parser_ = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser_.add_argument('--groups', type=int, default=120)
+  parser_.add_argument('--subgroups-per-group', type=int, default=4)
+  parser_.add_argument('--commands-per-group', type=int, default=8)
+  parser_.add_argument('--json', action='store_true',
+                       help='Print the results as JSON.')
+  args = parser_.parse_args(argv)
+
+  results = RunBenchmark(
+      args.groups, args.subgroups_per_group, args.commands_per_group)
+  if args.json:
+    print(json.dumps(results))
+    return
+  for r in results:
+    print(', '.join('{0}={1}'.format(k, v) for k, v in r.items()))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
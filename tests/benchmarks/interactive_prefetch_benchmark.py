@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the first resource TAB completion with and without prefetching.
+
+Completes from a resource cache table whose updater sleeps for the latency
+of a list command, once from a cold cache, as a gcloud interactive TAB did
+before the prefetcher, and once after the prefetcher had the time the user
+takes to type the command.
+
+Usage:
+  python tests/benchmarks/interactive_prefetch_benchmark.py
+      [--list-seconds=S] [--typing-seconds=S] [--json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+sys.path[:0] = [
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))), 'lib', path)
+    for path in ('', 'third_party')]
+
+# pylint: disable=g-import-not-at-top,wrong-import-position
+from googlecloudsdk.command_lib.interactive import prefetcher
+from googlecloudsdk.core.cache import resource_cache
+# pylint: enable=g-import-not-at-top,wrong-import-position
+
+_LIST_SECONDS = 1.0
+
+
+class _Completer(resource_cache.Updater):
+  """Completes instance names listed by a simulated list command."""
+
+  def __init__(self, cache=None, qualified_parameter_names=None):
+    del qualified_parameter_names
+    super(_Completer, self).__init__(
+        cache=cache, collection='benchmark.instances', columns=1)
+
+  def ParameterInfo(self, parsed_args, argument):
+    del parsed_args, argument
+    return resource_cache.ParameterInfo()
+
+  def Complete(self, prefix, parameter_info):
+    return [row[0] for row in self.Select((prefix + '*',), parameter_info)]
+
+  def Update(self, parameter_info=None, aggregations=None):
+    time.sleep(_LIST_SECONDS)
+    return [('instance-{0}'.format(i),) for i in range(500)]
+
+
+def _Tab():
+  """Returns the seconds a TAB completion takes."""
+  start = time.time()
+  with resource_cache.ResourceCache(refresh_in_background=True) as cache:
+    _Completer(cache).Complete('instance-1', resource_cache.ParameterInfo())
+  return time.time() - start
+
+
+def RunBenchmark(list_seconds, typing_seconds):
+  """Runs the prefetch benchmark and returns its results."""
+  global _LIST_SECONDS
+  _LIST_SECONDS = list_seconds
+  results = []
+  for prefetch in (False, True):
+    temp_dir = tempfile.mkdtemp()
+    try:
+      with mock.patch.object(
+          resource_cache.ResourceCache, 'GetDefaultName',
+          return_value=os.path.join(temp_dir, 'resource.cache')):
+        completion_prefetcher = prefetcher.CompletionPrefetcher(
+            completers=['{0}:_Completer'.format(__name__)] if prefetch else [],
+            parsed_args=None)
+        completion_prefetcher.SetContext('my-project', None)
+        time.sleep(typing_seconds)
+        seconds = _Tab()
+        completion_prefetcher.Stop()
+    finally:
+      shutil.rmtree(temp_dir)
+    results.append({
+        'benchmark': 'first TAB {0} prefetch'.format(
+            'with' if prefetch else 'without'),
+        'list_s': list_seconds,
+        'typing_s': typing_seconds,
+        'tab_s': round(seconds, 3),
+    })
+  return results
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--list-seconds', type=float, default=1.0,
+                      help='The simulated list command latency.')
+  parser.add_argument('--typing-seconds', type=float, default=2.0,
+                      help='The time between entering the project and TAB.')
+  parser.add_argument('--json', action='store_true',
+                      help='Print the results as JSON.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark(args.list_seconds, args.typing_seconds)
+  if args.json:
+    print(json.dumps(results))
+    return
+  for r in results:
+    print(', '.join('{0}={1}'.format(k, v) for k, v in r.items()))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
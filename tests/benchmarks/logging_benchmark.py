@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures the cost of file logging and of log directory cleanup.
+
+Logs records through the log file formatter to a synchronous
+logging.FileHandler and to the background log writer, optionally with a delay
+added to every flush of the file to mimic a configuration directory on network
+storage, and reports the time each log call takes. It then times a log cleanup
+pass over a logs directory with many old files, and the pass that follows it,
+which the cleanup marker file lets skip the directory.
+
+Usage:
+  python tests/benchmarks/logging_benchmark.py [--records=N]
+      [--flush-delay-ms=MS] [--json]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+_SDK_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+sys.path[:0] = [os.path.join(_SDK_ROOT, 'lib'),
+                os.path.join(_SDK_ROOT, 'lib', 'third_party')]
+
+# pylint: disable=g-import-not-at-top
+from googlecloudsdk.core import log
+
+
+class _SlowStream(object):
+  """Wraps a file to add a delay to each flush."""
+
+  def __init__(self, stream, delay):
+    self._stream = stream
+    self._delay = delay
+
+  def flush(self):
+    time.sleep(self._delay)
+    self._stream.flush()
+
+  def __getattr__(self, name):
+    return getattr(self._stream, name)
+
+
+def _TimeLogging(handler_name, records, flush_delay, temp_dir):
+  """Returns the seconds per log call and until all records are written."""
+  log_file = os.path.join(temp_dir, handler_name + '.log')
+  if handler_name == 'sync':
+    handler = logging.FileHandler(log_file, encoding=log.LOG_FILE_ENCODING)
+    handler.stream = _SlowStream(handler.stream, flush_delay)
+  else:
+    handler = log._AsyncFileHandler(  # pylint: disable=protected-access
+        log_file, encoding=log.LOG_FILE_ENCODING)
+    handler._stream = _SlowStream(  # pylint: disable=protected-access
+        handler._stream, flush_delay)  # pylint: disable=protected-access
+  handler.setFormatter(log._LogFileFormatter())  # pylint: disable=protected-access
+  logger = logging.getLogger('logging_benchmark.' + handler_name)
+  logger.propagate = False
+  logger.setLevel(logging.DEBUG)
+  logger.addHandler(handler)
+  try:
+    start = time.time()
+    for i in range(records):
+      logger.debug('Copied %d bytes of [gs://bucket/object-%d].', 1024, i)
+    logged = time.time()
+    handler.flush()
+    written = time.time()
+  finally:
+    logger.removeHandler(handler)
+    handler.close()
+  return (logged - start) / records, written - start
+
+
+def _TimeCleanUp(day_dirs, files_per_dir, temp_dir):
+  """Returns the seconds taken by two consecutive log cleanup passes."""
+  logs_dir = os.path.join(temp_dir, 'logs')
+  now = datetime.datetime.now()
+  for day in range(day_dirs):
+    day_dir = os.path.join(logs_dir, (now - datetime.timedelta(days=day))
+                           .strftime(log.DAY_DIR_FORMAT))
+    os.makedirs(day_dir)
+    for i in range(files_per_dir):
+      with open(os.path.join(day_dir, '{0:06d}.log'.format(i)), 'w'):
+        pass
+  log_manager = log._log_manager  # pylint: disable=protected-access
+  timings = []
+  for _ in range(2):
+    start = time.time()
+    log_manager._CleanUpLogs(logs_dir)  # pylint: disable=protected-access
+    timings.append(time.time() - start)
+  return timings
+
+
+def RunBenchmark(records, flush_delay_ms, day_dirs=30, files_per_dir=200):
+  """Runs the logging and cleanup benchmarks and returns their results."""
+  os.environ['CLOUDSDK_CORE_MAX_LOG_DAYS'] = str(day_dirs)
+  temp_dir = tempfile.mkdtemp()
+  try:
+    results = []
+    for handler_name in ('sync', 'async'):
+      per_record, total = _TimeLogging(
+          handler_name, records, flush_delay_ms / 1000, temp_dir)
+      results.append({
+          'benchmark': 'log {0} ({1} records)'.format(handler_name, records),
+          'per_call_us': round(per_record * 1e6, 2),
+          'total_s': round(total, 3),
+      })
+    first, second = _TimeCleanUp(day_dirs, files_per_dir, temp_dir)
+    results.append({
+        'benchmark': 'cleanup ({0} dirs x {1} files)'.format(
+            day_dirs, files_per_dir),
+        'first_pass_ms': round(first * 1000, 2),
+        'next_pass_ms': round(second * 1000, 2),
+    })
+    return results
+  finally:
+    shutil.rmtree(temp_dir)
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--records', type=int, default=20000)
+  parser.add_argument('--flush-delay-ms', type=float, default=0,
+                      help='Milliseconds added to every flush of a log file.')
+  parser.add_argument('--json', action='store_true',
+                      help='Print the results as JSON.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark(args.records, args.flush_delay_ms)
+  if args.json:
+    print(json.dumps(results))
+    return
+  for r in results:
+    print(', '.join('{0}={1}'.format(k, v) for k, v in r.items()))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
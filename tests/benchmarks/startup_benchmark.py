@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measures gcloud startup time for commands that make no API requests.
+
+Each command runs in a new process with a fresh configuration directory, once
+with the API modules of command modules imported lazily and once without, so
+the benchmark shows what lazy imports save on startup.
+
+Usage:
+  python tests/benchmarks/startup_benchmark.py [--repeat=N] [--json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+_SDK_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+_GCLOUD_PY = os.path.join(_SDK_ROOT, 'lib', 'gcloud.py')
+
+_COMMANDS = (
+    ['--version'],
+    ['config', 'list'],
+    ['compute', 'instances', 'list', '--help'],
+)
+
+
+def _TimeCommand(command, lazy_imports, config_dir):
+  env = dict(
+      os.environ,
+      CLOUDSDK_CONFIG=config_dir,
+      CLOUDSDK_CORE_LAZY_COMMAND_IMPORTS=str(lazy_imports).lower(),
+      CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK='true',
+      CLOUDSDK_CORE_DISABLE_USAGE_REPORTING='true',
+      PAGER='cat',
+  )
+  start = time.time()
+  subprocess.check_call(
+      [sys.executable, _GCLOUD_PY] + command, env=env,
+      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  return time.time() - start
+
+
+def RunBenchmark(repeat):
+  """Runs each command repeat times per setting and returns the latencies."""
+  config_dir = tempfile.mkdtemp()
+  try:
+    results = []
+    for command in _COMMANDS:
+      result = {'command': 'gcloud ' + ' '.join(command)}
+      for lazy_imports in (False, True):
+        latencies = sorted(
+            _TimeCommand(command, lazy_imports, config_dir)
+            for _ in range(repeat))
+        key = 'lazy_median_s' if lazy_imports else 'eager_median_s'
+        result[key] = round(latencies[len(latencies) // 2], 3)
+      results.append(result)
+    return results
+  finally:
+    shutil.rmtree(config_dir)
+
+
+def main(argv):
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--repeat', type=int, default=5)
+  parser.add_argument('--json', action='store_true',
+                      help='Print the results as JSON.')
+  args = parser.parse_args(argv)
+
+  results = RunBenchmark(args.repeat)
+  if args.json:
+    print(json.dumps(results))
+    return
+  print('{0:<40} {1:>9} {2:>9}'.format('command', 'eager s', 'lazy s'))
+  for r in results:
+    print('{command:<40} {eager_median_s:>9} {lazy_median_s:>9}'.format(**r))
+
+
+if __name__ == '__main__':
+  main(sys.argv[1:])
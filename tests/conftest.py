@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Makes the SDK libraries importable from the tests."""
+
+import os
+import sys
+
+SDK_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR = os.path.join(SDK_ROOT, 'lib')
+THIRD_PARTY_DIR = os.path.join(LIB_DIR, 'third_party')
+
+for path in (THIRD_PARTY_DIR, LIB_DIR):
+  if path not in sys.path:
+    sys.path.insert(0, path)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for streaming Cloud Spanner query results."""
+
+import contextlib
+import json
+import unittest
+from unittest import mock
+
+from googlecloudsdk.api_lib.spanner import database_sessions
+from googlecloudsdk.command_lib.spanner import sql
+import requests
+
+_METADATA = {'rowType': {'fields': [{'name': 'v', 'type': {'code': 'STRING'}}]}}
+
+
+class _FakeResponse(object):
+  """A streamed response that sends its chunks and then fails, if given."""
+
+  def __init__(self, chunks, error=None):
+    self.status_code = 200
+    self._chunks = chunks
+    self._error = error
+
+  def iter_content(self, chunk_size):
+    del chunk_size  # Unused.
+    for chunk in self._chunks:
+      yield chunk
+    if self._error is not None:
+      raise self._error
+
+
+class _FakeSession(object):
+  """Returns the given responses in order and records the request bodies."""
+
+  def __init__(self, responses):
+    self._responses = list(responses)
+    self.bodies = []
+
+  @contextlib.contextmanager
+  def request(self, method, url, data, headers, stream):
+    del method, url, headers, stream  # Unused.
+    self.bodies.append(json.loads(data))
+    yield self._responses.pop(0)
+
+
+def _Chunks(elements, chunk_size):
+  """Returns the JSON array of elements split into chunks of chunk_size."""
+  data = json.dumps(elements).encode('utf-8')
+  return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+class IterJsonArrayTest(unittest.TestCase):
+
+  def testElementsSplitMidValueAreParsed(self):
+    elements = [
+        {'metadata': _METADATA, 'values': ['café ☃'] * 3},
+        {'values': ['x' * 1000], 'chunkedValue': True},
+        {'values': [], 'stats': {}},
+    ]
+    for chunk_size in (1, 2, 7, 100):
+      parsed = [element for element, _ in database_sessions._IterJsonArray(  # pylint: disable=protected-access
+          iter(_Chunks(elements, chunk_size)))]
+      self.assertEqual(elements, parsed, chunk_size)
+
+  def testElementIsYieldedOnceItsLastChunkArrives(self):
+    head = json.dumps({'values': ['a' * 100]}).encode('utf-8')
+    sent = []
+
+    def _Chunks():
+      for chunk in [b'[', head[:10], head[10:], b',']:
+        sent.append(chunk)
+        yield chunk
+      raise AssertionError('The element was only parsed after the next chunk.')
+
+    element, _ = next(database_sessions._IterJsonArray(_Chunks()))  # pylint: disable=protected-access
+    self.assertEqual({'values': ['a' * 100]}, element)
+    self.assertEqual(3, len(sent))
+
+  def testEmptyArray(self):
+    for chunks in ([], [b'[]'], [b'[', b' ', b']']):
+      self.assertEqual(
+          [], list(database_sessions._IterJsonArray(iter(chunks))))  # pylint: disable=protected-access
+
+  def testTruncatedArrayRaises(self):
+    chunks = _Chunks([{'values': ['a']}, {'values': ['b']}], 5)[:-2]
+    with self.assertRaises(ValueError):
+      list(database_sessions._IterJsonArray(iter(chunks)))  # pylint: disable=protected-access
+
+
+class ExecuteStreamingSqlTest(unittest.TestCase):
+
+  def _Execute(self, *responses):
+    session = _FakeSession(responses)
+    session_ref = mock.Mock()
+    session_ref.RelativeName.return_value = 'projects/p/sessions/s'
+    with mock.patch.object(
+        database_sessions, '_GetClientInstance',
+        return_value=mock.Mock(url='https://spanner.googleapis.com/')), \
+        mock.patch.object(
+            database_sessions.creds_requests, 'GetSession',
+            return_value=session), \
+        mock.patch.object(database_sessions.time, 'sleep'):
+      result = sql.StreamedResultSet(database_sessions.ExecuteStreamingSql(
+          'SELECT v FROM t', 'NORMAL', session_ref))
+      rows = list(result.Rows())
+    return rows, result, session.bodies
+
+  def testResumesAfterDroppedStreamWithoutRepeatingRows(self):
+    rows, _, bodies = self._Execute(
+        _FakeResponse(
+            _Chunks([
+                {'metadata': _METADATA, 'values': ['a'],
+                 'resumeToken': 'dDE='},
+                # Not covered by a resume token, so it is sent again.
+                {'values': ['b']},
+            ], 16),
+            error=requests.exceptions.ChunkedEncodingError('dropped')),
+        _FakeResponse(_Chunks([
+            {'values': ['b']},
+            {'values': ['c'], 'resumeToken': 'dDI='},
+        ], 16)))
+    self.assertEqual([['a'], ['b'], ['c']], rows)
+    self.assertNotIn('resumeToken', bodies[0])
+    self.assertEqual('dDE=', bodies[1]['resumeToken'])
+
+  def testResumesChunkedValueSplitAcrossTheDrop(self):
+    rows, _, _ = self._Execute(
+        _FakeResponse(
+            _Chunks([
+                {'metadata': _METADATA, 'values': ['ab'],
+                 'chunkedValue': True, 'resumeToken': 'dDE='},
+            ], 8) + [b',{"values": ["c'],
+            error=requests.exceptions.ChunkedEncodingError('dropped')),
+        _FakeResponse(_Chunks([{'values': ['cd', 'e']}], 8)))
+    self.assertEqual([['abcd'], ['e']], rows)
+
+  def testEmptyResultSet(self):
+    rows, result, bodies = self._Execute(_FakeResponse(_Chunks([
+        {'metadata': _METADATA, 'stats': {'rowCountExact': '0'}},
+    ], 4)))
+    self.assertEqual([], rows)
+    self.assertEqual(1, len(bodies))
+    self.assertEqual('v', result.metadata.rowType.fields[0].name)
+    self.assertEqual(0, result.stats.rowCountExact)
+
+  def testEmptyResponse(self):
+    rows, result, _ = self._Execute(_FakeResponse([b'[]']))
+    self.assertEqual([], rows)
+    self.assertEqual([], result.metadata.rowType.fields)
+    self.assertEqual([], result.ToResultSet().rows)
+
+  def testNonRetryableErrorIsRaised(self):
+    error_element = {'error': {'code': 400, 'message': 'Bad query'}}
+    with self.assertRaises(database_sessions.apitools_exceptions.HttpError):
+      self._Execute(_FakeResponse(_Chunks(
+          [{'metadata': _METADATA, 'values': ['a']}, error_element], 16)))
+
+
+if __name__ == '__main__':
+  unittest.main()
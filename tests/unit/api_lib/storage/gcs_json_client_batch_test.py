@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for object requests sent in batch calls by the JSON client."""
+
+import email
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from googlecloudsdk.api_lib.storage import errors
+from googlecloudsdk.api_lib.storage import request_config_factory
+from googlecloudsdk.api_lib.storage import retry_util
+from googlecloudsdk.api_lib.storage.gcs_json import client as gcs_json_client
+from googlecloudsdk.command_lib.storage import storage_url
+from googlecloudsdk.core import properties
+
+
+class _FakeBatchEndpoint(object):
+  """A local stand-in for the GCS batch endpoint.
+
+  Deleting an object named "missing" fails with 404, and an object named
+  "flaky" fails with 503 the first time it is requested.
+  """
+
+  def __init__(self):
+    self.batch_calls = []
+    fake = self
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+      protocol_version = 'HTTP/1.1'
+
+      def do_POST(self):  # pylint: disable=invalid-name
+        data = self.rfile.read(int(self.headers['Content-Length']))
+        message = email.message_from_bytes(
+            b'Content-Type: ' + self.headers['Content-Type'].encode() +
+            b'\r\n\r\n' + data)
+        parts = []
+        inner_requests = []
+        for part in message.get_payload():
+          request_line, _, rest = part.get_payload().partition('\n')
+          inner_headers = email.message_from_string(rest)
+          inner_requests.append((request_line.strip(), dict(inner_headers)))
+          status, body = fake.respond(request_line)
+          parts.append(
+              '--boundary\r\nContent-Type: application/http\r\n'
+              'Content-ID: <response-{0}>\r\n\r\n'
+              'HTTP/1.1 {1}\r\nContent-Type: application/json\r\n'
+              'Content-Length: {2}\r\n\r\n{3}\r\n'.format(
+                  part['Content-ID'].strip('<>'), status, len(body), body))
+        fake.batch_calls.append((self.path, inner_requests))
+        payload = (''.join(parts) + '--boundary--\r\n').encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'multipart/mixed; boundary=boundary')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+      def log_message(self, *args):
+        pass
+
+    self._seen_flaky = False
+    self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self.url = 'http://127.0.0.1:{0}/storage/v1/'.format(
+        self._server.server_port)
+    self._thread = threading.Thread(target=self._server.serve_forever)
+    self._thread.daemon = True
+
+  def respond(self, request_line):
+    if '/o/missing' in request_line:
+      return '404 Not Found', '{"error": {"code": 404, "message": "gone"}}'
+    if '/o/flaky' in request_line and not self._seen_flaky:
+      self._seen_flaky = True
+      return '503 Service Unavailable', '{"error": {"code": 503}}'
+    return '204 No Content', ''
+
+  def __enter__(self):
+    self._thread.start()
+    return self
+
+  def __exit__(self, *args):
+    self._server.shutdown()
+    self._server.server_close()
+
+
+def _Url(name):
+  return storage_url.storage_url_from_string('gs://bucket/' + name)
+
+
+def _RequestConfig(url, generation_match=None):
+  request_config = request_config_factory.get_request_config(url)
+  request_config.precondition_generation_match = generation_match
+  return request_config
+
+
+class DeleteObjectsTest(unittest.TestCase):
+
+  def setUp(self):
+    config_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, config_dir)
+    env = mock.patch.dict(os.environ, {'CLOUDSDK_CONFIG': config_dir})
+    env.start()
+    self.addCleanup(env.stop)
+    self.endpoint = _FakeBatchEndpoint().__enter__()
+    self.addCleanup(self.endpoint.__exit__)
+    properties.VALUES.auth.disable_credentials.Set(True)
+    properties.VALUES.api_endpoint_overrides.storage.Set(self.endpoint.url)
+    properties.VALUES.storage.additional_headers.Set('x-custom=value')
+    properties.VALUES.storage.base_retry_delay.Set(0)
+    self.client = gcs_json_client.JsonClient()
+
+  def _Delete(self, names, generation_matches=None):
+    urls = [_Url(name) for name in names]
+    generation_matches = generation_matches or [None] * len(names)
+    return self.client.delete_objects(
+        urls,
+        [_RequestConfig(url, generation_match)
+         for url, generation_match in zip(urls, generation_matches)])
+
+  def testSendsEachRequestWithItsOwnConfigAndHeaders(self):
+    result = self._Delete(['a', 'b', 'missing'], [1, 2, None])
+
+    self.assertEqual([None, None], result[:2])
+    self.assertIsInstance(result[2], errors.NotFoundError)
+    (path, inner_requests), = self.endpoint.batch_calls
+    self.assertEqual('/batch/storage/v1', path)
+    request_lines = [request_line for request_line, _ in inner_requests]
+    self.assertIn('/o/a?alt=json&ifGenerationMatch=1', request_lines[0])
+    self.assertIn('/o/b?alt=json&ifGenerationMatch=2', request_lines[1])
+    self.assertNotIn('ifGenerationMatch', request_lines[2])
+    for _, headers in inner_requests:
+      self.assertEqual('value', headers.get('x-custom'))
+
+  def testAddsPerRequestHeadersToThatRequestOnly(self):
+    # pylint: disable=protected-access
+    batch_requests = [
+        gcs_json_client._BatchRequest(
+            self.client._get_delete_object_request(
+                _Url(name), _RequestConfig(_Url(name))),
+            cleared_fields=None,
+            headers=headers)
+        for name, headers in (('a', {'x-extra': '1'}), ('b', None))
+    ]
+    self.client._execute_batch('Delete', batch_requests)
+    # pylint: enable=protected-access
+
+    (_, inner_requests), = self.endpoint.batch_calls
+    self.assertEqual(
+        ['1', None], [headers.get('x-extra') for _, headers in inner_requests])
+    self.assertNotIn('x-extra', self.client.client.additional_http_headers)
+
+  def testRetriesRetryableItemsWithRetryHelper(self):
+    with mock.patch.object(
+        gcs_json_client.retry_util, 'retryer',
+        wraps=retry_util.retryer) as retryer:
+      result = self._Delete(['flaky', 'a'])
+
+    self.assertEqual([None, None], result)
+    retryer.assert_called_once()
+    self.assertEqual(
+        [2, 1], [len(requests) for _, requests in self.endpoint.batch_calls])
+    self.assertIn('/o/flaky', self.endpoint.batch_calls[1][1][0][0])
+
+  def testReportsLastErrorWhenRetriesRunOut(self):
+    properties.VALUES.storage.max_retries.Set(0)
+    result = self._Delete(['flaky', 'a'])
+
+    self.assertIsNone(result[1])
+    self.assertIsInstance(result[0], errors.CloudApiError)
+    self.assertEqual(1, len(self.endpoint.batch_calls))
+
+
+if __name__ == '__main__':
+  unittest.main()
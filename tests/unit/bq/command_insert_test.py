@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for batched `bq insert` requests."""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+_TESTS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+_BENCHMARK = os.path.join(_TESTS_DIR, 'benchmarks', 'bq_insert_benchmark.py')
+_BQ_DIR = os.path.join(os.path.dirname(_TESTS_DIR), 'platform', 'bq')
+
+# Runs in the bq process: reads batches of 2 rows from argv[1] and prints
+# their row line numbers and insert ids, or the usage error.
+_READ_BATCHES = """
+import io, json, sys
+sys.path[:0] = sys.argv[2:]
+from absl import app
+from frontend import command_insert
+try:
+  print(json.dumps([
+      [batch.first_index, batch.line_numbers,
+       [row.insert_id for row in batch.rows]]
+      for batch in command_insert._ReadBatches(
+          io.StringIO(sys.argv[1]), 'id', 2, None)]))
+except app.UsageError as e:
+  print(json.dumps(str(e)))
+"""
+
+
+class InsertBenchmarkTest(unittest.TestCase):
+
+  def _Run(self, *args):
+    # bq vendors its own third party packages, so it runs in its own process.
+    output = subprocess.check_output(
+        [sys.executable, _BENCHMARK, '--json', '--latency=0'] + list(args))
+    return json.loads(output)
+
+  def testRequestsStayWithinMaxRequestBytes(self):
+    results = self._Run(
+        '--rows=600', '--concurrency=1,3', '--max_request_bytes=20000')
+    for result in results:
+      self.assertEqual(0, result['status'])
+      self.assertEqual(600, result['rows_received'])
+      self.assertLessEqual(result['max_request_bytes'], 20000)
+      # Requests are filled close to the bound rather than split early.
+      self.assertLessEqual(result['requests'], 600 * 280 // 20000 + 2)
+
+  def _ReadBatches(self, data):
+    output = subprocess.check_output(
+        [sys.executable, '-c', _READ_BATCHES, data, _BQ_DIR,
+         os.path.join(_BQ_DIR, 'third_party')])
+    return json.loads(output)
+
+  def testBlankLinesAreSkippedAndCounted(self):
+    self.assertEqual(
+        [[0, [1, 3], ['id_1', 'id_2']], [2, [6], ['id_3']]],
+        self._ReadBatches('{"a": 1}\n\n{"a": 2}\n \n\n{"a": 3}\n'))
+    self.assertEqual(
+        'Line 4: Could not parse object: Expecting value: line 1 column 1 '
+        '(char 0)',
+        self._ReadBatches('{"a": 1}\n\n{"a": 2}\nnot json\n'))
+
+  def testMaxRowsPerRequest(self):
+    (result,) = self._Run(
+        '--rows=95', '--concurrency=2', '--max_rows_per_request=10')
+    self.assertEqual(10, result['requests'])
+    self.assertEqual(95, result['rows_received'])
+
+
+if __name__ == '__main__':
+  unittest.main()
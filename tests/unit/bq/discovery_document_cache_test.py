@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the bq parsed discovery document cache."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+_TESTS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+_BQ_DIR = os.path.join(os.path.dirname(_TESTS_DIR), 'platform', 'bq')
+
+# Runs in the bq process: gets each document in argv[2] from the cache in
+# argv[1], each after the in-process cache is cleared if its step says so,
+# and prints whether it was parsed, the result and the persisted files.
+_GET_DOCUMENTS = """
+import json, os, sys
+sys.path[:0] = sys.argv[3:]
+from discovery_documents import discovery_document_cache as cache
+parses = []
+loads = json.loads
+cache.json.loads = lambda s: parses.append(s) or loads(s)
+results = []
+previous = None
+for document, clear_process_cache in json.loads(sys.argv[2]):
+  if clear_process_cache:
+    cache._marshalled_documents.clear()
+  del parses[:]
+  parsed = cache.get_parsed_document(document, cache_root=sys.argv[1])
+  results.append({
+      'parsed': bool(parses),
+      'document': json.loads(json.dumps(parsed)),
+      'same_object': parsed is previous,
+      'files': sorted(os.listdir(sys.argv[1])),
+  })
+  parsed['mutated'] = True
+  previous = parsed
+print(json.dumps(results))
+"""
+
+
+class DiscoveryDocumentCacheTest(unittest.TestCase):
+
+  def setUp(self):
+    self.cache_root = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.cache_root)
+
+  def _GetDocuments(self, *steps):
+    # bq vendors its own third party packages, so it runs in its own process.
+    output = subprocess.check_output(
+        [sys.executable, '-c', _GET_DOCUMENTS, self.cache_root,
+         json.dumps(steps), _BQ_DIR, os.path.join(_BQ_DIR, 'third_party')])
+    return json.loads(output)
+
+  def testMissThenHitInProcessAndOnDisk(self):
+    document = json.dumps({'rootUrl': 'https://example.com/', 'n': [1, 2]})
+    miss, process_hit, disk_hit = self._GetDocuments(
+        (document, False), (document, False), (document, True))
+    self.assertTrue(miss['parsed'])
+    self.assertEqual(1, len(miss['files']))
+    self.assertFalse(process_hit['parsed'])
+    self.assertFalse(disk_hit['parsed'])
+    self.assertEqual(miss['files'], disk_hit['files'])
+    # Each call returns a new object, unaffected by updates to earlier ones.
+    for result in (miss, process_hit, disk_hit):
+      self.assertEqual(json.loads(document), result['document'])
+      self.assertFalse(result['same_object'])
+
+  def testChangedDocumentIsParsedAgain(self):
+    old, new = self._GetDocuments(
+        (json.dumps({'revision': '1'}), False),
+        (json.dumps({'revision': '2'}), True))
+    self.assertTrue(new['parsed'])
+    self.assertEqual({'revision': '2'}, new['document'])
+    self.assertEqual(2, len(new['files']))
+    self.assertEqual(1, len(old['files']))
+
+  def testInvalidPersistedDocumentIsReplaced(self):
+    document = json.dumps({'revision': '1'})
+    (miss,) = self._GetDocuments((document, False))
+    (path,) = [os.path.join(self.cache_root, f) for f in miss['files']]
+    with open(path, 'rb') as f:
+      contents = f.read()
+    with open(path, 'wb') as f:
+      f.write(contents[:-2])
+    (reparsed,) = self._GetDocuments((document, True))
+    self.assertTrue(reparsed['parsed'])
+    self.assertEqual({'revision': '1'}, reparsed['document'])
+    with open(path, 'rb') as f:
+      self.assertEqual(contents, f.read())
+
+
+if __name__ == '__main__':
+  unittest.main()
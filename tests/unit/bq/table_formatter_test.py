@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the bq streaming table formatters."""
+
+import importlib.util
+import io
+import os
+import unittest
+
+_TABLE_FORMATTER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))), 'platform', 'bq', 'table_formatter.py')
+
+
+def _LoadTableFormatter():
+  # Loaded by path so the bq packages do not shadow the SDK ones.
+  spec = importlib.util.spec_from_file_location(
+      'bq_table_formatter', _TABLE_FORMATTER_PATH)
+  module = importlib.util.module_from_spec(spec)
+  spec.loader.exec_module(module)
+  return module
+
+
+table_formatter = _LoadTableFormatter()
+
+
+class StreamingFormatterTest(unittest.TestCase):
+
+  def _Format(self, streaming, table_format, rows):
+    output = io.StringIO()
+    if streaming:
+      formatter = table_formatter.GetStreamingFormatter(
+          table_format, output=output)
+    else:
+      formatter = table_formatter.GetFormatter(table_format)
+    for column in ('n', 's', 't'):
+      formatter.AddColumn(column)
+    formatter.AddRows(rows)
+    formatter.Print(output)
+    return output.getvalue()
+
+  def _AssertSameAsBuffered(self, table_format, rows):
+    self.assertEqual(
+        self._Format(False, table_format, rows),
+        self._Format(True, table_format, rows))
+
+  def testMatchesBufferedFormatters(self):
+    rows = [[1, 'a b ', 'NULL'], [2, 'x,y', 'multi\nline'], [3, 'é', '']]
+    for table_format in ('csv', 'json', 'prettyjson', 'pretty', 'sparse'):
+      with self.subTest(table_format=table_format):
+        self._AssertSameAsBuffered(table_format, rows)
+
+  def testCsvStripsTrailingWhitespaceOfLastRow(self):
+    for rows in ([[1, 'a', 'b  ']], [[1, 'a', 'b'], ['  ', '', ' ']], []):
+      with self.subTest(rows=rows):
+        self._AssertSameAsBuffered('csv', rows)
+    self.assertEqual(
+        'n,s,t\n1,a,b  \n2,c,d\n',
+        self._Format(True, 'csv', [[1, 'a', 'b  '], [2, 'c', 'd   ']]))
+
+  def testPrettyAbbreviatesWideValuesAfterWindow(self):
+    output = io.StringIO()
+    formatter = table_formatter.StreamingPrettyFormatter(
+        output=output, window=2)
+    formatter.AddColumn('s')
+    formatter.AddRows([['ab'], ['cd'], ['wider than the column']])
+    formatter.Print()
+    lines = output.getvalue().splitlines()
+    self.assertEqual(len(lines[0]), len(lines[-2]))
+    self.assertNotIn('wider than the column', output.getvalue())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the lazily loaded CLI tree layout."""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.calliope import cli_tree_lazy
+
+
+def _Flag(name, **kwargs):
+  flag = {
+      cli_tree.LOOKUP_NAME: name,
+      cli_tree.LOOKUP_DESCRIPTION: 'The {} flag.'.format(name),
+      cli_tree.LOOKUP_IS_GLOBAL: False,
+      cli_tree.LOOKUP_IS_HIDDEN: False,
+      cli_tree.LOOKUP_TYPE: 'string',
+  }
+  flag.update(kwargs)
+  return flag
+
+
+def _Command(path, flags, commands=(), positionals=(), arguments=(),
+             is_hidden=False, release='GA'):
+  return {
+      cli_tree.LOOKUP_NAME: path[-1],
+      cli_tree.LOOKUP_PATH: list(path),
+      cli_tree.LOOKUP_CAPSULE: 'The {} command.'.format(path[-1]),
+      cli_tree.LOOKUP_SECTIONS: {'DESCRIPTION': 'Describes it.'},
+      cli_tree.LOOKUP_FLAGS: dict(flags),
+      cli_tree.LOOKUP_POSITIONALS: list(positionals),
+      cli_tree.LOOKUP_COMMANDS: {
+          c[cli_tree.LOOKUP_NAME]: c for c in commands},
+      cli_tree.LOOKUP_CONSTRAINTS: {
+          cli_tree.LOOKUP_ARGUMENTS: list(arguments)},
+      cli_tree.LOOKUP_IS_GROUP: bool(commands),
+      cli_tree.LOOKUP_IS_HIDDEN: is_hidden,
+      cli_tree.LOOKUP_RELEASE: release,
+  }
+
+
+def _SerializedTree():
+  """Returns a small serialized CLI tree, as json.loads reads it."""
+  flags = [_Flag('--help', type='bool'),
+           _Flag('--verbosity', is_global=True, choices=['debug', 'info']),
+           _Flag('--zone'),
+           _Flag('--secret', is_hidden=True)]
+  help_flag = ('--help', 0)
+  verbosity = ('--verbosity', 1)
+
+  def _Compute(track, release):
+    path = ['gcloud'] + track + ['compute']
+    create = _Command(
+        path + ['instances', 'create'],
+        [help_flag, verbosity, ('--zone', 2), ('--secret', 3)],
+        positionals=[{cli_tree.LOOKUP_NAME: 'NAME',
+                      cli_tree.LOOKUP_NARGS: '+'}],
+        arguments=[{cli_tree.LOOKUP_IS_GROUP: True,
+                    cli_tree.LOOKUP_IS_MUTEX: True,
+                    cli_tree.LOOKUP_ARGUMENTS: [2, -1]}],
+        release=release)
+    delete = _Command(path + ['instances', 'delete'],
+                      [help_flag, verbosity, ('--zone', 2)], release=release)
+    instances = _Command(path + ['instances'], [help_flag, verbosity],
+                         commands=[create, delete], release=release)
+    secrets = _Command(
+        path + ['secrets'], [help_flag, verbosity], is_hidden=True,
+        commands=[_Command(path + ['secrets', 'list'], [help_flag, verbosity],
+                           release=release)],
+        release=release)
+    return _Command(path, [help_flag, verbosity],
+                    commands=[instances, secrets], release=release)
+
+  beta = _Command(['gcloud', 'beta'], [help_flag, verbosity],
+                  commands=[_Compute(['beta'], 'BETA')], release='BETA')
+  version = _Command(['gcloud', 'version'], [help_flag, verbosity])
+  tree = _Command(['gcloud'], [help_flag, verbosity],
+                  commands=[_Compute([], 'GA'), beta, version])
+  tree[cli_tree.LOOKUP_PATH] = []
+  tree[cli_tree.LOOKUP_VERSION] = cli_tree.VERSION
+  tree[cli_tree.LOOKUP_CLI_VERSION] = cli_tree.TEST_CLI_VERSION_TEST
+  tree[cli_tree._LOOKUP_SERIALIZED_FLAG_LIST] = flags
+  return tree
+
+
+def _Dump(tree):
+  return json.dumps(tree, sort_keys=True)
+
+
+class CliTreeLazyTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.tree_path = os.path.join(self.temp_dir, 'gcloud.json')
+    self._WriteTree(_SerializedTree())
+
+  def _WriteTree(self, tree):
+    with open(self.tree_path, 'w') as f:
+      json.dump(tree, f)
+    cli_tree_lazy.Write(tree, self.tree_path)
+
+  def testLazyTreeMatchesFullTree(self):
+    lazy = cli_tree_lazy.Load(self.tree_path)
+    self.assertIsNotNone(lazy)
+    self.assertEqual(_Dump(cli_tree.Load(self.tree_path)), _Dump(lazy))
+
+  def testGroupsLoadOnFirstUse(self):
+    root = cli_tree_lazy.Load(self.tree_path)
+    compute = root[cli_tree.LOOKUP_COMMANDS]['compute']
+    self.assertIsInstance(compute, cli_tree_lazy.LazyGroup)
+    self.assertIsInstance(root[cli_tree.LOOKUP_COMMANDS]['version'], dict)
+    # Listing and parsing the root command line only needs the stubs.
+    for group in root[cli_tree.LOOKUP_COMMANDS].values():
+      self.assertTrue(group[cli_tree.LOOKUP_IS_GROUP] is not None)
+      self.assertFalse(group.get(cli_tree.LOOKUP_IS_HIDDEN))
+    self.assertFalse(compute.loaded)
+
+    instances = compute[cli_tree.LOOKUP_COMMANDS]['instances']
+    self.assertTrue(compute.loaded)
+    self.assertFalse(instances.loaded)
+    self.assertFalse(
+        root[cli_tree.LOOKUP_COMMANDS]['beta'].loaded)
+
+    create = instances[cli_tree.LOOKUP_COMMANDS]['create']
+    self.assertEqual(['--help', '--verbosity', '--zone', '--secret'],
+                     list(create[cli_tree.LOOKUP_FLAGS]))
+    # Flags are shared by the commands of all loaded groups.
+    self.assertIs(root[cli_tree.LOOKUP_FLAGS]['--help'],
+                  create[cli_tree.LOOKUP_FLAGS]['--help'])
+    mutex = create[cli_tree.LOOKUP_CONSTRAINTS][cli_tree.LOOKUP_ARGUMENTS][0]
+    self.assertEqual(
+        [create[cli_tree.LOOKUP_FLAGS]['--zone'],
+         create[cli_tree.LOOKUP_POSITIONALS][0]],
+        mutex[cli_tree.LOOKUP_ARGUMENTS])
+
+  def testOutOfDateLayoutIsNotLoaded(self):
+    tree = _SerializedTree()
+    tree[cli_tree.LOOKUP_VERSION] = 'old'
+    cli_tree_lazy.Write(tree, self.tree_path)
+    self.assertIsNone(cli_tree_lazy.Load(self.tree_path))
+
+  def testLayoutOfAnotherTreeIsNotLoaded(self):
+    with open(self.tree_path, 'a') as f:
+      f.write('\n')
+    self.assertIsNone(cli_tree_lazy.Load(self.tree_path))
+    self.assertIsNone(
+        cli_tree_lazy.Load(os.path.join(self.temp_dir, 'missing.json')))
+
+  def testLoadWritesMissingLayout(self):
+    for path in cli_tree_lazy.LayoutPaths(self.tree_path):
+      os.remove(path)
+    tree = cli_tree.Load(self.tree_path, lazy=True)
+    self.assertNotIsInstance(
+        tree[cli_tree.LOOKUP_COMMANDS]['compute'], cli_tree_lazy.LazyGroup)
+    lazy = cli_tree.Load(self.tree_path, lazy=True)
+    self.assertIsInstance(
+        lazy[cli_tree.LOOKUP_COMMANDS]['compute'], cli_tree_lazy.LazyGroup)
+    self.assertEqual(_Dump(tree), _Dump(lazy))
+
+  def testChangedGroupsFileLeavesGroupEmpty(self):
+    root = cli_tree_lazy.Load(self.tree_path)
+    with open(cli_tree_lazy.LayoutPaths(self.tree_path)[1], 'a') as f:
+      f.write('\n')
+    compute = root[cli_tree.LOOKUP_COMMANDS]['compute']
+    self.assertEqual({}, compute[cli_tree.LOOKUP_COMMANDS])
+    self.assertEqual('compute', compute[cli_tree.LOOKUP_NAME])
+
+
+if __name__ == '__main__':
+  unittest.main()
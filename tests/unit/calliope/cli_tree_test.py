@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for sharded CLI tree generation."""
+
+import json
+import multiprocessing
+import os
+import sys
+import unittest
+from unittest import mock
+
+from googlecloudsdk import gcloud_main
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.core.resource import resource_projector
+
+_SHARD_NAMES = ('config', 'topic', 'version')
+
+
+def _Dump(tree):
+  return json.dumps(
+      resource_projector.MakeSerializable(cli_tree._Serialize(tree)),
+      sort_keys=True)
+
+
+@unittest.skipUnless(
+    'fork' in multiprocessing.get_all_start_methods() and
+    sys.platform != 'darwin',
+    'CLI tree shards are generated in forked processes.')
+class ShardedGenerationTest(unittest.TestCase):
+
+  def setUp(self):
+    self.cli = gcloud_main.CreateCLI([])
+    self.shards = [shard for shard in cli_tree._GetShards(self.cli)
+                   if shard[0] in _SHARD_NAMES]
+    patcher = mock.patch.object(
+        cli_tree, '_GetShards', return_value=self.shards)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def testShardsCoverTopLevelElements(self):
+    self.assertEqual(
+        [('config', ['gcloud.config']), ('topic', ['gcloud.topic']),
+         ('version', ['gcloud.version'])],
+        self.shards)
+
+  def testShardedTreeMatchesWalk(self):
+    paths = [path for _, shard_paths in self.shards for path in shard_paths]
+    walked = cli_tree._ShardCliTreeGenerator(self.cli, paths).Walk(
+        hidden=True, restrict=paths)
+    sharded = cli_tree._GenerateShardedTree(
+        gcloud_main.CreateCLI([]), 2, 'Generating')
+    self.assertEqual(['config', 'topic', 'version'], list(sharded.commands))
+    self.assertEqual(_Dump(walked), _Dump(sharded))
+
+  def testProcessCount(self):
+    with mock.patch.dict(
+        os.environ, {'CLOUDSDK_CORE_CLI_TREE_GENERATION_PROCESSES': '3'}):
+      self.assertEqual(3, cli_tree._GetGenerationProcessCount())
+    with mock.patch.object(os, 'cpu_count', return_value=64):
+      self.assertEqual(8, cli_tree._GetGenerationProcessCount())
+    with mock.patch.object(os, 'cpu_count', return_value=None):
+      self.assertEqual(1, cli_tree._GetGenerationProcessCount())
+
+  def testInvalidProcessCountFallsBackToDefault(self):
+    for value in ('0', '-2', 'many'):
+      with mock.patch.dict(
+          os.environ, {'CLOUDSDK_CORE_CLI_TREE_GENERATION_PROCESSES': value}), \
+          mock.patch.object(os, 'cpu_count', return_value=2):
+        self.assertEqual(2, cli_tree._GetGenerationProcessCount(), value)
+
+
+if __name__ == '__main__':
+  unittest.main()
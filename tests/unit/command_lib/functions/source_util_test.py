@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the function source archive and its signed URL upload."""
+
+import http.server
+import io
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import zipfile
+
+from googlecloudsdk.command_lib.functions import source_util
+
+
+class _UploadHandler(http.server.BaseHTTPRequestHandler):
+  """Records PUT bodies, rejecting the first as a delayed permission error."""
+
+  def do_PUT(self):  # pylint: disable=invalid-name
+    body = self.rfile.read(int(self.headers['Content-Length']))
+    self.server.bodies.append(body)
+    self.send_response(403 if len(self.server.bodies) == 1 else 200)
+    self.send_header('Content-Length', '0')
+    self.end_headers()
+
+  def log_message(self, *args):
+    pass
+
+
+class SourceUtilTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.source_dir = os.path.join(self.temp_dir, 'source')
+    os.makedirs(os.path.join(self.source_dir, 'lib'))
+    self.contents = {
+        'main.py': b'def handler(request):\n  return "ok"\n' * 100,
+        'lib/data.bin': os.urandom(256 * 1024),
+    }
+    for name, data in self.contents.items():
+      with open(os.path.join(self.source_dir, name), 'wb') as f:
+        f.write(data)
+
+  def _Names(self, zip_stream):
+    with zipfile.ZipFile(zip_stream) as zip_file:
+      return {name: zip_file.read(name) for name in zip_file.namelist()
+              if not name.endswith('/')}
+
+  def testZipStreamIsSpooledToDisk(self):
+    with mock.patch.object(source_util, '_MAX_IN_MEMORY_ZIP_BYTES', 1024):
+      with source_util.CreateSourcesZipStream(self.source_dir) as zip_stream:
+        self.assertEqual(0, zip_stream.tell())
+        self.assertTrue(zip_stream._rolled)  # pylint: disable=protected-access
+        self.assertEqual(self.contents, self._Names(zip_stream))
+
+  def testUploadStreamsAndReplaysTheBodyOnRetry(self):
+    server = http.server.HTTPServer(('localhost', 0), _UploadHandler)
+    server.bodies = []
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    self.addCleanup(thread.join)
+    self.addCleanup(server.server_close)
+    self.addCleanup(server.shutdown)
+    url = 'http://localhost:{0}/upload'.format(server.server_port)
+
+    with source_util.CreateSourcesZipStream(self.source_dir) as zip_stream, \
+        mock.patch.object(source_util, '_UPLOAD_CHUNK_BYTES', 1024), \
+        mock.patch.object(source_util.time, 'sleep'):
+      source_util.UploadStreamToGeneratedUrl(zip_stream, url)
+      zip_stream.seek(0)
+      archive_bytes = zip_stream.read()
+
+    self.assertEqual([archive_bytes, archive_bytes], server.bodies)
+    self.assertEqual(self.contents, self._Names(io.BytesIO(archive_bytes)))
+
+
+if __name__ == '__main__':
+  unittest.main()
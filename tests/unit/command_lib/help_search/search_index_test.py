@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the help search index."""
+
+import copy
+import os
+import shutil
+import tempfile
+import unittest
+
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.command_lib.help_search import lookup
+from googlecloudsdk.command_lib.help_search import search
+from googlecloudsdk.command_lib.help_search import search_index
+
+
+def _Flag(name, description, **kwargs):
+  flag = {
+      lookup.NAME: name,
+      lookup.DESCRIPTION: description,
+      lookup.DEFAULT: None,
+      lookup.IS_GLOBAL: False,
+      lookup.IS_HIDDEN: False,
+  }
+  flag.update(kwargs)
+  return flag
+
+
+def _Command(path, capsule, description, flags=(), positionals=(),
+             commands=(), is_hidden=False, release='GA'):
+  command = {
+      lookup.NAME: path[-1],
+      lookup.PATH: list(path),
+      lookup.CAPSULE: capsule,
+      lookup.SECTIONS: {'DESCRIPTION': description},
+      lookup.FLAGS: {flag[lookup.NAME]: flag for flag in flags},
+      lookup.POSITIONALS: list(positionals),
+      lookup.COMMANDS: {c[lookup.NAME]: c for c in commands},
+      cli_tree.LOOKUP_IS_GROUP: bool(commands),
+      lookup.IS_HIDDEN: is_hidden,
+      lookup.RELEASE: release,
+      cli_tree.LOOKUP_CONSTRAINTS: {},
+  }
+  return command
+
+
+def _Tree():
+  """Returns a small CLI tree with GA and beta tracks of the same commands."""
+  help_flag = _Flag('--help', 'Display detailed help.')
+  global_flag = _Flag('--verbosity', 'Override the default verbosity.',
+                      is_global=True, choices=['debug', 'info'])
+
+  def _Instances(track, release):
+    path = ['gcloud'] + track + ['compute', 'instances']
+    zone = _Flag('--zone', 'Zone of the instance.')
+    create = _Command(
+        path + ['create'], 'Create virtual machine instances.',
+        'Creates Compute Engine virtual machine instances in a zone.',
+        flags=[help_flag, zone,
+               _Flag('--machine-type', 'Specifies the machine type.',
+                     default='n1-standard-1'),
+               _Flag('--provisioning-model', 'The provisioning model.',
+                     choices=['SPOT', 'STANDARD', 'SECRET'],
+                     attr={lookup.HIDDEN_CHOICES: ['SECRET']}),
+               _Flag('--debug-only', 'Undocumented alpaca flag.',
+                     is_hidden=True)],
+        positionals=[{lookup.NAME: 'INSTANCE_NAMES',
+                      lookup.DESCRIPTION: 'Names of the instances to create.'}],
+        release=release)
+    delete = _Command(
+        path + ['delete'], 'Delete Compute Engine instances.',
+        'Deletes one or more virtual machine instances.',
+        flags=[help_flag, zone], release=release)
+    secret = _Command(
+        path + ['alpaca'], 'A hidden alpaca command.', 'Alpaca.',
+        flags=[help_flag], is_hidden=True, release=release)
+    instances = _Command(
+        path, 'Read and manipulate Compute Engine virtual machines.',
+        'Read and manipulate Compute Engine virtual machine instances.',
+        flags=[help_flag], commands=[create, delete, secret], release=release)
+    return _Command(
+        path[:-1], 'Create and manipulate Compute Engine resources.',
+        'The compute command group.', flags=[help_flag],
+        commands=[instances], release=release)
+
+  beta = _Command(['gcloud', 'beta'], 'Beta versions of gcloud commands.',
+                  'Beta commands.', flags=[help_flag],
+                  commands=[_Instances(['beta'], 'BETA')], release='BETA')
+  tree = _Command(['gcloud'], 'Manage Google Cloud resources.',
+                  'The gcloud CLI manages authentication and resources.',
+                  flags=[help_flag, global_flag],
+                  commands=[_Instances([], 'GA'), beta])
+  tree[lookup.PATH] = []
+  tree[cli_tree.LOOKUP_VERSION] = cli_tree.VERSION
+  tree[cli_tree.LOOKUP_CLI_VERSION] = cli_tree.TEST_CLI_VERSION_TEST
+  return tree
+
+
+class SearchIndexTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.tree_path = os.path.join(self.temp_dir, 'gcloud.json')
+    self.tree = _Tree()
+    search_index.Write(self.tree, self.tree_path)
+
+  def _SearchTree(self, terms):
+    results = search.Searcher(copy.deepcopy(self.tree), terms).Search()
+    for result in results:
+      del result[cli_tree.LOOKUP_CONSTRAINTS]
+    return results
+
+  def _SearchIndex(self, terms):
+    index = search_index.Load(self.tree_path)
+    self.assertIsNotNone(index)
+    return search.IndexSearcher(index, terms).Search()
+
+  def testResultsMatchTreeSearch(self):
+    for terms in (['instances'], ['zone', 'machine'], ['Virtual'],
+                  ['n1-standard'], ["'spot',"], ['secret'], ['alpaca'],
+                  ['debug'], ['instance_names'], ['delete', 'missing'],
+                  ['create,'], ['virtual machine'], ['machine  instances'],
+                  ['name'], [' '], ['nothing-matches']):
+      with self.subTest(terms=terms):
+        self.assertEqual(self._SearchTree(terms), self._SearchIndex(terms))
+
+  def testCandidatesNarrowTheSearch(self):
+    index = search_index.Load(self.tree_path)
+    self.assertEqual([], index.CommandIds('alpaca'))
+    # The create commands of both tracks.
+    self.assertEqual(2, len(index.CommandIds('machine-type')))
+    # The create and delete commands of both tracks.
+    self.assertEqual(4, len(index.CommandIds('zone of')))
+
+  def testOutOfDateIndexIsNotLoaded(self):
+    self.tree[cli_tree.LOOKUP_VERSION] = 'old'
+    search_index.Write(self.tree, self.tree_path)
+    self.assertIsNone(search_index.Load(self.tree_path))
+
+  def testIndexWithoutItsCommandsFileIsNotLoaded(self):
+    os.remove(search_index.IndexPaths(self.tree_path)[1])
+    self.assertIsNone(search_index.Load(self.tree_path))
+    self.assertIsNone(
+        search_index.Load(os.path.join(self.temp_dir, 'missing.json')))
+
+
+if __name__ == '__main__':
+  unittest.main()
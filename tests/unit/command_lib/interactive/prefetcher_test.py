@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the gcloud interactive resource completion prefetcher."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from googlecloudsdk.command_lib.interactive import prefetcher
+from googlecloudsdk.core.cache import resource_cache
+
+
+class _Completer(resource_cache.Updater):
+  """Completes from a table of things, recording the processes it updates in.
+
+  The updates are appended to updates_path, since they run in forked
+  processes.
+  """
+
+  COLLECTION = 'test.things'
+  TIMEOUT = resource_cache.DEFAULT_TIMEOUT
+  updates_path = None
+
+  def __init__(self, cache=None, qualified_parameter_names=None):
+    del qualified_parameter_names
+    super(_Completer, self).__init__(
+        cache=cache, collection=self.COLLECTION, columns=1,
+        timeout=self.TIMEOUT)
+
+  def ParameterInfo(self, parsed_args, argument):
+    del parsed_args, argument
+    return resource_cache.ParameterInfo()
+
+  def Complete(self, prefix, parameter_info):
+    return [row[0] for row in self.Select((prefix + '*',), parameter_info)]
+
+  def Update(self, parameter_info=None, aggregations=None):
+    with open(self.updates_path, 'a') as f:
+      f.write('{0} {1}\n'.format(self.collection, os.getpid()))
+    return [('thing-{0}'.format(i),) for i in range(3)]
+
+
+def _Updates():
+  """Returns the (collection, pid) tuple of each update so far."""
+  if not os.path.exists(_Completer.updates_path):
+    return []
+  with open(_Completer.updates_path) as f:
+    return [(collection, int(pid))
+            for collection, pid in (line.split() for line in f)]
+
+
+class _ShortLivedCompleter(_Completer):
+
+  COLLECTION = 'test.short_lived_things'
+  TIMEOUT = 0.05
+
+
+class _FailingCompleter(_Completer):
+
+  COLLECTION = 'test.failing_things'
+
+  def Update(self, parameter_info=None, aggregations=None):
+    raise ValueError('list command failed')
+
+
+def _ModulePath(completer_class):
+  return '{0}:{1}'.format(__name__, completer_class.__name__)
+
+
+class CompletionPrefetcherTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    patcher = mock.patch.object(
+        resource_cache.ResourceCache, 'GetDefaultName',
+        return_value=os.path.join(self.temp_dir, 'resource.cache'))
+    patcher.start()
+    self.addCleanup(patcher.stop)
+    _Completer.updates_path = os.path.join(self.temp_dir, 'updates')
+
+  def _Prefetcher(self, *completer_classes):
+    prefetch = prefetcher.CompletionPrefetcher(
+        completers=[_ModulePath(c) for c in completer_classes],
+        parsed_args=None)
+    self.addCleanup(prefetch.Stop, 10)
+    return prefetch
+
+  def _WaitForUpdates(self, count):
+    deadline = time.time() + 10
+    while len(_Updates()) < count and time.time() < deadline:
+      time.sleep(0.01)
+    return [collection for collection, _ in _Updates()]
+
+  def testWarmsTablesInForkedProcesses(self):
+    prefetch = self._Prefetcher(_FailingCompleter, _Completer)
+    self.assertTrue(prefetch.SetContext('my-project', 'me@example.com'))
+    self.assertEqual(['test.things'], self._WaitForUpdates(1))
+    self.assertTrue(prefetch.Stop(timeout=10))
+    self.assertNotEqual(os.getpid(), _Updates()[0][1])
+
+    # The warm table completes without an update.
+    with resource_cache.ResourceCache() as cache:
+      self.assertEqual(['thing-0', 'thing-1', 'thing-2'],
+                       sorted(_Completer(cache).Complete(
+                           'thing', resource_cache.ParameterInfo())))
+    self.assertEqual(1, len(_Updates()))
+
+  def testWarmsTablesAgainWhenTheyExpire(self):
+    prefetch = self._Prefetcher(_ShortLivedCompleter)
+    prefetch.SetContext('my-project', None)
+    self.assertEqual(['test.short_lived_things'] * 3, self._WaitForUpdates(3))
+
+  def testRestartsOnlyWhenTheContextChanges(self):
+    prefetch = self._Prefetcher(_Completer)
+    self.assertTrue(prefetch.SetContext('my-project', None))
+    self.assertFalse(prefetch.SetContext('my-project', None))
+    self.assertTrue(prefetch.SetContext('my-project', 'me@example.com'))
+    self.assertTrue(prefetch.SetContext('other-project', 'me@example.com'))
+    self.assertFalse(prefetch.SetContext(None, 'me@example.com'))
+    # Each worker thread waits for the one of the previous context, so Stop
+    # also waits for the worker threads of the earlier contexts.
+    self.assertTrue(prefetch.Stop(timeout=10))
+
+  def testNothingToPrefetch(self):
+    self.assertFalse(self._Prefetcher().SetContext('my-project', None))
+    prefetch = prefetcher.CompletionPrefetcher(
+        completers=['googlecloudsdk.no_such_module:Completer'],
+        parsed_args=None)
+    self.assertTrue(prefetch.SetContext('my-project', None))
+    self.assertTrue(prefetch.Stop(timeout=10))
+    self.assertEqual([], _Updates())
+
+  def testNothingToPrefetchWithoutFork(self):
+    prefetch = self._Prefetcher(_Completer)
+    with mock.patch.object(
+        resource_cache, '_GetRefreshContext', return_value=None):
+      self.assertFalse(prefetch.SetContext('my-project', None))
+    self.assertTrue(prefetch.Stop(timeout=10))
+    self.assertEqual([], _Updates())
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for bulk online prediction."""
+
+import io
+import json
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from googlecloudsdk.command_lib.ml_engine import bulk_predict
+from googlecloudsdk.command_lib.ml_engine import predict_utilities
+
+
+class _FakePredict(object):
+  """Doubles each instance, failing the instances listed in errors."""
+
+  def __init__(self, errors=None):
+    # Instance to the status codes of its next failed requests.
+    self.errors = errors or {}
+    self.lock = threading.Lock()
+    self.requests = []
+
+  def __call__(self, ref, instances, signature_name=None, session=None):
+    del ref, signature_name, session  # Unused.
+    with self.lock:
+      self.requests.append(list(instances))
+      for instance in instances:
+        if self.errors.get(instance):
+          raise bulk_predict.predict.HttpRequestFailError(
+              'failed', self.errors[instance].pop(0))
+    time.sleep(random.random() / 100)
+    return {'predictions': [2 * instance for instance in instances]}
+
+
+class ChunkTest(unittest.TestCase):
+
+  def testSplitsByCountAndSize(self):
+    chunks = list(bulk_predict.Chunk(
+        ((i, i) for i in range(1, 8)), instances_per_request=3))
+    self.assertEqual([(1, [1, 2, 3]), (4, [4, 5, 6]), (7, [7])], chunks)
+
+    big = 'x' * 600000
+    chunks = list(bulk_predict.Chunk(
+        ((i, big) for i in range(1, 6)), instances_per_request=100))
+    self.assertEqual([1, 3, 5], [chunk.first_line for chunk in chunks])
+
+  def testInstanceTooLargeForRequest(self):
+    with self.assertRaisesRegex(predict_utilities.InvalidInstancesFileError,
+                                'Line 2: The instance is larger'):
+      list(bulk_predict.Chunk([(1, 'a'), (2, 'x' * 2000000)], 10))
+
+
+class ReadInstancesTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.path = os.path.join(self.temp_dir, 'instances')
+
+  def _Read(self, contents, data_format):
+    with open(self.path, 'wb') as f:
+      f.write(contents)
+    return list(bulk_predict.ReadInstances(self.path, data_format))
+
+  def testReadsLines(self):
+    self.assertEqual(
+        [(1, {'a': 1}), (2, [1, 2])],
+        self._Read(b'\xef\xbb\xbf{"a": 1}\r\n[1, 2]\n', 'json'))
+    self.assertEqual([(1, '1,2'), (2, 'ü')],
+                     self._Read('1,2\nü\n'.encode('utf-8'), 'text'))
+
+  def testInvalidLine(self):
+    with self.assertRaisesRegex(predict_utilities.InvalidInstancesFileError,
+                                'Line 2: Input instances are not in JSON'):
+      self._Read(b'1\nnot json\n', 'json')
+
+
+class BulkPredictorTest(unittest.TestCase):
+
+  def setUp(self):
+    patcher = mock.patch.object(bulk_predict.requests, 'GetSession')
+    patcher.start()
+    self.addCleanup(patcher.stop)
+    patcher = mock.patch.object(bulk_predict, '_INITIAL_RETRY_DELAY_MS', 0)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def _Predict(self, fake, instances, output):
+    with mock.patch.object(bulk_predict.predict, 'Predict', fake):
+      predictor = bulk_predict.BulkPredictor(
+          mock.Mock(), max_concurrent_requests=3)
+      return predictor.Predict(
+          bulk_predict.Chunk(((i, i) for i in instances), 4), output)
+
+  def testWritesPredictionsInInputOrderAndRetries(self):
+    fake = _FakePredict({5: [503, 429], 30: [500]})
+    output = io.StringIO()
+    summary = self._Predict(fake, range(1, 101), output)
+    self.assertEqual([2 * i for i in range(1, 101)],
+                     [json.loads(line) for line in output.getvalue().split()])
+    self.assertEqual(100, summary['instances'])
+    self.assertEqual(25, summary['requests'])
+    self.assertEqual(3, summary['retries'])
+    self.assertEqual(28, len(fake.requests))
+
+  def testPermanentErrorIsRaisedAfterEarlierPredictions(self):
+    fake = _FakePredict({9: [400]})
+    output = io.StringIO()
+    with self.assertRaises(bulk_predict.predict.HttpRequestFailError):
+      self._Predict(fake, range(1, 101), output)
+    self.assertEqual([2 * i for i in range(1, 9)],
+                     [json.loads(line) for line in output.getvalue().split()])
+    self.assertEqual(1, sum(9 in request for request in fake.requests))
+
+  def testInvalidInputIsRaisedAfterEarlierPredictions(self):
+    def _Instances():
+      for i in range(1, 31):
+        yield i, i
+      raise predict_utilities.InvalidInstancesFileError('Line 31: invalid')
+
+    output = io.StringIO()
+    with mock.patch.object(
+        bulk_predict.predict, 'Predict', _FakePredict({})), \
+        mock.patch.object(bulk_predict.log.status, 'Print') as status:
+      predictor = bulk_predict.BulkPredictor(
+          mock.Mock(), max_concurrent_requests=3)
+      with self.assertRaisesRegex(
+          predict_utilities.InvalidInstancesFileError, 'Line 31'):
+        predictor.Predict(bulk_predict.Chunk(_Instances(), 4), output)
+    # The last two instances were not in a complete chunk yet.
+    self.assertEqual([2 * i for i in range(1, 29)],
+                     [json.loads(line) for line in output.getvalue().split()])
+    status.assert_called_with(
+        'Predicted 28 instances before the invalid input.')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for streaming local prediction."""
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from googlecloudsdk.command_lib.ml_engine import local_predict
+from googlecloudsdk.command_lib.ml_engine import local_utils
+
+
+class _FakePredictor(object):
+  """Predicts the sum of each instance and records the batches it saw."""
+
+  loads = []
+
+  def __init__(self, model_dir, framework, signature_name):
+    _FakePredictor.loads.append((model_dir, framework, signature_name))
+
+  def predict(self, instances):
+    if 'fail' in instances:
+      raise ValueError('cannot predict')
+    return [{'sum': sum(instance), 'pid': os.getpid()}
+            for instance in instances]
+
+
+class StreamPredictTest(unittest.TestCase):
+
+  def setUp(self):
+    _FakePredictor.loads = []
+    patcher = mock.patch.object(local_predict, '_Predictor', _FakePredictor)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+    self.lines = [json.dumps([i, i]) + '\n' for i in range(10)]
+
+  def _Predict(self, lines, **kwargs):
+    output = io.StringIO()
+    local_predict.stream_predict(
+        ('model', 'scikit_learn', None), lines, output, **kwargs)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+  def testLoadsModelOnceAndWritesOnePredictionPerLine(self):
+    predictions = self._Predict(iter(self.lines), batch_size=3)
+    self.assertEqual([2 * i for i in range(10)],
+                     [p['sum'] for p in predictions])
+    self.assertEqual([('model', 'scikit_learn', None)], _FakePredictor.loads)
+
+  def testWorkerProcessesKeepInputOrder(self):
+    predictions = self._Predict(iter(self.lines), batch_size=2, workers=2)
+    self.assertEqual([2 * i for i in range(10)],
+                     [p['sum'] for p in predictions])
+    self.assertNotIn(os.getpid(), {p['pid'] for p in predictions})
+
+  def testWorkerErrorIsRaised(self):
+    lines = self.lines + ['"fail"\n']
+    with self.assertRaisesRegex(ValueError, 'cannot predict'):
+      self._Predict(iter(lines), batch_size=4, workers=2)
+
+  def testBatches(self):
+    self.assertEqual([[1, 2], [3, 4], [5]],
+                     list(local_predict._batches(iter([1, 2, 3, 4, 5]), 2)))
+
+
+# Predicts the first value of each instance line as soon as it is read.
+_ECHO_SCRIPT = (
+    'import json, sys\n'
+    'for line in sys.stdin:\n'
+    '  print(json.dumps({"x": json.loads(line)[0]}), flush=True)\n')
+
+
+class LocalUtilsStreamPredictTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+
+  def _MockProcess(self, script):
+    start = mock.patch.object(
+        local_utils, '_StartPredictProcess',
+        return_value=subprocess.Popen(
+            [sys.executable, '-c', script], stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE))
+    self.start_process = start.start()
+    self.addCleanup(start.stop)
+
+  def _WriteInstances(self, contents):
+    path = os.path.join(self.temp_dir, 'instances.json')
+    with open(path, 'w') as f:
+      f.write(contents)
+    return path
+
+  def testYieldsPredictionsAsTheyArePrinted(self):
+    self._MockProcess(_ECHO_SCRIPT)
+    path = self._WriteInstances(
+        ''.join(json.dumps([i]) + '\n' for i in range(5000)))
+    with mock.patch.object(
+        local_utils.predict_utilities, 'ReadInstancesFromArgs') as read_all:
+      predictions = local_utils.StreamPredict(
+          'model', json_instances=path, framework='scikit_learn',
+          batch_size=10, workers=2)
+      self.assertEqual(list(range(5000)), [p['x'] for p in predictions])
+    # The instances are read one line at a time instead.
+    read_all.assert_not_called()
+    self.assertEqual(
+        ['--batch-size', '10', '--workers', '2'],
+        self.start_process.call_args[0][3])
+
+  def testInvalidLineIsRaisedAfterThePredictionsBeforeIt(self):
+    self._MockProcess(_ECHO_SCRIPT)
+    path = self._WriteInstances('[0]\n[1]\nnot json\n[3]\n')
+    predictions = []
+    with self.assertRaisesRegex(
+        local_utils.predict_utilities.InvalidInstancesFileError, 'Line 3'):
+      for prediction in local_utils.StreamPredict(
+          'model', json_instances=path, batch_size=10):
+        predictions.append(prediction['x'])
+    self.assertEqual([0, 1], predictions)
+
+  def testEmptyInstancesFileIsInvalid(self):
+    self._MockProcess(_ECHO_SCRIPT)
+    path = self._WriteInstances('')
+    with self.assertRaisesRegex(
+        local_utils.predict_utilities.InvalidInstancesFileError,
+        'No valid instance'):
+      list(local_utils.StreamPredict('model', text_instances=path,
+                                     batch_size=10))
+
+  def testJsonRequestIsReadWhole(self):
+    self._MockProcess(_ECHO_SCRIPT)
+    path = self._WriteInstances(json.dumps({'instances': [[5], [6]]}))
+    self.assertEqual(
+        [{'x': 5}, {'x': 6}],
+        list(local_utils.StreamPredict('model', json_request=path,
+                                       batch_size=10)))
+
+  def testFailureRaisesRuntimeError(self):
+    self._MockProcess(
+        'import sys\n'
+        'sys.stdin.readline()\n'
+        'sys.stderr.write("model not found")\n'
+        'sys.exit(1)\n')
+    path = self._WriteInstances('[0]\n')
+    with self.assertRaisesRegex(local_utils.LocalPredictRuntimeError,
+                                'model not found'):
+      list(local_utils.StreamPredict('model', json_instances=path,
+                                     batch_size=10))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for publishing Cloud Pub/Sub messages read from a file."""
+
+import io
+import threading
+import unittest
+from unittest import mock
+
+from googlecloudsdk.api_lib.util import apis
+from googlecloudsdk.command_lib.pubsub import bulk_publish
+from googlecloudsdk.command_lib.pubsub import util
+
+
+class _FakeTopicsClient(object):
+  """Records the data of published messages."""
+
+  published = []
+  lock = threading.Lock()
+
+  def PublishMessages(self, topic_ref, messages):
+    del topic_ref  # Unused.
+    with self.lock:
+      self.published.extend(message.data for message in messages)
+
+
+class BulkPublishTest(unittest.TestCase):
+
+  def setUp(self):
+    self.messages = apis.GetMessagesModule('pubsub', 'v1')
+    _FakeTopicsClient.published = []
+    patcher = mock.patch.object(
+        bulk_publish.topics, 'TopicsClient', _FakeTopicsClient)
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def _Read(self, text, message_format=bulk_publish.TEXT_FORMAT):
+    return bulk_publish.ReadMessages(
+        io.StringIO(text), message_format, self.messages)
+
+  def testSkipsEmptyLines(self):
+    text = 'a\n\n \n\r\nb\n\n'
+    self.assertEqual(
+        [(1, b'a'), (3, b' '), (5, b'b')],
+        [(m.line_number, m.message.data) for m in self._Read(text)])
+    json_text = '{"data": "a"}\n\n{"data": "b"}\n'
+    self.assertEqual(
+        [1, 3],
+        [m.line_number
+         for m in self._Read(json_text, bulk_publish.JSON_FORMAT)])
+
+  def testInvalidLineReportsMessagesAlreadyPublished(self):
+    lines = ['{"data": "m%d"}' % i for i in range(1500)]
+    lines.append('{"data": ""}')
+    publisher = bulk_publish.BulkPublisher(mock.Mock())
+
+    with self.assertRaises(util.InvalidArgumentError) as context:
+      publisher.Publish(
+          self._Read('\n'.join(lines), bulk_publish.JSON_FORMAT))
+
+    self.assertEqual(1000, len(_FakeTopicsClient.published))
+    message = str(context.exception)
+    self.assertIn('Line 1501: You cannot send an empty message.', message)
+    self.assertIn('publishing 1000 messages; 0 failed and 500', message)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for continuously pulling Cloud Pub/Sub messages to a stream."""
+
+import base64
+import collections
+import io
+import json
+import os
+import signal
+import threading
+import unittest
+from unittest import mock
+
+from apitools.base.py import exceptions as apitools_exceptions
+from googlecloudsdk.api_lib.util import apis
+from googlecloudsdk.command_lib.pubsub import drain
+
+
+class _FakeSubscriptionsClient(object):
+  """Serves pull batches in order and records acks and deadline changes."""
+
+  def __init__(self, batches, fail_acks=False):
+    self._messages = apis.GetMessagesModule('pubsub', 'v1')
+    self._batches = collections.deque(batches)
+    self._fail_acks = fail_acks
+    self._lock = threading.Lock()
+    # Pull number to the event that pull waits for before it returns a batch.
+    self.pull_gates = collections.defaultdict(threading.Event)
+    self.pull_count = 0
+    self.acked = []
+    self.modified = []
+
+  def Pull(self, subscription_ref, max_messages, return_immediately=False):
+    del subscription_ref, max_messages, return_immediately  # Unused.
+    with self._lock:
+      self.pull_count += 1
+      pull_number = self.pull_count
+    gate = self.pull_gates.get(pull_number)
+    if gate is not None:
+      gate.wait(10)
+    with self._lock:
+      batch = self._batches.popleft() if self._batches else []
+    if not batch:
+      # A long poll that received nothing.
+      threading.Event().wait(0.05)
+    return self._messages.PullResponse(receivedMessages=[
+        self._messages.ReceivedMessage(
+            ackId=ack_id,
+            message=self._messages.PubsubMessage(data=ack_id.encode()))
+        for ack_id in batch
+    ])
+
+  def Ack(self, ack_ids, subscription_ref):
+    del subscription_ref  # Unused.
+    if self._fail_acks:
+      raise apitools_exceptions.HttpError(
+          {'status': 503}, '{"error": {"message": "Unavailable"}}', 'url')
+    with self._lock:
+      self.acked.extend(ack_ids)
+
+  def ModifyAckDeadline(self, subscription_ref, ack_ids, ack_deadline):
+    del subscription_ref  # Unused.
+    with self._lock:
+      self.modified.extend((ack_id, ack_deadline) for ack_id in ack_ids)
+
+
+class _Stream(io.StringIO):
+  """A text stream that calls on_write before each write."""
+
+  def __init__(self, on_write):
+    super(_Stream, self).__init__()
+    self._on_write = on_write
+    self.write_count = 0
+
+  def write(self, text):
+    self.write_count += 1
+    self._on_write(self.write_count)
+    return super(_Stream, self).write(text)
+
+
+class DrainTest(unittest.TestCase):
+
+  def _Drain(self, client, stream, **kwargs):
+    with mock.patch.object(
+        drain.subscriptions, 'SubscriptionsClient', return_value=client):
+      return drain.Drainer(mock.Mock(), concurrent_pulls=1).Drain(
+          stream, **kwargs)
+
+  def _Written(self, stream):
+    return [base64.b64decode(json.loads(line)['message']['data']).decode()
+            for line in stream.getvalue().splitlines()]
+
+  def testLeasesAreExtendedWhileMessagesAreInFlight(self):
+    client = _FakeSubscriptionsClient([['a', 'b']])
+    extended = threading.Event()
+
+    def _WaitForExtension(write_count):
+      del write_count  # Unused.
+      # The write blocks until the messages being written had their ack
+      # deadline extended.
+      self.assertTrue(extended.wait(10))
+
+    def _ModifyAckDeadline(subscription_ref, ack_ids, ack_deadline):
+      _FakeSubscriptionsClient.ModifyAckDeadline(
+          client, subscription_ref, ack_ids, ack_deadline)
+      extended.set()
+
+    client.ModifyAckDeadline = _ModifyAckDeadline
+    stream = _Stream(_WaitForExtension)
+    with mock.patch.object(drain, '_MIN_ACK_DEADLINE_SECONDS', 0), \
+        mock.patch.object(drain, '_LEASE_CHECK_INTERVAL_SECONDS', 0.01):
+      result = self._Drain(client, stream, max_message_count=2)
+
+    self.assertEqual(2, result['messagesWritten'])
+    self.assertEqual(['a', 'b'], sorted(client.acked))
+    self.assertIn(('a', drain._LEASE_EXTENSION_SECONDS), client.modified)  # pylint: disable=protected-access
+    self.assertIn(('b', drain._LEASE_EXTENSION_SECONDS), client.modified)  # pylint: disable=protected-access
+
+  def testAckFailureIsRaisedAfterWriting(self):
+    client = _FakeSubscriptionsClient([['a', 'b', 'c']], fail_acks=True)
+    stream = _Stream(lambda write_count: None)
+
+    with self.assertRaisesRegex(
+        drain.AcknowledgeFailedError,
+        'Failed to acknowledge 3 of 3 written messages'):
+      self._Drain(client, stream, max_message_count=3)
+
+    self.assertEqual(['a', 'b', 'c'], self._Written(stream))
+    self.assertEqual([], client.acked)
+
+  def testInterruptAcksWrittenAndReleasesUnwrittenMessages(self):
+    client = _FakeSubscriptionsClient([['a', 'b'], ['c', 'd']])
+    # The second batch is only pulled once the first one is being written.
+    second_pull = client.pull_gates[2]
+
+    def _InterruptSecondWrite(write_count):
+      if write_count == 1:
+        second_pull.set()
+      else:
+        os.kill(os.getpid(), signal.SIGINT)
+
+    stream = _Stream(_InterruptSecondWrite)
+    result = self._Drain(client, stream)
+
+    self.assertEqual(2, result['messagesWritten'])
+    self.assertEqual(['a', 'b'], self._Written(stream))
+    self.assertEqual(['a', 'b'], sorted(client.acked))
+    self.assertEqual([('c', 0), ('d', 0)], sorted(client.modified))
+
+  def testIdleTimeoutStopsDraining(self):
+    client = _FakeSubscriptionsClient([['a']])
+    stream = _Stream(lambda write_count: None)
+
+    result = self._Drain(client, stream, idle_timeout=0.2)
+
+    self.assertEqual(1, result['messagesWritten'])
+    self.assertEqual(['a'], client.acked)
+    self.assertEqual([], client.modified)
+
+
+if __name__ == '__main__':
+  unittest.main()
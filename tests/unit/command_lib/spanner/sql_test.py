@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for reading streamed Cloud Spanner query results."""
+
+import unittest
+
+from apitools.base.py import encoding
+from googlecloudsdk.api_lib.util import apis
+from googlecloudsdk.command_lib.spanner import sql
+
+
+def _PartialResultSets(*elements):
+  msgs = apis.GetMessagesModule('spanner', 'v1')
+  return [encoding.DictToMessage(element, msgs.PartialResultSet)
+          for element in elements]
+
+
+def _Metadata(*names):
+  return {'rowType': {'fields': [
+      {'name': name, 'type': {'code': 'STRING'}} for name in names]}}
+
+
+class MergeChunkedValueTest(unittest.TestCase):
+
+  def testMergesStrings(self):
+    self.assertEqual('abcd', sql._MergeChunkedValue('ab', 'cd'))  # pylint: disable=protected-access
+
+  def testMergesTheLastAndFirstElementsOfLists(self):
+    self.assertEqual(
+        ['a', 'bc', 'd'],
+        sql._MergeChunkedValue(['a', 'b'], ['c', 'd']))  # pylint: disable=protected-access
+    self.assertEqual(
+        [['a', 'bc'], ['d']],
+        sql._MergeChunkedValue([['a', 'b']], [['c'], ['d']]))  # pylint: disable=protected-access
+    # Numbers and booleans are never chunked, so the lists are concatenated.
+    self.assertEqual(
+        [1.5, True, 2.5],
+        sql._MergeChunkedValue([1.5, True], [2.5]))  # pylint: disable=protected-access
+    self.assertEqual(['a'], sql._MergeChunkedValue(['a'], []))  # pylint: disable=protected-access
+
+  def testMergesObjectsByKey(self):
+    self.assertEqual(
+        {'a': 'xy', 'b': 'z'},
+        sql._MergeChunkedValue({'a': 'x'}, {'a': 'y', 'b': 'z'}))  # pylint: disable=protected-access
+
+  def testOtherValuesCannotBeChunked(self):
+    with self.assertRaises(ValueError):
+      sql._MergeChunkedValue(1.5, 2.5)  # pylint: disable=protected-access
+
+
+class StreamedResultSetTest(unittest.TestCase):
+
+  def testChunksSplitMidValueAreMerged(self):
+    result = sql.StreamedResultSet(_PartialResultSets(
+        {'metadata': _Metadata('s', 'l'), 'values': ['ab'],
+         'chunkedValue': True},
+        {'values': ['cd', ['x', 'y']], 'chunkedValue': True},
+        # Continues both the list and its last string.
+        {'values': [['z', 'w'], 'e'], 'chunkedValue': True},
+        {'values': ['f', ['v']]},
+        {'values': [], 'stats': {'rowCountExact': '2'}},
+    ))
+    self.assertEqual(
+        [['abcd', ['x', 'yz', 'w']], ['ef', ['v']]], list(result.Rows()))
+    self.assertEqual(2, result.stats.rowCountExact)
+
+  def testRowsSplitAcrossPartialResultSets(self):
+    result = sql.StreamedResultSet(_PartialResultSets(
+        {'metadata': _Metadata('a', 'b'), 'values': ['1', '2', '3']},
+        {'values': ['4']},
+    ))
+    result_set = result.ToResultSet()
+    self.assertEqual(
+        [['1', '2'], ['3', '4']],
+        [encoding.MessageToPyValue(row) for row in result_set.rows])
+    self.assertEqual(result.metadata, result_set.metadata)
+
+  def testEmptyResultSet(self):
+    result = sql.StreamedResultSet(_PartialResultSets(
+        {'metadata': _Metadata('a'), 'stats': {'rowCountExact': '0'}}))
+    self.assertEqual('a', result.metadata.rowType.fields[0].name)
+    self.assertIsNone(result.stats)
+    self.assertEqual([], list(result.Rows()))
+    self.assertEqual(0, result.stats.rowCountExact)
+
+  def testEmptyStream(self):
+    result = sql.StreamedResultSet(iter([]))
+    self.assertEqual([], result.metadata.rowType.fields)
+    self.assertEqual([], list(result.Rows()))
+    self.assertIsNone(result.stats)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the binary static completion CLI tree."""
+
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from googlecloudsdk.calliope import cli_tree
+from googlecloudsdk.command_lib.meta import generate_cli_trees
+from googlecloudsdk.command_lib.static_completion import generate
+from googlecloudsdk.command_lib.static_completion import lookup
+
+
+def _Tree():
+  """Returns a static completion CLI tree, as GenerateCompletionTree does."""
+  instances = {
+      'commands': {
+          'create': {'commands': {}, 'flags': {
+              '--zone': 'dynamic',
+              '--boot-disk-type': ['pd-ssd', 'pd-standard', 'é-disk'],
+              '--async': 'bool',
+              '--metadata': 'value',
+          }},
+          'delete': {'commands': {}, 'flags': {'--zone': 'dynamic',
+                                               '--quiet': 'bool'}},
+          'list': {'commands': {}, 'flags': {'--filter': 'value',
+                                             '--empty-choices': []}},
+      },
+      'flags': {},
+  }
+  return {
+      'commands': {
+          'compute': {'commands': {'instances': instances}, 'flags': {}},
+          'config': {'commands': {'set': {'commands': {}, 'flags': {}}},
+                     'flags': {'--installation': 'bool'}},
+          'version': {'commands': {}, 'flags': {}},
+      },
+      'flags': {'--project': 'dynamic', '--verbosity': ['debug', 'info'],
+                '--help': 'bool'},
+  }
+
+
+def _Decode(node):
+  """Returns the dict tree of a binary tree node."""
+  return {
+      'commands': {name: _Decode(child)
+                   for name, child in node['commands'].items()},
+      'flags': node['flags'],
+  }
+
+
+def _Complete(root, cmd_line):
+  try:
+    return lookup._FindCompletions(root, cmd_line)  # pylint: disable=protected-access
+  except lookup.CannotHandleCompletionError as e:
+    return str(e)
+
+
+class CompletionTreeBinaryTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+
+  def _ModuleTree(self):
+    """Returns the tree listed in the Python module format and loaded."""
+    out = io.StringIO()
+    with mock.patch.object(
+        generate, 'GenerateCompletionTree', return_value=_Tree()):
+      generate.ListCompletionTree(cli=None, out=out)
+    module = {}
+    exec(out.getvalue(), module)  # pylint: disable=exec-used
+    return module['STATIC_COMPLETION_CLI_TREE']
+
+  def _BinaryTree(self):
+    """Returns the tree listed in the binary format and memory mapped."""
+    path = os.path.join(self.temp_dir, 'gcloud_completions.bin')
+    with open(path, 'wb') as f:
+      generate.ListCompletionTreeBinary(cli=None, out=f, tree=_Tree())
+    return lookup.LoadCompletionCliTreeBinary(path)
+
+  def testRoundTripMatchesModuleTree(self):
+    module_tree = self._ModuleTree()
+    binary_tree = self._BinaryTree()
+    self.assertEqual(module_tree, _Decode(binary_tree))
+    for cmd_line in (
+        'gcloud ',
+        'gcloud c',
+        'gcloud compute instances ',
+        'gcloud compute instances create --',
+        'gcloud compute instances create --boot-disk-type=',
+        'gcloud compute instances create --boot-disk-type pd-s',
+        'gcloud compute instances create --verbosity=d',
+        'gcloud compute instances create --zone ',
+        'gcloud compute instances list --empty-choices=',
+        'gcloud compute instances delete my-instance --q',
+        'gcloud compute unknown ',
+        'gcloud version ',
+    ):
+      self.assertEqual(_Complete(module_tree, cmd_line),
+                       _Complete(binary_tree, cmd_line), cmd_line)
+
+  def testInvalidBinaryTreeIsNotLoaded(self):
+    path = os.path.join(self.temp_dir, 'gcloud_completions.bin')
+    with open(path, 'wb') as f:
+      f.write(b'GCCX' + generate.SerializeCompletionTreeBinary(_Tree())[4:])
+    with self.assertRaises(lookup.CannotHandleCompletionError):
+      lookup.LoadCompletionCliTreeBinary(path)
+    with self.assertRaises(lookup.CannotHandleCompletionError):
+      lookup.LoadCompletionCliTreeBinary(
+          os.path.join(self.temp_dir, 'missing.bin'))
+
+  def _UpdateCliTrees(self):
+    with mock.patch.object(cli_tree, 'Load'), mock.patch.object(
+        generate, 'GenerateCompletionTree', return_value=_Tree()) as generated:
+      generate_cli_trees.UpdateCliTrees(
+          cli=object(), commands=[cli_tree.DEFAULT_CLI_NAME],
+          directory=self.temp_dir)
+    return generated.call_count
+
+  def testMissingOrStaleBinaryTreeIsWritten(self):
+    module_path = lookup.CompletionCliTreePath(directory=self.temp_dir)
+    binary_path = lookup.CompletionCliTreeBinaryPath(directory=self.temp_dir)
+    self.assertEqual(1, self._UpdateCliTrees())
+    self.assertTrue(os.path.exists(module_path))
+    self.assertEqual(_Tree(), _Decode(
+        lookup.LoadCompletionCliTreeBinary(binary_path)))
+
+    # Both are up to date.
+    self.assertEqual(0, self._UpdateCliTrees())
+
+    # The module is up to date, the binary tree is missing or stale.
+    os.remove(binary_path)
+    self.assertEqual(1, self._UpdateCliTrees())
+    self.assertTrue(os.path.exists(binary_path))
+    stale = time.time() - 60
+    os.utime(binary_path, (stale, stale))
+    self.assertEqual(1, self._UpdateCliTrees())
+    self.assertGreaterEqual(
+        os.path.getmtime(binary_path), os.path.getmtime(module_path))
+
+
+if __name__ == '__main__':
+  unittest.main()
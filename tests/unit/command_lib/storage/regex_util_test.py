@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for exclude pattern matching."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from googlecloudsdk.command_lib.storage import regex_util
+from googlecloudsdk.command_lib.storage import wildcard_iterator
+
+
+class MatchAllWithPrefixTest(unittest.TestCase):
+
+  def testLiteralPrefixPatterns(self):
+    for pattern, prefix in (
+        ('logs/.*', 'logs/2024/'),
+        ('logs/', 'logs/2024/'),
+        (r'a\.b/.*', 'a.b/c/'),
+        ('', 'anything/'),
+        ('.*', 'anything/'),
+    ):
+      with self.subTest(pattern=pattern):
+        self.assertTrue(
+            regex_util.Patterns([pattern]).match_all_with_prefix(prefix))
+
+  def testOtherPatternsAreNotAssumedToMatchEverything(self):
+    for pattern, prefix in (
+        ('logs/.*', 'other/'),
+        (r'logs/(?!keep).*', 'logs/'),
+        ('logs/[^k].*', 'logs/'),
+        ('logs/.*x$', 'logs/'),
+        ('logs/.*/tmp', 'logs/'),
+        ('a.b/.*', 'a.b/'),
+    ):
+      with self.subTest(pattern=pattern):
+        self.assertFalse(
+            regex_util.Patterns([pattern]).match_all_with_prefix(prefix))
+
+  def testIgnorePrefixLength(self):
+    patterns = regex_util.Patterns(['logs/.*'], ignore_prefix_length=4)
+    self.assertTrue(patterns.match_all_with_prefix('dir/logs/x/'))
+    self.assertFalse(patterns.match_all_with_prefix('logs/x/'))
+
+
+class RecursiveExcludeTest(unittest.TestCase):
+
+  def setUp(self):
+    self.root = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.root)
+    for path in ('logs/keep/a', 'logs/drop/b', 'logs/c', 'src/d'):
+      path = os.path.join(self.root, *path.split('/'))
+      os.makedirs(os.path.dirname(path), exist_ok=True)
+      with open(path, 'w'):
+        pass
+
+  def _Walk(self, pattern):
+    base = self.root + os.sep
+    patterns = regex_util.Patterns(
+        [pattern], ignore_prefix_length=len(base))
+    iterator = wildcard_iterator.get_wildcard_iterator(
+        os.path.join(self.root, '**'), exclude_patterns=patterns)
+    with mock.patch.object(
+        regex_util.Patterns, 'match_all_with_prefix', autospec=True,
+        side_effect=regex_util.Patterns.match_all_with_prefix) as prune_check:
+      names = sorted(
+          resource.storage_url.resource_name[len(base):]
+          for resource in iterator)
+    return names, prune_check
+
+  def testDescendsWhenPatternDoesNotMatchEverythingBelow(self):
+    names, _ = self._Walk(r'logs/(?!keep)')
+    self.assertEqual(['logs/keep/a', 'src/d'], names)
+
+  def testPrunesDirectoriesExcludedByLiteralPrefix(self):
+    names, prune_check = self._Walk('logs/.*')
+    self.assertEqual(['src/d'], names)
+    checked = [call.args[1] for call in prune_check.call_args_list]
+    self.assertNotIn(os.path.join(self.root, 'logs', 'keep') + os.sep, checked)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Smoke tests for the storage transfer benchmark and its fake GCS server."""
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from googlecloudsdk.command_lib.storage.diagnose import fake_gcs_server
+from googlecloudsdk.command_lib.storage.diagnose import transfer_benchmark
+from googlecloudsdk.core import execution_utils
+
+
+class TransferBenchmarkTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    # The gcloud subprocesses get a configuration of their own.
+    patcher = mock.patch.dict(
+        os.environ,
+        {'CLOUDSDK_CONFIG': os.path.join(self.temp_dir, 'config')})
+    patcher.start()
+    self.addCleanup(patcher.stop)
+
+  def _Gcloud(self, args, environment):
+    return subprocess.run(
+        execution_utils.ArgsForGcloud() + args,
+        env=environment,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        check=False,
+        timeout=120)
+
+  def testUploadAndDownloadThroughFakeServer(self):
+    source = os.path.join(self.temp_dir, 'source')
+    destination = os.path.join(self.temp_dir, 'destination')
+    contents = os.urandom(64 * 1024)
+    with open(source, 'wb') as f:
+      f.write(contents)
+    with fake_gcs_server.FakeGcsServer(bucket_names=['bucket']) as server:
+      environment = transfer_benchmark.TransferBenchmark(
+          workloads=[])._get_environment(server.endpoint)  # pylint: disable=protected-access
+      upload = self._Gcloud(
+          ['storage', 'cp', source, 'gs://bucket/object'], environment)
+      self.assertEqual(0, upload.returncode, upload.stdout)
+      download = self._Gcloud(
+          ['storage', 'cp', 'gs://bucket/object', destination], environment)
+      self.assertEqual(0, download.returncode, download.stdout)
+      self.assertGreater(server.request_count, 0)
+    with open(destination, 'rb') as f:
+      self.assertEqual(contents, f.read())
+
+  def testBenchmarkReportsRequestedOperations(self):
+    benchmark = transfer_benchmark.TransferBenchmark(
+        workloads=[transfer_benchmark.Workload('smoke', 2, 1024)],
+        operations=(transfer_benchmark.UPLOAD, transfer_benchmark.DOWNLOAD))
+    with mock.patch.object(
+        benchmark, '_run_gcloud', wraps=benchmark._run_gcloud) as run_gcloud:  # pylint: disable=protected-access
+      results = benchmark.run()
+    self.assertEqual([transfer_benchmark.UPLOAD, transfer_benchmark.DOWNLOAD],
+                     [result.operation for result in results])
+    # The list in between is run but not reported, rsync and rm are not run.
+    self.assertEqual(3, run_gcloud.call_count)
+    for result in results:
+      self.assertEqual(0, result.exit_code)
+      self.assertEqual(2, result.object_count)
+      self.assertEqual(2048, result.bytes_transferred)
+      self.assertGreater(result.http_requests, 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
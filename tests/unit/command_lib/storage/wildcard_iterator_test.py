@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for concurrent wildcard expansion."""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from googlecloudsdk.command_lib.storage import storage_url
+from googlecloudsdk.command_lib.storage import wildcard_iterator
+from googlecloudsdk.command_lib.storage.resources import resource_reference
+from googlecloudsdk.core import properties
+
+_OBJECT_NAMES = [
+    'logs/{0:02d}/2024-{1:02d}/part-{2}'.format(a, b, c)
+    for a in range(6) for b in range(3) for c in range(2)
+] + ['logs/x.txt', 'logs/00/2023-01/part-0']
+
+
+def _Url(name):
+  return storage_url.storage_url_from_string('gs://bucket/' + name)
+
+
+class _FakeClient(object):
+  """Lists _OBJECT_NAMES, recording the thread of each client."""
+
+  capabilities = frozenset()
+
+  def __init__(self, threads):
+    threads.append(threading.current_thread())
+
+  def list_objects(self, bucket_name, prefix=None, delimiter=None, **kwargs):
+    del bucket_name, kwargs  # Unused.
+    time.sleep(0.005)
+    prefixes = set()
+    resources = []
+    for name in _OBJECT_NAMES:
+      if prefix and not name.startswith(prefix):
+        continue
+      rest = name[len(prefix or ''):]
+      if delimiter and delimiter in rest:
+        sub_prefix = (prefix or '') + rest.split(delimiter)[0] + delimiter
+        if sub_prefix not in prefixes:
+          prefixes.add(sub_prefix)
+          resources.append(
+              resource_reference.PrefixResource(_Url(sub_prefix), sub_prefix))
+      else:
+        resources.append(resource_reference.ObjectResource(_Url(name)))
+    return sorted(resources, key=lambda r: r.storage_url.url_string)
+
+
+class CloudWildcardIteratorTest(unittest.TestCase):
+
+  def setUp(self):
+    config_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, config_dir)
+    env = mock.patch.dict(os.environ, {'CLOUDSDK_CONFIG': config_dir})
+    env.start()
+    self.addCleanup(env.stop)
+    self.client_threads = []
+    self.cleared_threads = []
+    for patcher in (
+        mock.patch.object(
+            wildcard_iterator.api_factory, 'get_api',
+            side_effect=lambda *args: _FakeClient(self.client_threads)),
+        mock.patch.object(
+            wildcard_iterator.api_factory, 'clear_thread_local_instances',
+            side_effect=lambda: self.cleared_threads.append(
+                threading.current_thread())),
+        mock.patch.object(
+            wildcard_iterator.CloudWildcardIterator, '_is_hns_bucket',
+            return_value=False),
+    ):
+      patcher.start()
+      self.addCleanup(patcher.stop)
+
+  def _Expand(self, thread_count, preserve_order=True):
+    properties.VALUES.storage.wildcard_expansion_thread_count.Set(thread_count)
+    return [
+        resource.storage_url.url_string
+        for resource in wildcard_iterator.get_wildcard_iterator(
+            'gs://bucket/logs/*/2024-*/part-*', preserve_order=preserve_order)
+    ]
+
+  def testParallelExpansionMatchesSequentialExpansion(self):
+    sequential = self._Expand(1)
+    self.assertEqual(36, len(sequential))
+    self.assertEqual(sequential, self._Expand(4))
+    self.assertEqual(sorted(sequential), sorted(self._Expand(4, False)))
+
+  def testExpansionThreadsCloseTheirClients(self):
+    self._Expand(4)
+    worker_threads = [
+        thread for thread in self.client_threads
+        if thread is not threading.current_thread()]
+    self.assertTrue(worker_threads)
+    for thread in worker_threads:
+      thread.join(5)
+    self.assertLessEqual(set(worker_threads), set(self.cleared_threads))
+
+  def testThreadCountMustBePositive(self):
+    for value in ('0', '-2', 'many'):
+      with self.subTest(value=value):
+        with self.assertRaises(properties.InvalidValueError):
+          properties.VALUES.storage.wildcard_expansion_thread_count.Set(value)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for background refreshes of expired resource cache tables."""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from googlecloudsdk.core.cache import resource_cache
+
+
+class _Updater(resource_cache.Updater):
+  """Lists one generation of rows per update.
+
+  Updates wait for the release file, if any, since they may run in another
+  process.
+  """
+
+  def __init__(self, cache=None, release=None):
+    super(_Updater, self).__init__(
+        cache=cache, collection='test.things', columns=1)
+    self.generation = 0
+    self.release = release
+
+  def Update(self, parameter_info=None, aggregations=None):
+    deadline = time.time() + 10
+    while (self.release and not os.path.exists(self.release) and
+           time.time() < deadline):
+      time.sleep(0.01)
+    self.generation += 1
+    return [('thing-{0}-{1}'.format(self.generation, i),) for i in range(3)]
+
+
+class BackgroundRefreshTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.cache_name = os.path.join(self.temp_dir, 'resource.cache')
+    self.parameter_info = resource_cache.ParameterInfo()
+    with resource_cache.ResourceCache(name=self.cache_name) as cache:
+      _Updater(cache).Select(('thing*',), self.parameter_info)
+      cache.Table('test.things').Invalidate()
+
+  def _Select(self, updater, refresh_in_background):
+    with resource_cache.ResourceCache(
+        name=self.cache_name,
+        refresh_in_background=refresh_in_background) as cache:
+      updater.cache = cache
+      return sorted(row[0] for row in updater.Select(
+          ('thing*',), self.parameter_info))
+
+  def testExpiredTableIsRefreshedInForeground(self):
+    updater = _Updater()
+    updater.generation = 1
+    self.assertEqual(['thing-2-0', 'thing-2-1', 'thing-2-2'],
+                     self._Select(updater, False))
+
+  def testExpiredTableServesStaleRowsWhileRefreshing(self):
+    release = os.path.join(self.temp_dir, 'release')
+    updater = _Updater(release=release)
+    updater.generation = 1
+    self.assertEqual(['thing-1-0', 'thing-1-1', 'thing-1-2'],
+                     self._Select(updater, True))
+    self.assertFalse(resource_cache.WaitForBackgroundRefreshes(timeout=0.1))
+    # A second select does not start another refresh of the table.
+    self.assertEqual(['thing-1-0', 'thing-1-1', 'thing-1-2'],
+                     self._Select(updater, True))
+    with open(release, 'w'):
+      pass
+    self.assertTrue(resource_cache.WaitForBackgroundRefreshes(timeout=10))
+    # The refresh ran in another process.
+    self.assertEqual(1, updater.generation)
+
+    # The refreshed table must not be updated again.
+    fresh = _Updater(release=os.path.join(self.temp_dir, 'never'))
+    self.assertEqual(['thing-2-0', 'thing-2-1', 'thing-2-2'],
+                     self._Select(fresh, True))
+    self.assertEqual(0, fresh.generation)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the sqlite persistent cache row template matching."""
+
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from googlecloudsdk.core.cache import sqlite_cache
+
+_COMPLETION_BENCHMARK = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))), 'benchmarks', 'completion_benchmark.py')
+
+_NAMES = [
+    'alpha', 'Alpha-1', 'ALPHA_2', 'alphabet', 'al.pha', 'alXpha', 'beta',
+    'b%eta', 'bet_a', 'a', 'Z', 'z@', 'z[', 'zebra', 'é-name', 'É-name', '',
+]
+
+_TEMPLATES = [
+    'alpha', 'ALPHA', 'alpha*', 'ALP*', 'al.pha', 'al.*', 'alpha_2', 'bet_a',
+    'b%*', '*pha', 'a*1', 'z*', 'Z@*', 'z[*', 'é*', 'É*', '*', 'missing*',
+    'a', '',
+]
+
+
+def _LegacyLikeSelect(db, table, column, term):
+  """Selects rows with the LIKE clause the cache built before indexing."""
+  pattern = term.replace('*', '%').replace('.', '_').replace('"', '""')
+  return db.execute('SELECT f0, f1 FROM "{table}" WHERE f{column} LIKE '
+                    '"{pattern}"'.format(table=table, column=column,
+                                         pattern=pattern)).fetchall()
+
+
+class WhereTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.cache_name = os.path.join(self.temp_dir, 'test.cache')
+
+  def _Cache(self):
+    cache = sqlite_cache.Cache(self.cache_name, timeout=0)
+    self.addCleanup(cache.Close)
+    return cache
+
+  def testSelectMatchesLegacyLikeSemantics(self):
+    cache = self._Cache()
+    table = cache.Table('names', columns=2, keys=2)
+    table.AddRows([('project', name) for name in _NAMES] +
+                  [(name, 'name') for name in _NAMES])
+    table.Validate()
+    for column in (0, 1):
+      for term in _TEMPLATES:
+        template = [None, None]
+        template[column] = term
+        with self.subTest(column=column, term=term):
+          self.assertEqual(
+              sorted(_LegacyLikeSelect(cache._db, 'names', column, term)),
+              sorted(table.Select(tuple(template))))
+
+  def testSelectUsesColumnIndexes(self):
+    cache = self._Cache()
+    cache.Table('names', columns=3, keys=3)
+    for template in [('p', None, None), (None, None, 'name'),
+                     (None, None, 'Name*'), (None, 'z*', None)]:
+      where, parameters = sqlite_cache._Where(template)
+      plan = cache._db.execute(
+          'EXPLAIN QUERY PLAN SELECT * FROM "names"' + where,
+          parameters).fetchall()
+      with self.subTest(template=template):
+        self.assertIn('USING INDEX', ' '.join(row[-1] for row in plan))
+
+  def testOpeningTableCreatesMissingIndexes(self):
+    cache = self._Cache()
+    cache.Table('names', columns=2, keys=2)
+    cache.Close()
+    db = sqlite3.connect(self.cache_name)
+    db.execute('DROP INDEX "names.f0"')
+    db.execute('DROP INDEX "names.f1"')
+    db.commit()
+    db.close()
+
+    cache = self._Cache()
+    cache.Table('names', create=False)
+    indexes = [row[0] for row in cache._db.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND "
+        "tbl_name = 'names' AND sql NOT NULL")]
+    self.assertEqual(['names.f0', 'names.f1'], sorted(indexes))
+
+
+class CompletionBenchmarkTest(unittest.TestCase):
+
+  def testCompletesFromWarmCache(self):
+    env = dict(os.environ, CLOUDSDK_CONFIG=tempfile.mkdtemp())
+    self.addCleanup(shutil.rmtree, env['CLOUDSDK_CONFIG'])
+    output = subprocess.check_output(
+        [sys.executable, _COMPLETION_BENCHMARK, '--json', '--instances=20000',
+         '--zones=3', '--repeat=1'], env=env)
+    matches = dict((r['prefix'], r['matches'])
+                   for r in json.loads(output)['completions'])
+    self.assertEqual({
+        'instance-00042': 1,
+        'instance-0004': 10,
+        'instance-1': 10000,
+        'INSTANCE-0004': 10,
+        'missing-': 0,
+    }, matches)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for file logging and log cleanup."""
+
+import datetime
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from googlecloudsdk.core import log
+
+
+class AsyncFileHandlerTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.log_file = os.path.join(self.temp_dir, 'test.log')
+    self.handler = log._AsyncFileHandler(
+        self.log_file, encoding=log.LOG_FILE_ENCODING)
+    self.addCleanup(self.handler.close)
+    self.handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+    self.logger = logging.getLogger('log_test')
+    self.logger.propagate = False
+    self.logger.setLevel(logging.DEBUG)
+    self.logger.addHandler(self.handler)
+    self.addCleanup(self.logger.removeHandler, self.handler)
+
+  def _Contents(self):
+    with open(self.log_file, encoding=log.LOG_FILE_ENCODING) as f:
+      return f.read()
+
+  def testFlushWritesRecordsInOrder(self):
+    for i in range(2500):
+      self.logger.debug('record %d', i)
+    self.handler.flush()
+    self.assertEqual(
+        ''.join('DEBUG record {0}\n'.format(i) for i in range(2500)),
+        self._Contents())
+
+  def testCloseWritesQueuedRecordsAndStopsWriter(self):
+    self.logger.info('first ✓')
+    self.handler.close()
+    self.logger.info('after close')
+    self.assertFalse(self.handler._writer.is_alive())
+    self.assertEqual('INFO first ✓\n', self._Contents())
+    self.handler.flush()
+    self.handler.close()
+
+  def testWriterRestartsInForkedChild(self):
+    if not hasattr(os, 'fork'):
+      self.skipTest('os.fork is not available.')
+    self.logger.info('parent')
+    pid = os.fork()
+    if not pid:
+      try:
+        self.logger.info('child')
+        self.handler.flush()
+      finally:
+        os._exit(0)  # pylint: disable=protected-access
+    os.waitpid(pid, 0)
+    self.handler.flush()
+    self.assertEqual('INFO parent\nINFO child\n', self._Contents())
+
+
+class CleanUpLogsTest(unittest.TestCase):
+
+  def setUp(self):
+    self.logs_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.logs_dir)
+    env = mock.patch.dict(os.environ, {
+        'CLOUDSDK_CORE_MAX_LOG_DAYS': '30',
+        'CLOUDSDK_CORE_LOG_CLEANUP_INTERVAL_HOURS': '24',
+    })
+    env.start()
+    self.addCleanup(env.stop)
+    self.marker = os.path.join(
+        self.logs_dir, log._LOG_CLEANUP_MARKER_FILE_NAME)
+
+  def _AddOldLogDir(self):
+    day = datetime.datetime.now() - datetime.timedelta(days=60)
+    day_dir = os.path.join(self.logs_dir, day.strftime(log.DAY_DIR_FORMAT))
+    os.makedirs(day_dir)
+    log_file = os.path.join(day_dir, '12.00.00.000000.log')
+    with open(log_file, 'w'):
+      pass
+    old = time.time() - 60 * 24 * 60 * 60
+    os.utime(log_file, (old, old))
+    return day_dir
+
+  def testCleansUpAtMostOncePerInterval(self):
+    day_dir = self._AddOldLogDir()
+    log._log_manager._CleanUpLogs(self.logs_dir)
+    self.assertFalse(os.path.exists(day_dir))
+    self.assertTrue(os.path.exists(self.marker))
+
+    day_dir = self._AddOldLogDir()
+    log._log_manager._CleanUpLogs(self.logs_dir)
+    self.assertTrue(os.path.exists(day_dir))
+
+    a_day_ago = time.time() - 24 * 60 * 60 - 1
+    os.utime(self.marker, (a_day_ago, a_day_ago))
+    log._log_manager._CleanUpLogs(self.logs_dir)
+    self.assertFalse(os.path.exists(day_dir))
+
+  def testNoCleanupWhenRetentionIsDisabled(self):
+    day_dir = self._AddOldLogDir()
+    with mock.patch.dict(os.environ, {'CLOUDSDK_CORE_MAX_LOG_DAYS': '0'}):
+      log._log_manager._CleanUpLogs(self.logs_dir)
+    self.assertTrue(os.path.exists(day_dir))
+    self.assertFalse(os.path.exists(self.marker))
+
+
+if __name__ == '__main__':
+  unittest.main()
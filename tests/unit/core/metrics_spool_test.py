@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for spooled metrics reporting."""
+
+import http.server
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from googlecloudsdk.core import metrics
+from googlecloudsdk.core import properties
+
+
+def _ImportReporter():
+  # The reporter is a script that drops the first sys.path entry on import.
+  saved_path = list(sys.path)
+  try:
+    return importlib.import_module('googlecloudsdk.core.metrics_reporter')
+  finally:
+    sys.path[:] = saved_path
+
+
+def _ClearcutBeacon(url, num_events, user_agent='gcloud', event_prefix='e'):
+  body = {
+      'client_info': {'client_type': 'DESKTOP'},
+      'log_source_name': 'CONCORD',
+      'request_time_ms': 1,
+      'log_event': [
+          {'source_extension_json': '{0}{1}'.format(event_prefix, i),
+           'event_time_ms': i}
+          for i in range(num_events)],
+  }
+  return [url, 'POST', json.dumps(body), {'user-agent': user_agent}]
+
+
+class _FakeClearcut(object):
+  """A local HTTP stand-in for the Clearcut endpoint."""
+
+  def __init__(self):
+    self.requests = []
+    fake = self
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+
+      def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        fake.requests.append(
+            (self.path, dict(self.headers), json.loads(body)))
+        self.send_response(200)
+        self.end_headers()
+
+      def log_message(self, *args):
+        pass
+
+    self._server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self.url = 'http://127.0.0.1:{0}/log'.format(self._server.server_port)
+    self._thread = threading.Thread(target=self._server.serve_forever)
+    self._thread.daemon = True
+
+  def __enter__(self):
+    self._thread.start()
+    return self
+
+  def __exit__(self, *args):
+    self._server.shutdown()
+    self._server.server_close()
+
+
+class BatchClearcutRequestsTest(unittest.TestCase):
+
+  def testMergesEventsIntoRequestsOfAtMost100Events(self):
+    reporter = _ImportReporter()
+    metrics_list = [_ClearcutBeacon('https://x/log', 1, event_prefix=i)
+                    for i in range(250)]
+    batched = reporter._BatchClearcutRequests(metrics_list)
+    sizes = [len(json.loads(body)['log_event']) for _, _, body, _ in batched]
+    self.assertEqual([100, 100, 50], sizes)
+    events = [event['source_extension_json']
+              for _, _, body, _ in batched
+              for event in json.loads(body)['log_event']]
+    self.assertEqual(['{0}0'.format(i) for i in range(250)], events)
+
+  def testKeepsDifferentHeadersAndOtherBodiesApart(self):
+    reporter = _ImportReporter()
+    other = ['https://other/beacon', 'GET', 'not json', {}]
+    batched = reporter._BatchClearcutRequests([
+        _ClearcutBeacon('https://x/log', 2, user_agent='a'),
+        other,
+        _ClearcutBeacon('https://x/log', 3, user_agent='b'),
+        _ClearcutBeacon('https://x/log', 4, user_agent='a'),
+    ])
+    self.assertIn(tuple(other), [tuple(m) for m in batched])
+    by_agent = dict(
+        (headers['user-agent'], len(json.loads(body)['log_event']))
+        for url, _, body, headers in batched if url == 'https://x/log')
+    self.assertEqual({'a': 6, 'b': 3}, by_agent)
+
+
+class SpoolTest(unittest.TestCase):
+
+  def setUp(self):
+    self.config_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.config_dir)
+    env = mock.patch.dict(os.environ, {
+        'CLOUDSDK_CONFIG': self.config_dir,
+        'CLOUDSDK_METRICS_SPOOL': 'true',
+    })
+    env.start()
+    self.addCleanup(env.stop)
+    self.spool_dir = os.path.join(self.config_dir, metrics._SPOOL_DIR_NAME)
+    start_reporter = mock.patch.object(
+        metrics._MetricsCollector, '_StartReporter')
+    self.start_reporter = start_reporter.start()
+    self.start_reporter.return_value = True
+    self.addCleanup(start_reporter.stop)
+
+  def _Report(self, num_events=1, wait_for_report=False):
+    collector = metrics._MetricsCollector()
+    collector._metrics = [_ClearcutBeacon('https://x/log', num_events)]
+    collector.ReportMetrics(wait_for_report=wait_for_report)
+
+  def _Batches(self):
+    return sorted(f for f in os.listdir(self.spool_dir)
+                  if f.startswith('batch-'))
+
+  def testAppendsUntilSizeThreshold(self):
+    self.assertTrue(properties.VALUES.metrics.spool.GetBool())
+    with mock.patch.object(metrics, '_SPOOL_FLUSH_BYTES', 2000):
+      for _ in range(3):
+        self._Report()
+      self.assertEqual([], self._Batches())
+      self.start_reporter.assert_not_called()
+      self._Report(num_events=20)
+
+    batches = self._Batches()
+    self.assertEqual(1, len(batches))
+    batch_path = os.path.join(self.spool_dir, batches[0])
+    self.start_reporter.assert_called_once_with(
+        ['--spool', batch_path], False)
+    with open(batch_path) as f:
+      self.assertEqual(4, len(f.readlines()))
+    self.assertFalse(
+        os.path.exists(os.path.join(self.spool_dir, metrics._SPOOL_FILE_NAME)))
+
+  def testFlushesAfterInterval(self):
+    self._Report()
+    self.start_reporter.assert_not_called()
+    last_flush = os.path.join(
+        self.spool_dir, metrics._SPOOL_LAST_FLUSH_FILE_NAME)
+    old = time.time() - metrics._SPOOL_FLUSH_INTERVAL_SECS - 1
+    os.utime(last_flush, (old, old))
+
+    self._Report()
+    self.assertEqual(1, len(self._Batches()))
+    self.assertGreater(os.path.getmtime(last_flush), old + 1)
+    self._Report()
+    self.assertEqual(1, len(self._Batches()))
+
+  def testWaitForReportFlushes(self):
+    self._Report(wait_for_report=True)
+    batches = self._Batches()
+    self.assertEqual(1, len(batches))
+    self.start_reporter.assert_called_once_with(
+        ['--spool', os.path.join(self.spool_dir, batches[0])], True)
+
+  def testRestoresBatchWhenReporterFailsToStart(self):
+    self._Report(num_events=2)
+    self.start_reporter.return_value = False
+    self._Report(num_events=3, wait_for_report=True)
+    self.start_reporter.assert_called_once()
+    self.assertEqual([], self._Batches())
+    with open(os.path.join(self.spool_dir, metrics._SPOOL_FILE_NAME)) as f:
+      self.assertEqual(
+          [2, 3], [len(json.loads(json.loads(line)[2])['log_event'])
+                   for line in f])
+
+    # The restored batch is reported with the next flush.
+    self.start_reporter.return_value = True
+    self._Report(wait_for_report=True)
+    (batch,) = self._Batches()
+    with open(os.path.join(self.spool_dir, batch)) as f:
+      self.assertEqual(3, len(f.readlines()))
+
+  def testFallsBackToReporterProcessWhenLocked(self):
+    os.makedirs(self.spool_dir)
+    with mock.patch.object(metrics.file_utils, 'FileLock',
+                           side_effect=metrics.file_utils.FileLockTimeoutError(
+                               'locked')):
+      self._Report()
+    (reporter_args, _), _ = self.start_reporter.call_args
+    self.assertEqual(1, len(reporter_args))
+    self.assertNotEqual('--spool', reporter_args[0])
+    os.remove(reporter_args[0])
+
+
+class SpoolReporterScriptTest(unittest.TestCase):
+
+  def testSendsBatchFileInBatchedRequests(self):
+    temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, temp_dir)
+    batch_path = os.path.join(temp_dir, 'batch-1-1.jsonl')
+    with _FakeClearcut() as fake:
+      with open(batch_path, 'w') as f:
+        for _ in range(150):
+          f.write(json.dumps(_ClearcutBeacon(fake.url, 1)) + '\n')
+        f.write('["truncated')
+      script = os.path.join(
+          os.path.dirname(metrics.__file__), 'metrics_reporter.py')
+      env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+      subprocess.check_call(
+          [sys.executable, script, '--spool', batch_path], env=env)
+
+    self.assertFalse(os.path.exists(batch_path))
+    self.assertEqual(
+        [100, 50], [len(body['log_event']) for _, _, body in fake.requests])
+    self.assertEqual(
+        {'/log'}, set(path for path, _, _ in fake.requests))
+    self.assertEqual(
+        {'gcloud'}, set(headers['user-agent']
+                        for _, headers, _ in fake.requests))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for local tracing of gcloud invocations."""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from googlecloudsdk.core import tracing
+from googlecloudsdk.core import transport
+
+
+class TracingTest(unittest.TestCase):
+
+  def setUp(self):
+    self.trace_dir = os.path.join(tempfile.mkdtemp(), 'traces')
+    self.addCleanup(shutil.rmtree, os.path.dirname(self.trace_dir))
+    env = mock.patch.dict(
+        os.environ, {'CLOUDSDK_CORE_TRACE_SPANS_DIR': self.trace_dir})
+    env.start()
+    self.addCleanup(env.stop)
+    atexit_register = mock.patch.object(tracing.atexit, 'register')
+    atexit_register.start()
+    self.addCleanup(atexit_register.stop)
+    self.addCleanup(tracing.Finish)
+
+  def _Trace(self):
+    path = tracing.Finish()
+    self.assertEqual(self.trace_dir, os.path.dirname(path))
+    with open(path) as f:
+      return json.load(f)
+
+  def testDisabledWithoutProperty(self):
+    with mock.patch.dict(os.environ, {'CLOUDSDK_CORE_TRACE_SPANS_DIR': ''}):
+      tracing.Start()
+    self.assertFalse(tracing.IsEnabled())
+    with tracing.Span('span', key='value') as attributes:
+      attributes['more'] = 1
+    self.assertIsNone(tracing.Finish())
+    self.assertFalse(os.path.exists(self.trace_dir))
+
+  def testChromeTraceNestsSpansPerThread(self):
+    start_time = time.time()
+    tracing.Start(start_time, start_time + 0.5)
+    self.assertTrue(tracing.IsEnabled())
+    with tracing.Span('run', command='gcloud.test') as attributes:
+      attributes['done'] = True
+      thread = threading.Thread(
+          target=tracing.AddSpan, args=('worker', start_time, start_time + 1))
+      thread.start()
+      thread.join()
+    with self.assertRaises(ValueError):
+      with tracing.Span('display'):
+        raise ValueError()
+
+    events = self._Trace()['traceEvents']
+    by_name = dict((event['name'], event) for event in events)
+    self.assertEqual('gcloud', events[0]['name'])
+    self.assertTrue(
+        {'gcloud', 'imports', 'run', 'worker', 'display'} <= set(by_name))
+    self.assertEqual(500000, by_name['imports']['dur'])
+    self.assertEqual(
+        {'command': 'gcloud.test', 'done': True}, by_name['run']['args'])
+    self.assertEqual({'error': 'ValueError'}, by_name['display']['args'])
+    self.assertNotEqual(by_name['run']['tid'], by_name['worker']['tid'])
+    for event in events:
+      self.assertEqual('X', event['ph'])
+      self.assertEqual(os.getpid(), event['pid'])
+
+  def testOtlpTraceHasParentSpans(self):
+    with mock.patch.dict(
+        os.environ, {'CLOUDSDK_CORE_TRACE_SPANS_FORMAT': 'otlp'}):
+      tracing.Start()
+    with tracing.Span('display'):
+      now = time.time()
+      tracing.AddSpan(tracing.HTTP_REQUEST_SPAN, now, now, status=200,
+                      url='https://x/y')
+
+    resource_spans = self._Trace()['resourceSpans']
+    spans = resource_spans[0]['scopeSpans'][0]['spans']
+    by_name = dict((span['name'], span) for span in spans)
+    self.assertEqual(1, len(set(span['traceId'] for span in spans)))
+    self.assertNotIn('parentSpanId', by_name['gcloud'])
+    self.assertEqual(
+        by_name['gcloud']['spanId'], by_name['display']['parentSpanId'])
+    request = by_name[tracing.HTTP_REQUEST_SPAN]
+    self.assertEqual(by_name['display']['spanId'], request['parentSpanId'])
+    self.assertEqual(3, request['kind'])
+    self.assertEqual(
+        [{'key': 'status', 'value': {'intValue': '200'}},
+         {'key': 'url', 'value': {'stringValue': 'https://x/y'}}],
+        request['attributes'])
+
+  def testHttpRequestSpans(self):
+    tracing.Start()
+    request = mock.Mock(
+        uri='https://x/v1/items?pageToken=abc&key=secret', method='POST',
+        body=b'12345', headers={})
+    data = transport.StartSpan()(request)
+    response = mock.Mock(
+        status_code=404, body=None, headers={'content-length': '42'})
+    transport.RecordSpan()(response, data)
+
+    events = self._Trace()['traceEvents']
+    self.assertEqual(tracing.HTTP_REQUEST_SPAN, events[-1]['name'])
+    self.assertEqual(
+        {'method': 'POST', 'url': 'https://x/v1/items', 'page_token': True,
+         'request_bytes': 5, 'response_bytes': 42, 'status': 404},
+        events[-1]['args'])
+
+
+if __name__ == '__main__':
+  unittest.main()
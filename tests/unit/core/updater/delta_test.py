@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for delta updates of components from a file manifest."""
+
+import collections
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+from googlecloudsdk.core.updater import delta
+from googlecloudsdk.core.updater import installers
+
+_Component = collections.namedtuple('_Component', ['id', 'data'])
+_ComponentData = collections.namedtuple('_ComponentData', ['manifest', 'size'])
+
+
+def _WriteArchive(path, entries):
+  """Writes a .tar.gz of (name, contents or None for a dir, link target)."""
+  with tarfile.open(path, 'w:gz') as tar:
+    for name, contents, target in entries:
+      info = tarfile.TarInfo(name)
+      if target is not None:
+        info.type = tarfile.SYMTYPE
+        info.linkname = target
+        tar.addfile(info)
+      elif contents is None:
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+        tar.addfile(info)
+      else:
+        info.size = len(contents)
+        info.mode = 0o644
+        tar.addfile(info, io.BytesIO(contents))
+
+
+def _ReadFile(path):
+  with open(path, 'rb') as f:
+    return f.read()
+
+
+class StageComponentTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.sdk_root = os.path.join(self.temp_dir, 'sdk')
+    self.repo_dir = os.path.join(self.temp_dir, 'repo')
+    self.staging_dir = os.path.join(self.temp_dir, 'staging')
+    os.makedirs(self.repo_dir)
+
+    # Version 1 is installed with the hashes recorded for delta updates.
+    v1_archive = os.path.join(self.temp_dir, 'v1.tar.gz')
+    _WriteArchive(v1_archive, [
+        ('lib/', None, None),
+        ('lib/a.py', b'unchanged', None),
+        ('lib/b.py', b'old b', None),
+        ('bin/', None, None),
+        ('bin/tool', None, '../lib/a.py'),
+    ])
+    with tarfile.open(v1_archive) as tar:
+      tar.extractall(self.sdk_root)
+      files = [m.name + '/' if m.isdir() else m.name
+               for m in tar.getmembers()]
+    self.installed_hashes = installers.HashFiles(self.sdk_root, files)
+
+  def _Publish(self, entries):
+    """Publishes a component version to the file:// repository."""
+    archive = os.path.join(self.repo_dir, 'component.tar.gz')
+    _WriteArchive(archive, entries)
+    manifest = delta.CreateManifest(
+        archive, os.path.join(self.repo_dir, 'objects'))
+    manifest_path = os.path.join(self.repo_dir, 'manifest.json')
+    with open(manifest_path, 'w') as f:
+      json.dump(manifest, f)
+    return _Component(
+        'component',
+        _ComponentData('file://' + manifest_path, 10 * 1024 * 1024))
+
+  def _WriteManifest(self, files):
+    manifest_path = os.path.join(self.repo_dir, 'manifest.json')
+    with open(manifest_path, 'w') as f:
+      json.dump({'files': files}, f)
+    return _Component(
+        'component', _ComponentData('file://' + manifest_path, 1024))
+
+  def testStagesChangedFilesFromRepositoryAndCopiesUnchangedOnes(self):
+    component = self._Publish([
+        ('lib/', None, None),
+        ('lib/a.py', b'unchanged', None),
+        ('lib/b.py', b'new b', None),
+        ('lib/c.py', b'new c', None),
+        ('lib/c_copy.py', b'new c', None),
+        ('bin/', None, None),
+        ('bin/tool', None, '../lib/a.py'),
+    ])
+    # Unchanged files must come from the installed version.
+    objects_dir = os.path.join(self.repo_dir, 'objects')
+    unchanged_hash = self.installed_hashes['lib/a.py']
+    os.remove(os.path.join(objects_dir, unchanged_hash + delta.OBJECT_SUFFIX))
+
+    staged = delta.StageComponent(
+        component, self.installed_hashes, self.sdk_root, self.staging_dir)
+
+    self.assertEqual(self.staging_dir, staged.staging_dir)
+    self.assertEqual(
+        ['lib/', 'lib/a.py', 'lib/b.py', 'lib/c.py', 'lib/c_copy.py', 'bin/',
+         'bin/tool'], staged.files)
+    for name, contents in [('lib/a.py', b'unchanged'), ('lib/b.py', b'new b'),
+                           ('lib/c.py', b'new c'),
+                           ('lib/c_copy.py', b'new c'),
+                           ('bin/tool', b'unchanged')]:
+      self.assertEqual(
+          contents, _ReadFile(os.path.join(self.staging_dir, name)))
+    self.assertEqual(
+        '../lib/a.py',
+        os.readlink(os.path.join(self.staging_dir, 'bin', 'tool')))
+    staged_hashes = installers.HashFiles(self.staging_dir, staged.files)
+    self.assertEqual(staged_hashes, staged.hashes)
+
+  def testRejectsSymlinkOutsideOfComponent(self):
+    for target in ['../../outside', '/etc/passwd']:
+      component = self._WriteManifest([
+          {'path': 'lib/', 'type': 'dir'},
+          {'path': 'lib/link', 'type': 'symlink', 'target': target},
+      ])
+      with self.assertRaisesRegex(delta.ManifestError, 'Invalid target'):
+        delta.StageComponent(
+            component, self.installed_hashes, self.sdk_root,
+            self.staging_dir)
+      self.assertFalse(os.path.lexists(self.staging_dir))
+
+  def testRejectsSymlinkEscapingThroughAnotherSymlink(self):
+    component = self._WriteManifest([
+        {'path': 'lib/', 'type': 'dir'},
+        {'path': 'lib/root', 'type': 'symlink', 'target': '..'},
+        {'path': 'lib/escape', 'type': 'symlink', 'target': 'root/../..'},
+    ])
+    with self.assertRaisesRegex(delta.ManifestError, 'lib/escape'):
+      delta.StageComponent(
+          component, self.installed_hashes, self.sdk_root, self.staging_dir)
+    self.assertFalse(os.path.lexists(self.staging_dir))
+
+  def testRejectsPathUnderSymlink(self):
+    component = self._WriteManifest([
+        {'path': 'lib', 'type': 'symlink', 'target': 'bin'},
+        {'path': 'lib/a.py', 'sha256': self.installed_hashes['lib/a.py'],
+         'size': 9},
+    ])
+    with self.assertRaisesRegex(delta.ManifestError, 'under the symlink'):
+      delta.StageComponent(
+          component, self.installed_hashes, self.sdk_root, self.staging_dir)
+    self.assertFalse(os.path.lexists(self.staging_dir))
+
+
+if __name__ == '__main__':
+  unittest.main()
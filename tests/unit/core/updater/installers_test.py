@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for installing staged component archives."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from googlecloudsdk.core.updater import installers
+
+
+def _WriteFile(path, contents):
+  if not os.path.isdir(os.path.dirname(path)):
+    os.makedirs(os.path.dirname(path))
+  with open(path, 'w') as f:
+    f.write(contents)
+
+
+def _ReadFile(path):
+  with open(path) as f:
+    return f.read()
+
+
+class InstallStagedArchiveTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    self.staging_dir = os.path.join(self.temp_dir, 'staging')
+    self.install_dir = os.path.join(self.temp_dir, 'install')
+    self.files = ['bin/', 'bin/tool', 'lib/', 'lib/new/', 'lib/new/a.py',
+                  'lib/new/b.py', 'lib/old.py']
+    for name in self.files:
+      if not name.endswith('/'):
+        _WriteFile(os.path.join(self.staging_dir, name), 'new ' + name)
+    _WriteFile(os.path.join(self.install_dir, 'bin', 'tool'), 'old tool')
+    _WriteFile(os.path.join(self.install_dir, 'bin', 'other'), 'other')
+
+  def _StagedArchive(self):
+    return installers.StagedArchive(self.staging_dir, self.files, {})
+
+  def testMovesFilesAndRemovesStagingDir(self):
+    installers.InstallStagedArchive(self._StagedArchive(), self.install_dir)
+
+    for name in self.files:
+      if not name.endswith('/'):
+        self.assertEqual(
+            'new ' + name, _ReadFile(os.path.join(self.install_dir, name)))
+    self.assertEqual(
+        'other', _ReadFile(os.path.join(self.install_dir, 'bin', 'other')))
+    self.assertFalse(os.path.exists(self.staging_dir))
+
+  def testRemovesNewFilesAndDirectoriesWhenMoveFails(self):
+    real_replace = os.replace
+
+    def Replace(source, dest):
+      if dest.endswith('b.py'):
+        raise OSError('disk full')
+      real_replace(source, dest)
+
+    with mock.patch.object(installers.os, 'replace', side_effect=Replace):
+      with self.assertRaises(OSError):
+        installers.InstallStagedArchive(
+            self._StagedArchive(), self.install_dir)
+
+    self.assertEqual(['bin'], os.listdir(self.install_dir))
+    self.assertEqual(
+        ['other', 'tool'],
+        sorted(os.listdir(os.path.join(self.install_dir, 'bin'))))
+    # Files that replaced an existing file are not removed.
+    self.assertEqual(
+        'new bin/tool',
+        _ReadFile(os.path.join(self.install_dir, 'bin', 'tool')))
+    self.assertTrue(os.path.isdir(self.staging_dir))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for creating ZIP archives from directories."""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import zipfile
+
+from googlecloudsdk.core.util import archive
+
+
+def _Entries(zip_bytes):
+  with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_file:
+    assert zip_file.testzip() is None
+    return [(info.filename, zip_file.read(info.filename))
+            for info in zip_file.infolist()]
+
+
+class MakeZipFromDirTest(unittest.TestCase):
+
+  def setUp(self):
+    self.src_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.src_dir)
+    for rel_path, size in (('main.py', 100), ('lib/big.bin', 5000),
+                           ('lib/small.txt', 10), ('lib/empty', 0)):
+      path = os.path.join(self.src_dir, rel_path)
+      os.makedirs(os.path.dirname(path), exist_ok=True)
+      with open(path, 'wb') as f:
+        f.write(os.urandom(size // 2) + b'a' * (size - size // 2))
+    os.makedirs(os.path.join(self.src_dir, 'empty_dir'))
+
+  def _ZipBytes(self, parallel):
+    output = io.BytesIO()
+    archive.MakeZipFromDir(output, self.src_dir, parallel=parallel)
+    return output.getvalue()
+
+  def _Zip(self, parallel):
+    return _Entries(self._ZipBytes(parallel))
+
+  def testParallelMatchesSerial(self):
+    self.assertEqual(self._ZipBytes(False), self._ZipBytes(True))
+    self.assertEqual(
+        ['empty_dir/', 'lib/', 'lib/big.bin', 'lib/empty', 'lib/small.txt',
+         'main.py'],
+        sorted(name for name, _ in self._Zip(True)))
+
+  def testLargeFilesAndPendingBoundKeepOrder(self):
+    serial = self._Zip(False)
+    with mock.patch.object(archive, '_PARALLEL_ZIP_MAX_FILE_BYTES', 1000), \
+        mock.patch.object(archive, '_PARALLEL_ZIP_MAX_PENDING_BYTES', 150), \
+        mock.patch.object(
+            archive, '_ReadFile', wraps=archive._ReadFile) as read:
+      self.assertEqual(serial, self._Zip(True))
+    read_ahead = sorted(
+        os.path.relpath(call.args[0], self.src_dir)
+        for call in read.call_args_list)
+    self.assertEqual(
+        [os.path.join('lib', 'empty'), os.path.join('lib', 'small.txt'),
+         'main.py'], read_ahead)
+
+  def testRemovedFilesAreSkipped(self):
+    with mock.patch.object(archive, '_PARALLEL_ZIP_MAX_FILE_BYTES', 1000), \
+        mock.patch.object(archive, '_ReadFile', return_value=None):
+      names = [name for name, _ in self._Zip(True)]
+    self.assertNotIn('main.py', names)
+    self.assertIn('lib/big.bin', names)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*- #
+# Copyright 2026 Google LLC. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for lazy module imports."""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from googlecloudsdk.calliope import command_loading
+from googlecloudsdk.command_lib.meta import import_profiler
+from googlecloudsdk.core.util import lazy_module
+
+_PACKAGE = 'lazy_module_test_pkg'
+
+
+class LazyImportsTest(unittest.TestCase):
+
+  def setUp(self):
+    self.temp_dir = tempfile.mkdtemp()
+    self.addCleanup(shutil.rmtree, self.temp_dir)
+    package_dir = os.path.join(self.temp_dir, _PACKAGE)
+    os.makedirs(os.path.join(package_dir, 'heavy'))
+    self._Write('__init__.py', '')
+    self._Write('heavy/__init__.py', '')
+    self._Write('heavy/api.py', (
+        'import time\n'
+        'from {0}.events import events\n'
+        'events.append("api")\n'
+        'time.sleep(0.05)\n'
+        'VALUE = 42\n').format(_PACKAGE))
+    self._Write('heavy/broken.py', 'raise ValueError("broken")\n')
+    self._Write('heavy/uninstalled.py', 'import lazy_module_test_missing\n')
+    self._Write('events.py', 'events = []\n')
+    self._Write('command.py', (
+        'from {0}.heavy import api\n'
+        'def Run():\n'
+        '  return api.VALUE\n').format(_PACKAGE))
+    sys.path.insert(0, self.temp_dir)
+    self.addCleanup(sys.path.remove, self.temp_dir)
+    self.addCleanup(self._Unimport)
+
+  def _Write(self, name, contents):
+    with open(os.path.join(self.temp_dir, _PACKAGE, name), 'w') as f:
+      f.write(contents)
+
+  def _Unimport(self):
+    for name in list(sys.modules):
+      if name.startswith(_PACKAGE):
+        del sys.modules[name]
+
+  def _Events(self):
+    return sys.modules[_PACKAGE + '.events'].events
+
+  def testModuleRunsOnFirstAttributeUse(self):
+    with lazy_module.LazyImports([_PACKAGE + '.heavy.']):
+      # pylint: disable=g-import-not-at-top
+      from lazy_module_test_pkg import command
+      from lazy_module_test_pkg import events
+    api = sys.modules[_PACKAGE + '.heavy.api']
+    self.assertFalse(lazy_module.IsLoaded(api))
+    self.assertEqual([], events.events)
+
+    self.assertEqual(42, command.Run())
+    self.assertTrue(lazy_module.IsLoaded(api))
+    self.assertEqual(['api'], events.events)
+    self.assertEqual(42, command.Run())
+    self.assertEqual(['api'], events.events)
+
+  def testOtherModulesAreImportedAsUsual(self):
+    with lazy_module.LazyImports(['other.']):
+      # pylint: disable=g-import-not-at-top
+      from lazy_module_test_pkg.heavy import api
+    self.assertTrue(lazy_module.IsLoaded(api))
+    self.assertEqual(['api'], self._Events())
+
+  def testModuleRunsOnceWhenUsedFromManyThreads(self):
+    with lazy_module.LazyImports([_PACKAGE + '.heavy.']):
+      # pylint: disable=g-import-not-at-top
+      from lazy_module_test_pkg.heavy import api
+    values = []
+    threads = [threading.Thread(target=lambda: values.append(api.VALUE))
+               for _ in range(4)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+    self.assertEqual([42] * 4, values)
+    self.assertEqual(['api'], self._Events())
+
+  def testFailedModuleIsImportedAgainNextTime(self):
+    with lazy_module.LazyImports([_PACKAGE + '.heavy.']):
+      # pylint: disable=g-import-not-at-top
+      from lazy_module_test_pkg.heavy import broken
+    with self.assertRaisesRegex(ValueError, 'broken'):
+      broken.anything  # pylint: disable=pointless-statement
+    self.assertNotIn(_PACKAGE + '.heavy.broken', sys.modules)
+
+  def testErrorOnFirstUseIsWrapped(self):
+    with lazy_module.LazyImports(
+        [_PACKAGE + '.heavy.'],
+        wrap_error=lambda e: RuntimeError('wrapped: {0}'.format(e))):
+      # pylint: disable=g-import-not-at-top
+      from lazy_module_test_pkg.heavy import broken
+    with self.assertRaisesRegex(RuntimeError, 'wrapped: broken'):
+      broken.anything  # pylint: disable=pointless-statement
+    self.assertNotIn(_PACKAGE + '.heavy.broken', sys.modules)
+
+  def testCalliopeImportsCommandDependenciesLazily(self):
+    prefixes = (_PACKAGE + '.heavy.',)
+    with mock.patch.object(
+        command_loading, '_LAZY_IMPORT_PREFIXES', prefixes):
+      module = command_loading._GetModuleFromPath(
+          os.path.join(self.temp_dir, _PACKAGE, 'command'), ['gcloud', 'lazy'],
+          'lazy_module_test')
+    self.addCleanup(sys.modules.pop, module.__name__)
+    self.assertFalse(
+        lazy_module.IsLoaded(sys.modules[_PACKAGE + '.heavy.api']))
+    self.assertEqual(42, module.Run())
+
+  def testCalliopeReportsDeferredImportErrorsAsLoadFailures(self):
+    self._Write('uninstalled_command.py', (
+        'from {0}.heavy import uninstalled\n'
+        'def Run():\n'
+        '  return uninstalled.VALUE\n').format(_PACKAGE))
+    prefixes = (_PACKAGE + '.heavy.',)
+    with mock.patch.object(
+        command_loading, '_LAZY_IMPORT_PREFIXES', prefixes):
+      module = command_loading._GetModuleFromPath(
+          os.path.join(self.temp_dir, _PACKAGE, 'uninstalled_command'),
+          ['gcloud', 'lazy'], 'lazy_module_test')
+    self.addCleanup(sys.modules.pop, module.__name__)
+
+    with self.assertRaises(command_loading.CommandLoadFailure) as context:
+      module.Run()
+    self.assertEqual('gcloud.lazy', context.exception.command)
+    self.assertIsInstance(
+        context.exception.root_exception, ModuleNotFoundError)
+    self.assertIn("No module named 'lazy_module_test_missing'",
+                  str(context.exception))
+
+
+class ParseImportTimesTest(unittest.TestCase):
+
+  def testBuildsTreeFromNestedLines(self):
+    lines = [
+        'import time: self [us] | cumulative | imported package',
+        'import time:       100 |        100 |       c',
+        'import time:       200 |        300 |     b',
+        'import time:       400 |        400 |     d',
+        'import time:      1000 |       1700 |   a',
+        'import time:        50 |         50 |   e',
+        'some other output',
+    ]
+    timings = import_profiler.ParseImportTimes(lines)
+    self.assertEqual(['a', 'e'], [t.module for t in timings])
+    self.assertEqual(1.7, timings[0].cumulative_ms)
+    self.assertEqual(['b', 'd'], [t.module for t in timings[0].children])
+    self.assertEqual(['c'], [t.module for t in timings[0].children[0].children])
+
+    rows = import_profiler.Flatten(timings, min_cumulative_ms=0.1, max_depth=2)
+    self.assertEqual(['a', '  d', '  b'], [row['module'] for row in rows])
+
+
+if __name__ == '__main__':
+  unittest.main()